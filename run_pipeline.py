@@ -19,6 +19,16 @@ Example:
         --steps LOAD,SUMMARIZE,INDEX \\
         --summary-max-length 200 \\
         --no-pii
+
+    # Stream batches from the loader to the index with bounded memory
+    python run_pipeline.py path/to/notion/export --stream --queue-size 2
+
+    # Only process pages that changed since the last run
+    python run_pipeline.py path/to/notion/export --incremental --prune-deleted
+
+    # Checkpoint every batch, then continue after an interruption
+    python run_pipeline.py path/to/notion/export --checkpoint
+    python run_pipeline.py path/to/notion/export --resume
     ```
 """
 
@@ -49,10 +59,22 @@ def parse_args() -> argparse.Namespace:
             - cache_ttl (int): Cache TTL in seconds, defaults to 86400
             - no_pii (bool): Whether to skip PII detection
             - no_dedup (bool): Whether to skip deduplication
+            - pii_processes (int): Processes used for PII detection, defaults to 1
+            - near_duplicate_threshold (float, optional): Jaccard similarity at which
+              documents are skipped as near-duplicates
+            - embedding_concurrency (int): Embedding requests in flight, defaults to 4
+            - embedding_rpm (int, optional): Embedding requests-per-minute quota
+            - embedding_tpm (int, optional): Embedding tokens-per-minute quota
             - summary_max_length (int): Maximum summary length, defaults to 150
             - summary_min_length (int): Minimum summary length, defaults to 50
             - cluster_count (int): Number of clusters, defaults to 5
             - min_cluster_size (int): Minimum cluster size, defaults to 3
+            - stream (bool): Whether to stream batches through the steps
+            - queue_size (int): Batches buffered between streaming stages, defaults to 4
+            - incremental (bool): Whether to skip documents unchanged since the last run
+            - prune_deleted (bool): Whether to delete documents whose sources were removed
+            - checkpoint (bool): Whether to checkpoint every batch after each step
+            - resume (bool): Whether to continue from the checkpoints of an interrupted run
 
     Example:
         ```python
@@ -77,6 +99,32 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cache-ttl", type=int, default=86400, help="Cache TTL in seconds")
     parser.add_argument("--no-pii", action="store_true", help="Skip PII detection")
     parser.add_argument("--no-dedup", action="store_true", help="Skip deduplication")
+    parser.add_argument(
+        "--pii-processes",
+        type=int,
+        default=1,
+        help="Processes used for PII detection (-1 for one per CPU core)",
+    )
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        help="Skip documents whose estimated Jaccard similarity to an earlier "
+        "document reaches this value (e.g. 0.8)",
+    )
+
+    # Embedding rate limits
+    parser.add_argument(
+        "--embedding-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of embedding requests in flight",
+    )
+    parser.add_argument(
+        "--embedding-rpm", type=int, help="Embedding requests-per-minute quota (default: none)"
+    )
+    parser.add_argument(
+        "--embedding-tpm", type=int, help="Embedding tokens-per-minute quota (default: none)"
+    )
 
     # Summarization config
     parser.add_argument("--summary-max-length", type=int, default=150)
@@ -86,7 +134,44 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--cluster-count", type=int, default=5)
     parser.add_argument("--min-cluster-size", type=int, default=3)
 
-    return parser.parse_args()
+    # Streaming config
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream batches through the steps with bounded memory",
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=4, help="Batches buffered between streaming stages"
+    )
+
+    # Incremental config
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip documents unchanged since the last run",
+    )
+    parser.add_argument(
+        "--prune-deleted",
+        action="store_true",
+        help="With --incremental, delete documents whose sources were removed",
+    )
+
+    # Checkpoint config
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="Checkpoint every batch after each step so the run can be resumed",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its checkpoints (implies --checkpoint)",
+    )
+
+    args = parser.parse_args()
+    if args.stream and (args.checkpoint or args.resume):
+        parser.error("--checkpoint and --resume are not supported with --stream")
+    return args
 
 
 def parse_steps(steps_str: str) -> Set[PipelineStep]:
@@ -134,7 +219,7 @@ def main():
     4. Handling any errors that occur during execution
 
     Returns:
-        int: 0 for successful execution, 1 for errors
+        int: 0 for successful execution, 1 if any documents were dropped
 
     Raises:
         SystemExit: With exit code 1 if an unhandled error occurs
@@ -155,10 +240,15 @@ def main():
             cache_host=args.cache_host,
             cache_port=args.cache_port,
             cache_ttl=args.cache_ttl,
+            pii_processes=args.pii_processes,
+            near_duplicate_threshold=args.near_duplicate_threshold,
+            embedding_concurrency=args.embedding_concurrency,
+            embedding_requests_per_minute=args.embedding_rpm,
+            embedding_tokens_per_minute=args.embedding_tpm,
         )
 
         steps = parse_steps(args.steps)
-        docs = pipeline.process_documents(
+        options = dict(
             steps=steps,
             detect_pii=not args.no_pii,
             deduplicate=not args.no_dedup,
@@ -168,10 +258,33 @@ def main():
             cluster_config=ClusteringConfig(
                 n_clusters=args.cluster_count, min_cluster_size=args.min_cluster_size
             ),
+            incremental=args.incremental,
+            prune_deleted=args.prune_deleted,
         )
-
-        print(f"\nProcessing complete. Processed {len(docs)} documents")
+        if args.stream:
+            processed = 0
+            for batch in pipeline.stream_documents(queue_size=args.queue_size, **options):
+                processed += len(batch)
+                print(f"Processed {processed} documents", end="\r", flush=True)
+        else:
+            processed = len(
+                pipeline.process_documents(
+                    checkpoint=args.checkpoint, resume=args.resume, **options
+                )
+            )
+
+        print(f"\nProcessing complete. Processed {processed} documents")
+        if args.near_duplicate_threshold and pipeline.skipped_near_duplicates:
+            print(f"Skipped {pipeline.skipped_near_duplicates} near-duplicate documents")
+        if args.incremental and pipeline.deleted_sources:
+            print(f"{len(pipeline.deleted_sources)} removed sources still in the index")
         print(f"Check {args.log_dir}/pipeline.json for detailed logs")
+        if pipeline.dropped_documents:
+            print(
+                f"Error: {pipeline.dropped_documents} documents were dropped by a failing step",
+                file=sys.stderr,
+            )
+            return 1
         return 0
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
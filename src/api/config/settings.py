@@ -80,6 +80,13 @@ class Settings(BaseSettings):
     CACHE_MAX_MEMORY: str = "1gb"
     CACHE_POLICY: str = "allkeys-lru"
 
+    # Semantic search cache (per process, opt-in)
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.95  # Minimum cosine similarity for a hit
+    SEMANTIC_CACHE_MAX_AGE: float = 300.0  # Maximum age of reused results in seconds
+    SEMANTIC_CACHE_SIZE: int = 1024  # Number of recent queries kept
+    SEMANTIC_CACHE_MODEL: str = "text-embedding-3-small"
+
     # Supabase Configuration
     SUPABASE_URL: str = Field("http://localhost:54321", env="SUPABASE_URL")  # Default to local dev
     SUPABASE_DB_URL: Optional[str] = Field(None, env="SUPABASE_DB_URL")  # PostgreSQL connection URL
@@ -0,0 +1,50 @@
+"""Semantic search cache dependencies."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+from src.api.config.settings import settings
+
+if TYPE_CHECKING:
+    from src.utils.semantic_cache import SemanticCache
+
+
+@lru_cache()
+def get_semantic_cache() -> Optional["SemanticCache"]:
+    """Get the process-wide semantic search cache.
+
+    Returns:
+        Optional[SemanticCache]: Shared cache, or None if disabled
+    """
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    from src.utils.semantic_cache import SemanticCache
+
+    return SemanticCache(
+        capacity=settings.SEMANTIC_CACHE_SIZE,
+        threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+        max_age=settings.SEMANTIC_CACHE_MAX_AGE,
+    )
+
+
+@lru_cache()
+def get_query_embedder() -> Optional[Callable[[str], List[float]]]:
+    """Get the function embedding query text for the semantic cache.
+
+    Returns:
+        Optional[Callable[[str], List[float]]]: Query embedder, or None if the
+            semantic cache is disabled
+    """
+    if not settings.SEMANTIC_CACHE_ENABLED:
+        return None
+
+    from openai import OpenAI
+
+    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+
+    def embed(text: str) -> List[float]:
+        response = client.embeddings.create(model=settings.SEMANTIC_CACHE_MODEL, input=text)
+        return response.data[0].embedding
+
+    return embed
@@ -1,7 +1,7 @@
 """Request models for the API."""
 
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, EmailStr, Field, HttpUrl
 
@@ -51,6 +51,24 @@ class SearchQuery(BaseModel):
         json_schema_extra = {"example": {"query": "machine learning", "limit": 10, "offset": 0}}
 
 
+class BatchSearchQuery(BaseModel):
+    """Batch search query model."""
+
+    queries: List[SearchQuery] = Field(
+        ..., min_length=1, max_length=100, description="Search queries, answered in order"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "queries": [
+                    {"query": "machine learning", "limit": 5},
+                    {"query": "vector databases", "limit": 5},
+                ]
+            }
+        }
+
+
 class DocumentFilter(BaseModel):
     """Document filter model."""
 
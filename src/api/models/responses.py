@@ -57,6 +57,16 @@ class SearchResponse(BaseModel):
         json_schema_extra = {"example": {"results": [], "total": 42, "took": 123.45}}
 
 
+class BatchSearchResponse(BaseModel):
+    """Batch search response model."""
+
+    responses: List[SearchResponse] = Field(..., description="Response of every query, in order")
+    took: float = Field(..., description="Search time in milliseconds")
+
+    class Config:
+        json_schema_extra = {"example": {"responses": [], "took": 123.45}}
+
+
 class Stats(BaseModel):
     """API statistics model."""
 
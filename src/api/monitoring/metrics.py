@@ -17,6 +17,7 @@ from src.api.monitoring.prometheus_metrics import (
     EXTERNAL_SERVICE_ERRORS,
     HTTP_REQUEST_DURATION,
     HTTP_REQUESTS_TOTAL,
+    SEMANTIC_CACHE_SIMILARITY,
 )
 from src.api.monitoring.recorders import (
     record_cache_hit,
@@ -26,6 +27,7 @@ from src.api.monitoring.recorders import (
     record_db_pool_stats,
     record_error,
     record_external_request,
+    record_semantic_similarity,
 )
 
 __all__ = [
@@ -45,6 +47,7 @@ __all__ = [
     "ERROR_COUNTER",
     "EXTERNAL_REQUEST_DURATION",
     "EXTERNAL_SERVICE_ERRORS",
+    "SEMANTIC_CACHE_SIMILARITY",
     # Recorders
     "record_cache_hit",
     "record_cache_miss",
@@ -53,4 +56,5 @@ __all__ = [
     "record_db_pool_stats",
     "record_error",
     "record_external_request",
+    "record_semantic_similarity",
 ]
@@ -53,6 +53,12 @@ CACHE_MISSES = Counter(
     ["cache_type"],
 )
 
+SEMANTIC_CACHE_SIMILARITY = Histogram(
+    "semantic_cache_similarity",
+    "Cosine similarity of the closest cached query per semantic cache lookup",
+    buckets=(0.5, 0.8, 0.9, 0.95, 0.98, 0.99, 1.0),
+)
+
 # Error metrics
 ERROR_COUNTER = Counter(
     "application_errors_total",
@@ -12,6 +12,7 @@ from src.api.monitoring.prometheus_metrics import (
     ERROR_COUNTER,
     EXTERNAL_REQUEST_DURATION,
     EXTERNAL_SERVICE_ERRORS,
+    SEMANTIC_CACHE_SIMILARITY,
 )
 
 
@@ -121,3 +122,12 @@ def record_cache_miss(cache_type: str) -> None:
         cache_type: Type of cache (redis, memory, etc.)
     """
     CACHE_MISSES.labels(cache_type=cache_type).inc()
+
+
+def record_semantic_similarity(similarity: float) -> None:
+    """Record the similarity of the closest cached query in a semantic cache lookup.
+
+    Args:
+        similarity: Cosine similarity of the best match
+    """
+    SEMANTIC_CACHE_SIMILARITY.observe(similarity)
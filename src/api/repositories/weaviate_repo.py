@@ -1,9 +1,13 @@
 """Weaviate repository for data access."""
 
+import base64
+import binascii
 import json
 import logging
 import time
-from typing import Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import weaviate
 from weaviate.util import generate_uuid5
@@ -11,20 +15,60 @@ from weaviate.util import generate_uuid5
 from src.api.models.requests import DocumentFilter, SearchQuery
 from src.api.models.responses import SearchResponse, SearchResult, Stats
 
+if TYPE_CHECKING:
+    from src.utils.semantic_cache import SemanticCache
+
 logger = logging.getLogger(__name__)
 
+SEARCH_PROPERTIES = ["title", "content", "file_path", "file_type", "metadata_json"]
+
+# Queries combined into one aliased GraphQL request by search_batch
+QUERIES_PER_REQUEST = 16
+
+# Batched requests in flight at once
+BATCH_CONCURRENCY = 4
+
+
+def encode_cursor(document_id: str) -> str:
+    """Encode the ID of the last listed document as an opaque cursor token."""
+    return base64.urlsafe_b64encode(document_id.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Decode a cursor token into the ID of the last listed document.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return str(uuid.UUID(base64.urlsafe_b64decode(padded.encode()).decode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError(f"Invalid cursor: {cursor}")
+
 
 class WeaviateRepository:
     """Repository for Weaviate operations."""
 
-    def __init__(self, client: weaviate.Client):
+    def __init__(
+        self,
+        client: weaviate.Client,
+        semantic_cache: Optional["SemanticCache"] = None,
+        embed_query: Optional[Callable[[str], List[float]]] = None,
+    ):
         """Initialize repository with Weaviate client.
 
         Args:
             client: Configured Weaviate client
+            semantic_cache: Optional cache answering searches with the results of
+                a recent similar query; lookups require embed_query, and the
+                cache is cleared whenever a document is indexed or deleted
+            embed_query: Function embedding query text for the semantic cache
         """
         self.client = client
         self.collection = "Document"
+        self.semantic_cache = semantic_cache
+        self.embed_query = embed_query
 
     async def search(self, query: SearchQuery) -> SearchResponse:
         """Perform semantic search.
@@ -37,11 +81,20 @@ class WeaviateRepository:
         """
         start_time = time.time()
 
+        query_vector = None
+        scope = f"{query.limit}:{query.offset}"
+        if self.semantic_cache and self.embed_query:
+            try:
+                query_vector = self.embed_query(query.query)
+                cached = self.semantic_cache.lookup(query_vector, scope)
+                if cached is not None:
+                    return cached.model_copy(update={"took": (time.time() - start_time) * 1000})
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup failed: {str(e)}")
+
         try:
             result = (
-                self.client.query.get(
-                    self.collection, ["title", "content", "file_path", "file_type", "metadata_json"]
-                )
+                self.client.query.get(self.collection, SEARCH_PROPERTIES)
                 .with_near_text({"concepts": [query.query]})
                 .with_limit(query.limit)
                 .with_offset(query.offset)
@@ -52,20 +105,7 @@ class WeaviateRepository:
             documents = result.get("data", {}).get("Get", {}).get("Document", [])
 
             # Format results
-            search_results = []
-            for doc in documents:
-                metadata = json.loads(doc.get("metadata_json", "{}"))
-                search_results.append(
-                    SearchResult(
-                        id=doc.get("_additional", {}).get("id", ""),
-                        title=doc.get("title", ""),
-                        content=doc.get("content", ""),
-                        file_path=doc.get("file_path", ""),
-                        file_type=doc.get("file_type", ""),
-                        metadata=metadata,
-                        score=doc.get("_additional", {}).get("score", 0.0),
-                    )
-                )
+            search_results = [self._to_search_result(doc) for doc in documents]
 
             # Get total count
             total = (
@@ -82,16 +122,86 @@ class WeaviateRepository:
                 .get("count", 0)
             )
 
-            return SearchResponse(
+            response = SearchResponse(
                 results=search_results,
                 total=total_count,
                 took=(time.time() - start_time) * 1000,
             )
+            if query_vector is not None:
+                self.semantic_cache.add(query_vector, response, scope)
+            return response
 
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             raise
 
+    async def search_batch(self, queries: List[SearchQuery]) -> List[SearchResponse]:
+        """Perform many semantic searches with few round trips.
+
+        Queries are combined into GraphQL requests of aliased ``Get`` queries,
+        several of which run concurrently. Weaviate vectorizes all query texts
+        of a request server-side. The per-query match count is not aggregated,
+        so ``total`` is the number of returned results.
+
+        Args:
+            queries: Search parameters of every query
+
+        Returns:
+            List[SearchResponse]: Response of every query, in input order
+        """
+        start_time = time.time()
+        groups = [
+            range(start, min(start + QUERIES_PER_REQUEST, len(queries)))
+            for start in range(0, len(queries), QUERIES_PER_REQUEST)
+        ]
+
+        def run(group: range) -> List[List[Dict]]:
+            builders = [
+                self.client.query.get(self.collection, SEARCH_PROPERTIES)
+                .with_alias(f"q{i}")
+                .with_near_text({"concepts": [queries[i].query]})
+                .with_limit(queries[i].limit)
+                .with_offset(queries[i].offset)
+                .with_additional(["id", "score"])
+                for i in group
+            ]
+            result = self.client.query.multi_get(builders).do()
+            if result.get("errors"):
+                raise RuntimeError(f"Batch search failed: {result['errors']}")
+            data = result.get("data", {}).get("Get", {})
+            return [data.get(f"q{i}") or [] for i in group]
+
+        try:
+            if len(groups) <= 1:
+                grouped = [run(group) for group in groups]
+            else:
+                workers = min(BATCH_CONCURRENCY, len(groups))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    grouped = list(executor.map(run, groups))
+        except Exception as e:
+            logger.error(f"Batch search failed: {str(e)}")
+            raise
+
+        took = (time.time() - start_time) * 1000
+        responses = []
+        for documents in (documents for group in grouped for documents in group):
+            results = [self._to_search_result(doc) for doc in documents]
+            responses.append(SearchResponse(results=results, total=len(results), took=took))
+        return responses
+
+    @staticmethod
+    def _to_search_result(doc: Dict) -> SearchResult:
+        """Convert a Weaviate search hit into a SearchResult."""
+        return SearchResult(
+            id=doc.get("_additional", {}).get("id", ""),
+            title=doc.get("title", ""),
+            content=doc.get("content", ""),
+            file_path=doc.get("file_path", ""),
+            file_type=doc.get("file_type", ""),
+            metadata=json.loads(doc.get("metadata_json", "{}")),
+            score=doc.get("_additional", {}).get("score", 0.0),
+        )
+
     async def get_stats(self) -> Stats:
         """Get collection statistics.
 
@@ -210,6 +320,11 @@ class WeaviateRepository:
             logger.error(f"Filter failed: {str(e)}")
             raise
 
+    def _invalidate_semantic_cache(self) -> None:
+        """Drop cached search responses after the collection changed."""
+        if self.semantic_cache:
+            self.semantic_cache.clear()
+
     # New document operations
     async def index_single_document(self, document: Dict) -> str:
         """Index a single document.
@@ -230,6 +345,7 @@ class WeaviateRepository:
                 class_name=self.collection,
                 uuid=doc_id,
             )
+            self._invalidate_semantic_cache()
 
             return str(doc_id)
         except Exception as e:
@@ -274,6 +390,65 @@ class WeaviateRepository:
             logger.error(f"Failed to list documents: {str(e)}")
             raise
 
+    async def list_documents_page(
+        self, file_type: Optional[str] = None, limit: int = 10, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """List indexed documents with cursor pagination.
+
+        Every page costs the same regardless of its depth. Without a filter the
+        query pages with Weaviate's ``after`` cursor; since ``after`` cannot be
+        combined with where filters, filtered listings sort by ID and match IDs
+        greater than the last one seen.
+
+        Args:
+            file_type: Optional file type filter
+            limit: Maximum number of results
+            cursor: Token returned with the previous page, None for the first page
+
+        Returns:
+            Tuple of document metadata (each with its "id") and the cursor of
+            the next page, or None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = decode_cursor(cursor) if cursor else None
+        try:
+            query = self.client.query.get(
+                self.collection, ["title", "file_path", "file_type", "metadata"]
+            ).with_additional(["id"])
+
+            if file_type:
+                where = {
+                    "path": ["file_type"],
+                    "operator": "Equal",
+                    "valueString": file_type.lower(),
+                }
+                if after:
+                    where = {
+                        "operator": "And",
+                        "operands": [
+                            where,
+                            {"path": ["id"], "operator": "GreaterThan", "valueText": after},
+                        ],
+                    }
+                query = query.with_where(where).with_sort({"path": ["_id"], "order": "asc"})
+            elif after:
+                query = query.with_after(after)
+
+            result = query.with_limit(limit).do()
+
+            documents = []
+            for doc in result.get("data", {}).get("Get", {}).get(self.collection, []):
+                doc_id = doc.pop("_additional", {}).get("id", "")
+                documents.append({"id": doc_id, **doc})
+
+            next_cursor = encode_cursor(documents[-1]["id"]) if len(documents) == limit else None
+            return documents, next_cursor
+        except Exception as e:
+            logger.error(f"Failed to list documents: {str(e)}")
+            raise
+
     async def get_document(self, document_id: str) -> Optional[Dict]:
         """Get a specific document by ID.
 
@@ -320,6 +495,7 @@ class WeaviateRepository:
                 uuid=document_id,
                 class_name=self.collection,
             )
+            self._invalidate_semantic_cache()
             return True
         except Exception as e:
             logger.error(f"Failed to delete document {document_id}: {str(e)}")
@@ -2,9 +2,10 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Path, Query, Response, UploadFile
 from fastapi.responses import StreamingResponse
 
+from src.api.dependencies.semantic_cache import get_semantic_cache
 from src.api.dependencies.weaviate import get_weaviate_client
 from src.api.models.requests import DocumentFilter, DocumentUploadResponse
 from src.api.repositories.weaviate_repo import WeaviateRepository
@@ -15,32 +16,54 @@ router = APIRouter(prefix="/documents", tags=["documents"])
 
 def get_document_service(
     client=Depends(get_weaviate_client),
+    semantic_cache=Depends(get_semantic_cache),
 ) -> DocumentService:
     """Dependency injection for document service."""
-    repository = WeaviateRepository(client)
+    repository = WeaviateRepository(client, semantic_cache=semantic_cache)
     return DocumentService(repository)
 
 
 @router.get("/", response_model=List[dict])
 async def list_documents(
+    response: Response,
     file_type: Optional[str] = Query(None, description="Filter by file type (e.g., docx, pdf)"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of documents to return"),
     offset: int = Query(0, ge=0, description="Number of documents to skip"),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from the X-Next-Cursor header of the previous page"
+    ),
     service: DocumentService = Depends(get_document_service),
 ) -> List[dict]:
     """List indexed documents with optional filtering.
 
+    Without an offset, pages are fetched with a cursor and the token of the next
+    page is returned in the ``X-Next-Cursor`` header (absent on the last page).
+    Cursor pages cost the same at any depth; offsets are kept for compatibility.
+
     Args:
+        response: Outgoing response, used to set the cursor header
         file_type: Optional file type filter
         limit: Maximum number of results (default: 10)
         offset: Number of results to skip (default: 0)
+        cursor: Cursor token of the previous page
         service: Injected document service
 
     Returns:
         List of document metadata
     """
+    if cursor and offset:
+        raise HTTPException(status_code=400, detail="Use either cursor or offset, not both")
     try:
-        return await service.list_documents(file_type=file_type, limit=limit, offset=offset)
+        if offset:
+            return await service.list_documents(file_type=file_type, limit=limit, offset=offset)
+        documents, next_cursor = await service.list_documents_page(
+            file_type=file_type, limit=limit, cursor=cursor
+        )
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return documents
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -4,9 +4,10 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 
+from src.api.dependencies.semantic_cache import get_query_embedder, get_semantic_cache
 from src.api.dependencies.weaviate import get_weaviate_client
-from src.api.models.requests import DocumentFilter, SearchQuery
-from src.api.models.responses import SearchResponse, Stats
+from src.api.models.requests import BatchSearchQuery, DocumentFilter, SearchQuery
+from src.api.models.responses import BatchSearchResponse, SearchResponse, Stats
 from src.api.repositories.weaviate_repo import WeaviateRepository
 from src.api.services.search import SearchService
 
@@ -15,9 +16,11 @@ router = APIRouter(prefix="/search", tags=["search"])
 
 def get_search_service(
     client=Depends(get_weaviate_client),
+    semantic_cache=Depends(get_semantic_cache),
+    embed_query=Depends(get_query_embedder),
 ) -> SearchService:
     """Dependency injection for search service."""
-    repository = WeaviateRepository(client)
+    repository = WeaviateRepository(client, semantic_cache=semantic_cache, embed_query=embed_query)
     return SearchService(repository)
 
 
@@ -43,6 +46,26 @@ async def search_documents(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/batch", response_model=BatchSearchResponse)
+async def search_batch(
+    batch: BatchSearchQuery,
+    service: SearchService = Depends(get_search_service),
+) -> BatchSearchResponse:
+    """Search documents for many queries in one call.
+
+    Args:
+        batch: Search parameters of every query
+        service: Injected search service
+
+    Returns:
+        BatchSearchResponse with one response per query, in input order
+    """
+    try:
+        return await service.search_batch(batch)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/stats", response_model=Stats)
 async def get_stats(
     service: SearchService = Depends(get_search_service),
@@ -59,3 +82,18 @@ async def get_stats(
         return await service.get_stats()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache", response_model=dict)
+async def get_cache_stats(semantic_cache=Depends(get_semantic_cache)) -> dict:
+    """Get semantic cache statistics.
+
+    Args:
+        semantic_cache: Injected semantic cache, None if disabled
+
+    Returns:
+        Hit ratio and best-match similarity distribution of the semantic cache
+    """
+    if semantic_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **semantic_cache.stats()}
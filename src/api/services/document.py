@@ -1,7 +1,7 @@
 """Document service for orchestrating document operations."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import UploadFile
 from fastapi.responses import StreamingResponse
@@ -66,6 +66,21 @@ class DocumentService:
         """
         return await self._retrieval_service.list_documents(file_type, limit, offset)
 
+    async def list_documents_page(
+        self, file_type: Optional[str] = None, limit: int = 10, cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """List indexed documents with cursor pagination.
+
+        Args:
+            file_type: Optional file type filter
+            limit: Maximum number of results
+            cursor: Cursor token of the previous page, None for the first page
+
+        Returns:
+            Tuple of document metadata and the cursor of the next page, if any
+        """
+        return await self._retrieval_service.list_documents_page(file_type, limit, cursor)
+
     async def get_document(self, document_id: str) -> Optional[Dict]:
         """Get a specific document by ID.
 
@@ -2,7 +2,7 @@
 
 import logging
 import mimetypes
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import HTTPException, status
 from fastapi.responses import StreamingResponse
@@ -36,6 +36,21 @@ class DocumentRetrievalService:
         """
         return await self._repository.list_documents(file_type, limit, offset)
 
+    async def list_documents_page(
+        self, file_type: Optional[str], limit: int, cursor: Optional[str]
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """List indexed documents with cursor pagination.
+
+        Args:
+            file_type: Optional file type filter
+            limit: Maximum number of results
+            cursor: Cursor token of the previous page, None for the first page
+
+        Returns:
+            Tuple of document metadata and the cursor of the next page, if any
+        """
+        return await self._repository.list_documents_page(file_type, limit, cursor)
+
     async def get_document(self, document_id: str) -> Optional[Dict]:
         """Get a specific document by ID.
 
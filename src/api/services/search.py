@@ -1,10 +1,11 @@
 """Search service for document operations."""
 
 import logging
+import time
 from typing import Optional
 
-from src.api.models.requests import DocumentFilter, SearchQuery
-from src.api.models.responses import SearchResponse, Stats
+from src.api.models.requests import BatchSearchQuery, DocumentFilter, SearchQuery
+from src.api.models.responses import BatchSearchResponse, SearchResponse, Stats
 from src.api.repositories.weaviate_repo import WeaviateRepository
 
 logger = logging.getLogger(__name__)
@@ -47,6 +48,23 @@ class SearchService:
             logger.error(f"Search failed: {str(e)}")
             raise
 
+    async def search_batch(self, batch: BatchSearchQuery) -> BatchSearchResponse:
+        """Search documents for many queries at once.
+
+        Args:
+            batch: Search parameters of every query
+
+        Returns:
+            BatchSearchResponse with one response per query, in input order
+        """
+        start_time = time.time()
+        try:
+            responses = await self._repository.search_batch(batch.queries)
+            return BatchSearchResponse(responses=responses, took=(time.time() - start_time) * 1000)
+        except Exception as e:
+            logger.error(f"Batch search failed: {str(e)}")
+            raise
+
     async def get_stats(self) -> Stats:
         """Get collection statistics.
 
@@ -7,7 +7,7 @@ and conversion into a standardized document format suitable for further processi
 
 import sys
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
 import pandas as pd
 from bs4 import BeautifulSoup
@@ -59,7 +59,21 @@ class NotionConnector:
                 print(f"Loaded table {table_name} with {len(df)} rows")
             ```
         """
-        csv_files = {}
+        return dict(self.iter_csv_files())
+
+    def iter_csv_files(self) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """Lazily load and validate CSV files from the Notion export directory.
+
+        Yields one table at a time so that callers can stream large exports
+        without holding every DataFrame in memory. Validation is the same as
+        in ``load_csv_files``.
+
+        Yields:
+            Tuple[str, pd.DataFrame]: File stem and DataFrame of each CSV file.
+
+        Raises:
+            pd.errors.EmptyDataError: If a CSV file is empty or malformed.
+        """
         for csv_file in self.export_path.glob("**/*.csv"):
             # Skip the _all files as they're duplicates
             if not csv_file.name.endswith("_all.csv"):
@@ -104,7 +118,7 @@ class NotionConnector:
                         escapechar="\\",
                         skip_blank_lines=True,
                     )
-                    csv_files[csv_file.stem] = df
+                    yield csv_file.stem, df
 
                 except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
                     # Convert all parsing errors to EmptyDataError as expected by tests
@@ -113,8 +127,6 @@ class NotionConnector:
                     print(f"Error reading CSV file {csv_file}: {str(e)}")
                     continue
 
-        return csv_files
-
     def _read_file_with_fallback(self, file_path: Path, strict: bool = False) -> str:
         """Read file content with encoding fallback mechanism.
 
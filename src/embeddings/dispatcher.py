@@ -0,0 +1,280 @@
+"""Concurrent, rate-limit-aware dispatch of embedding requests.
+
+This module keeps several embedding requests in flight at once while staying
+within the provider's requests-per-minute and tokens-per-minute quotas. Quotas
+are enforced client-side with token buckets, and rate-limit (HTTP 429) responses
+trigger an adaptive backoff shared by all workers, so a throttled provider sees
+the whole client slow down instead of a burst of immediate retries.
+
+Classes:
+    TokenBucket: Thread-safe token bucket refilled at a per-minute rate.
+    EmbeddingDispatcher: Runs requests concurrently under rate limits.
+
+Example:
+    ```python
+    dispatcher = EmbeddingDispatcher(
+        max_concurrency=8,
+        requests_per_minute=3000,
+        tokens_per_minute=1_000_000,
+    )
+    results = dispatcher.map(
+        lambda batch: dispatcher.call(embed, batch, tokens=count_tokens(batch)), batches
+    )
+    ```
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an error, or any error it wraps, is a rate-limit response.
+
+    Args:
+        error: Raised exception.
+
+    Returns:
+        bool: True if the error chain contains an HTTP 429 response.
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if getattr(current, "status_code", None) == 429:
+            return True
+        response = getattr(current, "response", None)
+        if getattr(response, "status_code", None) == 429:
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _retry_after(error: BaseException) -> Optional[float]:
+    """Extract a Retry-After delay in seconds from an error chain, if present."""
+    current: Optional[BaseException] = error
+    while current is not None:
+        headers = getattr(getattr(current, "response", None), "headers", None)
+        if headers:
+            try:
+                value = headers.get("retry-after") or headers.get("Retry-After")
+                if value is not None:
+                    return max(0.0, float(value))
+            except (TypeError, ValueError):
+                pass
+        current = current.__cause__
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at a per-minute rate.
+
+    Attributes:
+        rate_per_minute (float): Tokens added per minute.
+        capacity (float): Maximum number of tokens held.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute.
+            capacity: Maximum tokens held. Defaults to one minute of tokens.
+
+        Raises:
+            ValueError: If the rate is not positive.
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate_per_minute / 60.0
+        )
+        self._updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """Take tokens from the bucket, blocking until enough are available.
+
+        Requests larger than the capacity wait for a full bucket and then
+        drain it, so oversized requests are still admitted.
+
+        Args:
+            amount: Number of tokens to take.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        amount = min(float(amount), self.capacity)
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) * 60.0 / self.rate_per_minute
+            time.sleep(delay)
+            waited += delay
+
+
+class EmbeddingDispatcher:
+    """Runs embedding requests concurrently under rate limits.
+
+    Attributes:
+        max_concurrency (int): Maximum number of requests in flight.
+        request_bucket (Optional[TokenBucket]): Requests-per-minute limiter.
+        token_bucket (Optional[TokenBucket]): Tokens-per-minute limiter.
+        max_retries (int): Maximum retries of a rate-limited request.
+        initial_backoff (float): First backoff delay in seconds after a 429.
+        max_backoff (float): Upper bound of the backoff delay in seconds.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 6,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight.
+            requests_per_minute: Optional request quota per minute.
+            tokens_per_minute: Optional token quota per minute.
+            max_retries: Maximum retries of a rate-limited request.
+            initial_backoff: First backoff delay in seconds after a 429.
+            max_backoff: Upper bound of the backoff delay in seconds.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.request_bucket = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+
+        self._backoff = 0.0
+        self._cooldown_until = 0.0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _wait_for_cooldown(self) -> None:
+        """Block while a shared rate-limit cooldown is active."""
+        while True:
+            with self._lock:
+                remaining = self._cooldown_until - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
+    def _on_rate_limited(self, error: BaseException) -> float:
+        """Grow the shared backoff and start a cooldown for all workers."""
+        with self._lock:
+            self._backoff = min(self.max_backoff, max(self.initial_backoff, self._backoff * 2))
+            delay = _retry_after(error)
+            if delay is None:
+                delay = self._backoff * (0.5 + random.random() / 2)
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + delay)
+            return delay
+
+    def _on_success(self) -> None:
+        """Decay the shared backoff after a successful request."""
+        with self._lock:
+            self._backoff /= 2
+            if self._backoff < self.initial_backoff / 8:
+                self._backoff = 0.0
+
+    def call(self, func: Callable[..., Any], *args, tokens: int = 0, **kwargs) -> Any:
+        """Call a request function under the rate limits.
+
+        Args:
+            func: Function issuing one API request.
+            *args: Positional arguments for ``func``.
+            tokens: Number of tokens the request consumes.
+            **kwargs: Keyword arguments for ``func``.
+
+        Returns:
+            Any: Result of ``func``.
+
+        Raises:
+            Exception: The last error if the request is still rate limited after
+                ``max_retries`` retries, or any other error raised by ``func``.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._wait_for_cooldown()
+            if self.request_bucket:
+                self.request_bucket.acquire(1)
+            if self.token_bucket and tokens:
+                self.token_bucket.acquire(tokens)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                delay = self._on_rate_limited(e)
+                logger.warning(
+                    f"Rate limited, backing off {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                continue
+            self._on_success()
+            return result
+
+    def map(self, func: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+        """Run ``func`` over items with up to ``max_concurrency`` in flight.
+
+        Args:
+            func: Function applied to each item.
+            items: Items to process.
+
+        Returns:
+            List[Any]: Results in input order.
+
+        Raises:
+            Exception: The first error raised by ``func``, after all items finish.
+        """
+        if len(items) <= 1 or self.max_concurrency == 1:
+            return [func(item) for item in items]
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_concurrency, thread_name_prefix="embedding"
+                )
+            executor = self._executor
+        futures = [executor.submit(func, item) for item in items]
+
+        results, first_error = [], None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                first_error = first_error or e
+                results.append(None)
+        if first_error is not None:
+            raise first_error
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
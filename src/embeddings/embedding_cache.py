@@ -0,0 +1,103 @@
+"""Content-addressed cache for chunk embeddings.
+
+This module stores embedding vectors under keys derived from the model, the
+requested dimensionality and the exact chunk text, so unchanged chunks are never
+sent to the embedding API twice. Lookups and writes for a whole batch go through
+``CacheManager.get_many`` and ``CacheManager.set_many`` (one ``MGET`` and one
+pipelined ``SETEX``), which serve hot vectors from the in-process tier and count
+every lookup in the cache statistics. Vectors are stored with the ``float32``
+codec rather than as pickled lists.
+
+Classes:
+    EmbeddingCache: Bulk get/set of embedding vectors keyed by chunk content.
+
+Example:
+    ```python
+    cache = EmbeddingCache(cache_manager, model="text-embedding-3-small")
+    vectors = cache.get_many(["first chunk", "second chunk"])
+    cache.set_many(["second chunk"], [[0.1, 0.2, 0.3]])
+    ```
+"""
+
+import hashlib
+import logging
+from typing import List, Optional, Sequence
+
+from src.utils.cache_manager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """Bulk cache of embedding vectors keyed by hash(model, dimensions, text).
+
+    Attributes:
+        cache_manager (CacheManager): Cache manager storing the vectors.
+        model (str): Embedding model identifier included in every key.
+        dimensions (Optional[int]): Requested dimensionality included in every key.
+        ttl (int): Time-to-live in seconds for stored vectors.
+    """
+
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        model: str,
+        dimensions: Optional[int] = None,
+        ttl: Optional[int] = None,
+    ):
+        """Initialize the embedding cache.
+
+        Args:
+            cache_manager: Cache manager storing the vectors.
+            model: Embedding model identifier.
+            dimensions: Requested embedding dimensionality, if any.
+            ttl: Optional TTL in seconds. Defaults to the cache manager's default TTL.
+        """
+        self.cache_manager = cache_manager
+        self.model = model
+        self.dimensions = dimensions
+        self.ttl = ttl if ttl is not None else cache_manager.default_ttl
+
+    def key_for(self, text: str) -> str:
+        """Build the cache key of a chunk of text, without the manager's prefix.
+
+        Args:
+            text: Chunk text.
+
+        Returns:
+            str: Cache key.
+        """
+        digest = hashlib.sha256(
+            f"{self.model}\x00{self.dimensions}\x00{text}".encode("utf-8")
+        ).hexdigest()
+        return f"chunk:{digest}"
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Look up the vectors of several texts in one round trip.
+
+        Args:
+            texts: Chunk texts to look up.
+
+        Returns:
+            List[Optional[List[float]]]: Cached vector per text, or ``None`` on a miss.
+        """
+        if not texts:
+            return []
+        vectors = self.cache_manager.get_many([self.key_for(text) for text in texts])
+        logger.debug(f"Embedding cache hits: {sum(v is not None for v in vectors)}/{len(texts)}")
+        return vectors
+
+    def set_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> bool:
+        """Store the vectors of several texts in one pipelined round trip.
+
+        Args:
+            texts: Chunk texts.
+            vectors: Vectors to store, aligned with ``texts``.
+
+        Returns:
+            bool: True if the vectors were written, False otherwise.
+        """
+        if not texts:
+            return False
+        items = {self.key_for(text): vector for text, vector in zip(texts, vectors)}
+        return self.cache_manager.set_many(items, self.ttl, codec="float32")
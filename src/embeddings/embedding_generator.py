@@ -3,14 +3,25 @@
 This module provides functionality for generating embeddings from document text using OpenAI's
 embedding models. It supports text chunking, caching, and both body and summary embeddings
 generation with configurable parameters.
+
+Chunk vectors are cached by content (model, dimensions and chunk text), so reruns over
+mostly unchanged documents only send new or modified chunks to the API.
+
+Chunks from many documents can be packed into a single embeddings request with
+``generate_embeddings_batch``; requests are bounded by an item count and a token budget,
+and vectors are scattered back to their documents and chunk positions. Batched requests
+are dispatched concurrently within optional requests-per-minute and tokens-per-minute
+budgets, backing off adaptively when the provider responds with HTTP 429.
 """
 
 import logging
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from openai import OpenAI
 
+from src.embeddings.dispatcher import EmbeddingDispatcher, is_rate_limit_error
+from src.embeddings.embedding_cache import EmbeddingCache
 from src.utils.cache_manager import CacheManager
 from src.utils.chunking import ChunkingConfig
 
@@ -30,6 +41,11 @@ class EmbeddingGenerator:
         chunking_config (ChunkingConfig): Configuration for text chunking.
         client (OpenAI): OpenAI client instance for API calls.
         cache_manager (CacheManager): Manager for caching embeddings.
+        embedding_cache (Optional[EmbeddingCache]): Content-addressed chunk vector cache.
+        batch_size (int): Maximum number of texts per batched embeddings request.
+        max_batch_tokens (int): Maximum number of tokens per batched embeddings request.
+        dispatcher (EmbeddingDispatcher): Concurrency and rate-limit control for batched
+            requests.
     """
 
     def __init__(
@@ -43,6 +59,12 @@ class EmbeddingGenerator:
         cache_port: int = 6379,
         cache_ttl: int = 86400,
         client: Optional[OpenAI] = None,
+        batch_size: int = 128,
+        max_batch_tokens: int = 100_000,
+        cache_embeddings: bool = True,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
     ):
         """Initialize the embedding generator with specified configuration.
 
@@ -56,6 +78,14 @@ class EmbeddingGenerator:
             cache_port: Redis cache port number (default: 6379).
             cache_ttl: Cache time-to-live in seconds (default: 86400).
             client: Optional pre-configured OpenAI client instance.
+            batch_size: Maximum number of texts sent in one embeddings request (default: 128).
+            max_batch_tokens: Maximum total tokens sent in one embeddings request
+                (default: 100000).
+            cache_embeddings: Whether batched embedding reads and writes chunk vectors
+                through the cache (default: True).
+            max_concurrency: Maximum number of batched requests in flight (default: 4).
+            requests_per_minute: Optional request quota enforced client-side.
+            tokens_per_minute: Optional token quota enforced client-side.
 
         Example:
             ```python
@@ -70,6 +100,12 @@ class EmbeddingGenerator:
         logger.info(f"Initializing EmbeddingGenerator with model={model}, chunk_size={chunk_size}")
         self.model = model
         self.dimensions = dimensions
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_batch_tokens < 1:
+            raise ValueError("max_batch_tokens must be at least 1")
+        self.batch_size = batch_size
+        self.max_batch_tokens = max_batch_tokens
         try:
             self.chunking_config = ChunkingConfig(
                 chunk_size=chunk_size,
@@ -89,6 +125,16 @@ class EmbeddingGenerator:
             prefix="emb",
             default_ttl=cache_ttl,
         )
+        self.embedding_cache = (
+            EmbeddingCache(self.cache_manager, model=model, dimensions=dimensions)
+            if cache_embeddings
+            else None
+        )
+        self.dispatcher = EmbeddingDispatcher(
+            max_concurrency=max_concurrency,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
         logger.info("EmbeddingGenerator initialization complete")
 
     def _normalize_l2(self, x: Union[List[float], np.ndarray]) -> np.ndarray:
@@ -179,11 +225,235 @@ class EmbeddingGenerator:
             logger.error(error_msg, exc_info=True)
             raise Exception(error_msg) from e
 
+    def _get_embeddings(self, texts: Sequence[str]) -> List[List[float]]:
+        """Generate embeddings for several text segments in one API call.
+
+        Args:
+            texts: Input texts to generate embeddings for.
+
+        Returns:
+            List[List[float]]: One embedding vector per input text, in input order.
+
+        Raises:
+            Exception: If the API call fails or returns an unexpected number of vectors.
+        """
+        try:
+            if not all(isinstance(text, str) for text in texts):
+                raise ValueError("Invalid input type: texts must be strings")
+
+            logger.debug(f"Generating embeddings for batch of {len(texts)} texts")
+            response = self.client.embeddings.create(
+                model=self.model,
+                input=list(texts),
+                dimensions=self.dimensions,
+                encoding_format="float",
+            )
+            data = sorted(response.data, key=lambda item: item.index)
+            if len(data) != len(texts):
+                raise ValueError(f"Expected {len(texts)} embeddings, received {len(data)}")
+
+            embeddings = [item.embedding for item in data]
+            if self.dimensions:
+                embeddings = self._normalize_l2(embeddings).tolist()
+
+            return embeddings
+
+        except Exception as e:
+            error_msg = f"Error generating batch embeddings: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
+    def _plan_batches(self, token_counts: Sequence[int]) -> List[List[int]]:
+        """Pack text positions into request batches.
+
+        Texts are packed greedily in input order. A batch is closed when adding the
+        next text would exceed ``batch_size`` items or ``max_batch_tokens`` tokens.
+        A single text larger than the token budget is sent in a batch of its own.
+
+        Args:
+            token_counts: Token count of each text.
+
+        Returns:
+            List[List[int]]: Positions of the texts belonging to each batch.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for position, tokens in enumerate(token_counts):
+            if current and (
+                len(current) >= self.batch_size or current_tokens + tokens > self.max_batch_tokens
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(position)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _embed_batch(
+        self,
+        texts: Sequence[str],
+        positions: List[int],
+        results: List[Optional[List[float]]],
+        token_counts: Sequence[int],
+    ) -> None:
+        """Embed one batch, splitting it and retrying only the halves that fail.
+
+        The request goes through the dispatcher, which enforces the rate limits and
+        retries rate-limited responses with backoff. Any other failed request is
+        bisected until the failing texts are isolated, so one bad input cannot
+        discard the vectors of the rest of its batch. Texts that still fail on their
+        own are left as ``None`` in ``results``.
+
+        Args:
+            texts: All texts of the current run.
+            positions: Positions in ``texts`` belonging to this batch.
+            results: Output list, filled in place at ``positions``.
+            token_counts: Token count of each text in ``texts``.
+        """
+        try:
+            vectors = self.dispatcher.call(
+                self._get_embeddings,
+                [texts[p] for p in positions],
+                tokens=sum(token_counts[p] for p in positions),
+            )
+        except Exception as e:
+            if len(positions) == 1 or is_rate_limit_error(e):
+                logger.error(f"Failed to generate embeddings for {len(positions)} texts: {str(e)}")
+                return
+            middle = len(positions) // 2
+            logger.warning(
+                f"Embedding batch of {len(positions)} texts failed, "
+                f"retrying as batches of {middle} and {len(positions) - middle}"
+            )
+            self._embed_batch(texts, positions[:middle], results, token_counts)
+            self._embed_batch(texts, positions[middle:], results, token_counts)
+            return
+
+        for position, vector in zip(positions, vectors):
+            results[position] = vector
+
+    def embed_texts(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Generate embeddings for many texts using the cache and batched requests.
+
+        Cached vectors are resolved with a single bulk lookup; only the distinct texts
+        that miss are sent to the API, and their vectors are written back in one
+        pipelined round trip.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            List[Optional[List[float]]]: One vector per text in input order, or ``None``
+                for texts whose embedding could not be generated.
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        if not texts:
+            return results
+
+        cached = (
+            self.embedding_cache.get_many(texts) if self.embedding_cache else [None] * len(texts)
+        )
+        pending: Dict[str, List[int]] = {}
+        for position, (text, vector) in enumerate(zip(texts, cached)):
+            if vector is not None:
+                results[position] = vector
+            else:
+                pending.setdefault(text, []).append(position)
+
+        hits = len(texts) - sum(len(positions) for positions in pending.values())
+        logger.info(f"Embedding cache resolved {hits}/{len(texts)} texts")
+        if not pending:
+            return results
+
+        missing = list(pending)
+        vectors: List[Optional[List[float]]] = [None] * len(missing)
+        token_counts = [self.chunking_config.count_tokens(text) for text in missing]
+        batches = self._plan_batches(token_counts)
+        logger.info(f"Embedding {len(missing)} texts in {len(batches)} batched requests")
+        self.dispatcher.map(
+            lambda positions: self._embed_batch(missing, positions, vectors, token_counts),
+            batches,
+        )
+
+        embedded_texts, embedded_vectors = [], []
+        for text, vector in zip(missing, vectors):
+            if vector is None:
+                continue
+            for position in pending[text]:
+                results[position] = vector
+            embedded_texts.append(text)
+            embedded_vectors.append(vector)
+
+        if self.embedding_cache and embedded_texts:
+            self.embedding_cache.set_many(embedded_texts, embedded_vectors)
+
+        return results
+
+    def _build_embeddings(
+        self,
+        chunks: List[str],
+        chunk_vectors: List[Optional[List[float]]],
+        summary_embedding: Optional[List[float]],
+    ) -> Dict:
+        """Build the embeddings entry of a document from its chunk and summary vectors.
+
+        Args:
+            chunks: Text chunks of the document body.
+            chunk_vectors: Embedding of every chunk, aligned with ``chunks``; None
+                for chunks whose embedding failed.
+            summary_embedding: Embedding of the document summary, if any.
+
+        Returns:
+            Dict: Embedding information to merge into ``doc["embeddings"]``. Chunks
+                whose embedding failed are left out of the chunk texts and vectors.
+        """
+        embedded = [(chunk, vector) for chunk, vector in zip(chunks, chunk_vectors) if vector]
+        chunk_embeddings = [vector for _, vector in embedded]
+        if chunk_embeddings:
+            # Normalize each chunk embedding, then average them
+            embeddings_array = np.array(chunk_embeddings, dtype=np.float64)
+            normalized_embeddings = self._normalize_l2(embeddings_array)
+            body_embedding = np.mean(normalized_embeddings, axis=0).tolist()
+        else:
+            body_embedding = []
+
+        return {
+            "body": body_embedding,
+            "summary": summary_embedding,
+            "version": "v1",
+            "model": self.model,
+            "chunks": (
+                {"texts": [chunk for chunk, _ in embedded], "vectors": chunk_embeddings}
+                if len(chunks) > 1
+                else None
+            ),
+        }
+
+    def _failed_embeddings(self, error: Exception) -> Dict:
+        """Build the embeddings entry recorded for a document that failed.
+
+        Args:
+            error: The error that caused the failure.
+
+        Returns:
+            Dict: Embedding information to merge into ``doc["embeddings"]``.
+        """
+        return {
+            "body": [],
+            "summary": None,
+            "version": "v1_failed",
+            "model": self.model,
+            "error": f"Failed to generate embeddings: {str(error)}",
+        }
+
     def cleanup(self):
         """Clean up resources used by the embedding generator.
 
         Performs cleanup operations including:
         - Closing the cache manager connection
+        - Stopping the request dispatcher threads
         - Cleaning up the OpenAI client
         - Logging cleanup status
 
@@ -194,6 +464,8 @@ class EmbeddingGenerator:
             if self.cache_manager:
                 self.cache_manager.cleanup()
 
+            self.dispatcher.close()
+
             if hasattr(self, "client"):
                 self.client.close()
 
@@ -270,24 +542,13 @@ class EmbeddingGenerator:
                         chunk_embeddings.append(embedding)
                     except Exception as e:
                         logger.error(f"Failed to generate embedding for chunk {i+1}: {str(e)}")
+                        chunk_embeddings.append(None)
                         failed_chunks += 1
 
                 if failed_chunks == len(chunks):
                     logger.error("All chunks failed embedding generation")
                     raise Exception("Failed to generate embeddings for all chunks")
 
-                # Average chunk embeddings if multiple chunks
-                logger.debug(f"Averaging {len(chunk_embeddings)} chunk embeddings")
-                if chunk_embeddings:
-                    # Convert to numpy array and ensure float64 precision
-                    embeddings_array = np.array(chunk_embeddings, dtype=np.float64)
-                    # Normalize each chunk embedding
-                    normalized_embeddings = self._normalize_l2(embeddings_array)
-                    # Average the normalized embeddings
-                    body_embedding = np.mean(normalized_embeddings, axis=0).tolist()
-                else:
-                    body_embedding = []
-
                 # Process summary if available
                 summary_text = doc["content"].get("summary")
                 try:
@@ -299,34 +560,104 @@ class EmbeddingGenerator:
                     summary_embedding = None
 
                 # Update document with embeddings
+                logger.debug(f"Averaging {len(chunks) - failed_chunks} chunk embeddings")
                 doc["embeddings"].update(
-                    {
-                        "body": body_embedding,
-                        "summary": summary_embedding,
-                        "version": "v1",
-                        "model": self.model,
-                        "chunks": (
-                            {"texts": chunks, "vectors": chunk_embeddings}
-                            if len(chunks) > 1
-                            else None
-                        ),
-                    }
+                    self._build_embeddings(chunks, chunk_embeddings, summary_embedding)
                 )
                 logger.info("Successfully processed document")
 
             except Exception as e:
                 logger.error(f"Error processing document: {str(e)}", exc_info=True)
-                doc["embeddings"].update(
-                    {
-                        "body": [],
-                        "summary": None,
-                        "version": "v1_failed",
-                        "model": self.model,
-                        "error": f"Failed to generate embeddings: {str(e)}",
-                    }
-                )
+                doc["embeddings"].update(self._failed_embeddings(e))
 
             processed_docs.append(doc)
 
         logger.info(f"Completed processing {len(documents)} documents")
         return processed_docs
+
+    def generate_embeddings_batch(self, documents: List[Dict]) -> List[Dict]:
+        """Generate embeddings for a batch of documents using batched API requests.
+
+        Produces the same document structure as ``generate_embeddings``, but packs the
+        body chunks and summaries of all documents into as few embeddings requests as
+        the ``batch_size`` and ``max_batch_tokens`` limits allow, then scatters the
+        vectors back to their documents and chunk positions.
+
+        Args:
+            documents: List of document dictionaries containing content and metadata.
+
+        Returns:
+            List[Dict]: Documents with added embedding information, in input order.
+                Documents whose chunks all failed are marked with version ``v1_failed``.
+
+        Example:
+            ```python
+            processed_docs = generator.generate_embeddings_batch(docs)
+            ```
+        """
+        from src.utils.chunking.base import chunk_text_by_tokens
+
+        logger.info(f"Processing {len(documents)} documents in batched mode")
+
+        texts: List[str] = []
+        # (document position, chunk position or None for the summary) per text
+        owners: List[Tuple[int, Optional[int]]] = []
+        doc_chunks: Dict[int, List[str]] = {}
+        errors: Dict[int, Exception] = {}
+
+        for doc_pos, doc in enumerate(documents):
+            try:
+                body_text = doc["content"].get("body", "")
+                if not body_text:
+                    logger.warning("Document has no body text")
+                    raise ValueError("Document has no body text")
+                chunks = chunk_text_by_tokens(body_text, self.chunking_config)
+            except Exception as e:
+                errors[doc_pos] = e
+                continue
+
+            doc_chunks[doc_pos] = chunks
+            for chunk_pos, chunk in enumerate(chunks):
+                texts.append(chunk)
+                owners.append((doc_pos, chunk_pos))
+
+            summary_text = doc["content"].get("summary")
+            if summary_text:
+                texts.append(summary_text)
+                owners.append((doc_pos, None))
+
+        vectors = self.embed_texts(texts)
+
+        chunk_vectors: Dict[int, List[Optional[List[float]]]] = {
+            doc_pos: [None] * len(chunks) for doc_pos, chunks in doc_chunks.items()
+        }
+        summary_vectors: Dict[int, Optional[List[float]]] = {}
+        for (doc_pos, chunk_pos), vector in zip(owners, vectors):
+            if chunk_pos is None:
+                summary_vectors[doc_pos] = vector
+            else:
+                chunk_vectors[doc_pos][chunk_pos] = vector
+
+        for doc_pos, doc in enumerate(documents):
+            if doc_pos in errors:
+                logger.error(f"Error processing document: {str(errors[doc_pos])}")
+                doc.setdefault("embeddings", {}).update(self._failed_embeddings(errors[doc_pos]))
+                continue
+
+            if not any(v is not None for v in chunk_vectors[doc_pos]):
+                logger.error("All chunks failed embedding generation")
+                doc.setdefault("embeddings", {}).update(
+                    self._failed_embeddings(
+                        Exception("Failed to generate embeddings for all chunks")
+                    )
+                )
+                continue
+
+            doc.setdefault("embeddings", {}).update(
+                self._build_embeddings(
+                    doc_chunks[doc_pos], chunk_vectors[doc_pos], summary_vectors.get(doc_pos)
+                )
+            )
+
+        logger.info(f"Completed batched processing of {len(documents)} documents")
+        return documents
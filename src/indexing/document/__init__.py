@@ -38,10 +38,22 @@ Components:
     - DocumentStorage: Main interface for document operations
     - DocumentProcessor: Handles document validation and preparation
     - BatchManager: Manages batched operations for performance
+    - BulkWriter: Writes batches with concurrent requests and per-object retries
+    - IndexSnapshot: Saves and restores a class with its vectors
 """
 
 from .batch_manager import BatchManager
+from .bulk_writer import BulkWriter, BulkWriteStats
 from .document_processor import DocumentProcessor
 from .document_storage import DocumentStorage
-
-__all__ = ["DocumentStorage", "DocumentProcessor", "BatchManager"]
+from .snapshot import IndexSnapshot, SnapshotManifest
+
+__all__ = [
+    "DocumentStorage",
+    "DocumentProcessor",
+    "BatchManager",
+    "BulkWriter",
+    "BulkWriteStats",
+    "IndexSnapshot",
+    "SnapshotManifest",
+]
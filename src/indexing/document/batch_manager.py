@@ -2,7 +2,8 @@
 
 This module provides functionality for managing batched document operations in Weaviate,
 including batch creation, document addition, error handling, and cleanup. It optimizes
-document insertion by grouping multiple documents into batches for better performance.
+document insertion by grouping multiple documents into batches that are written by a
+parallel bulk writer and flushed explicitly.
 """
 
 import logging
@@ -10,6 +11,8 @@ from typing import Dict, List
 
 import weaviate
 
+from .bulk_writer import BulkWriter, BulkWriteStats
+
 
 class BatchManager:
     """Manages batched document operations in Weaviate.
@@ -23,7 +26,7 @@ class BatchManager:
         class_name (str): Name of the document class in Weaviate.
         batch_size (int): Maximum number of documents per batch.
         test_mode (bool): Whether running in test mode.
-        _current_batch: Current batch context manager.
+        writer (BulkWriter): Parallel writer that sends the batches.
         logger (logging.Logger): Logger instance for this class.
     """
 
@@ -33,6 +36,8 @@ class BatchManager:
         class_name: str,
         batch_size: int,
         test_mode: bool = False,
+        num_workers: int = 4,
+        max_batch_bytes: int = 8 * 1024 * 1024,
     ):
         """Initialize the batch manager with specified configuration.
 
@@ -44,6 +49,8 @@ class BatchManager:
             class_name: Name of the document class in Weaviate.
             batch_size: Maximum number of documents per batch operation.
             test_mode: Whether to run in test mode (disables error callbacks).
+            num_workers: Number of concurrent batch requests (default: 4).
+            max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB).
 
         Example:
             ```python
@@ -60,16 +67,22 @@ class BatchManager:
         self.class_name = class_name
         self.batch_size = batch_size
         self.test_mode = test_mode
-        self._current_batch = None
+        self.writer = BulkWriter(
+            client,
+            class_name,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+            num_workers=num_workers,
+        )
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
 
     def add_document(self, properties: Dict, vector: List[float], doc_id: str) -> None:
-        """Add a document to the current batch for processing.
+        """Queue a document for the next batch write.
 
-        Adds a document with its properties and vector to the current batch. If no
-        batch exists, creates a new one. Handles batch configuration and provides
-        detailed logging for debugging.
+        Adds a document with its properties and vector to the bulk writer. Full
+        batches are sent in the background; call ``flush()`` to wait until every
+        queued document is written.
 
         Args:
             properties: Document properties dictionary to store.
@@ -77,8 +90,7 @@ class BatchManager:
             doc_id: UUID string for the document.
 
         Raises:
-            ValueError: If the document ID is not a valid UUID.
-            Exception: For any other errors during document addition.
+            Exception: For any errors during document addition.
 
         Example:
             ```python
@@ -89,37 +101,38 @@ class BatchManager:
             vector = [0.1, 0.2, 0.3]
             doc_id = "123e4567-e89b-12d3-a456-426614174000"
             batch_mgr.add_document(properties, vector, doc_id)
+            failed = batch_mgr.flush()
             ```
         """
         try:
-            self.logger.debug(f"Attempting to add document with ID: {doc_id}")
-            self.logger.debug(f"Document properties: {properties}")
-            self.logger.debug(f"Vector length: {len(vector) if vector else 'None'}")
-
-            if self._current_batch is None:
-                self.logger.debug("Creating new batch")
-                self._current_batch = self.client.batch.configure(
-                    batch_size=self.batch_size,
-                    callback=self._on_batch_error if not self.test_mode else None,
-                )
-                self._current_batch.__enter__()
-
-            self._current_batch.add_data_object(
-                data_object=properties,
-                class_name=self.class_name,
-                uuid=doc_id,
-                vector=vector,
-            )
-            self.logger.debug(f"Successfully added document {doc_id} to batch")
-        except ValueError as ve:
-            self.logger.error(f"UUID validation error for document {doc_id}: {str(ve)}")
-            self.logger.error(f"UUID type: {type(doc_id)}, value: {doc_id}")
-            raise
+            self.logger.debug(f"Queueing document with ID: {doc_id}")
+            self.writer.add(properties, vector, doc_id)
         except Exception as e:
             self.logger.error(f"Error adding document {doc_id}: {str(e)}", exc_info=True)
-            self.logger.error(f"Document properties that caused error: {properties}")
             raise
 
+    def flush(self) -> Dict[str, str]:
+        """Write all queued documents.
+
+        Returns:
+            Dict[str, str]: Error message of every document that could not be
+                written after retries, keyed by document ID.
+        """
+        failed = self.writer.flush()
+        if failed and not self.test_mode:
+            self._on_batch_error(
+                [
+                    {"id": doc_id, "result": {"errors": {"error": [{"message": message}]}}}
+                    for doc_id, message in failed.items()
+                ]
+            )
+        return failed
+
+    @property
+    def stats(self) -> BulkWriteStats:
+        """Throughput and latency statistics of the bulk writer."""
+        return self.writer.stats
+
     def _on_batch_error(self, batch_results: List[Dict]) -> None:
         """Handle errors that occur during batch operations.
 
@@ -128,32 +141,21 @@ class BatchManager:
 
         Args:
             batch_results: List of results from the batch operation, each containing:
+                - id: ID of the object that failed
                 - result: Operation result including any errors
-                - object: The object that caused the error
 
         Note:
-            This method is called automatically by Weaviate's batch processor
-            when an error occurs during batch processing.
+            This method is called by ``flush()`` for documents that still
+            failed after all retries.
         """
         for result in batch_results:
             if "result" in result and "errors" in result["result"]:
                 self.logger.error(f"Batch operation error: {result['result']['errors']}")
-                self.logger.error(f"Failed object: {result.get('object', 'Unknown object')}")
-
-    def __del__(self):
-        """Clean up batch context and resources.
+                self.logger.error(f"Failed object: {result.get('id', 'Unknown object')}")
 
-        Ensures proper cleanup of the batch context when the BatchManager
-        instance is destroyed. Handles any errors during cleanup and logs
-        them appropriately.
-
-        Note:
-            This method is called automatically when the BatchManager
-            instance is garbage collected.
-        """
+    def close(self) -> None:
+        """Write queued documents and stop the writer threads."""
         try:
-            if self._current_batch is not None:
-                self.logger.debug("Cleaning up batch context")
-                self._current_batch.__exit__(None, None, None)
+            self.writer.close()
         except Exception as e:
-            self.logger.error(f"Error cleaning up batch context: {str(e)}", exc_info=True)
+            self.logger.error(f"Error closing bulk writer: {str(e)}", exc_info=True)
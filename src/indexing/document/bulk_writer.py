@@ -0,0 +1,348 @@
+"""Parallel bulk writer for Weaviate.
+
+This module provides a writer that groups objects into batches bounded by object
+count and payload size, sends them to the Weaviate batch endpoint from several
+worker threads, and re-queues only the objects the server reported as failed.
+Flushes are explicit, and every flush reports throughput and latency statistics.
+
+Note:
+    The v3 client only batches through ``client.batch``, whose shared buffer
+    cannot be used from several threads. Requests are therefore posted through
+    the client connection by ``BatchTransport``, which checks the client version
+    when the writer is created.
+"""
+
+import json
+import logging
+import math
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+import weaviate
+
+# Path of the Weaviate batch objects endpoint, relative to the API root
+BATCH_OBJECTS_PATH = "/batch/objects"
+
+# Number of most recent request latencies kept for percentiles
+LATENCY_WINDOW = 10000
+
+# Major version of weaviate-client whose connection API the transport relies on
+SUPPORTED_CLIENT_MAJOR = 3
+
+
+def _p95(values: Deque[float]) -> float:
+    """95th percentile of the given durations, 0 if there are none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+
+
+@dataclass
+class BulkWriteStats:
+    """Throughput and latency statistics of a bulk writer.
+
+    Attributes:
+        objects (int): Number of objects written successfully.
+        failed (int): Number of objects that failed after all retries.
+        retried (int): Number of object re-sends after a failure.
+        requests (int): Number of batch requests sent.
+        elapsed (float): Wall-clock seconds spent in flushes.
+        latencies (Deque[float]): Duration of the most recent batch requests in seconds.
+        flush_latencies (Deque[float]): Duration of the most recent flushes in seconds.
+    """
+
+    objects: int = 0
+    failed: int = 0
+    retried: int = 0
+    requests: int = 0
+    elapsed: float = 0.0
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    flush_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    @property
+    def objects_per_second(self) -> float:
+        """Objects written per second of flush time."""
+        return self.objects / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def p95_latency(self) -> float:
+        """95th percentile batch request latency in seconds."""
+        return _p95(self.latencies)
+
+    @property
+    def p95_flush_latency(self) -> float:
+        """95th percentile flush latency in seconds, including retries."""
+        return _p95(self.flush_latencies)
+
+    def to_dict(self) -> Dict:
+        """Summarize the statistics.
+
+        Returns:
+            Dict: Counters, objects per second and p95 request and flush
+                latencies in milliseconds.
+        """
+        return {
+            "objects": self.objects,
+            "failed": self.failed,
+            "retried": self.retried,
+            "requests": self.requests,
+            "objects_per_second": round(self.objects_per_second, 1),
+            "p95_latency_ms": round(self.p95_latency * 1000, 1),
+            "p95_flush_latency_ms": round(self.p95_flush_latency * 1000, 1),
+        }
+
+
+class BatchTransport:
+    """Posts batch payloads to the Weaviate batch objects endpoint.
+
+    Unlike ``client.batch``, one transport can be shared by several threads.
+    It uses the connection of a v3 client, which is not a public API, so the
+    client is checked when the transport is created.
+
+    Attributes:
+        client (weaviate.Client): Weaviate client instance.
+    """
+
+    def __init__(self, client: weaviate.Client):
+        """Initialize the transport.
+
+        Args:
+            client: Weaviate client instance.
+
+        Raises:
+            RuntimeError: If the installed weaviate-client is not a supported version.
+        """
+        version = getattr(weaviate, "__version__", "unknown")
+        if version.split(".")[0] != str(SUPPORTED_CLIENT_MAJOR):
+            raise RuntimeError(
+                f"BulkWriter supports weaviate-client {SUPPORTED_CLIENT_MAJOR}.x, "
+                f"found {version}"
+            )
+        self.client = client
+
+    def post_objects(self, objects: List[Dict]):
+        """Send one batch request.
+
+        Args:
+            objects: Objects in the batch endpoint format.
+
+        Returns:
+            The HTTP response of the request.
+        """
+        return self.client._connection.post(
+            path=BATCH_OBJECTS_PATH, weaviate_object={"fields": ["ALL"], "objects": objects}
+        )
+
+
+class BulkWriter:
+    """Writes objects to Weaviate with concurrent batch requests.
+
+    Objects are buffered until a batch reaches ``batch_size`` objects or
+    ``max_batch_bytes`` of JSON payload, then handed to a pool of worker
+    threads. Per-object errors in the batch response cause only those objects
+    to be re-queued; a failed request re-queues its whole batch. Objects still
+    failing after ``max_retries`` re-sends are reported by ``flush()``.
+
+    The writer is meant to be fed from a single thread.
+
+    Attributes:
+        client (weaviate.Client): Weaviate client instance.
+        class_name (str): Name of the document class in Weaviate.
+        batch_size (int): Maximum number of objects per batch request.
+        max_batch_bytes (int): Maximum JSON payload size per batch request.
+        num_workers (int): Number of concurrent batch requests.
+        max_retries (int): Maximum number of re-sends of a failed object.
+        retry_backoff (float): Base delay in seconds before a re-send.
+        transport (BatchTransport): Sender of the batch requests.
+        stats (BulkWriteStats): Statistics accumulated over all flushes.
+        logger (logging.Logger): Logger instance for this class.
+    """
+
+    def __init__(
+        self,
+        client: weaviate.Client,
+        class_name: str,
+        batch_size: int = 100,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+        num_workers: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        """Initialize the bulk writer.
+
+        Args:
+            client: Weaviate client instance for database operations.
+            class_name: Name of the document class in Weaviate.
+            batch_size: Maximum number of objects per batch request (default: 100).
+            max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB).
+            num_workers: Number of concurrent batch requests (default: 4).
+            max_retries: Maximum number of re-sends of a failed object (default: 3).
+            retry_backoff: Base delay in seconds before a re-send, doubled on
+                every attempt (default: 0.5).
+
+        Raises:
+            RuntimeError: If the installed weaviate-client is not a supported version.
+
+        Example:
+            ```python
+            writer = BulkWriter(client, "Document", batch_size=200, num_workers=8)
+            for properties, vector, doc_id in prepared:
+                writer.add(properties, vector, doc_id)
+            failed = writer.flush()
+            print(writer.stats.to_dict())
+            ```
+        """
+        self.client = client
+        self.class_name = class_name
+        self.batch_size = max(1, batch_size)
+        self.max_batch_bytes = max_batch_bytes
+        self.num_workers = max(1, num_workers)
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.transport = BatchTransport(client)
+        self.stats = BulkWriteStats()
+        self.logger = logging.getLogger(__name__)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Tuple[Dict, int]] = []
+        self._pending_bytes = 0
+        self._in_flight: Set[Future] = set()
+        self._retry: List[Tuple[Dict, int]] = []
+        self._failed: Dict[str, str] = {}
+
+    def add(self, properties: Dict, vector: Optional[List[float]], doc_id: str) -> None:
+        """Queue an object for writing.
+
+        Args:
+            properties: Object properties.
+            vector: Optional object vector.
+            doc_id: UUID string of the object.
+        """
+        obj = {"class": self.class_name, "properties": properties, "id": doc_id}
+        if vector is not None:
+            obj["vector"] = list(vector)
+        self._enqueue(obj, 0)
+
+    def _enqueue(self, obj: Dict, attempt: int) -> None:
+        size = len(json.dumps(obj, default=str))
+        if self._pending and self._pending_bytes + size > self.max_batch_bytes:
+            self._submit()
+        self._pending.append((obj, attempt))
+        self._pending_bytes += size
+        if len(self._pending) >= self.batch_size:
+            self._submit()
+
+    def _submit(self) -> None:
+        """Hand the pending batch to a worker, waiting while all workers are busy."""
+        if not self._pending:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.num_workers, thread_name_prefix="weaviate-bulk"
+            )
+        # Keep at most one queued batch per worker to bound memory
+        while len(self._in_flight) >= 2 * self.num_workers:
+            self._collect(FIRST_COMPLETED)
+        batch, self._pending, self._pending_bytes = self._pending, [], 0
+        self._in_flight.add(self._executor.submit(self._send, batch))
+
+    def _send(
+        self, batch: List[Tuple[Dict, int]]
+    ) -> Tuple[List[Tuple[Dict, int]], Dict[str, str], float]:
+        """Send one batch request; runs in a worker thread.
+
+        Returns:
+            Tuple of the sent batch, error messages keyed by object ID, and the
+            request latency in seconds.
+        """
+        attempt = max(item_attempt for _, item_attempt in batch)
+        if attempt:
+            time.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+        start = time.perf_counter()
+        try:
+            response = self.transport.post_objects([obj for obj, _ in batch])
+            latency = time.perf_counter() - start
+            if response.status_code != 200:
+                message = f"Batch request failed with status {response.status_code}"
+                return batch, {obj["id"]: message for obj, _ in batch}, latency
+            errors = {}
+            for result in response.json():
+                object_errors = (result.get("result") or {}).get("errors")
+                if object_errors:
+                    messages = [e.get("message", "") for e in object_errors.get("error", [])]
+                    errors[result.get("id")] = "; ".join(messages) or "Unknown error"
+            return batch, errors, latency
+        except Exception as e:
+            return batch, {obj["id"]: str(e) for obj, _ in batch}, time.perf_counter() - start
+
+    def _collect(self, return_when: str) -> None:
+        """Wait for in-flight batches and re-queue their failed objects."""
+        done, self._in_flight = wait(self._in_flight, return_when=return_when)
+        for future in done:
+            batch, errors, latency = future.result()
+            self.stats.requests += 1
+            self.stats.latencies.append(latency)
+            self.stats.objects += len(batch) - len(errors)
+            for obj, attempt in batch:
+                message = errors.get(obj["id"])
+                if message is None:
+                    continue
+                if attempt < self.max_retries:
+                    self._retry.append((obj, attempt + 1))
+                    self.stats.retried += 1
+                else:
+                    self._failed[obj["id"]] = message
+                    self.stats.failed += 1
+                    self.logger.error(f"Failed to write object {obj['id']}: {message}")
+
+    def flush(self) -> Dict[str, str]:
+        """Send all queued objects and wait until they are written or failed.
+
+        Returns:
+            Dict[str, str]: Error message of every object that could not be
+                written, keyed by object ID.
+        """
+        start = time.perf_counter()
+        objects_before = self.stats.objects
+        self._submit()
+        while self._in_flight or self._retry:
+            if self._in_flight:
+                self._collect(FIRST_COMPLETED)
+            retry, self._retry = self._retry, []
+            for obj, attempt in retry:
+                self._enqueue(obj, attempt)
+            self._submit()
+        duration = time.perf_counter() - start
+        self.stats.elapsed += duration
+
+        failed, self._failed = self._failed, {}
+        written = self.stats.objects - objects_before
+        if written or failed:
+            self.stats.flush_latencies.append(duration)
+            self.logger.info(
+                f"Flushed {written} objects ({len(failed)} failed) in {duration * 1000:.1f} ms, "
+                f"{self.stats.objects_per_second:.0f} obj/s, "
+                f"p95 request latency {self.stats.p95_latency * 1000:.1f} ms, "
+                f"p95 flush latency {self.stats.p95_flush_latency * 1000:.1f} ms"
+            )
+        return failed
+
+    def close(self) -> None:
+        """Flush queued objects and stop the worker threads."""
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+from src.utils.fingerprint import content_fingerprint
+
 
 class DocumentProcessor:
     """Handles document preparation, validation, and processing operations.
@@ -135,9 +137,9 @@ class DocumentProcessor:
     def compute_document_hash(self, doc: Dict) -> str:
         """Compute hash for document deduplication.
 
-        Generates a stable hash of the document's content, metadata, and embeddings
-        for deduplication purposes. The hash is computed from a sorted, stable
-        string representation of key document components.
+        Generates a hash of the document's content, metadata, and embedding model
+        for deduplication purposes. The hash is stable across processes; see
+        ``src.utils.fingerprint.content_fingerprint``.
 
         Args:
             doc: Document dictionary containing:
@@ -162,12 +164,7 @@ class DocumentProcessor:
             ```
         """
         try:
-            content = []
-            for key in sorted(doc.keys()):
-                if key in {"content", "metadata", "embeddings"}:
-                    content.append(f"{key}:{doc[key]}")
-            content_str = "|".join(content)
-            return str(hash(content_str))
+            return content_fingerprint(doc)
         except Exception as e:
             self.logger.error(f"Error computing document hash: {str(e)}")
             raise
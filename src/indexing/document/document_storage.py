@@ -5,7 +5,7 @@ addition, deletion, and updates. It integrates with Weaviate for vector storage
 supports batch operations, caching, and document deduplication.
 """
 
-from typing import Dict, List, Optional
+from typing import IO, Dict, Iterator, List, Optional
 
 import weaviate
 
@@ -15,7 +15,9 @@ from .batch_manager import BatchManager
 from .document_processor import DocumentProcessor
 from .operations.addition import DocumentAddition
 from .operations.deletion import DocumentDeletion
+from .operations.retrieval import ITER_BATCH_SIZE, DocumentRetrieval
 from .operations.update import DocumentUpdate
+from .snapshot import SNAPSHOT_CHUNK_SIZE, IndexSnapshot, ProgressCallback, SnapshotManifest
 
 
 class DocumentStorage:
@@ -36,6 +38,8 @@ class DocumentStorage:
         addition (DocumentAddition): Handler for document addition operations.
         deletion (DocumentDeletion): Handler for document deletion operations.
         update (DocumentUpdate): Handler for document update operations.
+        retrieval (DocumentRetrieval): Handler for full-index iteration.
+        snapshots (IndexSnapshot): Handler for offline snapshots and restores.
     """
 
     def __init__(
@@ -45,6 +49,8 @@ class DocumentStorage:
         batch_size: int = 100,
         cache_manager: Optional[CacheManager] = None,
         test_mode: bool = False,
+        num_workers: int = 4,
+        max_batch_bytes: int = 8 * 1024 * 1024,
     ):
         """Initialize document storage manager.
 
@@ -57,6 +63,8 @@ class DocumentStorage:
             batch_size: Maximum number of documents per batch operation (default: 100).
             cache_manager: Optional cache manager for document caching.
             test_mode: Whether to run in test mode (default: False).
+            num_workers: Number of concurrent batch write requests (default: 4).
+            max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB).
 
         Example:
             ```python
@@ -76,7 +84,14 @@ class DocumentStorage:
 
         # Initialize components
         self.processor = DocumentProcessor()
-        self.batch_manager = BatchManager(client, class_name, batch_size, test_mode=test_mode)
+        self.batch_manager = BatchManager(
+            client,
+            class_name,
+            batch_size,
+            test_mode=test_mode,
+            num_workers=num_workers,
+            max_batch_bytes=max_batch_bytes,
+        )
 
         # Initialize operations
         self.addition = DocumentAddition(
@@ -90,6 +105,14 @@ class DocumentStorage:
         )
         self.deletion = DocumentDeletion(client, class_name, cache_manager, test_mode=test_mode)
         self.update = DocumentUpdate(client, class_name, self.processor, cache_manager)
+        self.retrieval = DocumentRetrieval(client, class_name)
+        self.snapshots = IndexSnapshot(
+            client,
+            class_name,
+            batch_size,
+            num_workers=num_workers,
+            max_batch_bytes=max_batch_bytes,
+        )
 
     def add_documents(self, documents: List[Dict], deduplicate: bool = True) -> List[str]:
         """Add multiple documents to storage.
@@ -143,6 +166,106 @@ class DocumentStorage:
         """
         return self.deletion.delete_documents(doc_ids)
 
+    def bulk_delete(self, doc_ids: List[str]) -> Dict[str, str]:
+        """Delete documents by ID with batch delete requests.
+
+        Args:
+            doc_ids: List of document UUIDs to delete.
+
+        Returns:
+            Dict[str, str]: Outcome of every ID: "deleted", "not_found",
+                "invalid_id" or "failed".
+        """
+        return self.deletion.bulk_delete(doc_ids)
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """Delete all documents matching a where filter.
+
+        Args:
+            where: Weaviate where filter.
+            dry_run: Only report the matching documents (default: False).
+
+        Returns:
+            Dict[str, str]: Outcome of every matched document ID.
+        """
+        return self.deletion.delete_by_filter(where, dry_run=dry_run)
+
+    def iter_documents(
+        self,
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """Iterate over all stored documents with cursor pagination.
+
+        Args:
+            batch_size: Number of objects fetched per request (default: 500).
+            include_vectors: Whether to include object vectors (default: False).
+            where: Optional Weaviate where filter.
+
+        Returns:
+            Iterator[Dict]: Documents with ``id``, ``properties`` and optionally ``vector``.
+        """
+        return self.retrieval.iter_documents(batch_size, include_vectors, where)
+
+    def export_documents(
+        self,
+        stream: IO[str],
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> int:
+        """Write all stored documents to a stream as JSON Lines.
+
+        Args:
+            stream: Text stream to write to.
+            batch_size: Number of objects fetched per request (default: 500).
+            include_vectors: Whether to include object vectors (default: False).
+            where: Optional Weaviate where filter.
+
+        Returns:
+            int: Number of documents written.
+        """
+        return self.retrieval.export_documents(stream, batch_size, include_vectors, where)
+
+    def create_snapshot(
+        self,
+        path: str,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        compress: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SnapshotManifest:
+        """Save all stored documents and their vectors to a local directory.
+
+        Args:
+            path: Directory to write the snapshot to.
+            chunk_size: Number of documents per chunk file (default: 10000).
+            compress: Whether to gzip chunk files (default: True).
+            progress: Optional callback receiving (documents saved, 0).
+
+        Returns:
+            SnapshotManifest: Description of the written snapshot.
+        """
+        return self.snapshots.create(path, chunk_size, compress, progress)
+
+    def restore_snapshot(
+        self,
+        path: str,
+        class_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
+        """Bulk-load a snapshot without re-embedding.
+
+        Args:
+            path: Snapshot directory.
+            class_name: Target class, defaults to this storage's class.
+            progress: Optional callback receiving (documents restored, total).
+
+        Returns:
+            Dict[str, int]: Numbers of restored and failed documents.
+        """
+        return self.snapshots.restore(path, class_name, progress)
+
     def update_document(
         self, doc_id: str, updates: Dict, vector: Optional[List[float]] = None
     ) -> bool:
@@ -5,6 +5,7 @@ including:
 - Document addition with batching and deduplication
 - Document deletion with cache invalidation
 - Document updates with vector management
+- Cursor-based iteration over the whole index
 
 The operations are designed to work with Weaviate as the backend storage system
 and include comprehensive logging, error handling, and cache management.
@@ -31,6 +32,7 @@ Example:
 
 from src.indexing.document.operations.addition import DocumentAddition
 from src.indexing.document.operations.deletion import DocumentDeletion
+from src.indexing.document.operations.retrieval import DocumentRetrieval
 from src.indexing.document.operations.update import DocumentUpdate
 
-__all__ = ["DocumentAddition", "DocumentDeletion", "DocumentUpdate"]
+__all__ = ["DocumentAddition", "DocumentDeletion", "DocumentRetrieval", "DocumentUpdate"]
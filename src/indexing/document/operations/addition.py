@@ -80,23 +80,27 @@ class DocumentAddition:
         self.test_mode = test_mode
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
+        self._uncached: Dict[str, Dict] = {}
 
     def add_documents(self, documents: List[Dict], deduplicate: bool = True) -> List[str]:
         """Add multiple documents to the storage system.
 
         Processes and adds a batch of documents to storage, with optional
-        deduplication and caching. Handles validation and error cases.
+        deduplication. Documents are written by the batch manager's parallel
+        bulk writer, which is flushed before returning. Handles validation and
+        error cases.
 
         Args:
             documents: List of document dictionaries to add, each containing:
-                - uuid: Document UUID
+                - uuid: Document UUID, ``id`` is used if absent
                 - content: Document content
                 - metadata: Document metadata
                 - embeddings: Document embeddings
             deduplicate: Whether to check for and prevent duplicates (default: True).
 
         Returns:
-            List[str]: List of successfully added document UUIDs.
+            List[str]: List of successfully added document UUIDs, excluding
+                documents the server rejected after retries.
 
         Raises:
             Exception: If document addition process fails.
@@ -120,25 +124,9 @@ class DocumentAddition:
 
         self.logger.debug(f"Processing {len(documents)} documents (deduplicate={deduplicate})")
 
-        # Try to get from cache first
-        if self.cache_manager:
-            cache_key = f"docs:{hash(str(documents))}"
-            self.logger.debug(f"Checking cache with key: {cache_key}")
-            cached_ids = self.cache_manager.get(cache_key)
-            if cached_ids:
-                self.logger.info(f"Retrieved {len(cached_ids)} document IDs from cache")
-                return cached_ids
-
         try:
             doc_ids = self._add_documents_impl(documents, deduplicate)
             self.logger.info(f"Successfully added {len(doc_ids)} documents")
-
-            # Cache the results
-            if self.cache_manager:
-                cache_key = f"docs:{hash(str(documents))}"
-                self.logger.debug(f"Caching {len(doc_ids)} document IDs with key: {cache_key}")
-                self.cache_manager.set(cache_key, doc_ids)
-
             return doc_ids
         except Exception as e:
             self.logger.error(f"Error adding documents: {str(e)}", exc_info=True)
@@ -181,8 +169,8 @@ class DocumentAddition:
                     self.logger.debug(f"Invalid document structure: {doc}")
                     continue
 
-                # Get document ID
-                doc_id = doc.get("uuid")
+                # Get document ID, falling back to the pipeline's stable ID
+                doc_id = doc.get("uuid") or doc.get("id")
                 if not doc_id:
                     self.logger.error("Document missing UUID")
                     self.logger.debug(f"Document without UUID: {doc}")
@@ -221,6 +209,10 @@ class DocumentAddition:
                     )
                     continue
 
+            failed = self.flush()
+            if failed:
+                self.logger.warning(f"{len(failed)} documents could not be written")
+                doc_ids = [doc_id for doc_id in doc_ids if doc_id not in failed]
             return doc_ids
         except Exception as e:
             self.logger.error(f"Error in document addition: {str(e)}", exc_info=True)
@@ -229,8 +221,9 @@ class DocumentAddition:
     def _process_batch(self, batch: List[tuple[Dict, List[float], str]]) -> None:
         """Process a batch of prepared documents.
 
-        Adds a batch of prepared documents to storage and updates the cache
-        if enabled.
+        Queues a batch of prepared documents with the batch manager. Documents
+        are written concurrently with later batches and cached, if enabled, once
+        ``flush()`` confirms they were written.
 
         Args:
             batch: List of tuples containing:
@@ -248,12 +241,24 @@ class DocumentAddition:
         try:
             for properties, vector, doc_id in batch:
                 self.batch_manager.add_document(properties, vector, doc_id)
-
-                # Cache document if using caching
                 if self.cache_manager:
-                    self.cache_manager.set(f"doc:{doc_id}", properties)
+                    self._uncached[doc_id] = properties
 
-            self.logger.info(f"Successfully processed batch of {len(batch)} documents")
+            self.logger.info(f"Successfully queued batch of {len(batch)} documents")
         except Exception as e:
             self.logger.error(f"Error processing batch: {str(e)}")
             raise
+
+    def flush(self) -> Dict[str, str]:
+        """Write all queued documents and cache the ones that succeeded.
+
+        Returns:
+            Dict[str, str]: Error message of every document that could not be
+                written, keyed by document UUID.
+        """
+        failed = self.batch_manager.flush()
+        uncached, self._uncached = self._uncached, {}
+        for doc_id, properties in uncached.items():
+            if doc_id not in failed:
+                self.cache_manager.set(f"doc:{doc_id}", properties)
+        return failed
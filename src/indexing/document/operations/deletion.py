@@ -1,19 +1,29 @@
 """Document deletion operations module.
 
 This module provides functionality for deleting documents from the storage system,
-including UUID validation, cache management, and error handling. It handles both
-single and batch document deletions with detailed logging and status reporting.
+including UUID validation, cache management, and error handling. Documents are
+deleted with Weaviate's batch delete, either by ID in chunks or by any where filter,
+and cache entries of deleted documents are invalidated in one pipelined call.
 """
 
 import logging
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import weaviate
-from weaviate.exceptions import UnexpectedStatusCodeException
 
 from src.utils.cache_manager import CacheManager
 
+# Per-document outcomes of a deletion
+DELETED = "deleted"
+NOT_FOUND = "not_found"
+INVALID_ID = "invalid_id"
+FAILED = "failed"
+DRY_RUN = "dry_run"
+
+# Weaviate deletes at most QUERY_MAXIMUM_RESULTS (10000 by default) objects per request
+DELETE_CHUNK_SIZE = 10000
+
 
 class DocumentDeletion:
     """Handles document deletion operations in the storage system.
@@ -68,20 +78,15 @@ class DocumentDeletion:
     def delete_documents(self, doc_ids: List[str]) -> bool:
         """Delete multiple documents from the storage system.
 
-        Processes a list of document IDs for deletion, validating each UUID
-        and handling cache invalidation. Continues processing even if some
-        deletions fail, but returns False if any deletion fails.
+        Deletes the documents with batch requests (see ``bulk_delete``).
+        Documents that do not exist are skipped with a warning.
 
         Args:
             doc_ids: List of document UUIDs to delete.
 
         Returns:
-            bool: True if all deletions were successful, False if any failed.
-
-        Raises:
-            ValueError: If any document ID is not a valid UUID.
-            UnexpectedStatusCodeException: If Weaviate returns unexpected status.
-            Exception: For any other errors during deletion.
+            bool: True if all deletions were successful, False if any ID was
+                invalid or any deletion failed.
 
         Example:
             ```python
@@ -98,48 +103,132 @@ class DocumentDeletion:
             - Skips non-existent documents with a warning
             - Clears cache entries for successfully deleted documents
         """
-        try:
-            if not doc_ids:
-                self.logger.info("No documents to delete")
-                return True
-
-            self.logger.info(f"Starting deletion of {len(doc_ids)} documents")
-            for doc_id in doc_ids:
-                try:
-                    self.logger.debug(f"Attempting to validate UUID format for {doc_id}")
-                    # Validate UUID format
-                    uuid_obj = uuid.UUID(doc_id)
-                    self.logger.debug(f"UUID validation successful for {doc_id}")
-
-                    self.logger.debug(f"Calling delete on client for {doc_id}")
-                    result = self.client.data_object.delete(
-                        str(uuid_obj), class_name=self.class_name
-                    )
-                    self.logger.debug(f"Delete call completed for {doc_id} with result: {result}")
-
-                    # Weaviate returns None on successful deletion
-                    if result is not None:
-                        self.logger.error(f"Unexpected response from delete operation: {result}")
-                        return False
-
-                    # Clear cache if using caching
-                    if self.cache_manager:
-                        self.logger.debug(f"Clearing cache for {doc_id}")
-                        self.cache_manager.delete(f"doc:{doc_id}")
-                except ValueError as ve:
-                    self.logger.error(f"Invalid UUID format for document {doc_id}: {str(ve)}")
-                    return False
-                except UnexpectedStatusCodeException as e:
-                    if "404" in str(e):
-                        self.logger.warning(f"Document {doc_id} not found, skipping")
-                        continue
-                    self.logger.error(f"Error deleting document {doc_id}: {str(e)}")
-                    return False
-                except Exception as e:
-                    self.logger.error(f"Error deleting document {doc_id}: {str(e)}")
-                    return False
-            self.logger.info("Document deletion completed successfully")
+        if not doc_ids:
+            self.logger.info("No documents to delete")
             return True
-        except Exception as e:
-            self.logger.error(f"Error deleting documents: {str(e)}")
-            return False
+
+        outcomes = self.bulk_delete(doc_ids)
+        not_found = [doc_id for doc_id, outcome in outcomes.items() if outcome == NOT_FOUND]
+        if not_found:
+            self.logger.warning(f"{len(not_found)} documents not found, skipping")
+        return all(outcome in (DELETED, NOT_FOUND) for outcome in outcomes.values())
+
+    def bulk_delete(
+        self, doc_ids: List[str], chunk_size: int = DELETE_CHUNK_SIZE
+    ) -> Dict[str, str]:
+        """Delete documents by ID with batch delete requests.
+
+        IDs are validated and deleted in chunks with an ``id ContainsAny``
+        filter, one request per chunk instead of one per document.
+
+        Args:
+            doc_ids: List of document UUIDs to delete.
+            chunk_size: Maximum number of IDs per request (default: 10000).
+
+        Returns:
+            Dict[str, str]: Outcome of every ID: "deleted", "not_found",
+                "invalid_id" or "failed".
+
+        Example:
+            ```python
+            outcomes = deleter.bulk_delete(doc_ids)
+            failed = [doc_id for doc_id, outcome in outcomes.items() if outcome == "failed"]
+            ```
+        """
+        outcomes: Dict[str, str] = {}
+        normalized: Dict[str, str] = {}
+        for doc_id in doc_ids:
+            try:
+                normalized[str(uuid.UUID(doc_id))] = doc_id
+            except (ValueError, TypeError, AttributeError):
+                self.logger.error(f"Invalid UUID format for document {doc_id}")
+                outcomes[doc_id] = INVALID_ID
+
+        ids = list(normalized)
+        self.logger.info(f"Starting deletion of {len(ids)} documents")
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start : start + chunk_size]
+            where = {"path": ["id"], "operator": "ContainsAny", "valueTextArray": chunk}
+            try:
+                statuses, _ = self._delete_where(where)
+            except Exception as e:
+                self.logger.error(f"Error deleting {len(chunk)} documents: {str(e)}")
+                statuses = {doc_id: FAILED for doc_id in chunk}
+            for doc_id in chunk:
+                outcomes[normalized[doc_id]] = statuses.get(doc_id, NOT_FOUND)
+
+        deleted = [doc_id for doc_id, outcome in outcomes.items() if outcome == DELETED]
+        self._invalidate_cache(deleted)
+        self.logger.info(f"Deleted {len(deleted)} of {len(doc_ids)} documents")
+        return outcomes
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """Delete all documents matching a where filter.
+
+        Requests are repeated until no more documents match, since Weaviate
+        deletes a limited number of objects per request.
+
+        Args:
+            where: Weaviate where filter, e.g. on a source path or tenant property.
+            dry_run: Only report the matching documents (default: False).
+
+        Returns:
+            Dict[str, str]: Outcome of every matched ID: "deleted" or "failed"
+                ("dry_run" for a dry run).
+
+        Example:
+            ```python
+            outcomes = deleter.delete_by_filter(
+                {"path": ["parent_id"], "operator": "Equal", "valueText": parent_id}
+            )
+            ```
+        """
+        outcomes: Dict[str, str] = {}
+        while True:
+            statuses, more = self._delete_where(where, dry_run=dry_run)
+            deleted = [doc_id for doc_id, status in statuses.items() if status == DELETED]
+            outcomes.update(statuses)
+            self._invalidate_cache(deleted)
+            # Stop when everything matched, or when a round made no progress
+            if dry_run or not more or not deleted:
+                break
+
+        self.logger.info(
+            f"Deleted {sum(outcome == DELETED for outcome in outcomes.values())} "
+            f"of {len(outcomes)} documents matching filter"
+        )
+        return outcomes
+
+    def _delete_where(self, where: Dict, dry_run: bool = False) -> Tuple[Dict[str, str], bool]:
+        """Send one batch delete request.
+
+        Returns:
+            Tuple of the status of every matched ID and whether more objects
+            matched than the request could delete.
+        """
+        response = self.client.batch.delete_objects(
+            class_name=self.class_name,
+            where=where,
+            output="verbose",
+            dry_run=dry_run,
+        )
+        results = (response or {}).get("results") or {}
+        statuses = {}
+        for obj in results.get("objects") or []:
+            status = obj.get("status")
+            if status == "SUCCESS":
+                statuses[obj["id"]] = DELETED
+            elif status == "DRYRUN":
+                statuses[obj["id"]] = DRY_RUN
+            else:
+                statuses[obj["id"]] = FAILED
+                self.logger.error(f"Error deleting document {obj['id']}: {obj.get('errors')}")
+        limit = results.get("limit")
+        more = bool(limit) and results.get("matches", 0) >= limit
+        return statuses, more
+
+    def _invalidate_cache(self, doc_ids: List[str]) -> None:
+        """Remove cache entries of deleted documents in one pipelined call."""
+        if self.cache_manager and doc_ids:
+            self.logger.debug(f"Clearing cache for {len(doc_ids)} documents")
+            self.cache_manager.delete_many([f"doc:{doc_id}" for doc_id in doc_ids])
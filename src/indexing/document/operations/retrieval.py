@@ -0,0 +1,186 @@
+"""Document retrieval operations module.
+
+This module provides functionality for reading every document of the storage
+system page by page. Pages are fetched with Weaviate's ``after`` cursor, which
+keeps memory constant and makes every page cost the same regardless of how deep
+into the index it is, unlike offset pagination.
+"""
+
+import json
+import logging
+from typing import IO, Dict, Iterator, List, Optional
+
+import weaviate
+
+# Number of objects fetched per request while iterating
+ITER_BATCH_SIZE = 500
+
+
+class DocumentRetrieval:
+    """Handles full-index iteration in the storage system.
+
+    Without a where filter the REST objects endpoint is paged with the ``after``
+    cursor. Weaviate does not combine ``after`` with where filters, so filtered
+    iteration uses keyset pagination instead: a GraphQL query sorted by ID that
+    only matches IDs greater than the last one seen.
+
+    Attributes:
+        client (weaviate.Client): Weaviate client instance for database operations.
+        class_name (str): Name of the document class in Weaviate.
+        logger (logging.Logger): Logger instance for this class.
+    """
+
+    def __init__(self, client: weaviate.Client, class_name: str):
+        """Initialize the document retrieval handler.
+
+        Args:
+            client: Weaviate client instance for database operations.
+            class_name: Name of the document class in Weaviate.
+
+        Example:
+            ```python
+            client = weaviate.Client("http://localhost:8080")
+            retrieval = DocumentRetrieval(client=client, class_name="Document")
+            ```
+        """
+        self.client = client
+        self.class_name = class_name
+        self.logger = logging.getLogger(__name__)
+
+    def iter_documents(
+        self,
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """Iterate over all documents, one page in memory at a time.
+
+        Args:
+            batch_size: Number of objects fetched per request (default: 500).
+            include_vectors: Whether to include object vectors (default: False).
+            where: Optional Weaviate where filter.
+
+        Yields:
+            Dict: Document with ``id``, ``properties`` and, if requested, ``vector``.
+
+        Example:
+            ```python
+            for doc in retrieval.iter_documents(batch_size=1000):
+                reconcile(doc["id"], doc["properties"])
+            ```
+        """
+        batch_size = max(1, batch_size)
+        pages = self._filtered_pages if where else self._cursor_pages
+        count = 0
+        for page in pages(batch_size, include_vectors, where):
+            count += len(page)
+            yield from page
+        self.logger.debug(f"Iterated over {count} documents")
+
+    def _cursor_pages(
+        self, batch_size: int, include_vectors: bool, where: Optional[Dict]
+    ) -> Iterator[List[Dict]]:
+        after = None
+        while True:
+            result = self.client.data_object.get(
+                class_name=self.class_name,
+                limit=batch_size,
+                after=after,
+                with_vector=include_vectors,
+            )
+            objects = (result or {}).get("objects") or []
+            if not objects:
+                return
+            yield [self._from_object(obj, include_vectors) for obj in objects]
+            if len(objects) < batch_size:
+                return
+            after = objects[-1]["id"]
+
+    def _filtered_pages(
+        self, batch_size: int, include_vectors: bool, where: Optional[Dict]
+    ) -> Iterator[List[Dict]]:
+        properties = self._property_names()
+        additional = ["id", "vector"] if include_vectors else ["id"]
+        after = None
+        while True:
+            page_where = where
+            if after is not None:
+                page_where = {
+                    "operator": "And",
+                    "operands": [
+                        where,
+                        {"path": ["id"], "operator": "GreaterThan", "valueText": after},
+                    ],
+                }
+            result = (
+                self.client.query.get(self.class_name, properties)
+                .with_where(page_where)
+                .with_sort({"path": ["_id"], "order": "asc"})
+                .with_additional(additional)
+                .with_limit(batch_size)
+                .do()
+            )
+            if "errors" in result:
+                raise RuntimeError(f"Query failed: {result['errors']}")
+            objects = result.get("data", {}).get("Get", {}).get(self.class_name) or []
+            if not objects:
+                return
+            yield [self._from_graphql(obj, include_vectors) for obj in objects]
+            if len(objects) < batch_size:
+                return
+            after = objects[-1]["_additional"]["id"]
+
+    def _property_names(self) -> List[str]:
+        """Get the names of all properties of the document class."""
+        schema = self.client.schema.get(self.class_name)
+        return [prop["name"] for prop in schema.get("properties", [])]
+
+    @staticmethod
+    def _from_object(obj: Dict, include_vectors: bool) -> Dict:
+        doc = {"id": obj["id"], "properties": obj.get("properties", {})}
+        if include_vectors:
+            doc["vector"] = obj.get("vector")
+        return doc
+
+    @staticmethod
+    def _from_graphql(obj: Dict, include_vectors: bool) -> Dict:
+        additional = obj.get("_additional", {})
+        doc = {
+            "id": additional["id"],
+            "properties": {key: value for key, value in obj.items() if key != "_additional"},
+        }
+        if include_vectors:
+            doc["vector"] = additional.get("vector")
+        return doc
+
+    def export_documents(
+        self,
+        stream: IO[str],
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> int:
+        """Write all documents to a stream as JSON Lines.
+
+        Args:
+            stream: Text stream to write to, one JSON document per line.
+            batch_size: Number of objects fetched per request (default: 500).
+            include_vectors: Whether to include object vectors (default: False).
+            where: Optional Weaviate where filter.
+
+        Returns:
+            int: Number of documents written.
+
+        Example:
+            ```python
+            with open("export.jsonl", "w") as f:
+                count = retrieval.export_documents(f, include_vectors=True)
+            ```
+        """
+        count = 0
+        for doc in self.iter_documents(batch_size, include_vectors, where):
+            stream.write(json.dumps(doc, default=str))
+            stream.write("\n")
+            count += 1
+        self.logger.info(f"Exported {count} documents")
+        return count
@@ -0,0 +1,338 @@
+"""Offline snapshots of a document class.
+
+This module saves the properties and vectors of every document of a Weaviate
+class to a local directory, and loads them back through the parallel bulk writer
+without re-running summarization or embedding.
+
+Snapshot layout:
+    manifest.json            Class schema, document count, vector dimension and chunk list
+    chunk-00000.json[.gz]    Columnar metadata: {"id": [...], "properties": {name: [...]}}
+    chunk-00000.npy[.gz]     float32 vectors of the chunk, one row per document
+
+Documents without a vector are stored as a row of NaN and restored without one.
+Chunks are written while the class is iterated, so memory stays bounded by the
+chunk size. ``write_snapshot`` and ``read_chunk`` implement the format for any
+backend; ``IndexSnapshot`` applies them to a Weaviate class.
+"""
+
+import gzip
+import json
+import logging
+import math
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import IO, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+import weaviate
+
+from .bulk_writer import BulkWriter
+from .operations.retrieval import DocumentRetrieval
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+
+# Number of documents per chunk file
+SNAPSHOT_CHUNK_SIZE = 10000
+
+# Called with (documents done, total documents)
+ProgressCallback = Callable[[int, int], None]
+
+
+@dataclass
+class SnapshotManifest:
+    """Description of a snapshot directory.
+
+    Attributes:
+        class_name (str): Name of the snapshotted document class.
+        count (int): Number of documents in the snapshot.
+        dimension (int): Vector dimension, 0 if no document has a vector.
+        compressed (bool): Whether chunk files are gzip-compressed.
+        chunks (List[Dict]): Chunk file names and document counts, in order.
+        schema (Optional[Dict]): Class schema at snapshot time.
+        created_at (float): Unix timestamp of the snapshot.
+        version (int): Snapshot format version.
+    """
+
+    class_name: str
+    count: int = 0
+    dimension: int = 0
+    compressed: bool = True
+    chunks: List[Dict] = field(default_factory=list)
+    schema: Optional[Dict] = None
+    created_at: float = field(default_factory=time.time)
+    version: int = SNAPSHOT_VERSION
+
+    @classmethod
+    def load(cls, path: str) -> "SnapshotManifest":
+        """Read the manifest of a snapshot directory.
+
+        Raises:
+            ValueError: If the snapshot format version is not supported
+        """
+        with open(os.path.join(path, MANIFEST_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+        return cls(**data)
+
+    def save(self, path: str) -> None:
+        """Write the manifest to a snapshot directory."""
+        with open(os.path.join(path, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f, indent=2)
+
+
+def write_snapshot(
+    path: str,
+    manifest: SnapshotManifest,
+    documents: Iterable[Dict],
+    chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+) -> SnapshotManifest:
+    """Write documents to a snapshot directory, one chunk in memory at a time.
+
+    Args:
+        path: Directory to write the snapshot to; created if missing.
+        manifest: Empty manifest naming the class, schema and compression.
+        documents: Documents with ``id``, ``properties`` and optional ``vector``.
+        chunk_size: Number of documents per chunk file (default: 10000).
+        progress: Optional callback receiving (documents saved, 0) after
+            every chunk; the total is unknown while iterating.
+
+    Returns:
+        SnapshotManifest: The manifest, completed and saved.
+    """
+    os.makedirs(path, exist_ok=True)
+    chunk: List[Dict] = []
+    for doc in documents:
+        chunk.append(doc)
+        if len(chunk) >= chunk_size:
+            _write_chunk(path, manifest, chunk)
+            chunk = []
+            if progress:
+                progress(manifest.count, 0)
+    if chunk or not manifest.chunks:
+        _write_chunk(path, manifest, chunk)
+        if progress:
+            progress(manifest.count, 0)
+    manifest.save(path)
+    return manifest
+
+
+def _write_chunk(path: str, manifest: SnapshotManifest, docs: List[Dict]) -> None:
+    """Write one chunk of documents and record it in the manifest."""
+    names = sorted({name for doc in docs for name in doc["properties"]})
+    columns = {
+        "id": [doc["id"] for doc in docs],
+        "properties": {name: [doc["properties"].get(name) for doc in docs] for name in names},
+    }
+
+    vectors = [doc.get("vector") for doc in docs]
+    dimension = next((len(vector) for vector in vectors if vector), manifest.dimension)
+    matrix = np.full((len(docs), dimension), np.nan, dtype=np.float32)
+    for row, vector in enumerate(vectors):
+        if vector:
+            matrix[row] = vector
+
+    suffix = ".gz" if manifest.compressed else ""
+    stem = f"chunk-{len(manifest.chunks):05d}"
+    entry = {
+        "metadata": f"{stem}.json{suffix}",
+        "vectors": f"{stem}.npy{suffix}",
+        "count": len(docs),
+    }
+    with _open(os.path.join(path, entry["metadata"]), "wt", manifest.compressed) as f:
+        json.dump(columns, f, default=str)
+    with _open(os.path.join(path, entry["vectors"]), "wb", manifest.compressed) as f:
+        np.save(f, matrix, allow_pickle=False)
+
+    manifest.chunks.append(entry)
+    manifest.count += len(docs)
+    manifest.dimension = dimension
+
+
+def read_chunk(path: str, chunk: Dict, compressed: bool) -> List[Dict]:
+    """Read one chunk of a snapshot back into documents.
+
+    Args:
+        path: Snapshot directory.
+        chunk: Chunk entry of the snapshot manifest.
+        compressed: Whether the chunk files are gzip-compressed.
+
+    Returns:
+        List[Dict]: Documents with ``id``, ``properties`` and, if stored, ``vector``.
+    """
+    with _open(os.path.join(path, chunk["metadata"]), "rt", compressed) as f:
+        columns = json.load(f)
+    with _open(os.path.join(path, chunk["vectors"]), "rb", compressed) as f:
+        matrix = np.load(f, allow_pickle=False)
+
+    properties = columns["properties"]
+    docs = []
+    for row, doc_id in enumerate(columns["id"]):
+        doc = {
+            "id": doc_id,
+            "properties": {
+                name: values[row] for name, values in properties.items() if values[row] is not None
+            },
+        }
+        if matrix.shape[1] and not math.isnan(matrix[row, 0]):
+            doc["vector"] = matrix[row].tolist()
+        docs.append(doc)
+    return docs
+
+
+def _open(file_path: str, mode: str, compressed: bool) -> IO:
+    encoding = "utf-8" if "t" in mode else None
+    if compressed:
+        return gzip.open(file_path, mode, compresslevel=6, encoding=encoding)
+    return open(file_path, mode, encoding=encoding)
+
+
+class IndexSnapshot:
+    """Creates and restores snapshots of a document class.
+
+    Attributes:
+        client (weaviate.Client): Weaviate client instance.
+        class_name (str): Name of the document class in Weaviate.
+        retrieval (DocumentRetrieval): Cursor-based reader of the class.
+        batch_size (int): Maximum number of objects per restore batch request.
+        num_workers (int): Number of concurrent restore batch requests.
+        max_batch_bytes (int): Maximum JSON payload size per restore batch request.
+        logger (logging.Logger): Logger instance for this class.
+    """
+
+    def __init__(
+        self,
+        client: weaviate.Client,
+        class_name: str,
+        batch_size: int = 100,
+        num_workers: int = 4,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+    ):
+        """Initialize the snapshot handler.
+
+        Args:
+            client: Weaviate client instance for database operations.
+            class_name: Name of the document class in Weaviate.
+            batch_size: Maximum number of objects per restore batch request (default: 100).
+            num_workers: Number of concurrent restore batch requests (default: 4).
+            max_batch_bytes: Maximum JSON payload size per restore batch request
+                (default: 8 MiB).
+
+        Example:
+            ```python
+            snapshots = IndexSnapshot(client, "Document", num_workers=8)
+            snapshots.create("/backups/documents")
+            snapshots.restore("/backups/documents", class_name="DocumentV2")
+            ```
+        """
+        self.client = client
+        self.class_name = class_name
+        self.retrieval = DocumentRetrieval(client, class_name)
+        self.batch_size = batch_size
+        self.num_workers = num_workers
+        self.max_batch_bytes = max_batch_bytes
+        self.logger = logging.getLogger(__name__)
+
+    def create(
+        self,
+        path: str,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        compress: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SnapshotManifest:
+        """Save all documents of the class with their vectors.
+
+        Args:
+            path: Directory to write the snapshot to; created if missing.
+            chunk_size: Number of documents per chunk file (default: 10000).
+            compress: Whether to gzip chunk files (default: True).
+            progress: Optional callback receiving (documents saved, 0) after
+                every chunk; the total is unknown while iterating.
+
+        Returns:
+            SnapshotManifest: Description of the written snapshot.
+        """
+        start = time.perf_counter()
+        manifest = write_snapshot(
+            path,
+            SnapshotManifest(
+                class_name=self.class_name, compressed=compress, schema=self._get_schema()
+            ),
+            self.retrieval.iter_documents(batch_size=1000, include_vectors=True),
+            chunk_size,
+            progress,
+        )
+        self.logger.info(
+            f"Saved snapshot of {manifest.count} documents in {len(manifest.chunks)} chunks "
+            f"to {path} ({time.perf_counter() - start:.1f}s)"
+        )
+        return manifest
+
+    def restore(
+        self,
+        path: str,
+        class_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
+        """Load a snapshot through the parallel batch path.
+
+        The target class is created from the snapshot schema if it does not
+        exist. Document IDs are preserved, so restoring into a class that still
+        holds the documents overwrites them.
+
+        Args:
+            path: Snapshot directory.
+            class_name: Target class, defaults to the handler's class.
+            progress: Optional callback receiving (documents restored, total)
+                after every chunk.
+
+        Returns:
+            Dict[str, int]: Numbers of restored and failed documents.
+        """
+        manifest = SnapshotManifest.load(path)
+        target = class_name or self.class_name
+        self._ensure_class(target, manifest.schema)
+
+        start = time.perf_counter()
+        restored = failed = 0
+        with BulkWriter(
+            self.client,
+            target,
+            batch_size=self.batch_size,
+            max_batch_bytes=self.max_batch_bytes,
+            num_workers=self.num_workers,
+        ) as writer:
+            for chunk in manifest.chunks:
+                docs = read_chunk(path, chunk, manifest.compressed)
+                for doc in docs:
+                    writer.add(doc["properties"], doc.get("vector"), doc["id"])
+                errors = writer.flush()
+                failed += len(errors)
+                restored += len(docs) - len(errors)
+                if progress:
+                    progress(restored + failed, manifest.count)
+
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"Restored {restored} documents into {target} ({failed} failed) in {elapsed:.1f}s, "
+            f"{restored / elapsed if elapsed > 0 else 0:.0f} docs/s"
+        )
+        return {"restored": restored, "failed": failed}
+
+    def _get_schema(self) -> Optional[Dict]:
+        try:
+            return self.client.schema.get(self.class_name)
+        except Exception as e:
+            self.logger.warning(f"Could not read schema of {self.class_name}: {str(e)}")
+            return None
+
+    def _ensure_class(self, class_name: str, schema: Optional[Dict]) -> None:
+        if self.client.schema.exists(class_name):
+            return
+        if not schema:
+            raise ValueError(f"Class {class_name} does not exist and the snapshot has no schema")
+        self.client.schema.create_class({**schema, "class": class_name})
+        self.logger.info(f"Created class {class_name} from snapshot schema")
@@ -0,0 +1,17 @@
+"""Embedded index backend without an external database.
+
+This package implements the index operations interface on local files, for
+single-node deployments and tests that cannot run Weaviate. Select it with
+``IndexConfig(backend="embedded", data_dir=...)``.
+
+Components:
+    - EmbeddedIndexOperations: Index operations over the store and an ANN index
+    - EmbeddedDocumentStore: SQLite documents, vectors and BM25 inverted index
+    - matches_where: Evaluation of Weaviate where filters
+"""
+
+from .document_store import EmbeddedDocumentStore
+from .embedded_operations import EmbeddedIndexOperations
+from .where_filter import matches_where
+
+__all__ = ["EmbeddedIndexOperations", "EmbeddedDocumentStore", "matches_where"]
@@ -0,0 +1,295 @@
+"""On-disk document store with a BM25 inverted index.
+
+This module keeps the documents of the embedded backend in a single SQLite
+file. Properties are stored as JSON and vectors as packed float32, so the ANN
+index can always be rebuilt from the store. Titles and bodies are indexed in an
+FTS5 inverted index, which scores keyword matches with BM25.
+
+Layout:
+    documents        id, properties, vector, timestamp and parent_id columns;
+                     timestamp and parent_id are indexed for filtered searches
+    documents_text   FTS5 index of title and body, keyed by the document rowid
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .where_filter import to_timestamp
+
+# Rows fetched per query while iterating or resolving IDs
+FETCH_SIZE = 500
+
+# BM25 weight of a title match relative to a body match
+TITLE_WEIGHT = 2.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    properties TEXT NOT NULL,
+    vector BLOB,
+    timestamp REAL,
+    parent_id TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_timestamp ON documents (timestamp);
+CREATE INDEX IF NOT EXISTS documents_parent_id ON documents (parent_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_text
+    USING fts5 (title, body, tokenize = 'porter unicode61');
+"""
+
+# (document ID, properties, vector)
+StoredDocument = Tuple[str, Dict, Optional[List[float]]]
+
+
+def extract_text(properties: Dict) -> Tuple[str, str]:
+    """Get the title and body text of a document for keyword indexing.
+
+    Understands both the nested ``content``/``metadata`` properties written by
+    the indexing pipeline and the flat ``content_*`` properties of the schema.
+
+    Returns:
+        Tuple[str, str]: Title and body text
+    """
+    content = properties.get("content")
+    metadata = properties.get("metadata") if isinstance(properties.get("metadata"), dict) else {}
+    titles = [properties.get("content_title"), metadata.get("title")]
+    bodies = [properties.get("content_body"), properties.get("content_summary")]
+    if isinstance(content, dict):
+        titles.append(content.get("title"))
+        bodies.extend([content.get("body"), content.get("summary")])
+    elif content:
+        bodies.append(content)
+    title = " ".join(dict.fromkeys(str(text) for text in titles if text))
+    body = " ".join(dict.fromkeys(str(text) for text in bodies if text))
+    return title, body
+
+
+def extract_timestamp(properties: Dict) -> Optional[float]:
+    """Get the document time used by time range searches."""
+    metadata = properties.get("metadata") if isinstance(properties.get("metadata"), dict) else {}
+    for value in (
+        properties.get("timestamp_utc"),
+        metadata.get("timestamp_utc"),
+        properties.get("last_updated"),
+    ):
+        timestamp = to_timestamp(value)
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def has_vector(vector) -> bool:
+    """Check whether a vector is present and non-empty (lists or arrays)."""
+    return vector is not None and len(vector) > 0
+
+
+def to_match_query(text: str) -> Optional[str]:
+    """Turn free text into an FTS5 query matching any of its terms."""
+    terms = re.findall(r"\w+", text.lower())
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
+class EmbeddedDocumentStore:
+    """SQLite store of documents, vectors and their BM25 keyword index.
+
+    Attributes:
+        path (str): Path of the SQLite database file.
+        logger (logging.Logger): Logger instance for this class.
+    """
+
+    def __init__(self, path: str):
+        """Open or create the document store.
+
+        Args:
+            path: Path of the SQLite database file, or ":memory:".
+
+        Example:
+            ```python
+            store = EmbeddedDocumentStore("/var/lib/rag/Document.db")
+            store.upsert([(doc_id, {"content": {"body": "text"}}, [0.1, 0.2])])
+            hits = store.bm25_search("text", limit=5)
+            ```
+        """
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def count(self, with_vectors: bool = False) -> int:
+        """Number of stored documents, optionally only those with a vector."""
+        query = "SELECT COUNT(*) FROM documents"
+        if with_vectors:
+            query += " WHERE vector IS NOT NULL"
+        with self._lock:
+            return self._conn.execute(query).fetchone()[0]
+
+    def upsert(self, documents: Sequence[StoredDocument]) -> None:
+        """Insert or replace documents in one transaction.
+
+        Args:
+            documents: (ID, properties, vector) of every document.
+        """
+        with self._lock, self._conn:
+            for doc_id, properties, vector in documents:
+                blob = None
+                if has_vector(vector):
+                    blob = np.asarray(vector, dtype=np.float32).tobytes()
+                (rowid,) = self._conn.execute(
+                    "INSERT INTO documents (id, properties, vector, timestamp, parent_id) "
+                    "VALUES (?, ?, ?, ?, ?) ON CONFLICT (id) DO UPDATE SET "
+                    "properties = excluded.properties, vector = excluded.vector, "
+                    "timestamp = excluded.timestamp, parent_id = excluded.parent_id "
+                    "RETURNING rowid",
+                    (
+                        doc_id,
+                        json.dumps(properties, default=str),
+                        blob,
+                        extract_timestamp(properties),
+                        properties.get("parent_id"),
+                    ),
+                ).fetchone()
+                self._conn.execute("DELETE FROM documents_text WHERE rowid = ?", (rowid,))
+                self._conn.execute(
+                    "INSERT INTO documents_text (rowid, title, body) VALUES (?, ?, ?)",
+                    (rowid, *extract_text(properties)),
+                )
+
+    def delete(self, doc_ids: Sequence[str]) -> List[str]:
+        """Delete documents by ID.
+
+        Returns:
+            List[str]: IDs that existed and were deleted.
+        """
+        deleted = []
+        with self._lock, self._conn:
+            for start in range(0, len(doc_ids), FETCH_SIZE):
+                chunk = list(doc_ids[start : start + FETCH_SIZE])
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT rowid, id FROM documents WHERE id IN ({placeholders})", chunk
+                ).fetchall()
+                if not rows:
+                    continue
+                rowids = [rowid for rowid, _ in rows]
+                marks = ",".join("?" * len(rowids))
+                self._conn.execute(f"DELETE FROM documents_text WHERE rowid IN ({marks})", rowids)
+                self._conn.execute(f"DELETE FROM documents WHERE rowid IN ({marks})", rowids)
+                deleted.extend(doc_id for _, doc_id in rows)
+        return deleted
+
+    def get(self, doc_ids: Sequence[str]) -> Dict[str, StoredDocument]:
+        """Fetch documents by ID; missing IDs are left out."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(doc_ids), FETCH_SIZE):
+                chunk = list(doc_ids[start : start + FETCH_SIZE])
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT id, properties, vector FROM documents WHERE id IN ({placeholders})",
+                    chunk,
+                ):
+                    found[row[0]] = self._from_row(row)
+        return found
+
+    def iter_documents(self, batch_size: int = FETCH_SIZE) -> Iterator[StoredDocument]:
+        """Iterate over all documents in insertion order, one page at a time."""
+        after = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT rowid, id, properties, vector FROM documents "
+                    "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (after, batch_size),
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield self._from_row(row[1:])
+            after = rows[-1][0]
+
+    def bm25_search(self, text: str, limit: int) -> List[Tuple[str, float]]:
+        """Rank documents by BM25 keyword relevance.
+
+        Args:
+            text: Free-text query; a document matches if it contains any term.
+            limit: Maximum number of results.
+
+        Returns:
+            List[Tuple[str, float]]: (ID, BM25 score) pairs, best first.
+        """
+        query = to_match_query(text)
+        if not query:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT d.id, bm25(documents_text, ?, 1.0) AS rank "
+                "FROM documents_text JOIN documents d ON d.rowid = documents_text.rowid "
+                "WHERE documents_text MATCH ? ORDER BY rank LIMIT ?",
+                (TITLE_WEIGHT, query, limit),
+            ).fetchall()
+        # SQLite reports BM25 negated so that ascending order is best first
+        return [(doc_id, -rank) for doc_id, rank in rows]
+
+    def find(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        parent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[StoredDocument]:
+        """Fetch documents by time range and/or parent through the column indexes.
+
+        Args:
+            start: Minimum Unix timestamp, inclusive.
+            end: Maximum Unix timestamp, inclusive.
+            parent_id: Required parent document ID.
+            limit: Maximum number of documents, all if None.
+            offset: Number of matching documents to skip.
+
+        Returns:
+            List[StoredDocument]: Matching documents, newest first.
+        """
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end)
+        if parent_id is not None:
+            clauses.append("parent_id = ?")
+            params.append(parent_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        # rowid breaks timestamp ties, so pages never overlap; LIMIT -1 means no limit
+        order = "ORDER BY timestamp DESC, rowid DESC LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT id, properties, vector FROM documents {where} {order}", params
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    @staticmethod
+    def _from_row(row: Tuple) -> StoredDocument:
+        doc_id, properties, blob = row
+        vector = np.frombuffer(blob, dtype=np.float32).tolist() if blob else None
+        return doc_id, json.loads(properties), vector
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,685 @@
+"""Embedded index operations without an external database.
+
+This module implements the ``IndexOperations`` interface on local files: an
+SQLite document store with a BM25 keyword index, and a FAISS ANN index over the
+document vectors. It serves single-node deployments and realistic tests without
+a Weaviate server.
+
+Features:
+1. Search:
+   - Semantic search over cosine similarity, reported as Weaviate certainty
+   - Hybrid search fusing BM25 and vector scores like Weaviate's relative score
+     fusion, weighted by ``alpha``, or with reciprocal rank fusion
+   - Time range and relationship searches through indexed columns, optionally
+     ranked by vector similarity
+   - Batched semantic search in one ANN call
+
+2. Documents:
+   - Same document format, validation and deduplication as the Weaviate backend
+   - Batch deletes, delete by where filter, cursor-style iteration and export
+   - Snapshots in the same chunked format as the Weaviate backend, so either
+     backend can restore the other's snapshots
+
+3. Durability:
+   - The SQLite store is the source of truth, vectors included
+   - The ANN index is saved on ``flush``/``close`` and rebuilt from the store
+     when it is missing or stale, e.g. after a crash
+
+Usage:
+    ```python
+    from src.indexing.embedded import EmbeddedIndexOperations
+
+    ops = EmbeddedIndexOperations("/var/lib/rag/index", class_name="Document")
+    ops.add_documents(documents)
+    results = ops.hybrid_search("vector databases", query_vector, limit=5)
+    ops.close()
+    ```
+
+Note:
+    - Searches return every stored property; ``additional_props`` is accepted
+      for interface compatibility
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import IO, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.indexing.document.bulk_writer import BulkWriteStats
+from src.indexing.document.document_processor import DocumentProcessor
+from src.indexing.document.operations.deletion import (
+    DELETED,
+    DRY_RUN,
+    FAILED,
+    INVALID_ID,
+    NOT_FOUND,
+)
+from src.indexing.document.operations.retrieval import ITER_BATCH_SIZE
+from src.indexing.document.snapshot import (
+    SNAPSHOT_CHUNK_SIZE,
+    ProgressCallback,
+    SnapshotManifest,
+    read_chunk,
+    write_snapshot,
+)
+from src.indexing.search.fusion import fuse
+from src.indexing.search.search_result import ResultProcessor, SearchResult
+from src.utils.vector_index import VectorIndex as AnnIndex
+
+from .document_store import FETCH_SIZE, EmbeddedDocumentStore, StoredDocument, has_vector
+from .where_filter import matches_where, to_timestamp
+
+# Candidates fetched from each ranking before hybrid fusion, per requested result
+CANDIDATE_FACTOR = 4
+MIN_CANDIDATES = 50
+
+
+class EmbeddedIndexOperations:
+    """Index operations on a local document store and ANN index.
+
+    Attributes:
+        data_dir (str): Directory holding the store and the saved ANN index.
+        class_name (str): Name of the document class; names the files.
+        batch_size (int): Number of documents written per transaction.
+        index_type (str): ANN index type, "flat", "ivf" or "hnsw".
+        store (EmbeddedDocumentStore): Documents, vectors and BM25 index.
+        vectors (Optional[AnnIndex]): ANN index, created with the first vector.
+        processor (DocumentProcessor): Document validation and preparation.
+        stats (BulkWriteStats): Write throughput and latency statistics.
+        logger (logging.Logger): Logger instance for this class.
+    """
+
+    def __init__(
+        self,
+        data_dir: str,
+        class_name: str = "Document",
+        batch_size: int = 100,
+        index_type: str = "hnsw",
+    ):
+        """Open or create an embedded index.
+
+        Args:
+            data_dir: Directory for the index files; created if missing.
+            class_name: Name of the document class (default: "Document").
+            batch_size: Number of documents written per transaction (default: 100).
+            index_type: ANN index type (default: "hnsw").
+
+        Example:
+            ```python
+            ops = EmbeddedIndexOperations("/tmp/index", batch_size=500, index_type="flat")
+            ```
+        """
+        os.makedirs(data_dir, exist_ok=True)
+        self.data_dir = data_dir
+        self.class_name = class_name
+        self.batch_size = max(1, batch_size)
+        self.index_type = index_type
+        self.store = EmbeddedDocumentStore(os.path.join(data_dir, f"{class_name}.db"))
+        self.vectors: Optional[AnnIndex] = None
+        self.processor = DocumentProcessor()
+        self.stats = BulkWriteStats()
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._load_vectors()
+
+    @property
+    def _vectors_path(self) -> str:
+        return os.path.join(self.data_dir, f"{self.class_name}.vectors")
+
+    def _load_vectors(self) -> None:
+        """Load the saved ANN index, or rebuild it from the store if missing or stale."""
+        expected = self.store.count(with_vectors=True)
+        if os.path.isdir(self._vectors_path):
+            try:
+                vectors = AnnIndex.load(self._vectors_path)
+                if len(vectors) == expected:
+                    self.vectors = vectors
+                    return
+                self.logger.warning(
+                    f"Saved ANN index has {len(vectors)} vectors, store has {expected}"
+                )
+            except Exception as e:
+                self.logger.warning(f"Could not load ANN index: {str(e)}")
+        if not expected:
+            return
+
+        start = time.perf_counter()
+        batch: List[StoredDocument] = []
+        for doc in self.store.iter_documents():
+            if has_vector(doc[2]):
+                batch.append(doc)
+            if len(batch) >= ITER_BATCH_SIZE:
+                self._index_vectors(batch)
+                batch = []
+        self._index_vectors(batch)
+        self.logger.info(
+            f"Rebuilt ANN index of {expected} vectors in {time.perf_counter() - start:.1f}s"
+        )
+
+    def _index_vectors(self, documents: Sequence[StoredDocument]) -> None:
+        documents = [doc for doc in documents if has_vector(doc[2])]
+        if not documents:
+            return
+        if self.vectors is None:
+            self.vectors = AnnIndex(
+                dimension=len(documents[0][2]), index_type=self.index_type, metric="cosine"
+            )
+        self.vectors.add_vectors([doc[2] for doc in documents], [doc[0] for doc in documents])
+
+    def _mark_dirty(self) -> None:
+        """Drop the saved ANN index on the first change, so a crash forces a rebuild."""
+        if not self._dirty:
+            self._dirty = True
+            shutil.rmtree(self._vectors_path, ignore_errors=True)
+
+    def initialize(self) -> None:
+        """Prepare the index for use; the store creates its tables on open."""
+        self.logger.info(f"Embedded index {self.class_name} ready in {self.data_dir}")
+
+    def get_schema(self) -> Dict:
+        """Describe the embedded document class."""
+        return {"class": self.class_name, "vectorizer": "none", "backend": "embedded"}
+
+    def add_documents(self, documents: List[Dict], deduplicate: bool = True) -> List[str]:
+        """
+        Add a batch of documents to the index.
+
+        Documents are validated, prepared and deduplicated like in the Weaviate
+        backend, and written in transactions of ``batch_size`` documents.
+        Adding an existing ID replaces the document.
+
+        Args:
+            documents: List of document dictionaries to add
+            deduplicate: Whether to skip documents identical to an earlier one
+                in the batch (default: True)
+
+        Returns:
+            List[str]: List of IDs for the added documents
+        """
+        prepared: List[StoredDocument] = []
+        seen_hashes: Set[str] = set()
+        for doc in documents:
+            if not self.processor.validate_document(doc):
+                continue
+            try:
+                doc_id = str(uuid.UUID(doc.get("uuid") or doc.get("id") or ""))
+            except ValueError:
+                self.logger.error(f"Invalid or missing UUID: {doc.get('uuid', doc.get('id'))}")
+                continue
+            if deduplicate:
+                doc_hash = self.processor.compute_document_hash(doc)
+                if doc_hash in seen_hashes:
+                    continue
+                seen_hashes.add(doc_hash)
+            properties, vector = self.processor.prepare_document(doc)
+            prepared.append((doc_id, properties, vector))
+
+        with self._lock:
+            started = time.perf_counter()
+            self._mark_dirty()
+            for start in range(0, len(prepared), self.batch_size):
+                self._write(prepared[start : start + self.batch_size])
+            if prepared:
+                self.stats.flush_latencies.append(time.perf_counter() - started)
+        self.logger.info(f"Added {len(prepared)} documents")
+        return [doc_id for doc_id, _, _ in prepared]
+
+    def _write(self, batch: Sequence[StoredDocument]) -> None:
+        started = time.perf_counter()
+        self.store.upsert(batch)
+        self._index_vectors(batch)
+        without_vectors = [doc_id for doc_id, _, vector in batch if not has_vector(vector)]
+        if without_vectors and self.vectors is not None:
+            self.vectors.remove(without_vectors)
+        elapsed = time.perf_counter() - started
+        self.stats.objects += len(batch)
+        self.stats.requests += 1
+        self.stats.elapsed += elapsed
+        self.stats.latencies.append(elapsed)
+
+    def update_document(
+        self, doc_id: str, updates: Dict, vector: Optional[List[float]] = None
+    ) -> bool:
+        """
+        Update a document's properties and optionally its vector.
+
+        Args:
+            doc_id: ID of the document to update
+            updates: Properties to merge into the document
+            vector: Optional new vector
+
+        Returns:
+            bool: True if the document exists and was updated
+        """
+        with self._lock:
+            existing = self.store.get([doc_id]).get(doc_id)
+            if existing is None:
+                self.logger.warning(f"Document {doc_id} not found for update")
+                return False
+            properties = self.processor.merge_document_updates(existing[1], updates)
+            self._mark_dirty()
+            self._write([(doc_id, properties, vector if has_vector(vector) else existing[2])])
+            return True
+
+    def bulk_delete(self, doc_ids: List[str]) -> Dict[str, str]:
+        """
+        Delete documents by ID.
+
+        Returns:
+            Dict[str, str]: Outcome of every ID: "deleted", "not_found" or "invalid_id"
+        """
+        outcomes: Dict[str, str] = {}
+        valid = []
+        for doc_id in doc_ids:
+            try:
+                valid.append(str(uuid.UUID(doc_id)))
+            except (TypeError, ValueError):
+                outcomes[doc_id] = INVALID_ID
+        with self._lock:
+            self._mark_dirty()
+            deleted = set(self.store.delete(valid))
+            if deleted and self.vectors is not None:
+                self.vectors.remove(list(deleted))
+        for doc_id in valid:
+            outcomes[doc_id] = DELETED if doc_id in deleted else NOT_FOUND
+        self.logger.info(f"Deleted {len(deleted)} of {len(doc_ids)} documents")
+        return outcomes
+
+    def delete_documents(self, doc_ids: List[str]) -> bool:
+        """
+        Delete documents by ID.
+
+        Returns:
+            bool: False if any ID was invalid or any deletion failed
+        """
+        outcomes = self.bulk_delete(doc_ids)
+        return not any(outcome in (INVALID_ID, FAILED) for outcome in outcomes.values())
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """
+        Delete all documents matching a where filter.
+
+        Args:
+            where: Weaviate where filter
+            dry_run: Only report the matching documents (default: False)
+
+        Returns:
+            Dict[str, str]: Outcome of every matched document ID
+        """
+        matched = [doc["id"] for doc in self.iter_documents(where=where)]
+        if dry_run:
+            return {doc_id: DRY_RUN for doc_id in matched}
+        return self.bulk_delete(matched)
+
+    def iter_documents(
+        self,
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over all documents, one page in memory at a time.
+
+        Yields:
+            Dict: Document with ``id``, ``properties`` and, if requested, ``vector``
+        """
+        for doc_id, properties, vector in self.store.iter_documents(max(1, batch_size)):
+            if not matches_where(where, doc_id, properties):
+                continue
+            doc = {"id": doc_id, "properties": properties}
+            if include_vectors:
+                doc["vector"] = vector
+            yield doc
+
+    def export_documents(
+        self,
+        stream: IO[str],
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> int:
+        """
+        Write all documents to a stream as JSON Lines.
+
+        Returns:
+            int: Number of documents written
+        """
+        count = 0
+        for doc in self.iter_documents(batch_size, include_vectors, where):
+            stream.write(json.dumps(doc, default=str))
+            stream.write("\n")
+            count += 1
+        self.logger.info(f"Exported {count} documents")
+        return count
+
+    def create_snapshot(
+        self,
+        path: str,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        compress: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SnapshotManifest:
+        """
+        Save all documents and their vectors to a local snapshot directory.
+
+        Returns:
+            SnapshotManifest: Description of the written snapshot
+        """
+        start = time.perf_counter()
+        manifest = write_snapshot(
+            path,
+            SnapshotManifest(
+                class_name=self.class_name, compressed=compress, schema=self.get_schema()
+            ),
+            self.iter_documents(include_vectors=True),
+            chunk_size,
+            progress,
+        )
+        self.logger.info(
+            f"Saved snapshot of {manifest.count} documents in {len(manifest.chunks)} chunks "
+            f"to {path} ({time.perf_counter() - start:.1f}s)"
+        )
+        return manifest
+
+    def restore_snapshot(
+        self,
+        path: str,
+        class_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
+        """
+        Load a snapshot without re-embedding; existing IDs are overwritten.
+
+        Args:
+            path: Snapshot directory
+            class_name: Must be None or this index's class; the embedded
+                backend restores into its own files
+            progress: Optional callback receiving (documents restored, total)
+
+        Returns:
+            Dict[str, int]: Numbers of restored and failed documents
+
+        Raises:
+            ValueError: If class_name names another class
+        """
+        if class_name not in (None, self.class_name):
+            raise ValueError(f"Embedded index {self.class_name} cannot restore into {class_name}")
+        manifest = SnapshotManifest.load(path)
+        restored = 0
+        with self._lock:
+            self._mark_dirty()
+            for chunk in manifest.chunks:
+                docs = [
+                    (doc["id"], doc["properties"], doc.get("vector"))
+                    for doc in read_chunk(path, chunk, manifest.compressed)
+                ]
+                for start in range(0, len(docs), self.batch_size):
+                    self._write(docs[start : start + self.batch_size])
+                restored += len(docs)
+                if progress:
+                    progress(restored, manifest.count)
+        self.logger.info(f"Restored {restored} documents into {self.class_name}")
+        return {"restored": restored, "failed": 0}
+
+    def _vector_hits(self, query_vector: List[float], limit: int) -> List[Tuple[str, float]]:
+        """Get (ID, cosine similarity) pairs of the nearest vectors."""
+        if self.vectors is None or not len(self.vectors):
+            return []
+        scores, ids = self.vectors.search(query_vector, k=limit)
+        return [
+            (doc_id, float(score)) for score, doc_id in zip(scores[0], ids[0]) if doc_id is not None
+        ]
+
+    def _results(self, hits: Sequence[Tuple[str, Dict]]) -> List[Dict]:
+        """Build Weaviate-style result objects for (ID, additional fields) pairs."""
+        stored = self.store.get([doc_id for doc_id, _ in hits])
+        return [
+            {**stored[doc_id][1], "_additional": {"id": doc_id, **additional}}
+            for doc_id, additional in hits
+            if doc_id in stored
+        ]
+
+    def semantic_search(
+        self,
+        query_vector: List[float],
+        limit: int = 10,
+        min_score: float = 0.7,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[SearchResult]:
+        """
+        Perform semantic search using vector similarity.
+
+        Scores are Weaviate certainties, ``(1 + cosine) / 2``.
+
+        Args:
+            query_vector: Vector embedding to search with
+            limit: Maximum number of results to return (default: 10)
+            min_score: Minimum certainty (default: 0.7)
+            additional_props: Accepted for interface compatibility
+
+        Returns:
+            List[SearchResult]: Results ordered by similarity
+        """
+        return self.batch_semantic_search([query_vector], limit, min_score, additional_props)[0]
+
+    def batch_semantic_search(
+        self,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        min_score: float = 0.7,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        Perform many semantic searches with one ANN call.
+
+        Returns:
+            List[List[SearchResult]]: Results of every query, in input order
+        """
+        if not query_vectors:
+            return []
+        if self.vectors is None or not len(self.vectors):
+            return [[] for _ in query_vectors]
+        scores, ids = self.vectors.search(np.asarray(query_vectors, dtype=np.float32), k=limit)
+        all_results = []
+        for row_scores, row_ids in zip(scores, ids):
+            hits = []
+            for cosine, doc_id in zip(row_scores.tolist(), row_ids):
+                certainty = (1 + cosine) / 2
+                if doc_id is not None and certainty >= min_score:
+                    distance = 1 - cosine
+                    hits.append(
+                        (doc_id, {"score": certainty, "certainty": certainty, "distance": distance})
+                    )
+            all_results.append(ResultProcessor.process_documents(self._results(hits)))
+        return all_results
+
+    def hybrid_search(
+        self,
+        text_query: str,
+        query_vector: List[float],
+        limit: int = 10,
+        alpha: float = 0.5,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Perform hybrid search combining BM25 and vector similarity.
+
+        Args:
+            text_query: Text string to search for
+            query_vector: Vector embedding for similarity search
+            limit: Maximum number of results to return (default: 10)
+            alpha: Weight between text (0) and vector (1) search (default: 0.5)
+            additional_props: Accepted for interface compatibility
+
+        Returns:
+            List[Dict]: Result objects ordered by fused score
+        """
+        candidates = max(limit * CANDIDATE_FACTOR, MIN_CANDIDATES)
+        return self.parallel_hybrid_search(
+            text_query, query_vector, limit, alpha, "relative", candidates, candidates
+        )
+
+    def parallel_hybrid_search(
+        self,
+        text_query: str,
+        query_vector: List[float],
+        limit: int = 10,
+        alpha: float = 0.5,
+        fusion: str = "rrf",
+        bm25_limit: Optional[int] = None,
+        vector_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Perform hybrid search with separate BM25 and vector rankings fused with ``fusion``.
+
+        Both legs are local and run in sequence, so ``timeout`` is accepted for
+        interface compatibility only.
+
+        Args:
+            text_query: Text string to search for
+            query_vector: Vector embedding for similarity search
+            limit: Maximum number of results to return (default: 10)
+            alpha: Weight between text (0) and vector (1) search (default: 0.5)
+            fusion: "rrf" or "relative" (default: "rrf")
+            bm25_limit: Results fetched by the BM25 leg (default: 2 * limit)
+            vector_limit: Results fetched by the vector leg (default: 2 * limit)
+            timeout: Accepted for interface compatibility
+            additional_props: Accepted for interface compatibility
+
+        Returns:
+            List[Dict]: Result objects ordered by fused score
+        """
+        keyword_hits, vector_hits = [], []
+        if alpha < 1 and text_query:
+            keyword_hits = self.store.bm25_search(text_query, bm25_limit or limit * 2)
+        if alpha > 0 and has_vector(query_vector):
+            vector_hits = self._vector_hits(query_vector, vector_limit or limit * 2)
+        fused = fuse(keyword_hits, vector_hits, alpha, fusion)[:limit]
+        return self._results([(doc_id, {"score": score}) for doc_id, score in fused])
+
+    def batch_hybrid_search(
+        self,
+        text_queries: List[str],
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        alpha: float = 0.5,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Perform many hybrid searches.
+
+        Returns:
+            List[List[Dict]]: Results of every query, in input order
+
+        Raises:
+            ValueError: If text_queries and query_vectors differ in length
+        """
+        if len(text_queries) != len(query_vectors):
+            raise ValueError("text_queries and query_vectors must have the same length")
+        return [
+            self.hybrid_search(text, vector, limit, alpha, additional_props)
+            for text, vector in zip(text_queries, query_vectors)
+        ]
+
+    def time_range_search(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents within a time range, newest first or by vector similarity.
+
+        Returns:
+            List[Dict]: Result objects within the time range
+        """
+        return self._find(
+            query_vector, limit, start=to_timestamp(start_time), end=to_timestamp(end_time)
+        )
+
+    def relationship_search(
+        self,
+        parent_id: str,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents of a parent, newest first or by vector similarity.
+
+        Returns:
+            List[Dict]: Result objects related to the parent
+        """
+        return self._find(query_vector, limit, parent_id=parent_id)
+
+    def _find(self, query_vector: Optional[List[float]], limit: int, **filters) -> List[Dict]:
+        """Rank the documents matching store filters, reading them page by page."""
+        if not has_vector(query_vector):
+            return self._rank(self.store.find(limit=limit, **filters), None, limit)
+        ranked: List[Dict] = []
+        offset = 0
+        while True:
+            page = self.store.find(limit=FETCH_SIZE, offset=offset, **filters)
+            ranked = sorted(
+                ranked + self._rank(page, query_vector, limit),
+                key=lambda result: -result["_additional"]["score"],
+            )[:limit]
+            if len(page) < FETCH_SIZE:
+                return ranked
+            offset += FETCH_SIZE
+
+    @staticmethod
+    def _rank(
+        documents: List[StoredDocument], query_vector: Optional[List[float]], limit: int
+    ) -> List[Dict]:
+        """Order filtered documents by exact cosine similarity if a vector is given."""
+        if has_vector(query_vector):
+            documents = [doc for doc in documents if has_vector(doc[2])]
+            if not documents:
+                return []
+            matrix = np.asarray([doc[2] for doc in documents], dtype=np.float32)
+            matrix /= np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+            query = np.asarray(query_vector, dtype=np.float32)
+            similarities = matrix @ (query / max(float(np.linalg.norm(query)), 1e-12))
+            order = np.argsort(-similarities)[:limit]
+            return [
+                {
+                    **documents[i][1],
+                    "_additional": {"id": documents[i][0], "score": float(similarities[i])},
+                }
+                for i in order.tolist()
+            ]
+        return [
+            {**properties, "_additional": {"id": doc_id}}
+            for doc_id, properties, _ in documents[:limit]
+        ]
+
+    def write_stats(self) -> Dict:
+        """Get throughput and latency statistics of document writes."""
+        return self.stats.to_dict()
+
+    def flush(self) -> None:
+        """Save the ANN index so the next open skips the rebuild."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if self.vectors is not None and len(self.vectors):
+                self.vectors.save(self._vectors_path)
+            self._dirty = False
+
+    def close(self) -> None:
+        """Save the ANN index and close the store."""
+        self.flush()
+        self.store.close()
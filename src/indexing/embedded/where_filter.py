@@ -0,0 +1,119 @@
+"""Evaluation of Weaviate where filters against local documents.
+
+The embedded backend accepts the same where filters as the Weaviate backend
+(``delete_by_filter``, ``iter_documents``), so they are evaluated in Python
+against stored properties. Paths address nested properties, and ``["id"]``
+addresses the document ID.
+
+Supported operators: And, Or, Not, Equal, NotEqual, GreaterThan,
+GreaterThanEqual, LessThan, LessThanEqual, Like, ContainsAny, ContainsAll and
+IsNull.
+"""
+
+import fnmatch
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
+
+_MISSING = object()
+
+COMPARISONS = {
+    "Equal": lambda a, b: a == b,
+    "NotEqual": lambda a, b: a != b,
+    "GreaterThan": lambda a, b: a > b,
+    "GreaterThanEqual": lambda a, b: a >= b,
+    "LessThan": lambda a, b: a < b,
+    "LessThanEqual": lambda a, b: a <= b,
+}
+
+
+def to_timestamp(value: Union[str, datetime, None]) -> Optional[float]:
+    """Convert an ISO 8601 string or datetime to a Unix timestamp.
+
+    Naive datetimes are taken as UTC.
+
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if not a date
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _resolve(path: List[str], doc_id: str, properties: Dict) -> Any:
+    if path == ["id"]:
+        return doc_id
+    value: Any = properties
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def _operand_value(where: Dict) -> Any:
+    for key, value in where.items():
+        if key.startswith("value"):
+            return to_timestamp(value) if key == "valueDate" else value
+    raise ValueError(f"Where filter without value: {where}")
+
+
+def matches_where(where: Optional[Dict], doc_id: str, properties: Dict) -> bool:
+    """Check whether a document matches a Weaviate where filter.
+
+    Args:
+        where: Where filter, or None to match everything
+        doc_id: Document ID, addressed by the path ``["id"]``
+        properties: Document properties
+
+    Returns:
+        bool: True if the document matches
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator
+
+    Example:
+        ```python
+        where = {"path": ["parent_id"], "operator": "Equal", "valueText": "workspace"}
+        matches_where(where, doc_id, {"parent_id": "workspace"})  # True
+        ```
+    """
+    if not where:
+        return True
+    operator = where.get("operator")
+    if operator == "And":
+        return all(matches_where(operand, doc_id, properties) for operand in where["operands"])
+    if operator == "Or":
+        return any(matches_where(operand, doc_id, properties) for operand in where["operands"])
+    if operator == "Not":
+        return not matches_where(where["operands"][0], doc_id, properties)
+
+    actual = _resolve(where["path"], doc_id, properties)
+    if operator == "IsNull":
+        return (actual is _MISSING or actual is None) == _operand_value(where)
+    if actual is _MISSING or actual is None:
+        return operator == "NotEqual"
+
+    expected = _operand_value(where)
+    if "valueDate" in where:
+        actual = to_timestamp(actual)
+        if actual is None:
+            return False
+    if operator in COMPARISONS:
+        try:
+            return COMPARISONS[operator](actual, expected)
+        except TypeError:
+            return False
+    if operator == "Like":
+        return fnmatch.fnmatchcase(str(actual).lower(), str(expected).lower())
+    if operator in ("ContainsAny", "ContainsAll"):
+        values = set(actual) if isinstance(actual, (list, tuple, set)) else {actual}
+        check = any if operator == "ContainsAny" else all
+        return check(value in values for value in expected)
+    raise ValueError(f"Unsupported where operator: {operator}")
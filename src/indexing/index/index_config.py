@@ -38,6 +38,8 @@ import weaviate
 
 from src.utils.cache_manager import CacheManager
 
+BACKENDS = ("weaviate", "embedded")
+
 
 @dataclass
 class IndexConfig:
@@ -52,10 +54,17 @@ class IndexConfig:
         client_url: URL of the Weaviate instance (default: "http://localhost:8080")
         class_name: Name of the document class in Weaviate (default: "Document")
         batch_size: Size of batches for bulk operations (default: 100)
+        bulk_workers: Number of concurrent batch write requests (default: 4)
+        max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB)
         cache_host: Redis cache host address (default: "localhost")
         cache_port: Redis cache port number (default: 6379)
         cache_ttl: Cache entry time-to-live in seconds (default: 24 hours)
         cache_prefix: Prefix for cache keys (default: "idx")
+        backend: "weaviate", or "embedded" for local files without a server
+            (default: "weaviate")
+        data_dir: Directory of the embedded backend's files (required for "embedded")
+        ann_index_type: ANN index type of the embedded backend: "flat", "ivf"
+            or "hnsw" (default: "hnsw")
 
     Example:
         ```python
@@ -69,16 +78,33 @@ class IndexConfig:
             cache_host="redis.prod",
             cache_ttl=3600  # 1 hour
         )
+
+        # Single-node deployment without Weaviate
+        edge_config = IndexConfig(backend="embedded", data_dir="/var/lib/rag/index")
         ```
+
+    Raises:
+        ValueError: If the backend is unknown or the embedded backend has no data_dir
     """
 
     client_url: str = "http://localhost:8080"
     class_name: str = "Document"
     batch_size: int = 100
+    bulk_workers: int = 4
+    max_batch_bytes: int = 8 * 1024 * 1024
     cache_host: str = "localhost"
     cache_port: int = 6379
     cache_ttl: int = 86400  # 24 hours
     cache_prefix: str = "idx"
+    backend: str = "weaviate"
+    data_dir: Optional[str] = None
+    ann_index_type: str = "hnsw"
+
+    def __post_init__(self):
+        if self.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {self.backend!r}")
+        if self.backend == "embedded" and not self.data_dir:
+            raise ValueError("The embedded backend requires data_dir")
 
 
 class IndexInitializer:
@@ -48,11 +48,14 @@ Example:
 """
 
 import logging
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import IO, Dict, Iterator, List, Optional
 
 import weaviate
 
 from src.indexing.document import DocumentStorage
+from src.indexing.document.operations.retrieval import ITER_BATCH_SIZE
+from src.indexing.document.snapshot import SNAPSHOT_CHUNK_SIZE, ProgressCallback, SnapshotManifest
 from src.indexing.schema import SchemaMigrator
 from src.indexing.search import SearchExecutor, SearchResult
 from src.utils.cache_manager import CacheManager
@@ -119,6 +122,8 @@ class IndexOperations:
         cache_manager: Optional[CacheManager] = None,
         test_mode: bool = False,
         schema_validator=None,
+        num_workers: int = 4,
+        max_batch_bytes: int = 8 * 1024 * 1024,
     ):
         """
         Initialize a new IndexOperations instance.
@@ -134,6 +139,8 @@ class IndexOperations:
             cache_manager: Optional cache manager for result caching
             test_mode: Whether to run in test mode (default: False)
             schema_validator: Optional custom schema validator
+            num_workers: Number of concurrent batch write requests (default: 4)
+            max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB)
 
         Raises:
             TypeError: If client is not a weaviate.Client instance
@@ -145,10 +152,17 @@ class IndexOperations:
 
         self.schema = SchemaMigrator(client, class_name, schema_validator=schema_validator)
         self.documents = DocumentStorage(
-            client, class_name, batch_size, cache_manager, test_mode=test_mode
+            client,
+            class_name,
+            batch_size,
+            cache_manager,
+            test_mode=test_mode,
+            num_workers=num_workers,
+            max_batch_bytes=max_batch_bytes,
         )
         self.search = SearchExecutor(client, class_name)
         self.logger = logging.getLogger(__name__)
+        self._schema_ready = False
 
     def initialize(self) -> None:
         """
@@ -173,6 +187,7 @@ class IndexOperations:
         """
         try:
             self.schema.ensure_schema()
+            self._schema_ready = True
         except Exception as e:
             msg = f"Error initializing index: {str(e)}"
             self.logger.error(msg)
@@ -183,8 +198,8 @@ class IndexOperations:
         Add a batch of documents to the index.
 
         This method adds multiple documents to the index, optionally performing
-        deduplication. It handles initialization of the schema if needed and
-        processes documents in batches for efficiency.
+        deduplication. It initializes the schema on first use and processes
+        documents in parallel batches for efficiency.
 
         Args:
             documents: List of document dictionaries to add. Each document
@@ -220,7 +235,8 @@ class IndexOperations:
             ```
         """
         try:
-            self.initialize()  # Ensure schema exists
+            if not self._schema_ready:
+                self.initialize()  # Ensure schema exists, once per instance
             return self.documents.add_documents(documents, deduplicate)
         except Exception as e:
             msg = f"Error adding documents: {str(e)}"
@@ -251,6 +267,112 @@ class IndexOperations:
         """
         return self.documents.delete_documents(doc_ids)
 
+    def bulk_delete(self, doc_ids: List[str]) -> Dict[str, str]:
+        """
+        Delete documents by ID with batch delete requests.
+
+        Args:
+            doc_ids: List of document IDs to delete
+
+        Returns:
+            Dict[str, str]: Outcome of every ID: "deleted", "not_found",
+                "invalid_id" or "failed"
+        """
+        return self.documents.bulk_delete(doc_ids)
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """
+        Delete all documents matching a where filter.
+
+        Args:
+            where: Weaviate where filter
+            dry_run: Only report the matching documents (default: False)
+
+        Returns:
+            Dict[str, str]: Outcome of every matched document ID
+        """
+        return self.documents.delete_by_filter(where, dry_run=dry_run)
+
+    def iter_documents(
+        self,
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over all documents in the index with cursor pagination.
+
+        Args:
+            batch_size: Number of objects fetched per request (default: 500)
+            include_vectors: Whether to include object vectors (default: False)
+            where: Optional Weaviate where filter
+
+        Returns:
+            Iterator[Dict]: Documents with "id", "properties" and optionally "vector"
+        """
+        return self.documents.iter_documents(batch_size, include_vectors, where)
+
+    def export_documents(
+        self,
+        stream: IO[str],
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> int:
+        """
+        Write all documents in the index to a stream as JSON Lines.
+
+        Args:
+            stream: Text stream to write to
+            batch_size: Number of objects fetched per request (default: 500)
+            include_vectors: Whether to include object vectors (default: False)
+            where: Optional Weaviate where filter
+
+        Returns:
+            int: Number of documents written
+        """
+        return self.documents.export_documents(stream, batch_size, include_vectors, where)
+
+    def create_snapshot(
+        self,
+        path: str,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        compress: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SnapshotManifest:
+        """
+        Save all documents in the index and their vectors to a local directory.
+
+        Args:
+            path: Directory to write the snapshot to
+            chunk_size: Number of documents per chunk file (default: 10000)
+            compress: Whether to gzip chunk files (default: True)
+            progress: Optional callback receiving (documents saved, 0)
+
+        Returns:
+            SnapshotManifest: Description of the written snapshot
+        """
+        return self.documents.create_snapshot(path, chunk_size, compress, progress)
+
+    def restore_snapshot(
+        self,
+        path: str,
+        class_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
+        """
+        Bulk-load a snapshot without re-embedding.
+
+        Args:
+            path: Snapshot directory
+            class_name: Target class, defaults to the index class
+            progress: Optional callback receiving (documents restored, total)
+
+        Returns:
+            Dict[str, int]: Numbers of restored and failed documents
+        """
+        return self.documents.restore_snapshot(path, class_name, progress)
+
     def update_document(
         self, doc_id: str, updates: Dict, vector: Optional[List[float]] = None
     ) -> bool:
@@ -367,3 +489,166 @@ class IndexOperations:
             ```
         """
         return self.search.hybrid_search(text_query, query_vector, limit, alpha, additional_props)
+
+    def parallel_hybrid_search(
+        self,
+        text_query: str,
+        query_vector: List[float],
+        limit: int = 10,
+        alpha: float = 0.5,
+        fusion: str = "rrf",
+        bm25_limit: Optional[int] = None,
+        vector_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Perform hybrid search as concurrent BM25 and vector queries fused client-side.
+
+        Each leg has its own limit, and both share a deadline; a leg that fails
+        or misses it is dropped and the other leg's results are returned.
+
+        Args:
+            text_query: Text string to search for
+            query_vector: Vector embedding for similarity search
+            limit: Maximum number of results to return (default: 10)
+            alpha: Weight between text (0) and vector (1) results (default: 0.5)
+            fusion: "rrf" for reciprocal rank fusion or "relative" for
+                normalized score fusion (default: "rrf")
+            bm25_limit: Results fetched by the BM25 leg (default: 2 * limit)
+            vector_limit: Results fetched by the vector leg (default: 2 * limit)
+            timeout: Seconds to wait for both legs; None waits indefinitely
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Result objects ordered by fused score
+        """
+        return self.search.parallel_hybrid_search(
+            text_query,
+            query_vector,
+            limit,
+            alpha,
+            fusion,
+            bm25_limit,
+            vector_limit,
+            timeout,
+            additional_props,
+        )
+
+    def batch_semantic_search(
+        self,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        min_score: float = 0.7,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        Perform many semantic searches with batched, concurrent requests.
+
+        Args:
+            query_vectors: Vector embeddings of the queries
+            limit: Maximum number of results per query (default: 10)
+            min_score: Minimum similarity score threshold (default: 0.7)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[List[SearchResult]]: Results of every query, in input order
+
+        Example:
+            ```python
+            all_results = ops.batch_semantic_search(query_vectors, limit=5)
+            for vector, results in zip(query_vectors, all_results):
+                print(len(results))
+            ```
+        """
+        return self.search.batch_semantic_search(query_vectors, limit, min_score, additional_props)
+
+    def batch_hybrid_search(
+        self,
+        text_queries: List[str],
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        alpha: float = 0.5,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Perform many hybrid searches with batched, concurrent requests.
+
+        Args:
+            text_queries: Text strings to search for
+            query_vectors: Vector embeddings aligned with text_queries
+            limit: Maximum number of results per query (default: 10)
+            alpha: Weight between text (0) and vector (1) search (default: 0.5)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[List[Dict]]: Results of every query, in input order
+        """
+        return self.search.batch_hybrid_search(
+            text_queries, query_vectors, limit, alpha, additional_props
+        )
+
+    def time_range_search(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents within a time range, optionally ranked by vector similarity.
+
+        Args:
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            query_vector: Optional vector for similarity search
+            limit: Maximum number of results to return (default: 10)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Documents within the time range
+        """
+        return self.search.time_range_search(
+            start_time, end_time, query_vector, limit, additional_props
+        )
+
+    def relationship_search(
+        self,
+        parent_id: str,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents related to a parent, optionally ranked by vector similarity.
+
+        Args:
+            parent_id: ID of the parent document
+            query_vector: Optional vector for similarity search
+            limit: Maximum number of results to return (default: 10)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Documents related to the parent
+        """
+        return self.search.relationship_search(parent_id, query_vector, limit, additional_props)
+
+    def get_schema(self) -> Optional[Dict]:
+        """
+        Get the current schema of the document class.
+
+        Returns:
+            Optional[Dict]: Schema of the document class
+        """
+        return self.schema.validator.get_schema()
+
+    def write_stats(self) -> Dict:
+        """
+        Get throughput and latency statistics of document writes.
+
+        Returns:
+            Dict: Objects written and failed, retries, requests, objects per
+                second and p95 batch request latency in milliseconds
+        """
+        return self.documents.batch_manager.stats.to_dict()
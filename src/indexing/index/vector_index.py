@@ -8,8 +8,12 @@ management and search operations.
 
 The interface handles:
 - Document management (add, update, delete)
+- Cursor-based iteration and export of the whole index
+- Offline snapshots and bulk restore without re-embedding
 - Vector similarity search
 - Hybrid text and vector search
+- Time range and relationship search
+- Weaviate or embedded (local BM25 and ANN) backend
 - Schema management
 - Resource cleanup
 - Comprehensive logging
@@ -52,8 +56,11 @@ Example:
 """
 
 import logging
-from typing import Dict, List, Optional
+from datetime import datetime
+from typing import IO, Dict, Iterator, List, Optional
 
+from src.indexing.document.operations.retrieval import ITER_BATCH_SIZE
+from src.indexing.document.snapshot import SNAPSHOT_CHUNK_SIZE, ProgressCallback, SnapshotManifest
 from src.indexing.search import SearchResult
 
 from .index_config import IndexConfig, IndexInitializer
@@ -122,6 +129,11 @@ class VectorIndex:
         batch_size: int = 100,
         test_mode: bool = False,
         schema_validator=None,
+        bulk_workers: int = 4,
+        max_batch_bytes: int = 8 * 1024 * 1024,
+        backend: str = "weaviate",
+        data_dir: Optional[str] = None,
+        ann_index_type: str = "hnsw",
     ):
         """
         Initialize a new VectorIndex instance.
@@ -136,6 +148,12 @@ class VectorIndex:
             batch_size: Number of documents to process in each batch (default: 100)
             test_mode: Whether to run in test mode (default: False)
             schema_validator: Optional custom schema validator
+            bulk_workers: Number of concurrent batch write requests (default: 4)
+            max_batch_bytes: Maximum JSON payload size per batch request (default: 8 MiB)
+            backend: "weaviate", or "embedded" for a local store and ANN index
+                without a server (default: "weaviate")
+            data_dir: Directory of the embedded backend's files
+            ann_index_type: ANN index type of the embedded backend (default: "hnsw")
 
         Raises:
             ConnectionError: If unable to connect to Weaviate
@@ -152,6 +170,9 @@ class VectorIndex:
                 class_name="ProductionDocs",
                 batch_size=500
             )
+
+            # Embedded backend for single-node deployments and tests
+            local_index = VectorIndex(backend="embedded", data_dir="/var/lib/rag/index")
             ```
         """
         logger.info(f"Initializing VectorIndex with class_name={class_name}, test_mode={test_mode}")
@@ -159,7 +180,23 @@ class VectorIndex:
             client_url=client_url,
             class_name=class_name,
             batch_size=batch_size,
+            bulk_workers=bulk_workers,
+            max_batch_bytes=max_batch_bytes,
+            backend=backend,
+            data_dir=data_dir,
+            ann_index_type=ann_index_type,
         )
+        self._initialized = False
+        if config.backend == "embedded":
+            # Imported lazily: the embedded backend needs FAISS, Weaviate deployments do not
+            from src.indexing.embedded import EmbeddedIndexOperations
+
+            self.operations = EmbeddedIndexOperations(
+                config.data_dir, class_name, batch_size, index_type=config.ann_index_type
+            )
+            logger.debug(f"Created embedded index operations in {config.data_dir}")
+            return
+
         initializer = IndexInitializer(config)
         client, cache_manager = initializer.initialize()
         logger.debug("Initialized client and cache manager")
@@ -171,9 +208,10 @@ class VectorIndex:
             cache_manager,
             test_mode=test_mode,
             schema_validator=schema_validator,
+            num_workers=config.bulk_workers,
+            max_batch_bytes=config.max_batch_bytes,
         )
         logger.debug("Created IndexOperations instance")
-        self._initialized = False
 
     def initialize(self) -> None:
         """
@@ -236,7 +274,7 @@ class VectorIndex:
         """
         if not self.is_initialized:
             return None
-        return self.operations.schema.validator.get_schema()
+        return self.operations.get_schema()
 
     def add_documents(self, documents: List[Dict], deduplicate: bool = True) -> List[str]:
         """
@@ -288,8 +326,9 @@ class VectorIndex:
         """
         Delete multiple documents from the index.
 
-        This method removes the specified documents from the index. It operates
-        in batch mode for efficiency and includes proper error handling.
+        This method removes the specified documents from the index with batch
+        delete requests (chunks of IDs per request) and includes proper error
+        handling. Use ``bulk_delete`` for per-document outcomes.
 
         Args:
             doc_ids: List of document IDs to delete
@@ -306,11 +345,173 @@ class VectorIndex:
                 print("Some deletions may have failed")
             ```
         """
-        logger.info(f"Deleting documents: {doc_ids}")
+        logger.info(f"Deleting {len(doc_ids)} documents")
         success = self.operations.delete_documents(doc_ids)
         logger.debug(f"Delete operation {'succeeded' if success else 'failed'}")
         return success
 
+    def bulk_delete(self, doc_ids: List[str]) -> Dict[str, str]:
+        """
+        Delete documents by ID and report the outcome of each.
+
+        Args:
+            doc_ids: List of document IDs to delete
+
+        Returns:
+            Dict[str, str]: Outcome of every ID: "deleted", "not_found",
+                "invalid_id" or "failed"
+
+        Example:
+            ```python
+            outcomes = index.bulk_delete(doc_ids)
+            retry = [doc_id for doc_id, outcome in outcomes.items() if outcome == "failed"]
+            ```
+        """
+        logger.info(f"Bulk deleting {len(doc_ids)} documents")
+        return self.operations.bulk_delete(doc_ids)
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """
+        Delete all documents matching a where filter.
+
+        Args:
+            where: Weaviate where filter, e.g. on a source path or tenant property
+            dry_run: Only report the matching documents (default: False)
+
+        Returns:
+            Dict[str, str]: Outcome of every matched document ID
+
+        Example:
+            ```python
+            outcomes = index.delete_by_filter(
+                {"path": ["parent_id"], "operator": "Equal", "valueText": parent_id}
+            )
+            print(f"Deleted {len(outcomes)} chunks")
+            ```
+        """
+        logger.info(f"Deleting documents matching filter: {where}")
+        return self.operations.delete_by_filter(where, dry_run=dry_run)
+
+    def iter_documents(
+        self,
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Iterate over all documents in the index.
+
+        Pages are fetched with Weaviate's ``after`` cursor, so memory use stays
+        constant and every page costs the same no matter how large the index is.
+
+        Args:
+            batch_size: Number of objects fetched per request (default: 500)
+            include_vectors: Whether to include object vectors (default: False)
+            where: Optional Weaviate where filter
+
+        Returns:
+            Iterator[Dict]: Documents with "id", "properties" and optionally "vector"
+
+        Example:
+            ```python
+            stale = [
+                doc["id"]
+                for doc in index.iter_documents(batch_size=1000)
+                if doc["properties"].get("source") not in live_sources
+            ]
+            ```
+        """
+        return self.operations.iter_documents(batch_size, include_vectors, where)
+
+    def export_documents(
+        self,
+        stream: IO[str],
+        batch_size: int = ITER_BATCH_SIZE,
+        include_vectors: bool = False,
+        where: Optional[Dict] = None,
+    ) -> int:
+        """
+        Stream all documents in the index to a file as JSON Lines.
+
+        Args:
+            stream: Text stream to write to, one document per line
+            batch_size: Number of objects fetched per request (default: 500)
+            include_vectors: Whether to include object vectors (default: False)
+            where: Optional Weaviate where filter
+
+        Returns:
+            int: Number of documents written
+
+        Example:
+            ```python
+            with open("documents.jsonl", "w") as f:
+                count = index.export_documents(f, include_vectors=True)
+            ```
+        """
+        logger.info(f"Exporting documents (include_vectors={include_vectors})")
+        return self.operations.export_documents(stream, batch_size, include_vectors, where)
+
+    def snapshot(
+        self,
+        path: str,
+        chunk_size: int = SNAPSHOT_CHUNK_SIZE,
+        compress: bool = True,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SnapshotManifest:
+        """
+        Save all documents and their vectors to a local snapshot directory.
+
+        The snapshot holds columnar metadata and float32 ``.npy`` vectors in
+        chunks, so a class can be rebuilt without re-running summarization
+        and embedding.
+
+        Args:
+            path: Directory to write the snapshot to
+            chunk_size: Number of documents per chunk file (default: 10000)
+            compress: Whether to gzip chunk files (default: True)
+            progress: Optional callback receiving (documents saved, 0)
+
+        Returns:
+            SnapshotManifest: Description of the written snapshot
+
+        Example:
+            ```python
+            manifest = index.snapshot("/backups/documents-2024-06-01")
+            print(f"Saved {manifest.count} documents ({manifest.dimension}-d vectors)")
+            ```
+        """
+        logger.info(f"Creating snapshot at {path}")
+        return self.operations.create_snapshot(path, chunk_size, compress, progress)
+
+    def restore(
+        self,
+        path: str,
+        class_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
+        """
+        Restore a snapshot through the parallel batch write path.
+
+        Args:
+            path: Snapshot directory
+            class_name: Target class, created from the snapshot schema if missing
+                (default: this index's class)
+            progress: Optional callback receiving (documents restored, total)
+
+        Returns:
+            Dict[str, int]: Numbers of restored and failed documents
+
+        Example:
+            ```python
+            result = index.restore(
+                "/backups/documents-2024-06-01",
+                progress=lambda done, total: print(f"{done}/{total}"),
+            )
+            ```
+        """
+        logger.info(f"Restoring snapshot from {path}")
+        return self.operations.restore_snapshot(path, class_name, progress)
+
     def update_document(
         self, doc_id: str, updates: Dict, vector: Optional[List[float]] = None
     ) -> bool:
@@ -434,11 +635,181 @@ class VectorIndex:
             text_query, query_vector, limit, alpha, additional_props
         )
 
+    def parallel_hybrid_search(
+        self,
+        text_query: str,
+        query_vector: List[float],
+        limit: int = 10,
+        alpha: float = 0.5,
+        fusion: str = "rrf",
+        bm25_limit: Optional[int] = None,
+        vector_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Perform hybrid search as concurrent BM25 and vector queries fused client-side.
+
+        Each leg has its own limit, and both share a deadline; a leg that fails
+        or misses it is dropped and the other leg's results are returned.
+
+        Args:
+            text_query: Text string to search for
+            query_vector: Vector embedding for similarity search
+            limit: Maximum number of results to return (default: 10)
+            alpha: Weight between text (0) and vector (1) results (default: 0.5)
+            fusion: "rrf" for reciprocal rank fusion or "relative" for
+                normalized score fusion (default: "rrf")
+            bm25_limit: Results fetched by the BM25 leg (default: 2 * limit)
+            vector_limit: Results fetched by the vector leg (default: 2 * limit)
+            timeout: Seconds to wait for both legs; None waits indefinitely
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Result objects ordered by fused score
+        """
+        return self.operations.parallel_hybrid_search(
+            text_query,
+            query_vector,
+            limit,
+            alpha,
+            fusion,
+            bm25_limit,
+            vector_limit,
+            timeout,
+            additional_props,
+        )
+
+    def batch_semantic_search(
+        self,
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        min_score: float = 0.7,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[SearchResult]]:
+        """
+        Perform many semantic searches with batched, concurrent requests.
+
+        Args:
+            query_vectors: Vector embeddings of the queries
+            limit: Maximum number of results per query (default: 10)
+            min_score: Minimum similarity score threshold (default: 0.7)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[List[SearchResult]]: Results of every query, in input order
+
+        Example:
+            ```python
+            all_results = index.batch_semantic_search(query_vectors, limit=5)
+            for vector, results in zip(query_vectors, all_results):
+                print(len(results))
+            ```
+        """
+        return self.operations.batch_semantic_search(
+            query_vectors, limit, min_score, additional_props
+        )
+
+    def batch_hybrid_search(
+        self,
+        text_queries: List[str],
+        query_vectors: List[List[float]],
+        limit: int = 10,
+        alpha: float = 0.5,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[List[Dict]]:
+        """
+        Perform many hybrid searches with batched, concurrent requests.
+
+        Args:
+            text_queries: Text strings to search for
+            query_vectors: Vector embeddings aligned with text_queries
+            limit: Maximum number of results per query (default: 10)
+            alpha: Weight between text (0) and vector (1) search (default: 0.5)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[List[Dict]]: Results of every query, in input order
+        """
+        return self.operations.batch_hybrid_search(
+            text_queries, query_vectors, limit, alpha, additional_props
+        )
+
+    def time_range_search(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents within a time range, optionally ranked by vector similarity.
+
+        Args:
+            start_time: Start of the time range (inclusive)
+            end_time: End of the time range (inclusive)
+            query_vector: Optional vector for similarity search
+            limit: Maximum number of results to return (default: 10)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Documents within the time range
+
+        Example:
+            ```python
+            end = datetime.now()
+            results = index.time_range_search(end - timedelta(days=7), end, limit=20)
+            ```
+        """
+        return self.operations.time_range_search(
+            start_time, end_time, query_vector, limit, additional_props
+        )
+
+    def relationship_search(
+        self,
+        parent_id: str,
+        query_vector: Optional[List[float]] = None,
+        limit: int = 10,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Find documents related to a parent, optionally ranked by vector similarity.
+
+        Args:
+            parent_id: ID of the parent document
+            query_vector: Optional vector for similarity search
+            limit: Maximum number of results to return (default: 10)
+            additional_props: Additional properties to include in results
+
+        Returns:
+            List[Dict]: Documents related to the parent
+        """
+        return self.operations.relationship_search(parent_id, query_vector, limit, additional_props)
+
+    def write_stats(self) -> Dict:
+        """
+        Get throughput and latency statistics of document writes.
+
+        Returns:
+            Dict: Objects written and failed, retries, requests, objects per
+                second and p95 batch request latency in milliseconds
+
+        Example:
+            ```python
+            index.add_documents(docs)
+            stats = index.write_stats()
+            print(f"{stats['objects_per_second']} obj/s, p95 {stats['p95_latency_ms']} ms")
+            ```
+        """
+        return self.operations.write_stats()
+
     def cleanup(self):
         """
         Clean up resources used by the vector index.
 
         This method ensures proper cleanup of all resources including:
+        - Bulk writer threads (queued documents are written first)
         - Cache manager connections
         - Database client connections
         - Any other managed resources
@@ -460,6 +831,14 @@ class VectorIndex:
             ```
         """
         try:
+            # Save and close the embedded backend
+            if hasattr(self.operations, "close"):
+                self.operations.close()
+
+            # Write queued documents and stop the bulk writer
+            if hasattr(self.operations, "documents"):
+                self.operations.documents.batch_manager.close()
+
             # Clean up cache manager
             if hasattr(self.operations, "cache_manager"):
                 self.operations.cache_manager.cleanup()
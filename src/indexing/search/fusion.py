@@ -0,0 +1,112 @@
+"""
+Client-side fusion of keyword and vector rankings.
+
+Hybrid searches that run the BM25 and vector queries separately combine the two
+rankings here. Both functions take rankings as (ID, score) pairs, best first,
+weight the vector ranking by ``alpha`` and the keyword ranking by ``1 - alpha``,
+and return each ID once.
+
+Fusion methods:
+    - ``rrf``: reciprocal rank fusion, ``sum(weight / (k + rank))``; ignores raw
+      scores, so BM25 and similarity scales need not be comparable
+    - ``relative``: min-max normalized scores, like Weaviate's relative score
+      fusion; keeps how far apart the scores are
+
+Example:
+    ```python
+    keyword = [("doc-1", 7.2), ("doc-2", 3.1)]
+    vector = [("doc-2", 0.91), ("doc-3", 0.88)]
+    fused = reciprocal_rank_fusion(keyword, vector, alpha=0.5)
+    # [("doc-2", ...), ("doc-1", ...), ("doc-3", ...)]
+    ```
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+FUSION_METHODS = ("rrf", "relative")
+
+# Rank offset of reciprocal rank fusion; 60 is the value from the original paper
+RRF_K = 60
+
+Hits = Sequence[Tuple[str, float]]
+
+
+class FusedResults(list):
+    """Result objects of a client-side fused hybrid search.
+
+    Attributes:
+        degraded (bool): Whether a retrieval leg failed or missed its deadline,
+            so the results were ranked by the other leg alone.
+    """
+
+    def __init__(self, results: Iterable[Dict] = (), degraded: bool = False):
+        super().__init__(results)
+        self.degraded = degraded
+
+
+def reciprocal_rank_fusion(
+    keyword_hits: Hits, vector_hits: Hits, alpha: float = 0.5, k: int = RRF_K
+) -> List[Tuple[str, float]]:
+    """Combine keyword and vector rankings with weighted reciprocal rank fusion.
+
+    A document scores ``weight / (k + rank)`` in every ranking it appears in,
+    with ranks starting at 1. A repeated ID counts at its best rank.
+
+    Returns:
+        List[Tuple[str, float]]: (ID, fused score) pairs, best first.
+    """
+    fused: Dict[str, float] = {}
+    for hits, weight in ((keyword_hits, 1 - alpha), (vector_hits, alpha)):
+        seen = set()
+        for rank, (doc_id, _) in enumerate(hits, start=1):
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            fused[doc_id] = fused.get(doc_id, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+def fuse_scores(keyword_hits: Hits, vector_hits: Hits, alpha: float) -> List[Tuple[str, float]]:
+    """Combine keyword and vector rankings with relative score fusion.
+
+    Scores of each ranking are min-max normalized to [0, 1]; a document missing
+    from a ranking scores 0 there. The fused score is
+    ``alpha * vector + (1 - alpha) * keyword``.
+
+    Returns:
+        List[Tuple[str, float]]: (ID, fused score) pairs, best first.
+    """
+
+    def normalize(hits: Hits) -> Dict[str, float]:
+        if not hits:
+            return {}
+        scores = [score for _, score in hits]
+        low, high = min(scores), max(scores)
+        if high == low:
+            return {doc_id: 1.0 for doc_id, _ in hits}
+        normalized: Dict[str, float] = {}
+        for doc_id, score in hits:
+            normalized.setdefault(doc_id, (score - low) / (high - low))
+        return normalized
+
+    keyword, vector = normalize(keyword_hits), normalize(vector_hits)
+    fused = {
+        doc_id: alpha * vector.get(doc_id, 0.0) + (1 - alpha) * keyword.get(doc_id, 0.0)
+        for doc_id in {**keyword, **vector}
+    }
+    return sorted(fused.items(), key=lambda item: item[1], reverse=True)
+
+
+def fuse(
+    keyword_hits: Hits, vector_hits: Hits, alpha: float = 0.5, method: str = "rrf"
+) -> List[Tuple[str, float]]:
+    """Combine keyword and vector rankings with the given fusion method.
+
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method == "rrf":
+        return reciprocal_rank_fusion(keyword_hits, vector_hits, alpha)
+    if method == "relative":
+        return fuse_scores(keyword_hits, vector_hits, alpha)
+    raise ValueError(f"fusion must be one of {FUSION_METHODS}, got {method!r}")
@@ -3,6 +3,8 @@ Executes various types of search operations against a Weaviate vector database.
 
 This module provides the SearchExecutor class which implements different search strategies
 including semantic search, hybrid search, time-range search, and relationship-based search.
+Hybrid searches run either as one Weaviate query or as parallel BM25 and vector
+queries with per-leg limits and a deadline, fused client-side.
 It handles the execution of queries and processes the results into a standardized format.
 
 The module integrates with Weaviate's Python client and includes comprehensive error
@@ -23,13 +25,39 @@ Example:
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import weaviate
 
+from .fusion import FUSION_METHODS, FusedResults, fuse
 from .search_result import ResultProcessor, SearchResult
 
+# Queries combined into one aliased GraphQL request by the batch searches
+QUERIES_PER_REQUEST = 16
+
+# Batched requests in flight at once
+BATCH_CONCURRENCY = 4
+
+# Results fetched by each leg of a parallel hybrid search, per requested result
+LEG_CANDIDATE_FACTOR = 2
+
+# Threads running the legs of parallel hybrid searches, shared by all executors
+LEG_WORKERS = 8
+
+DEFAULT_PROPERTIES = [
+    "content_body",
+    "content_summary",
+    "content_title",
+    "timestamp_utc",
+    "schema_version",
+    "parent_id",
+    "chunk_ids",
+]
+
 
 class SearchExecutor:
     """
@@ -38,6 +66,7 @@ class SearchExecutor:
     This class provides methods to perform various types of searches including:
     - Semantic search using vector similarity
     - Hybrid search combining vector and text-based search
+    - Parallel hybrid search fusing separate BM25 and vector queries client-side
     - Time range filtering with optional vector similarity
     - Relationship-based search for finding related documents
 
@@ -52,6 +81,9 @@ class SearchExecutor:
         result_processor: Instance of ResultProcessor for handling query results
     """
 
+    _leg_pool: Optional[ThreadPoolExecutor] = None
+    _leg_pool_lock = threading.Lock()
+
     def __init__(self, client: weaviate.Client, class_name: str):
         """
         Initialize a new SearchExecutor instance.
@@ -69,6 +101,20 @@ class SearchExecutor:
         self.logger = logging.getLogger(__name__)
         self.result_processor = ResultProcessor()
 
+    @classmethod
+    def _legs(cls) -> ThreadPoolExecutor:
+        """Get the thread pool running hybrid search legs, created on first use.
+
+        The pool is shared so that a leg past its deadline keeps running in the
+        background without holding up the caller or leaking a thread per query.
+        """
+        with cls._leg_pool_lock:
+            if cls._leg_pool is None:
+                cls._leg_pool = ThreadPoolExecutor(
+                    max_workers=LEG_WORKERS, thread_name_prefix="hybrid-leg"
+                )
+            return cls._leg_pool
+
     def semantic_search(
         self,
         query_vector: List[float],
@@ -257,6 +303,273 @@ class SearchExecutor:
             self.logger.error(f"Error in hybrid search: {str(e)}")
             return []
 
+    def parallel_hybrid_search(
+        self,
+        text_query: str,
+        query_vector: List[float],
+        limit: int = 10,
+        alpha: float = 0.5,
+        fusion: str = "rrf",
+        bm25_limit: Optional[int] = None,
+        vector_limit: Optional[int] = None,
+        timeout: Optional[float] = None,
+        additional_props: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        Execute a hybrid search as concurrent BM25 and vector queries fused client-side.
+
+        Unlike ``hybrid_search``, the two retrieval legs are separate requests
+        with their own limits, run in parallel and bounded by a shared deadline.
+        A leg that fails or misses the deadline is dropped, and the results of
+        the other leg are returned alone. Results are deduplicated by ID.
+
+        Args:
+            text_query: Text string to search for using BM25
+            query_vector: Vector embedding for similarity search
+            limit: Maximum number of results to return (default: 10)
+            alpha: Weight between text (0) and vector (1) results (default: 0.5)
+            fusion: "rrf" for reciprocal rank fusion or "relative" for
+                normalized score fusion (default: "rrf")
+            bm25_limit: Results fetched by the BM25 leg (default: 2 * limit)
+            vector_limit: Results fetched by the vector leg (default: 2 * limit)
+            timeout: Seconds to wait for both legs; None waits indefinitely
+            additional_props: Additional properties to include in results
+
+        Returns:
+            FusedResults: Result objects ordered by fused score; ``_additional``
+                holds the ``id`` and the fused ``score``. ``degraded`` is set if
+                a leg was dropped.
+
+        Raises:
+            ValueError: If the fusion method is unknown
+
+        Example:
+            ```python
+            results = executor.parallel_hybrid_search(
+                text_query="machine learning",
+                query_vector=[0.1, 0.2, 0.3],
+                bm25_limit=50,
+                vector_limit=20,
+                timeout=0.25,
+            )
+            ```
+        """
+        if fusion not in FUSION_METHODS:
+            raise ValueError(f"fusion must be one of {FUSION_METHODS}, got {fusion!r}")
+        properties = DEFAULT_PROPERTIES + list(additional_props or [])
+        legs: Dict[str, Callable[[], List[Dict]]] = {}
+        if alpha < 1 and text_query:
+            legs["bm25"] = lambda: self._run_leg(
+                properties,
+                ["id", "score"],
+                lambda query: query.with_bm25({"query": text_query}),
+                bm25_limit or limit * LEG_CANDIDATE_FACTOR,
+            )
+        if alpha > 0 and query_vector:
+            legs["vector"] = lambda: self._run_leg(
+                properties,
+                ["id", "certainty"],
+                lambda query: query.with_near_vector({"vector": query_vector}),
+                vector_limit or limit * LEG_CANDIDATE_FACTOR,
+            )
+        if not legs:
+            return FusedResults()
+
+        started = time.perf_counter()
+        futures = {name: self._legs().submit(leg) for name, leg in legs.items()}
+        wait(futures.values(), timeout=timeout)
+        results: Dict[str, List[Dict]] = {"bm25": [], "vector": []}
+        degraded = False
+        for name, future in futures.items():
+            if not future.done():
+                future.cancel()
+                degraded = True
+                self.logger.warning(f"Hybrid search {name} leg missed its {timeout}s deadline")
+            elif future.exception():
+                degraded = True
+                self.logger.error(f"Error in hybrid search {name} leg: {future.exception()}")
+            else:
+                results[name] = future.result()
+        self.logger.debug(
+            f"Hybrid search legs returned {len(results['bm25'])} BM25 and "
+            f"{len(results['vector'])} vector results in "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+        objects: Dict[str, Dict] = {}
+        hits: Dict[str, List[Tuple[str, float]]] = {}
+        for name, score_field in (("bm25", "score"), ("vector", "certainty")):
+            hits[name] = []
+            for obj in results[name]:
+                additional = obj.get("_additional") or {}
+                if not additional.get("id"):
+                    continue
+                objects.setdefault(additional["id"], obj)
+                hits[name].append((additional["id"], float(additional.get(score_field) or 0)))
+        fused = fuse(hits["bm25"], hits["vector"], alpha, fusion)[:limit]
+        return FusedResults(
+            (
+                {**objects[doc_id], "_additional": {"id": doc_id, "score": score}}
+                for doc_id, score in fused
+            ),
+            degraded=degraded,
+        )
+
+    def _run_leg(
+        self,
+        properties: List[str],
+        additional: List[str],
+        apply: Callable,
+        limit: int,
+    ) -> List[Dict]:
+        """Run one retrieval leg of a parallel hybrid search and return its objects."""
+        query = self.client.query.get(self.class_name, properties).with_additional(additional)
+        result = apply(query).with_limit(limit).do()
+        if result.get("errors"):
+            raise RuntimeError(result["errors"])
+        return result.get("data", {}).get("Get", {}).get(self.class_name) or []
+
+    def batch_semantic_search(
+        self,
+        query_vectors: Sequence[List[float]],
+        limit: int = 10,
+        min_score: float = 0.7,
+        additional_props: Optional[List[str]] = None,
+        queries_per_request: int = QUERIES_PER_REQUEST,
+        max_concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[List[SearchResult]]:
+        """
+        Execute many semantic searches with few round trips.
+
+        Queries are combined into GraphQL requests of ``queries_per_request``
+        aliased ``Get`` queries each, and up to ``max_concurrency`` requests are
+        in flight at once.
+
+        Args:
+            query_vectors: Vector embeddings of the search queries
+            limit: Maximum number of results per query (default: 10)
+            min_score: Minimum similarity score threshold (0-1) (default: 0.7)
+            additional_props: Additional properties to include in results
+            queries_per_request: Queries per GraphQL request (default: 16)
+            max_concurrency: Maximum number of concurrent requests (default: 4)
+
+        Returns:
+            List[List[SearchResult]]: Results of every query, in input order. A
+                query whose request failed has an empty result list.
+
+        Example:
+            ```python
+            vectors = embedder.embed_batch(questions)
+            for question, results in zip(questions, executor.batch_semantic_search(vectors)):
+                print(question, [r.id for r in results])
+            ```
+        """
+        queries = [
+            {"near_vector": {"vector": list(vector), "certainty": min_score}}
+            for vector in query_vectors
+        ]
+        raw = self._execute_batch(
+            queries, limit, additional_props, queries_per_request, max_concurrency
+        )
+        return [self.result_processor.process_documents(documents) for documents in raw]
+
+    def batch_hybrid_search(
+        self,
+        text_queries: Sequence[str],
+        query_vectors: Sequence[List[float]],
+        limit: int = 10,
+        alpha: float = 0.5,
+        additional_props: Optional[List[str]] = None,
+        queries_per_request: int = QUERIES_PER_REQUEST,
+        max_concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[List[Dict]]:
+        """
+        Execute many hybrid searches with few round trips.
+
+        Queries are batched like in ``batch_semantic_search``; each query is
+        built like a single ``hybrid_search``.
+
+        Args:
+            text_queries: Text strings to search for using BM25
+            query_vectors: Vector embeddings aligned with ``text_queries``
+            limit: Maximum number of results per query (default: 10)
+            alpha: Weight between text (0) and vector (1) search (default: 0.5)
+            additional_props: Additional properties to include in results
+            queries_per_request: Queries per GraphQL request (default: 16)
+            max_concurrency: Maximum number of concurrent requests (default: 4)
+
+        Returns:
+            List[List[Dict]]: Results of every query, in input order
+
+        Raises:
+            ValueError: If text_queries and query_vectors differ in length
+        """
+        if len(text_queries) != len(query_vectors):
+            raise ValueError("text_queries and query_vectors must have the same length")
+        queries = [
+            {
+                "near_vector": {"vector": list(vector), "certainty": alpha},
+                "bm25": {"query": text},
+            }
+            for text, vector in zip(text_queries, query_vectors)
+        ]
+        return self._execute_batch(
+            queries, limit, additional_props, queries_per_request, max_concurrency
+        )
+
+    def _execute_batch(
+        self,
+        queries: List[Dict],
+        limit: int,
+        additional_props: Optional[List[str]],
+        queries_per_request: int,
+        max_concurrency: int,
+    ) -> List[List[Dict]]:
+        """Run queries as aliased GraphQL requests and return raw results in input order."""
+        if not queries:
+            return []
+        properties = DEFAULT_PROPERTIES + list(additional_props or [])
+        size = max(1, queries_per_request)
+        groups = [
+            range(start, min(start + size, len(queries))) for start in range(0, len(queries), size)
+        ]
+        self.logger.info(
+            f"Executing {len(queries)} searches in {len(groups)} requests "
+            f"(concurrency={max_concurrency})"
+        )
+
+        def run(group: range) -> List[List[Dict]]:
+            builders = []
+            for i in group:
+                builder = (
+                    self.client.query.get(self.class_name, properties)
+                    .with_alias(f"q{i}")
+                    .with_additional(["id", "score"])
+                    .with_near_vector(queries[i]["near_vector"])
+                    .with_limit(limit)
+                )
+                if "bm25" in queries[i]:
+                    builder = builder.with_bm25(queries[i]["bm25"])
+                builders.append(builder)
+            try:
+                result = self.client.query.multi_get(builders).do()
+                if result.get("errors"):
+                    raise RuntimeError(result["errors"])
+                data = result.get("data", {}).get("Get", {})
+                return [data.get(f"q{i}") or [] for i in group]
+            except Exception as e:
+                self.logger.error(
+                    f"Error in batch search of queries {group[0]}-{group[-1]}: {str(e)}"
+                )
+                return [[] for _ in group]
+
+        if len(groups) == 1 or max_concurrency <= 1:
+            grouped = [run(group) for group in groups]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_concurrency, len(groups))) as executor:
+                grouped = list(executor.map(run, groups))
+        return [results for group_results in grouped for results in group_results]
+
     def time_range_search(
         self,
         start_time: datetime,
@@ -205,9 +205,32 @@ class ResultProcessor:
             ```
         """
         logger.info("Processing search results")
-        results = []
         try:
             documents = raw_results.get("data", {}).get("Get", {}).get("Document", [])
+        except Exception as e:
+            logger.error(
+                f"Error processing search results: {str(e)}",
+                exc_info=True,
+                extra={"raw_results": raw_results},
+            )
+            return []
+        return ResultProcessor.process_documents(documents)
+
+    @staticmethod
+    def process_documents(documents: List[Dict]) -> List[SearchResult]:
+        """
+        Convert the documents of one query in a search response into SearchResult objects.
+
+        Individual documents that fail to convert are logged and skipped.
+
+        Args:
+            documents: Result objects of one query, e.g. one alias of a batched request
+
+        Returns:
+            List[SearchResult]: Successfully converted search results
+        """
+        results = []
+        try:
             logger.debug(f"Found {len(documents)} documents to process")
 
             for doc in documents:
@@ -228,10 +251,6 @@ class ResultProcessor:
                 )
 
         except Exception as e:
-            logger.error(
-                f"Error processing search results: {str(e)}",
-                exc_info=True,
-                extra={"raw_results": raw_results},
-            )
+            logger.error(f"Error processing search results: {str(e)}", exc_info=True)
 
         return results
@@ -46,7 +46,6 @@ Note:
     - Handles errors gracefully
 """
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict, List
@@ -54,6 +53,7 @@ from typing import Any, Dict, List
 import weaviate
 
 from src.indexing.index.vector_index import VectorIndex as NewVectorIndex
+from src.utils.fingerprint import documents_fingerprint
 
 
 class VectorIndex(NewVectorIndex):
@@ -168,13 +168,13 @@ class VectorIndex(NewVectorIndex):
     def get_all_documents(self) -> List[str]:
         """Retrieve all document IDs from the index.
 
+        Walks the whole index with cursor pagination (see ``iter_documents``).
+
         Returns:
             List of document IDs in the index
         """
         try:
-            result = self.client.data_object.get(class_name=self.class_name)
-            document_ids = [doc["id"] for doc in result["objects"]]
-            return document_ids
+            return [doc["id"] for doc in self.iter_documents()]
         except Exception as e:
             self.logger.error(f"Error retrieving documents: {str(e)}")
             return []
@@ -232,9 +232,8 @@ class VectorIndex(NewVectorIndex):
         Returns:
             Cache key string
         """
-        # Create a stable representation of documents for hashing
-        doc_str = json.dumps(documents, sort_keys=True)
-        return f"docs:{hash(doc_str)}"
+        # Documents are keyed by all their fields but the embedding vectors
+        return f"docs:{documents_fingerprint(documents)}"
 
     def delete_documents(self, document_ids: List[str]) -> bool:
         """Delete documents from the index.
@@ -245,7 +244,7 @@ class VectorIndex(NewVectorIndex):
         Returns:
             True if all documents were deleted successfully
         """
-        self.logger.info(f"Deleting documents: {document_ids}")
+        self.logger.info(f"Deleting {len(document_ids)} documents")
         try:
             return self.operations.delete_documents(doc_ids=document_ids)
         except Exception as e:
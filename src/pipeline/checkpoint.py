@@ -0,0 +1,198 @@
+"""Durable per-batch checkpoints for resumable pipeline runs.
+
+This module persists the output of every batch after each pipeline stage, so
+a run that is interrupted (a failing batch, a killed process, a preempted
+node) can resume from the last completed stage of each batch instead of
+reloading, re-summarizing and re-embedding the whole export.
+
+Features:
+1. Per-Batch Progress:
+   - One checkpoint file per batch, rewritten after every stage
+   - Stores the stage name and the documents it produced (summaries,
+     embeddings, cluster assignments, indexed documents)
+
+2. Safe Resumption:
+   - Batches are matched by a fingerprint of their input content
+   - Checkpoints written with a different run signature (steps, step
+     versions, batch size) are discarded instead of reused
+
+3. Cleanup:
+   - Checkpoints are removed once every batch completed
+
+Usage:
+    ```python
+    from pipeline.checkpoint import CheckpointStore, batch_fingerprint
+
+    store = CheckpointStore(".indexforge/checkpoints")
+    store.open({"stages": ["summarize", "embed"]}, resume=True)
+    fingerprint = batch_fingerprint(batch)
+    saved = store.load(0, fingerprint)  # ("summarize", documents) or None
+    store.save(0, fingerprint, "embed", processor.embed_batch(batch))
+    store.clear()
+    ```
+
+Note:
+    - Files are written atomically (temporary file and rename)
+    - Values that are not JSON serializable are stored as lists (numpy
+      arrays) or strings
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .manifest import content_hash
+
+CHECKPOINT_VERSION = 1
+
+
+def batch_fingerprint(batch: List[Dict]) -> str:
+    """Fingerprint the input content of a batch.
+
+    Document IDs are not included, since documents without a stable ID get a
+    new random one on every run.
+
+    Args:
+        batch: Documents of the batch before any stage ran
+
+    Returns:
+        str: Hex digest over the content hashes of the documents in order
+    """
+    digest = hashlib.sha256()
+    for doc in batch:
+        digest.update(content_hash(doc).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values the json module cannot serialize."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+class CheckpointStore:
+    """Per-batch stage outputs stored in a local directory.
+
+    Attributes:
+        directory (Path): Directory holding the checkpoint files
+        logger (logging.Logger): Logger instance
+    """
+
+    def __init__(self, directory: Union[str, Path], logger: Optional[logging.Logger] = None):
+        """Initialize the store.
+
+        Args:
+            directory: Directory holding the checkpoint files
+            logger: Optional logger instance
+        """
+        self.directory = Path(directory)
+        self.logger = logger or logging.getLogger(__name__)
+
+    @property
+    def run_path(self) -> Path:
+        """Path of the file describing the run that wrote the checkpoints."""
+        return self.directory / "run.json"
+
+    def _batch_path(self, index: int) -> Path:
+        return self.directory / f"batch-{index:06d}.json"
+
+    def _write(self, path: Path, data: Dict) -> None:
+        """Write a JSON file atomically."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=_json_default)
+        os.replace(tmp_path, path)
+
+    def _read(self, path: Path) -> Optional[Dict]:
+        """Read a JSON file, returning None if it is missing or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning("Ignoring unreadable checkpoint %s: %s", path, str(e))
+            return None
+
+    def open(self, signature: Dict, resume: bool = False) -> bool:
+        """Prepare the store for a run.
+
+        Existing checkpoints are kept only when resuming a run with the same
+        signature; otherwise they are removed.
+
+        Args:
+            signature: Description of the run (steps, step versions, batch size)
+            resume: Whether to reuse checkpoints of a previous run
+
+        Returns:
+            bool: True if existing checkpoints will be reused
+        """
+        signature = json.loads(json.dumps(signature, default=_json_default))
+        previous = self._read(self.run_path)
+        if resume and previous is not None:
+            if (
+                previous.get("version") == CHECKPOINT_VERSION
+                and previous.get("signature") == signature
+            ):
+                self.logger.info("Resuming from checkpoints in %s", self.directory)
+                return True
+            self.logger.warning(
+                "Checkpoints in %s were written by a different run configuration, starting over",
+                self.directory,
+            )
+        elif resume:
+            self.logger.info("No checkpoints found in %s, starting a new run", self.directory)
+
+        self.clear()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write(self.run_path, {"version": CHECKPOINT_VERSION, "signature": signature})
+        return False
+
+    def load(self, index: int, fingerprint: str) -> Optional[Tuple[str, List[Dict]]]:
+        """Load the last completed stage of a batch.
+
+        Args:
+            index: Position of the batch in the run
+            fingerprint: Fingerprint of the batch input
+
+        Returns:
+            Optional[Tuple[str, List[Dict]]]: Name of the last completed stage and
+                the documents it produced, or None if the batch has no usable checkpoint
+        """
+        data = self._read(self._batch_path(index))
+        if data is None:
+            return None
+        if data.get("fingerprint") != fingerprint:
+            self.logger.warning("Input of batch %d changed, ignoring its checkpoint", index)
+            return None
+        return data["stage"], data["documents"]
+
+    def save(self, index: int, fingerprint: str, stage: str, documents: List[Dict]) -> None:
+        """Record that a batch completed a stage.
+
+        Args:
+            index: Position of the batch in the run
+            fingerprint: Fingerprint of the batch input
+            stage: Name of the completed stage
+            documents: Documents produced by the stage
+        """
+        self._write(
+            self._batch_path(index),
+            {"fingerprint": fingerprint, "stage": stage, "documents": documents},
+        )
+        self.logger.debug("Checkpointed batch %d after %s", index, stage)
+
+    def clear(self) -> None:
+        """Remove all checkpoints."""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
@@ -67,7 +67,8 @@ class DocumentIndexer(PipelineComponent):
             **kwargs: Additional keyword arguments for customizing indexing
 
         Returns:
-            List[Dict]: List of successfully indexed documents
+            List[Dict]: Documents written to the index, identified by their ``uuid``
+                or ``id`` field
 
         Raises:
             IndexingError: If indexing fails
@@ -81,8 +82,10 @@ class DocumentIndexer(PipelineComponent):
             for i in range(0, len(documents), self.config.batch_size):
                 batch = documents[i : i + self.config.batch_size]
                 try:
-                    self.vector_index.index_documents(batch, deduplicate=deduplicate)
-                    indexed_docs.extend(batch)
+                    written = set(self.vector_index.add_documents(batch, deduplicate=deduplicate))
+                    indexed_docs.extend(
+                        doc for doc in batch if (doc.get("uuid") or doc.get("id")) in written
+                    )
                 except Exception as e:
                     self.logger.error("Failed to index batch: %s", str(e))
                     continue
@@ -15,7 +15,7 @@ Main Components:
 """
 
 import uuid
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from src.connectors.notion_connector import NotionConnector
 from src.pipeline.components.base import PipelineComponent
@@ -93,6 +93,40 @@ class DocumentLoader(PipelineComponent):
             self.logger.error("Failed to load documents: %s", str(e))
             raise LoaderError("Document loading failed") from e
 
+    def iter_batches(self, batch_size: Optional[int] = None) -> Iterator[List[Dict]]:
+        """Lazily load and standardize documents from the source in batches.
+
+        Unlike ``process``, source tables are read one at a time and documents are
+        yielded as soon as a batch is full, so memory stays bounded by the batch
+        size rather than the size of the export.
+
+        Args:
+            batch_size: Number of documents per batch. Defaults to ``config.batch_size``.
+
+        Yields:
+            List[Dict]: Batches of standardized documents
+
+        Raises:
+            LoaderError: If document loading fails
+        """
+        batch_size = batch_size or self.config.batch_size
+        batch: List[Dict] = []
+        try:
+            for table_name, dataframe in self.notion.iter_csv_files():
+                raw_docs = self.notion.normalize_data({table_name: dataframe})
+                self.logger.debug("Loaded %d raw documents from %s", len(raw_docs), table_name)
+                for doc in self._process_documents(raw_docs):
+                    batch.append(doc)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+        except Exception as e:
+            self.logger.error("Failed to load documents: %s", str(e))
+            raise LoaderError(f"Document loading failed: {str(e)}") from e
+
+        if batch:
+            yield batch
+
     def _process_documents(self, documents: List[Dict]) -> List[Dict]:
         """Process a list of raw documents into standardized format.
 
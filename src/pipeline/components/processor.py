@@ -2,6 +2,7 @@
 
 This module provides the document processor component that handles various document
 processing operations including:
+- Exact and near-duplicate removal
 - PII detection and redaction
 - Document summarization
 - Embedding generation
@@ -16,6 +17,7 @@ Main Components:
 """
 
 # Standard library imports
+import time
 from typing import Dict, List, Optional
 
 # Local application imports
@@ -30,7 +32,9 @@ from src.pipeline.errors import (
     ProcessingError,
     SummaryError,
 )
+from src.pipeline.manifest import SourceKeys
 from src.utils.document_processing import DocumentProcessor as BaseDocProcessor
+from src.utils.near_duplicates import NearDuplicateIndex
 from src.utils.pii_detector import PIIDetector
 from src.utils.summarizer.config.settings import SummarizerConfig
 from src.utils.summarizer.core.processor import DocumentSummarizer
@@ -53,6 +57,15 @@ class DocumentProcessor(PipelineComponent):
         summarizer (DocumentSummarizer): Document summarization
         embedding_generator (EmbeddingGenerator): Text embedding generation
         topic_clusterer (TopicClusterer): Document clustering by topic
+        near_duplicates (Optional[NearDuplicateIndex]): Run-spanning near-duplicate
+            index, if ``config.near_duplicate_threshold`` is set
+        source_keys (SourceKeys): Source keys of documents that arrive without one
+        dropped_documents (int): Documents dropped by a failing step during the last
+            call to ``process``
+        skipped_near_duplicates (int): Near-duplicate documents skipped since the
+            last ``reset_skipped``, e.g. at the start of ``process``
+        skipped_duplicates (Dict[str, str]): Canonical document ID keyed by the ID
+            of each exact or near-duplicate skipped since the last ``reset_skipped``
         logger (logging.Logger): Component logger
 
     Examples:
@@ -109,7 +122,11 @@ class DocumentProcessor(PipelineComponent):
             raise
 
         try:
-            self.embedding_generator = EmbeddingGenerator()
+            self.embedding_generator = EmbeddingGenerator(
+                max_concurrency=self.config.embedding_concurrency,
+                requests_per_minute=self.config.embedding_requests_per_minute,
+                tokens_per_minute=self.config.embedding_tokens_per_minute,
+            )
             self.logger.debug("Initialized embedding generator")
         except Exception as e:
             self.logger.error("Failed to initialize embedding generator: %s", str(e))
@@ -131,6 +148,26 @@ class DocumentProcessor(PipelineComponent):
             self.logger.error("Failed to initialize topic clusterer: %s", str(e))
             raise
 
+        self.source_keys = SourceKeys()
+        self.dropped_documents = 0
+        self.skipped_near_duplicates = 0
+        self.skipped_duplicates: Dict[str, str] = {}
+        self.near_duplicates: Optional[NearDuplicateIndex] = None
+        if self.config.near_duplicate_threshold:
+            try:
+                self.near_duplicates = NearDuplicateIndex(
+                    self.config.state_dir / "near_duplicates.npz",
+                    threshold=self.config.near_duplicate_threshold,
+                    logger=self.logger,
+                )
+                self.logger.debug(
+                    "Initialized near-duplicate index with threshold %.2f",
+                    self.config.near_duplicate_threshold,
+                )
+            except Exception as e:
+                self.logger.error("Failed to initialize near-duplicate index: %s", str(e))
+                raise
+
         self.logger.debug("All document processor sub-components initialized successfully")
 
     def _validate_document(self, doc: Dict) -> bool:
@@ -174,6 +211,9 @@ class DocumentProcessor(PipelineComponent):
         4. Embedding generation
         5. Topic clustering
 
+        A batch that fails a step is skipped and its documents are counted in
+        ``dropped_documents``.
+
         Args:
             documents: List of documents to process
             detect_pii: Whether to detect and analyze PII in documents
@@ -197,19 +237,14 @@ class DocumentProcessor(PipelineComponent):
             self.logger.warning("No documents to process")
             return []
 
-        # Validate and filter documents
-        valid_docs = []
-        for doc in documents:
-            if self._validate_document(doc):
-                valid_docs.append(doc)
-            else:
-                self.logger.debug("Skipping invalid document: %s", str(doc))
-
-        if not valid_docs:
+        self.source_keys.reset()
+        self.dropped_documents = 0
+        self.reset_skipped()
+        documents = self.filter_valid(documents)
+        if not documents:
             self.logger.warning("No valid documents to process after filtering")
             return []
 
-        documents = valid_docs
         self.logger.info("Processing %d valid documents", len(documents))
 
         try:
@@ -223,10 +258,7 @@ class DocumentProcessor(PipelineComponent):
                 try:
                     # Deduplicate if requested
                     if deduplicate:
-                        self.logger.info("Deduplicating documents")
-                        self.logger.debug("Pre-deduplication batch size: %d", len(batch))
-                        batch = self.doc_processor.deduplicate_documents(batch)
-                        self.logger.debug("Post-deduplication batch size: %d", len(batch))
+                        batch = self.deduplicate_batch(batch)
 
                     if not batch:
                         self.logger.info("Batch is empty after deduplication, skipping")
@@ -234,98 +266,17 @@ class DocumentProcessor(PipelineComponent):
 
                     # Detect PII if requested
                     if detect_pii:
-                        try:
-                            self.logger.info("Detecting PII")
-                            self.logger.debug(
-                                "Processing %d documents for PII detection", len(batch)
-                            )
-                            batch = [self.pii_detector.analyze_document(doc) for doc in batch]
-                            self.logger.debug("PII detection completed for batch")
-                        except Exception as e:
-                            self.logger.error("PII detection failed: %s", str(e))
-                            raise PIIError("Error detecting PII: %s", str(e)) from e
-
-                    # Generate summaries
-                    try:
-                        self.logger.info("Generating summaries")
-                        self.logger.debug(
-                            "Processing %d documents for summarization with config: %s",
-                            len(batch),
-                            summary_config,
-                        )
-                        batch = self.summarizer.process_documents(batch, summary_config)
-                        self.logger.debug("Summarization completed for batch")
-                    except Exception as e:
-                        self.logger.error("Summarization failed: %s", str(e))
-                        raise SummaryError("Error generating summaries: %s", str(e)) from e
-
-                    # Generate embeddings
-                    self.logger.info("Generating embeddings")
-                    self.logger.debug(
-                        "Processing %d documents for embedding generation", len(batch)
-                    )
-                    valid_batch = []
-                    for doc in batch:
-                        try:
-                            # Check document length
-                            try:
-                                text = doc["content"]["body"].strip()
-                                self.logger.debug("Document content length: %d chars", len(text))
-                                if len(text) > self.config.max_document_length:
-                                    self.logger.warning(
-                                        "Document too long (%d chars), truncating to %d",
-                                        len(text),
-                                        self.config.max_document_length,
-                                    )
-                                    doc["content"]["body"] = text[: self.config.max_document_length]
-                            except KeyError as e:
-                                self.logger.error("Document missing required field: %s", str(e))
-                                raise EmbeddingError(
-                                    f"Document missing required field: {str(e)}"
-                                ) from e
-
-                            # Generate embedding with retries
-                            for attempt in range(self.config.max_retries):
-                                try:
-                                    doc = self.embedding_generator.generate_embeddings([doc])[0]
-                                    valid_batch.append(doc)
-                                    break
-                                except Exception as e:
-                                    if attempt == self.config.max_retries - 1:
-                                        self.logger.error(
-                                            "Failed to generate embedding after %d attempts: %s",
-                                            self.config.max_retries,
-                                            str(e),
-                                        )
-                                        raise EmbeddingError(
-                                            "Failed to generate embedding after %d attempts",
-                                            self.config.max_retries,
-                                        ) from e
-                                    else:
-                                        self.logger.warning(
-                                            "Retry %d for embedding generation",
-                                            attempt + 1,
-                                        )
-                        except EmbeddingError:
-                            raise
-                        except Exception as e:
-                            raise EmbeddingError(
-                                "Error processing document for embedding: %s",
-                                str(e),
-                            ) from e
-                    batch = valid_batch
-
-                    # Perform topic clustering
-                    try:
-                        self.logger.info("Performing topic clustering")
-                        batch = self.topic_clusterer.cluster_documents(batch, cluster_config)
-                    except Exception as e:
-                        raise ClusteringError("Error clustering documents: %s", str(e)) from e
+                        batch = self.detect_pii_batch(batch)
+
+                    batch = self.summarize_batch(batch, summary_config)
+                    batch = self.embed_batch(batch)
+                    batch = self.cluster_batch(batch, cluster_config)
 
                     processed_docs.extend(batch)
 
                 except (PIIError, SummaryError, EmbeddingError, ClusteringError) as e:
                     self.logger.error("Error processing batch %d: %s", i + 1, str(e))
+                    self.dropped_documents += len(batch)
                     continue
 
             return processed_docs
@@ -335,11 +286,247 @@ class DocumentProcessor(PipelineComponent):
             self.logger.error(error_msg, str(e))
             raise ProcessingError(error_msg % str(e)) from e
 
+    def filter_valid(self, documents: List[Dict]) -> List[Dict]:
+        """Drop documents that cannot be processed.
+
+        Args:
+            documents: Documents to validate
+
+        Returns:
+            List[Dict]: Documents with a non-empty string body
+        """
+        valid_docs = []
+        for doc in documents:
+            if self._validate_document(doc):
+                valid_docs.append(doc)
+            else:
+                self.logger.debug("Skipping invalid document: %s", str(doc))
+        return valid_docs
+
+    def reset_skipped(self) -> None:
+        """Forget the duplicates skipped so far, at the start of a run."""
+        self.skipped_near_duplicates = 0
+        self.skipped_duplicates = {}
+
+    def deduplicate_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Remove duplicate documents from a batch.
+
+        Skipped documents are recorded in ``skipped_duplicates`` with the ID of
+        the document they duplicate.
+
+        Args:
+            batch: Documents to deduplicate
+
+        Returns:
+            List[Dict]: Batch without duplicates
+        """
+        self.logger.info("Deduplicating documents")
+        self.logger.debug("Pre-deduplication batch size: %d", len(batch))
+        unique_docs = self.doc_processor.deduplicate_documents(batch)
+        canonical_ids = {doc["content"]["body"].strip(): doc.get("id") for doc in unique_docs}
+        for doc in batch:
+            canonical_id = canonical_ids.get(doc["content"]["body"].strip())
+            if doc.get("id") and canonical_id and canonical_id != doc["id"]:
+                self.skipped_duplicates[doc["id"]] = canonical_id
+        batch = unique_docs
+        if self.near_duplicates is not None:
+            batch = self.drop_near_duplicates(batch)
+        self.logger.debug("Post-deduplication batch size: %d", len(batch))
+        return batch
+
+    def drop_near_duplicates(self, batch: List[Dict]) -> List[Dict]:
+        """Remove documents that nearly duplicate a document seen earlier.
+
+        Documents are compared with every document seen in this and, if the index
+        is persisted, earlier runs. Duplicates are linked to their canonical
+        document in ``near_duplicates.links``, skip all later steps and are
+        counted in ``skipped_near_duplicates``. Each document is identified by its
+        ``source_key``, which is assigned here if the pipeline did not already do so.
+
+        Args:
+            batch: Documents with IDs
+
+        Returns:
+            List[Dict]: Documents that are not near-duplicates
+        """
+        self.source_keys.assign_batch([doc for doc in batch if not doc.get("source_key")])
+        unique_docs = []
+        for doc in batch:
+            match = self.near_duplicates.check(doc["source_key"], doc["id"], doc["content"]["body"])
+            if match is None:
+                unique_docs.append(doc)
+                continue
+            canonical_id, similarity = match
+            self.skipped_duplicates[doc["id"]] = canonical_id
+            self.logger.debug(
+                "Skipping near-duplicate document %s of %s (similarity %.2f)",
+                doc["id"],
+                canonical_id,
+                similarity,
+            )
+        if len(unique_docs) < len(batch):
+            self.skipped_near_duplicates += len(batch) - len(unique_docs)
+            self.logger.info("Skipped %d near-duplicate documents", len(batch) - len(unique_docs))
+        return unique_docs
+
+    def commit_near_duplicates(self, documents: List[Dict]) -> None:
+        """Keep documents as canonical near-duplicate entries once they are indexed.
+
+        Args:
+            documents: Documents that completed every step
+        """
+        if self.near_duplicates is not None:
+            self.near_duplicates.commit([doc["source_key"] for doc in documents])
+
+    def save_state(self) -> None:
+        """Persist state that spans runs, such as the near-duplicate index.
+
+        Near-duplicate entries not confirmed with ``commit_near_duplicates``,
+        e.g. of documents whose batch failed a later step, are rolled back
+        first so they cannot hide their duplicates.
+        """
+        if self.near_duplicates is not None:
+            self.near_duplicates.rollback()
+            self.near_duplicates.save()
+
+    def detect_pii_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Detect PII in a batch of documents.
+
+        Args:
+            batch: Documents to analyze
+
+        Returns:
+            List[Dict]: Documents with PII analysis results
+
+        Raises:
+            PIIError: If PII detection fails
+        """
+        try:
+            self.logger.info("Detecting PII")
+            self.logger.debug("Processing %d documents for PII detection", len(batch))
+            batch = self.pii_detector.analyze_documents(
+                batch,
+                n_process=self.config.pii_processes,
+                batch_size=self.config.pii_batch_size,
+            )
+            self.logger.debug("PII detection completed for batch")
+            return batch
+        except Exception as e:
+            self.logger.error("PII detection failed: %s", str(e))
+            raise PIIError("Error detecting PII: %s", str(e)) from e
+
+    def summarize_batch(
+        self, batch: List[Dict], summary_config: Optional[SummarizerConfig] = None
+    ) -> List[Dict]:
+        """Generate summaries for a batch of documents.
+
+        Args:
+            batch: Documents to summarize
+            summary_config: Optional configuration for summarization
+
+        Returns:
+            List[Dict]: Documents with summaries
+
+        Raises:
+            SummaryError: If summarization fails
+        """
+        try:
+            self.logger.info("Generating summaries")
+            self.logger.debug(
+                "Processing %d documents for summarization with config: %s",
+                len(batch),
+                summary_config,
+            )
+            batch = self.summarizer.process_documents(batch, summary_config)
+            self.logger.debug("Summarization completed for batch")
+            return batch
+        except Exception as e:
+            self.logger.error("Summarization failed: %s", str(e))
+            raise SummaryError("Error generating summaries: %s", str(e)) from e
+
+    def embed_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Generate embeddings for a batch of documents.
+
+        Bodies longer than ``config.max_document_length`` are truncated, then the
+        whole batch is embedded with one batched call, retried up to
+        ``config.max_retries`` times with exponential backoff.
+
+        Args:
+            batch: Documents to embed
+
+        Returns:
+            List[Dict]: Documents with embeddings
+
+        Raises:
+            EmbeddingError: If embedding generation fails
+        """
+        self.logger.info("Generating embeddings")
+        self.logger.debug("Processing %d documents for embedding generation", len(batch))
+        for doc in batch:
+            # Check document length
+            try:
+                text = doc["content"]["body"].strip()
+                self.logger.debug("Document content length: %d chars", len(text))
+                if len(text) > self.config.max_document_length:
+                    self.logger.warning(
+                        "Document too long (%d chars), truncating to %d",
+                        len(text),
+                        self.config.max_document_length,
+                    )
+                    doc["content"]["body"] = text[: self.config.max_document_length]
+            except KeyError as e:
+                self.logger.error("Document missing required field: %s", str(e))
+                raise EmbeddingError(f"Document missing required field: {str(e)}") from e
+
+        # Generate embeddings for the whole batch with retries
+        for attempt in range(self.config.max_retries):
+            try:
+                return self.embedding_generator.generate_embeddings_batch(batch)
+            except Exception as e:
+                if attempt == self.config.max_retries - 1:
+                    self.logger.error(
+                        "Failed to generate embeddings after %d attempts: %s",
+                        self.config.max_retries,
+                        str(e),
+                    )
+                    raise EmbeddingError(
+                        "Failed to generate embeddings after %d attempts",
+                        self.config.max_retries,
+                    ) from e
+                else:
+                    delay = self.config.retry_backoff * (2**attempt)
+                    self.logger.warning(
+                        "Retry %d for embedding generation in %.1fs", attempt + 1, delay
+                    )
+                    time.sleep(delay)
+        return batch
+
+    def cluster_batch(
+        self, batch: List[Dict], cluster_config: Optional[ClusteringConfig] = None
+    ) -> List[Dict]:
+        """Assign topic clusters to a batch of documents.
+
+        Args:
+            batch: Documents to cluster
+            cluster_config: Optional configuration for topic clustering
+
+        Returns:
+            List[Dict]: Documents with cluster assignments
+
+        Raises:
+            ClusteringError: If topic clustering fails
+        """
+        try:
+            self.logger.info("Performing topic clustering")
+            return self.topic_clusterer.cluster_documents(batch, cluster_config)
+        except Exception as e:
+            raise ClusteringError("Error clustering documents: %s", str(e)) from e
+
     def cleanup(self):
         """Clean up resources used by the processor and its sub-components.
 
-        This method ensures proper cleanup of all resources including the summarizer
-        and topic clusterer components.
+        This method ensures proper cleanup of all resources including the summarizer,
+        the PII detector worker processes and the topic clusterer components.
 
         Raises:
             CleanupError: If there are issues during cleanup of any component
@@ -347,6 +534,8 @@ class DocumentProcessor(PipelineComponent):
         try:
             if hasattr(self, "summarizer"):
                 self.summarizer.cleanup()
+            if hasattr(self, "pii_detector"):
+                self.pii_detector.close()
             if hasattr(self, "topic_clusterer"):
                 self.topic_clusterer.cleanup()
         except Exception as e:
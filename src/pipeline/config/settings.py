@@ -20,6 +20,7 @@ Example:
 
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass
@@ -40,9 +41,46 @@ class PipelineConfig:
         cache_host (str): Redis cache host address. Defaults to "localhost"
         cache_port (int): Redis cache port number. Defaults to 6379
         cache_ttl (int): Cache TTL in seconds. Defaults to 86400 (24 hours)
+        cache_local_bytes (int): Size in bytes of the in-process cache in front of
+            Redis for search caching; 0 disables it. Defaults to 0
         min_document_length (int): Minimum length of documents to process. Defaults to 50
         max_document_length (int): Maximum length of documents to process. Defaults to 8192
         max_retries (int): Maximum number of retry attempts for failed operations. Defaults to 3
+        retry_backoff (float): Base delay in seconds between retries, doubled on each
+            attempt. Defaults to 1.0
+        embedding_concurrency (int): Maximum number of batched embedding requests in
+            flight. Defaults to 4
+        embedding_requests_per_minute (Optional[int]): Embedding request quota enforced
+            client-side. Unlimited if None. Defaults to None
+        embedding_tokens_per_minute (Optional[int]): Embedding token quota enforced
+            client-side. Unlimited if None. Defaults to None
+        state_dir (Path): Directory for local run state such as the incremental
+            manifest. Defaults to ".indexforge"
+        pii_processes (int): Number of processes used for PII detection, -1 for one
+            per CPU core. Defaults to 1
+        pii_batch_size (int): Number of texts per spaCy ``nlp.pipe`` batch during PII
+            detection. Defaults to 32
+        near_duplicate_threshold (Optional[float]): Estimated Jaccard similarity at which
+            a document is skipped as a near-duplicate of one seen in this or an earlier
+            run. Disabled if None. Defaults to None
+        search_embedding_ttl (int): TTL in seconds of cached query embeddings.
+            Defaults to 604800 (7 days)
+        search_result_ttl (int): TTL in seconds of cached search results, which are
+            also invalidated whenever the index changes. Defaults to 300
+        semantic_cache_threshold (Optional[float]): Cosine similarity at which a query
+            reuses the results of a recent similar query. Disabled if None.
+            Defaults to None
+        semantic_cache_max_age (float): Maximum age in seconds of results returned
+            for a similar query. Defaults to 300
+        semantic_cache_size (int): Number of recent queries kept for semantic
+            matching. Defaults to 1024
+        hybrid_fusion (Optional[str]): Run hybrid searches as parallel BM25 and vector
+            queries fused client-side, with "rrf" (reciprocal rank fusion) or
+            "relative" (normalized score fusion). Single index query if None.
+            Defaults to None
+        hybrid_timeout (Optional[float]): Deadline in seconds for both legs of a
+            parallel hybrid search; results of a leg that misses it are dropped.
+            Defaults to None (no deadline)
 
     Example:
         ```python
@@ -66,9 +104,25 @@ class PipelineConfig:
     cache_host: str = "localhost"
     cache_port: int = 6379
     cache_ttl: int = 86400
+    cache_local_bytes: int = 0
     min_document_length: int = 50
     max_document_length: int = 8192
     max_retries: int = 3
+    retry_backoff: float = 1.0
+    embedding_concurrency: int = 4
+    embedding_requests_per_minute: Optional[int] = None
+    embedding_tokens_per_minute: Optional[int] = None
+    state_dir: Path = Path(".indexforge")
+    pii_processes: int = 1
+    pii_batch_size: int = 32
+    near_duplicate_threshold: Optional[float] = None
+    search_embedding_ttl: int = 7 * 24 * 3600
+    search_result_ttl: int = 300
+    semantic_cache_threshold: Optional[float] = None
+    semantic_cache_max_age: float = 300.0
+    semantic_cache_size: int = 1024
+    hybrid_fusion: Optional[str] = None
+    hybrid_timeout: Optional[float] = None
 
     def __post_init__(self):
         """Validate and convert path attributes.
@@ -79,8 +133,15 @@ class PipelineConfig:
 
         Raises:
             TypeError: If a path-related attribute cannot be converted to a Path object
+            ValueError: If hybrid_fusion is not None, "rrf" or "relative"
         """
+        if self.hybrid_fusion not in (None, "rrf", "relative"):
+            raise ValueError(
+                f'hybrid_fusion must be None, "rrf" or "relative", got {self.hybrid_fusion!r}'
+            )
         if isinstance(self.export_dir, str):
             self.export_dir = Path(self.export_dir)
         if isinstance(self.log_dir, str):
             self.log_dir = Path(self.log_dir)
+        if isinstance(self.state_dir, str):
+            self.state_dir = Path(self.state_dir)
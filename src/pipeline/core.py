@@ -19,6 +19,14 @@ Example:
     # Process documents with all default steps
     documents = pipeline.process_documents()
 
+    # Stream documents through the steps with bounded memory
+    for batch in pipeline.stream_documents(queue_size=4):
+        print(f"Indexed {len(batch)} documents")
+
+    # Checkpoint every batch, and continue an interrupted run later
+    documents = pipeline.process_documents(checkpoint=True)
+    documents = pipeline.process_documents(resume=True)
+
     # Process with specific steps and configurations
     from .steps import PipelineStep
     documents = pipeline.process_documents(
@@ -31,7 +39,8 @@ Example:
 
 import logging
 import os
-from typing import Dict, List, Optional, Set
+import threading
+from typing import Dict, Iterator, List, Optional, Set
 
 # Set tokenizers parallelism to avoid deadlock warnings
 if "TOKENIZERS_PARALLELISM" not in os.environ:
@@ -40,21 +49,27 @@ if "TOKENIZERS_PARALLELISM" not in os.environ:
 from src.configuration.logger_setup import setup_json_logger
 from src.connectors.notion_connector import NotionConnector
 from src.models import ClusteringConfig
+from src.utils.cache_manager import CacheManager
 from src.utils.embedding_generator import EmbeddingGenerator
 from src.utils.pii_detector import PIIDetector as _PIIDetector
+from src.utils.semantic_cache import SemanticCache
 from src.utils.summarizer import DocumentSummarizer
 from src.utils.summarizer.config.settings import SummarizerConfig
 from src.utils.topic_clustering import TopicClusterer
 from src.utils.vector_index import VectorIndex
 
+from .checkpoint import CheckpointStore, batch_fingerprint
 from .components.indexer import DocumentIndexer
 from .components.loader import DocumentLoader
 from .components.processor import DocumentProcessor
 from .config.settings import PipelineConfig
 from .document_ops import DocumentOperations
-from .errors import DirectoryError, PipelineError
+from .errors import DirectoryError, PipelineError, ProcessingError
+from .manifest import DocumentManifest, SourceKeys
 from .search import SearchOperations
+from .search_cache import SearchCache
 from .steps import PipelineStep
+from .streaming import StreamingExecutor, StreamStage
 
 # Re-export for test mocking
 PIIDetector = _PIIDetector
@@ -98,6 +113,10 @@ class Pipeline:
         search_ops (SearchOperations): Search-related operations
         processed_files (Set[str]): Set of processed file paths
         failed_files (Dict[str, str]): Mapping of failed files to error messages
+        dropped_documents (int): Documents dropped by a failing processing step or
+            not written to the index during the last run
+        deleted_sources (Dict[str, str]): Sources missing from the last incremental run,
+            mapped to the IDs of their indexed documents
 
     Example:
         ```python
@@ -126,6 +145,13 @@ class Pipeline:
         cache_port: Optional[int] = 6379,
         cache_ttl: Optional[int] = 86400,
         debug: bool = False,
+        state_dir: str = ".indexforge",
+        pii_processes: int = 1,
+        near_duplicate_threshold: Optional[float] = None,
+        semantic_cache_threshold: Optional[float] = None,
+        embedding_concurrency: int = 4,
+        embedding_requests_per_minute: Optional[int] = None,
+        embedding_tokens_per_minute: Optional[int] = None,
     ):
         """Initialize the pipeline with the specified configuration.
 
@@ -144,6 +170,22 @@ class Pipeline:
             cache_port (int, optional): Redis cache port number. Defaults to 6379
             cache_ttl (int, optional): Cache TTL in seconds. Defaults to 86400 (24 hours)
             debug (bool, optional): Enable debug logging. Defaults to False
+            state_dir (str, optional): Directory for local run state such as the
+                incremental manifest. Defaults to ".indexforge"
+            pii_processes (int, optional): Number of processes used for PII detection,
+                -1 for one per CPU core. Defaults to 1
+            near_duplicate_threshold (float, optional): Estimated Jaccard similarity
+                at which documents are skipped as near-duplicates of a document seen
+                in this or an earlier run. Disabled if None. Defaults to None
+            semantic_cache_threshold (float, optional): Cosine similarity at which a
+                search reuses the results of a recent similar query. Disabled if
+                None. Defaults to None
+            embedding_concurrency (int, optional): Maximum number of batched
+                embedding requests in flight. Defaults to 4
+            embedding_requests_per_minute (int, optional): Embedding request quota
+                enforced client-side. Unlimited if None. Defaults to None
+            embedding_tokens_per_minute (int, optional): Embedding token quota
+                enforced client-side. Unlimited if None. Defaults to None
 
         Raises:
             DirectoryError: If export_dir doesn't exist or isn't a directory
@@ -160,6 +202,13 @@ class Pipeline:
                 cache_host=cache_host or "localhost",
                 cache_port=cache_port or 6379,
                 cache_ttl=cache_ttl or 86400,
+                state_dir=state_dir,
+                pii_processes=pii_processes,
+                near_duplicate_threshold=near_duplicate_threshold,
+                semantic_cache_threshold=semantic_cache_threshold,
+                embedding_concurrency=embedding_concurrency,
+                embedding_requests_per_minute=embedding_requests_per_minute,
+                embedding_tokens_per_minute=embedding_tokens_per_minute,
             )
 
             # Validate export directory
@@ -205,12 +254,8 @@ class Pipeline:
                 self.logger.error("Failed to initialize document indexer: %s", str(e))
                 raise
 
-            try:
-                self.pii_detector = PIIDetector()
-                self.logger.debug("PII detector initialized")
-            except Exception as e:
-                self.logger.error("Failed to initialize PII detector: %s", str(e))
-                raise
+            # Share the processor's detector instead of loading the spaCy model again
+            self.pii_detector = self.processor.pii_detector
 
             # Initialize operations with required instances
             self.logger.debug("Initializing pipeline operations")
@@ -227,11 +272,38 @@ class Pipeline:
                 raise
 
             try:
+                embedding_generator = self.processor.embedding_generator
+                search_cache = SearchCache(
+                    CacheManager(
+                        host=self.config.cache_host,
+                        port=self.config.cache_port,
+                        prefix="search",
+                        logger=self.logger,
+                        local_max_bytes=self.config.cache_local_bytes,
+                    ),
+                    model=getattr(embedding_generator, "model", None),
+                    dimensions=getattr(embedding_generator, "dimensions", None),
+                    embedding_ttl=self.config.search_embedding_ttl,
+                    result_ttl=self.config.search_result_ttl,
+                    logger=self.logger,
+                )
                 self.search_ops = SearchOperations(
-                    embedding_generator=self.processor.embedding_generator,
+                    embedding_generator=embedding_generator,
                     vector_index=self.indexer.vector_index,
                     topic_clusterer=self.processor.topic_clusterer,
                     logger=self.logger,
+                    cache=search_cache,
+                    semantic_cache=(
+                        SemanticCache(
+                            capacity=self.config.semantic_cache_size,
+                            threshold=self.config.semantic_cache_threshold,
+                            max_age=self.config.semantic_cache_max_age,
+                        )
+                        if self.config.semantic_cache_threshold is not None
+                        else None
+                    ),
+                    hybrid_fusion=self.config.hybrid_fusion,
+                    hybrid_timeout=self.config.hybrid_timeout,
                 )
                 self.logger.debug("Search operations initialized")
             except Exception as e:
@@ -241,6 +313,17 @@ class Pipeline:
             # Track processed files and errors
             self.processed_files: Set[str] = set()
             self.failed_files: Dict[str, str] = {}  # file_path -> error_message
+
+            # Documents dropped by a failing processing step in the last run
+            self.dropped_documents = 0
+            self._dropped_lock = threading.Lock()
+
+            # Source keys of the current run, assigned by the manifest if incremental
+            self._source_keys = SourceKeys()
+
+            # Incremental run state, created on first use
+            self._manifest: Optional[DocumentManifest] = None
+            self.deleted_sources: Dict[str, str] = {}  # source_key -> document_id
             self.logger.info("Pipeline initialized successfully")
 
         except Exception as e:
@@ -256,6 +339,10 @@ class Pipeline:
         cluster_config: Optional[ClusteringConfig] = None,
         detect_pii: bool = True,
         deduplicate: bool = True,
+        incremental: bool = False,
+        prune_deleted: bool = False,
+        checkpoint: bool = False,
+        resume: bool = False,
     ) -> List[Dict]:
         """Process documents through the specified pipeline steps.
 
@@ -275,10 +362,24 @@ class Pipeline:
                 Only used if PII step is included. Defaults to True
             deduplicate (bool, optional): Whether to deduplicate documents.
                 Only used if DEDUPLICATE step is included. Defaults to True
+            incremental (bool, optional): Skip documents whose content and step
+                versions are unchanged since the last run, using the manifest in
+                ``state_dir``. Documents get stable IDs derived from their source.
+                Defaults to False
+            prune_deleted (bool, optional): In incremental mode, delete documents
+                whose sources disappeared from the index. Otherwise they are only
+                reported in ``deleted_sources``. Defaults to False
+            checkpoint (bool, optional): Persist the output of every batch after each
+                step under ``state_dir``, so an interrupted run can be resumed.
+                Defaults to False
+            resume (bool, optional): Continue an interrupted checkpointed run,
+                skipping the steps each batch already completed. Implies
+                ``checkpoint``. Defaults to False
 
         Returns:
             List[Dict]: List of processed documents, where each document is a
-                dictionary containing the document content and metadata
+                dictionary containing the document content and metadata. In
+                incremental mode, only new or changed documents are returned
 
         Raises:
             PipelineError: If any processing step fails
@@ -298,6 +399,15 @@ class Pipeline:
             if steps is None:
                 steps = set(PipelineStep)
             self.logger.info("Processing documents with steps: %s", steps)
+            self.dropped_documents = 0
+            self.processor.reset_skipped()
+            self._source_keys.reset()
+            if incremental:
+                self.manifest.start_run(
+                    self._stage_versions(
+                        steps, summary_config, cluster_config, detect_pii, deduplicate
+                    )
+                )
 
             documents = []
 
@@ -314,6 +424,32 @@ class Pipeline:
                     self.logger.error("Error loading documents: %s", str(e), exc_info=True)
                     raise
 
+                if incremental:
+                    documents = self.manifest.select_changed(documents)
+                else:
+                    self._assign_source_keys(documents)
+
+            if checkpoint or resume:
+                self.logger.info("Processing documents with checkpoints")
+                stages = self._build_stages(
+                    steps, summary_config, cluster_config, detect_pii, deduplicate
+                )
+                signature = {
+                    "stages": [stage.name for stage in stages],
+                    "versions": self._stage_versions(
+                        steps, summary_config, cluster_config, detect_pii, deduplicate
+                    ),
+                    "batch_size": self.config.batch_size,
+                }
+                documents = self._process_with_checkpoints(documents, stages, signature, resume)
+                self.logger.info("Processed %d documents", len(documents))
+                self.processor.commit_near_duplicates(documents)
+                if incremental:
+                    self.manifest.record(documents)
+                    self._finish_incremental(prune_deleted)
+                self.processor.save_state()
+                return documents
+
             # Process documents
             processing_steps = {
                 PipelineStep.DEDUPLICATE,
@@ -332,6 +468,7 @@ class Pipeline:
                         summary_config=summary_config if PipelineStep.SUMMARIZE in steps else None,
                         cluster_config=cluster_config if PipelineStep.CLUSTER in steps else None,
                     )
+                    self.dropped_documents += self.processor.dropped_documents
                     self.logger.info("Processed %d documents", len(documents))
                 except Exception as e:
                     self.logger.error("Error processing documents: %s", str(e), exc_info=True)
@@ -341,14 +478,18 @@ class Pipeline:
             if PipelineStep.INDEX in steps:
                 self.logger.info("Indexing documents")
                 try:
-                    documents = self.indexer.process(
-                        documents, deduplicate=False
-                    )  # Already deduplicated
+                    documents = self._index_batch(documents)
                     self.logger.info("Indexed %d documents", len(documents))
                 except Exception as e:
                     self.logger.error("Error indexing documents: %s", str(e), exc_info=True)
                     raise
 
+            self.processor.commit_near_duplicates(documents)
+            if incremental:
+                self.manifest.record(documents)
+                self._finish_incremental(prune_deleted)
+            self.processor.save_state()
+
             return documents
 
         except Exception as e:
@@ -356,6 +497,368 @@ class Pipeline:
             self.logger.error(error_msg, exc_info=True)
             raise PipelineError(error_msg) from e
 
+    def stream_documents(
+        self,
+        steps: Optional[Set[PipelineStep]] = None,
+        summary_config: Optional[SummarizerConfig] = None,
+        cluster_config: Optional[ClusteringConfig] = None,
+        detect_pii: bool = True,
+        deduplicate: bool = True,
+        queue_size: int = 4,
+        incremental: bool = False,
+        prune_deleted: bool = False,
+    ) -> Iterator[List[Dict]]:
+        """Stream documents through the pipeline steps with bounded memory.
+
+        Documents are loaded lazily in batches of ``config.batch_size`` and each
+        step runs as a concurrent stage connected to the next by a bounded queue.
+        Batches reach the index while later batches are still being loaded and
+        processed, and peak memory depends on ``queue_size`` and the batch size
+        rather than on the size of the export.
+
+        Steps are selected as in ``process_documents``. A batch that fails a
+        processing step is logged and dropped, and its documents are counted in
+        ``dropped_documents`` along with documents the index did not write; any
+        other error stops the stream.
+
+        Args:
+            steps (Set[PipelineStep], optional): Set of pipeline steps to execute.
+                If None, all steps will be executed. Defaults to None
+            summary_config (SummarizerConfig, optional): Configuration for document
+                summarization. Defaults to None
+            cluster_config (ClusteringConfig, optional): Configuration for topic
+                clustering. Defaults to None
+            detect_pii (bool, optional): Whether to detect PII in documents. Defaults to True
+            deduplicate (bool, optional): Whether to deduplicate documents within each
+                batch. Defaults to True
+            queue_size (int, optional): Maximum number of batches buffered between
+                two stages. Defaults to 4
+            incremental (bool, optional): Only stream new or changed documents, as in
+                ``process_documents``. Defaults to False
+            prune_deleted (bool, optional): In incremental mode, delete documents whose
+                sources disappeared once the stream is exhausted. Defaults to False
+
+        Yields:
+            List[Dict]: Batches of documents that completed every selected step
+
+        Raises:
+            PipelineError: If loading or a stage fails
+
+        Example:
+            ```python
+            total = 0
+            for batch in pipeline.stream_documents(queue_size=2):
+                total += len(batch)
+            ```
+        """
+        if steps is None:
+            steps = set(PipelineStep)
+        self.logger.info("Streaming documents with steps: %s", steps)
+        self.dropped_documents = 0
+        self.processor.reset_skipped()
+        self._source_keys.reset()
+
+        if PipelineStep.LOAD not in steps:
+            self.logger.warning("No documents to process")
+            return
+
+        stages = self._build_stages(steps, summary_config, cluster_config, detect_pii, deduplicate)
+        stages = [self._guard_stage(stage) for stage in stages]
+        executor = StreamingExecutor(stages, queue_size=queue_size, logger=self.logger)
+        source = self.loader.iter_batches(self.config.batch_size)
+        if not incremental:
+            for batch in executor.run(map(self._assign_source_keys, source)):
+                self.processor.commit_near_duplicates(batch)
+                yield batch
+            self.processor.save_state()
+            return
+
+        self.manifest.start_run(
+            self._stage_versions(steps, summary_config, cluster_config, detect_pii, deduplicate)
+        )
+        changed = (batch for batch in map(self.manifest.select_changed, source) if batch)
+        for batch in executor.run(changed):
+            self.processor.commit_near_duplicates(batch)
+            self.manifest.record(batch)
+            yield batch
+        self._finish_incremental(prune_deleted)
+        self.processor.save_state()
+
+    def _assign_source_keys(self, documents: List[Dict]) -> List[Dict]:
+        """Assign disambiguated source keys, as the manifest does in incremental runs.
+
+        Args:
+            documents: Loaded documents, updated in place
+
+        Returns:
+            List[Dict]: The same documents
+        """
+        self._source_keys.assign_batch(documents)
+        return documents
+
+    def _build_stages(
+        self,
+        steps: Set[PipelineStep],
+        summary_config: Optional[SummarizerConfig],
+        cluster_config: Optional[ClusteringConfig],
+        detect_pii: bool,
+        deduplicate: bool,
+    ) -> List[StreamStage]:
+        """Build the per-batch stages matching ``process_documents`` semantics.
+
+        Args:
+            steps: Set of pipeline steps to execute
+            summary_config: Configuration for summarization
+            cluster_config: Configuration for topic clustering
+            detect_pii: Whether to detect PII
+            deduplicate: Whether to deduplicate documents
+
+        Returns:
+            List[StreamStage]: Stages in execution order
+        """
+        processor = self.processor
+        stages = []
+        processing_steps = {
+            PipelineStep.DEDUPLICATE,
+            PipelineStep.PII,
+            PipelineStep.SUMMARIZE,
+            PipelineStep.EMBED,
+            PipelineStep.CLUSTER,
+        }
+        if processing_steps & steps:
+            stages.append(StreamStage("validate", processor.filter_valid))
+            if deduplicate and PipelineStep.DEDUPLICATE in steps:
+                stages.append(StreamStage("deduplicate", processor.deduplicate_batch))
+            if detect_pii and PipelineStep.PII in steps:
+                stages.append(StreamStage("pii", processor.detect_pii_batch))
+            summary = summary_config if PipelineStep.SUMMARIZE in steps else None
+            clusters = cluster_config if PipelineStep.CLUSTER in steps else None
+            stages.append(
+                StreamStage("summarize", lambda batch: processor.summarize_batch(batch, summary))
+            )
+            stages.append(StreamStage("embed", processor.embed_batch))
+            stages.append(
+                StreamStage("cluster", lambda batch: processor.cluster_batch(batch, clusters))
+            )
+
+        if PipelineStep.INDEX in steps:
+            stages.append(StreamStage("index", self._index_batch))
+        return stages
+
+    def _index_batch(self, batch: List[Dict]) -> List[Dict]:
+        """Index a batch and invalidate cached search results.
+
+        Documents the indexer did not write are counted in ``dropped_documents``.
+
+        Args:
+            batch: Processed documents to index
+
+        Returns:
+            List[Dict]: Indexed documents
+        """
+        indexed = self.indexer.process(batch, deduplicate=False)  # Already deduplicated
+        self.search_ops.invalidate()
+        if len(indexed) < len(batch):
+            self.logger.error(
+                "%d of %d documents were not indexed", len(batch) - len(indexed), len(batch)
+            )
+            with self._dropped_lock:
+                self.dropped_documents += len(batch) - len(indexed)
+        return indexed
+
+    def _guard_stage(self, stage: StreamStage) -> StreamStage:
+        """Drop a batch that fails a processing step instead of stopping the stream.
+
+        Args:
+            stage: Stage to wrap
+
+        Returns:
+            StreamStage: Stage returning an empty batch on ``ProcessingError``
+        """
+
+        def run(batch: List[Dict]) -> List[Dict]:
+            try:
+                return stage.func(batch)
+            except ProcessingError as e:
+                self.logger.error("Dropping batch after %s failure: %s", stage.name, str(e))
+                with self._dropped_lock:
+                    self.dropped_documents += len(batch)
+                return []
+
+        return StreamStage(stage.name, run)
+
+    def _process_with_checkpoints(
+        self, documents: List[Dict], stages: List[StreamStage], signature: Dict, resume: bool
+    ) -> List[Dict]:
+        """Run the stages batch by batch, checkpointing each batch after every stage.
+
+        When resuming, each batch continues after the last stage recorded in its
+        checkpoint, so completed summarization, embedding and indexing work is not
+        repeated. A batch that fails a processing step is logged and skipped, its
+        documents are counted in ``dropped_documents``, and its checkpoint is kept
+        so that the next resumed run retries it. A batch the index did not fully
+        write keeps its checkpoint from before indexing, so a resumed run indexes
+        it again without repeating the earlier stages.
+
+        Args:
+            documents: Loaded documents
+            stages: Stages in execution order
+            signature: Description of the run used to validate checkpoints
+            resume: Whether to continue from existing checkpoints
+
+        Returns:
+            List[Dict]: Documents that completed every stage, including the written
+                documents of a partly indexed batch
+        """
+        store = CheckpointStore(self.config.state_dir / "checkpoints", logger=self.logger)
+        store.open(signature, resume=resume)
+        names = [stage.name for stage in stages]
+        batches = self.processor.doc_processor.batch_documents(documents, self.config.batch_size)
+
+        results, failed, resumed = [], 0, 0
+        for i, batch in enumerate(batches):
+            fingerprint = batch_fingerprint(batch)
+            start = 0
+            saved = store.load(i, fingerprint)
+            if saved is not None and saved[0] in names:
+                start = names.index(saved[0]) + 1
+                batch = saved[1]
+                resumed += 1
+                self.logger.debug("Batch %d resumes after %s", i + 1, saved[0])
+
+            self.logger.info("Processing batch %d/%d", i + 1, len(batches))
+            try:
+                for stage in stages[start:]:
+                    if not batch:
+                        break
+                    output = stage.func(batch) or []
+                    if stage.name == "index" and len(output) < len(batch):
+                        self.logger.error("Batch %d was not fully indexed", i + 1)
+                        failed += 1
+                        batch = output
+                        break
+                    batch = output
+                    store.save(i, fingerprint, stage.name, batch)
+            except ProcessingError as e:
+                self.logger.error("Error processing batch %d: %s", i + 1, str(e))
+                failed += 1
+                self.dropped_documents += len(batch)
+                continue
+            results.extend(batch)
+
+        self.logger.info("Resumed %d of %d batches from checkpoints", resumed, len(batches))
+        if failed:
+            self.logger.warning(
+                "%d batches failed; their checkpoints are kept for a resumed run", failed
+            )
+        else:
+            store.clear()
+        return results
+
+    @property
+    def duplicate_links(self) -> Dict[str, str]:
+        """Get the near-duplicate documents skipped so far, including earlier runs.
+
+        Returns:
+            Dict[str, str]: Canonical document ID keyed by the ID of each skipped
+                near-duplicate, empty if near-duplicate detection is disabled
+        """
+        near_duplicates = getattr(self.processor, "near_duplicates", None)
+        if near_duplicates is None:
+            return {}
+        return {doc_id: canonical for doc_id, (canonical, _) in near_duplicates.links.items()}
+
+    @property
+    def skipped_near_duplicates(self) -> int:
+        """Get the number of near-duplicate documents skipped during the last run.
+
+        Returns:
+            int: Documents skipped as near-duplicates, unlike ``duplicate_links``
+                not including those of earlier runs
+        """
+        return self.processor.skipped_near_duplicates
+
+    @property
+    def manifest(self) -> DocumentManifest:
+        """Get the incremental run manifest, loading it on first use.
+
+        Returns:
+            DocumentManifest: Manifest stored in ``state_dir``
+        """
+        if self._manifest is None:
+            self._manifest = DocumentManifest(
+                self.config.state_dir / "manifest.json", logger=self.logger
+            )
+        return self._manifest
+
+    def _stage_versions(
+        self,
+        steps: Set[PipelineStep],
+        summary_config: Optional[SummarizerConfig],
+        cluster_config: Optional[ClusteringConfig],
+        detect_pii: bool,
+        deduplicate: bool,
+    ) -> Dict[str, str]:
+        """Describe the output version of each executed step.
+
+        A document is only skipped by an incremental run if it was previously
+        produced by every executed step with the same version.
+
+        Args:
+            steps: Set of pipeline steps to execute
+            summary_config: Configuration for summarization
+            cluster_config: Configuration for topic clustering
+            detect_pii: Whether PII detection is enabled
+            deduplicate: Whether deduplication is enabled
+
+        Returns:
+            Dict[str, str]: Version string keyed by step name
+        """
+        embedding_generator = self.processor.embedding_generator
+        details = {
+            PipelineStep.DEDUPLICATE: str(deduplicate),
+            PipelineStep.PII: str(detect_pii),
+            PipelineStep.SUMMARIZE: repr(summary_config),
+            PipelineStep.EMBED: "{}:{}".format(
+                getattr(embedding_generator, "model", None),
+                getattr(embedding_generator, "dimensions", None),
+            ),
+            PipelineStep.CLUSTER: repr(cluster_config),
+            PipelineStep.INDEX: self.config.class_name,
+        }
+        return {step.name: f"v1:{details.get(step, '')}" for step in steps}
+
+    def _finish_incremental(self, prune_deleted: bool) -> None:
+        """Record skipped duplicates, report or prune deleted sources and persist the manifest.
+
+        Pruned sources are also removed from the near-duplicate index, which the
+        caller persists with ``processor.save_state``. Sources whose documents
+        failed to delete stay in ``deleted_sources`` and are retried next run.
+
+        Args:
+            prune_deleted: Whether to delete documents of missing sources from the index
+        """
+        self.manifest.record_duplicates(self.processor.skipped_duplicates)
+        self.deleted_sources = self.manifest.deleted_sources()
+        if self.deleted_sources:
+            self.logger.info(
+                "%d sources were removed since the last run", len(self.deleted_sources)
+            )
+            if prune_deleted:
+                outcomes = self.delete_documents(list(self.deleted_sources.values()))
+                remaining = {
+                    key: doc_id
+                    for key, doc_id in self.deleted_sources.items()
+                    if outcomes.get(doc_id) not in ("deleted", "not_found")
+                }
+                pruned = [key for key in self.deleted_sources if key not in remaining]
+                self.manifest.forget(pruned)
+                near_duplicates = getattr(self.processor, "near_duplicates", None)
+                if near_duplicates is not None:
+                    near_duplicates.remove(pruned)
+                self.deleted_sources = remaining
+        self.manifest.save()
+
     def search(self, query: str = None, **kwargs) -> List[Dict]:
         """Search for documents using the specified query.
 
@@ -386,6 +889,23 @@ class Pipeline:
             kwargs["query"] = query
         return self.search_ops.search(**kwargs)
 
+    def search_batch(self, queries: List[str], **kwargs) -> List[List[Dict]]:
+        """Search for many queries with batched embedding and index requests.
+
+        Args:
+            queries (List[str]): The search query texts
+            **kwargs: Additional search parameters passed to the search operations
+
+        Returns:
+            List[List[Dict]]: Matching documents of every query, in input order
+
+        Example:
+            ```python
+            results = pipeline.search_batch(["what is rag", "vector databases"], limit=5)
+            ```
+        """
+        return self.search_ops.batch_search(queries, **kwargs)
+
     def update_document(self, doc_id: str, content: str = None, metadata: Dict = None) -> Dict:
         """Update an existing document in the index.
 
@@ -404,23 +924,58 @@ class Pipeline:
             ValueError: If neither content nor metadata is provided
             PipelineError: If the update operation fails
         """
-        return self.doc_ops.update_document(doc_id=doc_id, content=content, metadata=metadata)
+        document = self.doc_ops.update_document(doc_id=doc_id, content=content, metadata=metadata)
+        self.search_ops.invalidate()
+        return document
 
-    def delete_documents(self, doc_ids: List[str]) -> bool:
+    def delete_documents(self, doc_ids: List[str]) -> Dict[str, str]:
         """Delete documents from the index.
 
-        Removes the specified documents from the vector index.
+        Removes the specified documents from the vector index with batch
+        delete requests.
 
         Args:
             doc_ids (List[str]): List of document IDs to delete
 
         Returns:
-            bool: True if all documents were successfully deleted, False otherwise
+            Dict[str, str]: Outcome ("deleted", "not_found", "invalid_id" or "failed")
+                of every document ID
 
-        Raises:
-            PipelineError: If the deletion operation fails
+        Example:
+            ```python
+            outcomes = pipeline.delete_documents(["doc1", "doc2"])
+            retry = [doc_id for doc_id, outcome in outcomes.items() if outcome == "failed"]
+            ```
+        """
+        outcomes = self.doc_ops.delete_documents(doc_ids)
+        self.search_ops.invalidate()
+        return outcomes
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """Delete all documents matching a filter from the index.
+
+        Removes documents with batch delete requests, e.g. every page of a
+        removed workspace, without listing their IDs first.
+
+        Args:
+            where (Dict): Weaviate where filter on document properties
+            dry_run (bool, optional): Only report the matching documents.
+                Defaults to False
+
+        Returns:
+            Dict[str, str]: Outcome ("deleted" or "failed") of every matched document ID
+
+        Example:
+            ```python
+            outcomes = pipeline.delete_by_filter(
+                {"path": ["parent_id"], "operator": "Equal", "valueText": parent_id}
+            )
+            ```
         """
-        return self.doc_ops.delete_documents(doc_ids)
+        outcomes = self.doc_ops.delete_by_filter(where, dry_run=dry_run)
+        if not dry_run:
+            self.search_ops.invalidate()
+        return outcomes
 
     @property
     def doc_processor(self):
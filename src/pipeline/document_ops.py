@@ -164,30 +164,55 @@ class DocumentOperations:
             self.logger.error(f"Error updating document: {str(e)}")
             return False
 
-    def delete_documents(self, doc_ids: List[str]) -> bool:
+    def delete_documents(self, doc_ids: List[str]) -> Dict[str, str]:
         """Delete documents from the vector index.
 
-        Removes specified documents from the vector index, handling cleanup
-        and relationship management.
+        Removes specified documents from the vector index with batch delete
+        requests and reports the outcome of each ID.
 
         Args:
             doc_ids: List of document IDs to delete
 
         Returns:
-            True if successful, False otherwise
+            Outcome of every ID ("deleted", "not_found", "invalid_id" or
+            "failed"), all "failed" if the deletion raised
 
         Example:
-            >>> success = doc_ops.delete_documents(["doc123", "doc456"])
+            >>> outcomes = doc_ops.delete_documents(["doc123", "doc456"])
         """
         try:
-            self.logger.debug("Attempting to delete %d documents: %s", len(doc_ids), doc_ids)
-            success = self.vector_index.delete_documents(doc_ids)
-            if not success:
-                self.logger.error("Failed to delete documents from vector index")
-                return False
-            self.logger.debug("Successfully deleted documents from vector index")
-            return True
+            self.logger.debug("Attempting to delete %d documents", len(doc_ids))
+            outcomes = self.vector_index.bulk_delete(doc_ids)
+            failed = [doc_id for doc_id, outcome in outcomes.items() if outcome == "failed"]
+            if failed:
+                self.logger.error("Failed to delete %d documents from vector index", len(failed))
+            return outcomes
 
         except Exception as e:
             self.logger.error(f"Error deleting documents: {str(e)}")
-            return False
+            return {doc_id: "failed" for doc_id in doc_ids}
+
+    def delete_by_filter(self, where: Dict, dry_run: bool = False) -> Dict[str, str]:
+        """Delete all documents matching a where filter from the vector index.
+
+        Args:
+            where: Weaviate where filter, e.g. on a source path or tenant property
+            dry_run: Only report the matching documents
+
+        Returns:
+            Outcome of every matched document ID, empty if the deletion failed
+
+        Example:
+            >>> outcomes = doc_ops.delete_by_filter(
+            ...     {"path": ["parent_id"], "operator": "Equal", "valueText": "doc123"}
+            ... )
+        """
+        try:
+            self.logger.debug("Deleting documents matching filter: %s", where)
+            outcomes = self.vector_index.delete_by_filter(where, dry_run=dry_run)
+            self.logger.debug("Filter matched %d documents", len(outcomes))
+            return outcomes
+
+        except Exception as e:
+            self.logger.error(f"Error deleting documents by filter: {str(e)}")
+            return {}
@@ -0,0 +1,459 @@
+"""Document manifest for incremental pipeline runs.
+
+This module keeps a local record of every source document the pipeline has
+processed: a stable document ID, a hash of the document content and the
+version of each step that produced its outputs. On the next run, documents
+whose content and step versions are unchanged are skipped, changed documents
+keep their ID, and sources that disappeared from the export are reported for
+removal from the index.
+
+Features:
+1. Change Detection:
+   - Content hash over body and source metadata
+   - Per-step output versions (models, configurations)
+   - Documents processed by fewer steps are reprocessed
+
+2. Stable Identity:
+   - Document IDs derived from the source key with UUIDv5
+   - Repeated source keys are disambiguated by the creation time supplied by
+     the source, so reordered export rows keep their IDs, and the key is
+     stored on the document for later steps
+   - Rows that cannot be told apart are reprocessed on every run
+
+3. Deletion Tracking:
+   - Sources not seen in a run are reported with their document IDs
+   - Entries are kept until explicitly forgotten
+
+4. Duplicates:
+   - Documents skipped as duplicates are recorded with their canonical document
+   - They are skipped while neither they nor their canonical document change
+
+Usage:
+    ```python
+    from pipeline.manifest import DocumentManifest
+
+    manifest = DocumentManifest(".indexforge/manifest.json")
+    manifest.start_run({"EMBED": "text-embedding-3-small:None"})
+    changed = manifest.select_changed(documents)
+    indexed = indexer.process(processor.process(changed))
+    manifest.record(indexed)
+    manifest.record_duplicates(processor.skipped_duplicates)
+    removed = manifest.deleted_sources()
+    manifest.save()
+    ```
+
+Note:
+    - The manifest is written atomically (temporary file and rename)
+    - Methods are thread-safe so streaming stages can share a manifest
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# Namespace for document IDs derived from source keys
+DOCUMENT_NAMESPACE = uuid.UUID("6f1c1a52-7f4e-5b8e-9c1d-2a4b7e3f9d10")
+
+MANIFEST_VERSION = 1
+
+# State of entries whose document was skipped as a duplicate and never indexed
+DUPLICATE = "duplicate"
+
+logger = logging.getLogger(__name__)
+
+
+def stable_document_id(source_key: str) -> str:
+    """Derive a stable document ID from a source key.
+
+    Args:
+        source_key: Unique key of the document source
+
+    Returns:
+        str: UUIDv5 string that is identical across runs for the same key
+    """
+    return str(uuid.uuid5(DOCUMENT_NAMESPACE, source_key))
+
+
+def source_key(doc: Dict) -> str:
+    """Build the base source key of a document.
+
+    Args:
+        doc: Standardized document
+
+    Returns:
+        str: Key built from the source, path and title of the document
+    """
+    metadata = doc.get("metadata") or {}
+    return "{}:{}:{}".format(
+        metadata.get("source", "unknown"),
+        metadata.get("path", ""),
+        metadata.get("title", ""),
+    )
+
+
+def content_hash(doc: Dict) -> str:
+    """Hash the source content of a document.
+
+    Covers the body text and the metadata supplied by the source, so that
+    either a content edit or a metadata change marks the document as changed.
+
+    Args:
+        doc: Standardized document
+
+    Returns:
+        str: Hex digest of the document content
+    """
+    metadata = doc.get("metadata") or {}
+    payload = json.dumps(
+        {"body": (doc.get("content") or {}).get("body", ""), "metadata": metadata},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def tie_breaker(doc: Dict) -> Optional[str]:
+    """Build the suffix that tells apart documents sharing a base source key.
+
+    Uses the creation time supplied by the source, which stays the same when
+    the document is edited or the rows of an export are reordered.
+
+    Args:
+        doc: Standardized document
+
+    Returns:
+        Optional[str]: Short hex digest of the creation time, None if the
+            source supplied none
+    """
+    created = (doc.get("metadata") or {}).get("timestamp_utc")
+    # NaN and NaT, as pandas fills empty cells, are the only values unequal to themselves
+    if created is None or created != created or not str(created).strip():
+        return None
+    return hashlib.sha256(str(created).encode("utf-8")).hexdigest()[:12]
+
+
+class SourceKeys:
+    """Disambiguated source keys of the documents seen in one run.
+
+    Documents sharing a base source key, such as untitled rows of one table,
+    get the key ``base#<tie breaker>`` so that their keys, and the IDs derived
+    from them, do not depend on the order of the rows. Rows whose tie breakers
+    are missing or equal are numbered by occurrence instead, with a warning;
+    their keys are listed in ``ambiguous`` so that they can be reprocessed on
+    every run. The key is stored in the ``source_key`` field of the document
+    so that later steps use the same key without assigning it again.
+
+    A document whose base key turns out to be shared only in a later batch
+    keeps the base key for the current run; ``DocumentManifest`` passes the
+    shared base keys of earlier runs to ``reset`` so that later runs suffix it.
+
+    Attributes:
+        key_func (Callable[[Dict], str]): Builds the base source key of a document
+        tie_func (Callable[[Dict], Optional[str]]): Builds the tie breaker of a document
+        shared (Set[str]): Base keys known to be shared by several documents
+        ambiguous (Set[str]): Keys numbered by occurrence in this run
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[[Dict], str] = source_key,
+        tie_func: Callable[[Dict], Optional[str]] = tie_breaker,
+    ):
+        """Initialize an empty key set.
+
+        Args:
+            key_func: Builds the base source key of a document
+            tie_func: Builds the tie breaker of a document
+        """
+        self.key_func = key_func
+        self.tie_func = tie_func
+        self.shared: Set[str] = set()
+        self.ambiguous: Set[str] = set()
+        self._assigned: Set[str] = set()
+        self._occurrences: Dict[str, int] = {}
+
+    def reset(self, shared: Iterable[str] = ()) -> None:
+        """Forget the documents seen so far, at the start of a run.
+
+        Args:
+            shared: Base keys shared by several documents in earlier runs
+        """
+        self.shared = set(shared)
+        self.ambiguous = set()
+        self._assigned = set()
+        self._occurrences = {}
+
+    def assign(self, doc: Dict) -> str:
+        """Assign the key of a single document.
+
+        Args:
+            doc: Standardized document, updated with its ``source_key``
+
+        Returns:
+            str: Disambiguated source key
+        """
+        return self.assign_batch([doc])[0]
+
+    def assign_batch(self, documents: List[Dict]) -> List[str]:
+        """Assign the keys of a batch of documents.
+
+        Args:
+            documents: Standardized documents, updated with their ``source_key``
+
+        Returns:
+            List[str]: Disambiguated source key per document
+        """
+        bases = [self.key_func(doc) for doc in documents]
+        ties = [self.tie_func(doc) for doc in documents]
+        base_counts = Counter(bases)
+        tie_counts = Counter(zip(bases, ties))
+        keys = []
+        for doc, base, tie in zip(documents, bases, ties):
+            if base_counts[base] > 1 or base in self._assigned:
+                self.shared.add(base)
+            candidate = f"{base}#{tie}"
+            if base not in self.shared:
+                key = base
+            elif tie is not None and tie_counts[base, tie] == 1 and candidate not in self._assigned:
+                key = candidate
+            else:
+                occurrence = self._occurrences.get(base, 0) + 1
+                self._occurrences[base] = occurrence
+                key = f"{base}#{occurrence}"
+                self.ambiguous.add(key)
+                if occurrence == 1:
+                    logger.warning(
+                        "Cannot tell apart documents with source key %s; "
+                        "they are reprocessed on every run",
+                        base,
+                    )
+            self._assigned.add(key)
+            doc["source_key"] = key
+            keys.append(key)
+        return keys
+
+    def seen(self) -> Set[str]:
+        """Return every key assigned since the last reset.
+
+        Returns:
+            Set[str]: Disambiguated source keys
+        """
+        return set(self._assigned)
+
+
+class DocumentManifest:
+    """Local record of processed documents used for incremental runs.
+
+    Attributes:
+        path (Path): Location of the manifest file
+        entries (Dict[str, Dict]): Manifest entries keyed by source key
+        stage_versions (Dict[str, str]): Step versions of the current run
+        logger (logging.Logger): Logger instance
+    """
+
+    def __init__(self, path: Union[str, Path], logger: Optional[logging.Logger] = None):
+        """Initialize the manifest, loading it from disk if it exists.
+
+        Args:
+            path: Location of the manifest file
+            logger: Optional logger instance
+        """
+        self.path = Path(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self.entries: Dict[str, Dict] = {}
+        self.stage_versions: Dict[str, str] = {}
+        self._keys = SourceKeys(self.source_key)
+        self._pending: Dict[str, Tuple[str, str]] = {}
+        self._seen: Dict[str, Tuple[str, str]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """Load entries from the manifest file, starting empty if it is missing or invalid."""
+        if not self.path.exists():
+            self.entries = {}
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                self.logger.warning("Ignoring manifest with unsupported version: %s", self.path)
+                self.entries = {}
+                return
+            self.entries = data.get("documents", {})
+            self.logger.info("Loaded manifest with %d documents", len(self.entries))
+        except (OSError, ValueError) as e:
+            self.logger.warning("Failed to read manifest %s: %s", self.path, str(e))
+            self.entries = {}
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            data = {"version": MANIFEST_VERSION, "documents": self.entries}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        self.logger.debug("Saved manifest with %d documents", len(self.entries))
+
+    def start_run(self, stage_versions: Dict[str, str]) -> None:
+        """Begin a run with the given step versions.
+
+        Args:
+            stage_versions: Version string of each step executed in this run
+        """
+        with self._lock:
+            self.stage_versions = dict(stage_versions)
+            self._keys.reset(key.rsplit("#", 1)[0] for key in self.entries if "#" in key)
+            self._pending = {}
+            self._seen = {}
+
+    def source_key(self, doc: Dict) -> str:
+        """Build the base source key of a document.
+
+        Args:
+            doc: Standardized document
+
+        Returns:
+            str: Key built from the source, path and title of the document
+        """
+        return source_key(doc)
+
+    def _is_current(self, entry: Optional[Dict], digest: str) -> bool:
+        """Check whether an entry covers this content with the current step versions.
+
+        Duplicate entries are also outdated once their canonical document changed
+        or was not seen earlier in this run.
+        """
+        if not entry or entry.get("content_hash") != digest:
+            return False
+        if entry.get("state") == DUPLICATE:
+            canonical = self._seen.get(entry.get("duplicate_of"))
+            if canonical is None or canonical[1] != entry.get("canonical_hash"):
+                return False
+        stages = entry.get("stages", {})
+        return all(stages.get(step) == version for step, version in self.stage_versions.items())
+
+    def select_changed(self, documents: List[Dict]) -> List[Dict]:
+        """Assign stable IDs and return the documents that need processing.
+
+        Args:
+            documents: Standardized documents from the loader
+
+        Returns:
+            List[Dict]: New or changed documents, with stable ``id`` and
+                ``source_key`` fields
+        """
+        changed = []
+        with self._lock:
+            keys = self._keys.assign_batch(documents)
+            for doc, key in zip(documents, keys):
+                digest = content_hash(doc)
+                entry = self.entries.get(key)
+                doc["id"] = entry["id"] if entry else stable_document_id(key)
+                self._seen[doc["id"]] = (key, digest)
+                if key not in self._keys.ambiguous and self._is_current(entry, digest):
+                    continue
+                self._pending[doc["id"]] = (key, digest)
+                changed.append(doc)
+        self.logger.info(
+            "Incremental selection: %d of %d documents changed", len(changed), len(documents)
+        )
+        return changed
+
+    def record(self, documents: List[Dict]) -> None:
+        """Record documents that completed the run.
+
+        Args:
+            documents: Processed documents returned by the last executed step
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            for doc in documents:
+                pending = self._pending.pop(doc.get("id"), None)
+                if pending is None:
+                    continue
+                key, digest = pending
+                entry = self.entries.get(key)
+                stages = dict(self.stage_versions)
+                if entry and entry.get("content_hash") == digest:
+                    stages = {**entry.get("stages", {}), **stages}
+                self.entries[key] = {
+                    "id": doc["id"],
+                    "content_hash": digest,
+                    "stages": stages,
+                    "updated_at": now,
+                }
+
+    def record_duplicates(self, duplicates: Dict[str, str]) -> None:
+        """Record documents that were skipped as duplicates of an indexed document.
+
+        Call after ``record``. A duplicate is only recorded if its canonical
+        document was seen in this run and is recorded as current, so that an
+        unindexed canonical document cannot hide it in later runs.
+
+        Args:
+            duplicates: Canonical document ID keyed by the ID of each skipped duplicate
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._lock:
+            for doc_id, canonical_id in duplicates.items():
+                canonical = self._seen.get(canonical_id)
+                if doc_id not in self._pending or canonical is None:
+                    continue
+                canonical_key, canonical_hash = canonical
+                canonical_entry = self.entries.get(canonical_key)
+                if (
+                    canonical_entry is None
+                    or canonical_entry.get("state") == DUPLICATE
+                    or not self._is_current(canonical_entry, canonical_hash)
+                ):
+                    continue
+                key, digest = self._pending.pop(doc_id)
+                self.entries[key] = {
+                    "id": doc_id,
+                    "content_hash": digest,
+                    "stages": dict(self.stage_versions),
+                    "state": DUPLICATE,
+                    "duplicate_of": canonical_id,
+                    "canonical_hash": canonical_hash,
+                    "updated_at": now,
+                }
+
+    def deleted_sources(self) -> Dict[str, str]:
+        """Return indexed sources recorded earlier but not seen in the current run.
+
+        Entries of missing duplicates are dropped instead, as their documents
+        were never indexed.
+
+        Returns:
+            Dict[str, str]: Document ID of each missing source, keyed by source key
+        """
+        with self._lock:
+            seen = self._keys.seen()
+            missing = {key: entry for key, entry in self.entries.items() if key not in seen}
+            deleted = {}
+            for key, entry in missing.items():
+                if entry.get("state") == DUPLICATE:
+                    del self.entries[key]
+                else:
+                    deleted[key] = entry["id"]
+            return deleted
+
+    def forget(self, source_keys: List[str]) -> None:
+        """Remove entries, e.g. after their documents were deleted from the index.
+
+        Args:
+            source_keys: Source keys to remove
+        """
+        with self._lock:
+            for key in source_keys:
+                self.entries.pop(key, None)
@@ -7,12 +7,15 @@ and embedding generator to enable efficient document retrieval.
 Features:
 1. Search Types:
    - Semantic search using embeddings
-   - Hybrid search combining text and vectors
+   - Hybrid search combining text and vectors, optionally as parallel,
+     deadline-bounded BM25 and vector queries fused client-side
    - Topic-based search and clustering
    - Similarity scoring
 
 2. Performance Optimization:
    - Query embedding caching
+   - Search result caching, invalidated when the index changes
+   - Optional semantic cache answering paraphrased queries
    - Result filtering
    - Score thresholding
    - Batch processing
@@ -58,8 +61,11 @@ from typing import Dict, List, Optional
 
 from src.embeddings.embedding_generator import EmbeddingGenerator
 from src.indexing.vector_index import VectorIndex
+from src.utils.semantic_cache import SemanticCache
 from src.utils.topic_clustering import TopicClusterer
 
+from .search_cache import SearchCache, normalize_query
+
 
 class SearchOperations:
     """Handles all search-related operations in the pipeline.
@@ -74,6 +80,10 @@ class SearchOperations:
         vector_index: VectorIndex,
         topic_clusterer: TopicClusterer,
         logger: logging.Logger,
+        cache: Optional[SearchCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        hybrid_fusion: Optional[str] = None,
+        hybrid_timeout: Optional[float] = None,
     ):
         """Initialize search operations.
 
@@ -82,11 +92,22 @@ class SearchOperations:
             vector_index: For performing vector similarity search
             topic_clusterer: For topic-based search and clustering
             logger: For operation logging
+            cache: Optional cache of query embeddings and search results
+            semantic_cache: Optional cache returning the results of a recent,
+                sufficiently similar query
+            hybrid_fusion: Run hybrid searches as parallel BM25 and vector
+                queries fused client-side with "rrf" or "relative" fusion;
+                None runs them as a single index query
+            hybrid_timeout: Deadline in seconds for the parallel hybrid legs
         """
         self.embedding_generator = embedding_generator
         self.vector_index = vector_index
         self.topic_clusterer = topic_clusterer
         self.logger = logger
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.hybrid_fusion = hybrid_fusion
+        self.hybrid_timeout = hybrid_timeout
 
     def search(
         self,
@@ -99,7 +120,10 @@ class SearchOperations:
         """Search for documents using text and/or vector similarity.
 
         Performs semantic or hybrid search based on the provided query and
-        parameters. Supports both text-based and vector-based queries.
+        parameters. Supports both text-based and vector-based queries. With a
+        cache, query embeddings and results of repeated searches are reused
+        until the index changes; with a semantic cache, paraphrases of a recent
+        query reuse its results as well.
 
         Args:
             query_text: Text query for search
@@ -127,16 +151,35 @@ class SearchOperations:
                 use_hybrid,
             )
 
+            mode = self._mode(use_hybrid and bool(query_text))
+            result_key = None
+            if self.cache:
+                result_key = self.cache.result_key(query_text, query_vector, mode, limit, min_score)
+                cached = self.cache.get_results(result_key)
+                if cached is not None:
+                    self.logger.debug("Returning %d cached results", len(cached))
+                    return cached
+
             if query_vector is None and query_text:
-                self.logger.debug("Generating embedding for text query")
-                query_vector = self.embedding_generator._get_embedding(query_text)
-                self.logger.debug("Successfully generated query embedding")
+                query_vector = self._embed_query(query_text)
+
+            scope = f"{mode}:{limit}:{min_score}"
+            if self.semantic_cache and query_vector:
+                similar = self.semantic_cache.lookup(query_vector, scope)
+                if similar is not None:
+                    self.logger.debug("Returning %d results of a similar query", len(similar))
+                    if result_key:
+                        self.cache.set_results(result_key, similar)
+                    return similar
 
             if use_hybrid and query_text and query_vector:
                 self.logger.debug("Performing hybrid search")
-                results = self.vector_index.hybrid_search(
-                    text_query=query_text, query_vector=query_vector, limit=limit
-                )
+                if self.hybrid_fusion:
+                    results = self._fused_search(query_text, query_vector, limit)
+                else:
+                    results = self.vector_index.hybrid_search(
+                        text_query=query_text, query_vector=query_vector, limit=limit
+                    )
                 self.logger.debug("Hybrid search returned %d results", len(results))
             elif query_vector:
                 self.logger.debug("Performing semantic search")
@@ -148,6 +191,13 @@ class SearchOperations:
                 self.logger.error("No valid search criteria provided")
                 return []
 
+            if getattr(results, "degraded", False):
+                self.logger.debug("Not caching results of a degraded hybrid search")
+            else:
+                if result_key:
+                    self.cache.set_results(result_key, results)
+                if self.semantic_cache:
+                    self.semantic_cache.add(query_vector, results, scope)
             self.logger.debug("Search operation completed successfully")
             return results
 
@@ -155,6 +205,175 @@ class SearchOperations:
             self.logger.error(f"Search error: {str(e)}")
             return []
 
+    def _mode(self, hybrid: bool) -> str:
+        """Name the search mode that keys cached results."""
+        if not hybrid:
+            return "semantic"
+        # Client-side fusion ranks differently, so it is cached separately
+        return f"hybrid-{self.hybrid_fusion}" if self.hybrid_fusion else "hybrid"
+
+    def _fused_search(self, query_text: str, query_vector: List[float], limit: int) -> List[Dict]:
+        """Run a hybrid search as parallel BM25 and vector legs fused client-side."""
+        return self.vector_index.parallel_hybrid_search(
+            text_query=query_text,
+            query_vector=query_vector,
+            limit=limit,
+            fusion=self.hybrid_fusion,
+            timeout=self.hybrid_timeout,
+        )
+
+    def _embed_query(self, query_text: str) -> List[float]:
+        """Get the embedding of a query, from the cache if possible.
+
+        Args:
+            query_text: Text query to embed
+
+        Returns:
+            Query embedding
+        """
+        if self.cache:
+            query_vector = self.cache.get_embedding(query_text)
+            if query_vector is not None:
+                self.logger.debug("Using cached query embedding")
+                return query_vector
+
+        self.logger.debug("Generating embedding for text query")
+        query_vector = self.embedding_generator._get_embedding(query_text)
+        self.logger.debug("Successfully generated query embedding")
+        if self.cache:
+            self.cache.set_embedding(query_text, query_vector)
+        return query_vector
+
+    def batch_search(
+        self,
+        query_texts: List[str],
+        limit: int = 10,
+        min_score: float = 0.7,
+        use_hybrid: bool = True,
+    ) -> List[List[Dict]]:
+        """Search for many text queries at once.
+
+        Cached results are reused per query. The remaining queries are embedded
+        with one bulk cache lookup and batched embeddings requests, and searched
+        with batched, concurrent index requests. With ``hybrid_fusion``, hybrid
+        queries are instead fused client-side one by one, like in ``search``.
+
+        Args:
+            query_texts: Text queries
+            limit: Maximum number of results per query
+            min_score: Minimum similarity score threshold
+            use_hybrid: Whether to use hybrid search
+
+        Returns:
+            Results of every query, in input order; a failed query has no results
+
+        Example:
+            >>> all_results = search_ops.batch_search(["what is rag", "vector databases"])
+            >>> len(all_results)
+            2
+        """
+        results: List[Optional[List[Dict]]] = [None] * len(query_texts)
+        try:
+            self.logger.debug("Starting batch search of %d queries", len(query_texts))
+            mode = self._mode(use_hybrid)
+            scope = f"{mode}:{limit}:{min_score}"
+            keys: List[Optional[str]] = [None] * len(query_texts)
+            if self.cache:
+                for i, query_text in enumerate(query_texts):
+                    keys[i] = self.cache.result_key(query_text, None, mode, limit, min_score)
+                    results[i] = self.cache.get_results(keys[i])
+
+            # Queries differing only in case or whitespace are embedded and searched once
+            pending: Dict[str, List[int]] = {}
+            for i, cached in enumerate(results):
+                if cached is None:
+                    pending.setdefault(normalize_query(query_texts[i]), []).append(i)
+            groups = list(pending.values())
+            vectors = self._embed_queries([query_texts[group[0]] for group in groups])
+
+            to_search = []
+            for group, vector in zip(groups, vectors):
+                if not vector:
+                    continue
+                similar = None
+                if self.semantic_cache:
+                    similar = self.semantic_cache.lookup(vector, scope)
+                if similar is not None:
+                    for i in group:
+                        results[i] = similar
+                else:
+                    to_search.append((group, vector))
+
+            if to_search:
+                self.logger.debug("Searching %d of %d queries", len(to_search), len(query_texts))
+                search_vectors = [vector for _, vector in to_search]
+                if use_hybrid and self.hybrid_fusion:
+                    found = [
+                        self._fused_search(query_texts[group[0]], vector, limit)
+                        for group, vector in to_search
+                    ]
+                elif use_hybrid:
+                    found = self.vector_index.batch_hybrid_search(
+                        text_queries=[query_texts[group[0]] for group, _ in to_search],
+                        query_vectors=search_vectors,
+                        limit=limit,
+                    )
+                else:
+                    found = self.vector_index.batch_semantic_search(
+                        query_vectors=search_vectors, limit=limit, min_score=min_score
+                    )
+                for (group, vector), query_results in zip(to_search, found):
+                    for i in group:
+                        results[i] = query_results
+                    if getattr(query_results, "degraded", False):
+                        continue
+                    if keys[group[0]]:
+                        self.cache.set_results(keys[group[0]], query_results)
+                    if self.semantic_cache:
+                        self.semantic_cache.add(vector, query_results, scope)
+
+        except Exception as e:
+            self.logger.error(f"Batch search error: {str(e)}")
+
+        return [query_results or [] for query_results in results]
+
+    def _embed_queries(self, query_texts: List[str]) -> List[Optional[List[float]]]:
+        """Get the embeddings of distinct queries, embedding cache misses in bulk.
+
+        Args:
+            query_texts: Distinct text queries to embed
+
+        Returns:
+            One embedding or None per query, in input order
+        """
+        if not query_texts:
+            return []
+        vectors = (
+            self.cache.get_embeddings(query_texts) if self.cache else [None] * len(query_texts)
+        )
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            self.logger.debug("Generating embeddings for %d queries", len(missing))
+            embedded = self.embedding_generator.embed_texts([query_texts[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+            if self.cache:
+                done = [i for i in missing if vectors[i] is not None]
+                self.cache.set_embeddings(
+                    [query_texts[i] for i in done], [vectors[i] for i in done]
+                )
+        return vectors
+
+    def invalidate(self) -> None:
+        """Invalidate cached search results after the index changed.
+
+        Query embeddings stay valid and are kept.
+        """
+        if self.cache:
+            self.cache.bump_generation()
+        if self.semantic_cache:
+            self.semantic_cache.clear()
+
     def find_similar_topics(
         self, query_text: str, documents: List[Dict], top_k: int = 5
     ) -> List[Dict]:
@@ -184,9 +403,7 @@ class SearchOperations:
             )
 
             # Generate embedding for query
-            self.logger.debug("Generating embedding for query text")
-            query_vector = self.embedding_generator._get_embedding(query_text)
-            self.logger.debug("Successfully generated query embedding")
+            query_vector = self._embed_query(query_text)
 
             # Find similar topics
             self.logger.debug("Finding similar topics in %d documents", len(documents))
@@ -0,0 +1,236 @@
+"""Two-level cache for pipeline searches.
+
+This module caches the two expensive steps of a search request. Popular queries
+repeat constantly, so most requests can skip both the embedding round trip and
+the vector search.
+
+Features:
+1. Query Embeddings (level one):
+   - Keyed by model, dimensions and normalized query text
+   - Stored as packed float32 through ``EmbeddingCache``
+   - Long TTL, since a model always embeds the same text the same way
+
+2. Search Results (level two):
+   - Keyed by query, search mode, limit, minimum score and filters
+   - Short TTL
+   - Invalidated by an index generation counter that every add, update and
+     delete bumps with an atomic Redis INCR, so results never outlive the
+     index state they came from
+
+3. Monitoring:
+   - Hits and misses of both levels are exported through the Prometheus
+     cache recorders (cache types ``query_embedding`` and ``search_results``)
+
+Usage:
+    ```python
+    from src.pipeline.search_cache import SearchCache
+    from src.utils.cache_manager import CacheManager
+
+    cache = SearchCache(CacheManager(prefix="search"), model="text-embedding-3-small")
+    vector = cache.get_embedding("What is RAG?")
+    if vector is None:
+        vector = embed("What is RAG?")
+        cache.set_embedding("What is RAG?", vector)
+
+    # After the index changes
+    cache.bump_generation()
+    ```
+
+Note:
+    - Degrades to no caching when Redis is unavailable
+    - The generation counter lives in Redis, so it is shared by all processes;
+      without Redis it is kept per process
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.api.monitoring.recorders import record_cache_hit, record_cache_miss
+from src.embeddings.embedding_cache import EmbeddingCache
+from src.utils.cache_manager import CacheManager
+
+EMBEDDING_TTL = 7 * 24 * 3600
+RESULT_TTL = 300
+
+# The generation outlives every result entry by far; losing it only costs hits
+GENERATION_KEY = "index_generation"
+GENERATION_TTL = 30 * 24 * 3600
+
+
+def normalize_query(query_text: str) -> str:
+    """Normalize query text for cache keys (case and whitespace insensitive)."""
+    return " ".join(query_text.lower().split())
+
+
+class SearchCache:
+    """Caches query embeddings and search results.
+
+    Attributes:
+        cache_manager (CacheManager): Cache manager for result entries and the generation.
+        embeddings (EmbeddingCache): Level-one cache of query vectors.
+        result_ttl (int): TTL in seconds of result entries.
+        logger (logging.Logger): Logger instance.
+    """
+
+    def __init__(
+        self,
+        cache_manager: CacheManager,
+        model: str,
+        dimensions: Optional[int] = None,
+        embedding_ttl: int = EMBEDDING_TTL,
+        result_ttl: int = RESULT_TTL,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the search cache.
+
+        Args:
+            cache_manager: Cache manager providing the Redis connection.
+            model: Embedding model identifier included in embedding keys.
+            dimensions: Requested embedding dimensionality, if any.
+            embedding_ttl: TTL in seconds of query embeddings (default: 7 days).
+            result_ttl: TTL in seconds of search results (default: 5 minutes).
+            logger: Optional logger instance.
+        """
+        self.cache_manager = cache_manager
+        self.embeddings = EmbeddingCache(
+            cache_manager, model=model, dimensions=dimensions, ttl=embedding_ttl
+        )
+        self.result_ttl = result_ttl
+        self.logger = logger or logging.getLogger(__name__)
+        self._local_generation = 0
+
+    def get_embedding(self, query_text: str) -> Optional[List[float]]:
+        """Look up the cached vector of a query.
+
+        Args:
+            query_text: Query text, normalized before the lookup.
+
+        Returns:
+            Optional[List[float]]: Cached query vector, or None on a miss.
+        """
+        vector = self.embeddings.get_many([normalize_query(query_text)])[0]
+        if vector is None:
+            record_cache_miss("query_embedding")
+        else:
+            record_cache_hit("query_embedding")
+        return vector
+
+    def set_embedding(self, query_text: str, vector: Sequence[float]) -> None:
+        """Store the vector of a query.
+
+        Args:
+            query_text: Query text, normalized before storing.
+            vector: Query vector.
+        """
+        self.embeddings.set_many([normalize_query(query_text)], [vector])
+
+    def get_embeddings(self, query_texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """Look up the cached vectors of several queries in one round trip.
+
+        Args:
+            query_texts: Query texts, normalized before the lookup.
+
+        Returns:
+            List[Optional[List[float]]]: Cached vector or None per query, in input order.
+        """
+        vectors = self.embeddings.get_many([normalize_query(text) for text in query_texts])
+        for vector in vectors:
+            if vector is None:
+                record_cache_miss("query_embedding")
+            else:
+                record_cache_hit("query_embedding")
+        return vectors
+
+    def set_embeddings(
+        self, query_texts: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        """Store the vectors of several queries in one round trip.
+
+        Args:
+            query_texts: Query texts, normalized before storing.
+            vectors: Query vectors aligned with query_texts.
+        """
+        self.embeddings.set_many([normalize_query(text) for text in query_texts], vectors)
+
+    def result_key(
+        self,
+        query_text: Optional[str],
+        query_vector: Optional[Sequence[float]],
+        mode: str,
+        limit: int,
+        min_score: float,
+        filters: Optional[Dict] = None,
+    ) -> str:
+        """Build the result key of a search for the current index generation.
+
+        Args:
+            query_text: Query text, if any.
+            query_vector: Query vector supplied by the caller, if any.
+            mode: Search mode, e.g. "hybrid" or "semantic".
+            limit: Maximum number of results.
+            min_score: Minimum similarity score.
+            filters: Optional search filters.
+
+        Returns:
+            str: Cache key, unprefixed.
+        """
+        params = {
+            "query": normalize_query(query_text) if query_text else None,
+            "vector": list(query_vector) if query_vector is not None else None,
+            "mode": mode,
+            "limit": limit,
+            "min_score": min_score,
+            "filters": filters,
+        }
+        digest = hashlib.sha256(
+            json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return f"results:{self.generation()}:{digest}"
+
+    def get_results(self, key: str) -> Optional[List[Any]]:
+        """Look up cached search results.
+
+        Args:
+            key: Key from ``result_key``.
+
+        Returns:
+            Optional[List[Any]]: Cached results, or None on a miss.
+        """
+        results = self.cache_manager.get(key)
+        if results is None:
+            record_cache_miss("search_results")
+        else:
+            record_cache_hit("search_results")
+        return results
+
+    def set_results(self, key: str, results: List[Any]) -> None:
+        """Store search results.
+
+        Args:
+            key: Key from ``result_key``.
+            results: Search results.
+        """
+        self.cache_manager.set(key, results, ttl=self.result_ttl)
+
+    def generation(self) -> int:
+        """Get the current index generation, read from Redis on every call."""
+        generation = self.cache_manager.get_counter(GENERATION_KEY)
+        if generation is None:
+            return self._local_generation
+        self._local_generation = max(self._local_generation, generation)
+        return generation
+
+    def bump_generation(self) -> int:
+        """Advance the index generation, invalidating all cached results.
+
+        Returns:
+            int: New generation.
+        """
+        generation = self.cache_manager.incr(GENERATION_KEY, ttl=GENERATION_TTL)
+        if generation is None:
+            self._local_generation += 1
+            generation = self._local_generation
+        self.logger.debug("Search result cache invalidated (generation %d)", generation)
+        return generation
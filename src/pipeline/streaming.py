@@ -0,0 +1,254 @@
+"""Streaming execution of pipeline steps over bounded queues.
+
+This module runs pipeline steps as concurrent stages connected by bounded
+queues. Each stage receives one batch at a time from the stage before it,
+applies its step and hands the result to the next stage, so batches flow from
+the loader to the index continuously instead of waiting for the whole corpus
+to finish each step.
+
+Features:
+1. Bounded Memory:
+   - Each queue holds at most ``queue_size`` batches
+   - A full queue blocks the producer (backpressure)
+   - Memory is bounded by stages and queue sizes, not corpus size
+
+2. Ordering:
+   - One worker per stage keeps batches in source order
+
+3. Error Handling:
+   - A failing stage stops the whole stream
+   - The first error is re-raised to the consumer
+   - Closing the consumer early stops all stages
+
+Usage:
+    ```python
+    from pipeline.streaming import StreamingExecutor, StreamStage
+
+    executor = StreamingExecutor(
+        stages=[
+            StreamStage("embed", processor.embed_batch),
+            StreamStage("index", indexer.process),
+        ],
+        queue_size=4,
+    )
+    for batch in executor.run(loader.iter_batches()):
+        print(f"Indexed {len(batch)} documents")
+    ```
+
+Note:
+    - Stages run in threads; I/O-bound steps and native code that releases the
+      GIL (tokenizers, torch, HTTP clients) overlap with one another
+    - Stage functions must return the batch to pass downstream
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from .errors import PipelineError
+
+BatchFunc = Callable[[List[Dict]], List[Dict]]
+
+# Marks the end of the stream in a queue
+_END = object()
+
+
+@dataclass
+class StreamStage:
+    """A named step applied to every batch flowing through a stream.
+
+    Attributes:
+        name: Stage name used in logs and statistics
+        func: Function receiving a batch and returning the batch to pass on
+    """
+
+    name: str
+    func: BatchFunc
+
+
+@dataclass
+class StageStats:
+    """Throughput statistics for one stream stage.
+
+    Attributes:
+        batches: Number of batches processed
+        documents: Number of documents emitted
+        seconds: Total time spent inside the stage function
+    """
+
+    batches: int = 0
+    documents: int = 0
+    seconds: float = 0.0
+
+
+class StreamingExecutor:
+    """Runs stages concurrently over bounded queues.
+
+    Attributes:
+        stages (List[StreamStage]): Stages in execution order
+        queue_size (int): Maximum number of batches buffered between two stages
+        poll_interval (float): Seconds between checks for cancellation while blocked
+        stats (Dict[str, StageStats]): Per-stage statistics of the last run
+        logger (logging.Logger): Logger instance
+    """
+
+    def __init__(
+        self,
+        stages: List[StreamStage],
+        queue_size: int = 4,
+        poll_interval: float = 0.1,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            stages: Stages in execution order
+            queue_size: Maximum number of batches buffered between two stages
+            poll_interval: Seconds between checks for cancellation while blocked
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If queue_size is less than 1
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        self.stages = stages
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.logger = logger or logging.getLogger(__name__)
+        self.stats: Dict[str, StageStats] = {}
+
+    def _put(self, target: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put an item, blocking while the queue is full unless the stream stops."""
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=self.poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _get(self, source: queue.Queue, stop: threading.Event):
+        """Get an item, blocking while the queue is empty unless the stream stops."""
+        while not stop.is_set():
+            try:
+                return source.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+        return _END
+
+    def _feed(
+        self,
+        source: Iterable[List[Dict]],
+        target: queue.Queue,
+        stop: threading.Event,
+        errors: List[BaseException],
+    ) -> None:
+        """Pull batches from the source into the first queue."""
+        try:
+            for batch in source:
+                if not self._put(target, batch, stop):
+                    return
+        except Exception as e:
+            self.logger.error("Stream source failed: %s", str(e), exc_info=True)
+            errors.append(e)
+            stop.set()
+            return
+        self._put(target, _END, stop)
+
+    def _work(
+        self,
+        stage: StreamStage,
+        source: queue.Queue,
+        target: queue.Queue,
+        stop: threading.Event,
+        errors: List[BaseException],
+    ) -> None:
+        """Apply a stage to every batch until the end of the stream."""
+        stats = self.stats[stage.name]
+        while True:
+            batch = self._get(source, stop)
+            if batch is _END:
+                self._put(target, _END, stop)
+                return
+            started = time.perf_counter()
+            try:
+                batch = stage.func(batch) or []
+            except Exception as e:
+                self.logger.error("Stream stage %s failed: %s", stage.name, str(e), exc_info=True)
+                errors.append(e)
+                stop.set()
+                return
+            stats.seconds += time.perf_counter() - started
+            stats.batches += 1
+            stats.documents += len(batch)
+            if batch and not self._put(target, batch, stop):
+                return
+
+    def run(self, source: Iterable[List[Dict]]) -> Iterator[List[Dict]]:
+        """Stream batches from the source through all stages.
+
+        Args:
+            source: Iterable of document batches
+
+        Yields:
+            List[Dict]: Batches that passed every stage, in source order
+
+        Raises:
+            PipelineError: If the source or any stage fails
+        """
+        self.stats = {stage.name: StageStats() for stage in self.stages}
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+
+        threads = [
+            threading.Thread(
+                target=self._feed,
+                args=(source, queues[0], stop, errors),
+                name="stream-source",
+                daemon=True,
+            )
+        ]
+        for i, stage in enumerate(self.stages):
+            threads.append(
+                threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[i], queues[i + 1], stop, errors),
+                    name=f"stream-{stage.name}",
+                    daemon=True,
+                )
+            )
+
+        self.logger.info(
+            "Starting stream with stages %s (queue size %d)",
+            [stage.name for stage in self.stages],
+            self.queue_size,
+        )
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                batch = self._get(queues[-1], stop)
+                if batch is _END:
+                    break
+                yield batch
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+            for name, stats in self.stats.items():
+                self.logger.info(
+                    "Stream stage %s: %d batches, %d documents, %.2fs",
+                    name,
+                    stats.batches,
+                    stats.documents,
+                    stats.seconds,
+                )
+
+        if errors:
+            raise PipelineError("Streaming pipeline failed: %s", str(errors[0])) from errors[0]
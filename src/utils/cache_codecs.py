@@ -0,0 +1,302 @@
+"""Binary encodings of cached values.
+
+This module serializes the values ``CacheManager`` stores. Every encoded value
+starts with a three-byte header naming its codec and compression, so processes
+running different versions or optional dependencies can read each other's
+values, or recognize the ones they cannot read and treat them as misses.
+
+Features:
+1. Codecs:
+   - ``msgpack``: dicts, lists, tuples, strings, bytes, numbers and None;
+     round trips are exact, so values of other types fall through
+   - ``float32``: vectors as raw little-endian float32 buffers, a quarter of
+     their pickled size; float32 numpy arrays use it automatically, float
+     lists when asked for with ``codec="float32"``
+   - ``bytes``: raw bytes, stored as they are
+   - ``pickle``: last resort for other objects; can be disabled
+
+2. Compression:
+   - zstd, else lz4, for values above a size threshold
+   - Kept only when it makes the value smaller
+
+3. Compatibility:
+   - Values pickled before headers existed are still read, unless pickle is
+     disabled
+   - Unknown codecs, and compression whose library is missing, raise
+     ``CodecError`` instead of returning garbage
+
+Usage:
+    ```python
+    from src.utils.cache_codecs import CacheCodec
+
+    codec = CacheCodec(compress_threshold=1024)
+    raw = codec.encode({"summary": "text", "scores": [0.9, 0.7]})
+    value = codec.decode(raw)
+    vector_raw = codec.encode([0.1, 0.2, 0.3], codec="float32")
+    ```
+
+Note:
+    - msgpack, zstandard and lz4 are optional; without msgpack, values fall
+      back to pickle, and without zstandard or lz4 values are stored uncompressed
+    - Decoding pickle runs arbitrary code if the cache is writable by an
+      attacker; set ``allow_pickle=False`` where that matters
+"""
+
+import pickle
+import struct
+import sys
+from array import array
+from typing import Any, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - depends on the environment
+    lz4_frame = None
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+MAGIC = 0xC5
+
+# Codec and compression IDs are part of the stored format; never reuse one
+BYTES, MSGPACK, FLOAT32_LIST, FLOAT32_ARRAY, PICKLE = 1, 2, 3, 4, 5
+CODECS = {
+    "bytes": BYTES,
+    "msgpack": MSGPACK,
+    "float32": FLOAT32_LIST,
+    "pickle": PICKLE,
+}
+NO_COMPRESSION, ZSTD, LZ4 = 0, 1, 2
+COMPRESSIONS = {"none": NO_COMPRESSION, "zstd": ZSTD, "lz4": LZ4}
+
+# Values smaller than this are not worth compressing
+COMPRESS_THRESHOLD = 1024
+ZSTD_LEVEL = 3
+
+# msgpack extension type of tuples, which would otherwise come back as lists
+TUPLE_EXT = 1
+
+# Every pickle protocol since 2 starts with the PROTO opcode
+PICKLE_PROTO = 0x80
+
+
+class CodecError(ValueError):
+    """Raised when a value cannot be encoded or decoded."""
+
+
+def available_compression() -> str:
+    """Name of the best compression whose library is installed."""
+    if zstandard is not None:
+        return "zstd"
+    if lz4_frame is not None:
+        return "lz4"
+    return "none"
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return msgpack.ExtType(TUPLE_EXT, _pack(list(value)))
+    raise TypeError(f"cannot encode {type(value).__name__} with msgpack")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+    if code == TUPLE_EXT:
+        return tuple(_unpack(data))
+    raise CodecError(f"unknown msgpack extension type {code}")
+
+
+def _pack(value: Any) -> bytes:
+    # strict_types sends tuples and dict/list subclasses to the default hook
+    return msgpack.packb(value, use_bin_type=True, strict_types=True, default=_msgpack_default)
+
+
+def _unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, strict_map_key=False, ext_hook=_msgpack_ext_hook)
+
+
+def _pack_floats(values: Any) -> bytes:
+    packed = array("f", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def _unpack_floats(data: bytes) -> array:
+    values = array("f")
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class CacheCodec:
+    """Encodes values to bytes with a codec header, and back.
+
+    Attributes:
+        compression (str): Compression applied above the threshold.
+        compress_threshold (int): Minimum encoded size in bytes to compress.
+        allow_pickle (bool): Whether values may be pickled and unpickled.
+    """
+
+    def __init__(
+        self,
+        compression: str = "auto",
+        compress_threshold: int = COMPRESS_THRESHOLD,
+        allow_pickle: bool = True,
+    ):
+        """Initialize the codec.
+
+        Args:
+            compression: "zstd", "lz4", "none", or "auto" for the best
+                installed one (default: "auto").
+            compress_threshold: Minimum encoded size in bytes to compress
+                (default: 1024).
+            allow_pickle: Whether values no other codec handles are pickled,
+                and pickled values decoded (default: True).
+
+        Raises:
+            ValueError: If the compression is unknown or not installed
+        """
+        if compression == "auto":
+            compression = available_compression()
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"compression must be one of {sorted(COMPRESSIONS)} or 'auto'")
+        if (compression == "zstd" and zstandard is None) or (
+            compression == "lz4" and lz4_frame is None
+        ):
+            raise ValueError(f"{compression} compression is not installed")
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.allow_pickle = allow_pickle
+
+    def encode(self, value: Any, codec: Optional[str] = None) -> bytes:
+        """Encode a value.
+
+        Args:
+            value: Value to encode
+            codec: Codec name from ``CODECS``; None picks one from the value
+
+        Returns:
+            bytes: Header followed by the, possibly compressed, payload
+
+        Raises:
+            CodecError: If the value cannot be encoded
+        """
+        codec_id, payload = self._serialize(value, codec)
+        compression_id = NO_COMPRESSION
+        if self.compression != "none" and len(payload) >= self.compress_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                compression_id, payload = COMPRESSIONS[self.compression], compressed
+        return bytes((MAGIC, codec_id, compression_id)) + payload
+
+    def decode(self, raw: bytes) -> Any:
+        """Decode a value written by ``encode``, or pickled by older versions.
+
+        Raises:
+            CodecError: If the value is invalid or uses an unavailable codec
+        """
+        if not raw:
+            raise CodecError("empty value")
+        if raw[0] == PICKLE_PROTO:
+            return self._unpickle(raw)
+        if raw[0] != MAGIC or len(raw) < 3:
+            raise CodecError("missing codec header")
+        codec_id, compression_id = raw[1], raw[2]
+        payload = self._decompress(compression_id, memoryview(raw)[3:])
+        try:
+            if codec_id == BYTES:
+                return bytes(payload)
+            if codec_id == MSGPACK:
+                if msgpack is None:
+                    raise CodecError("msgpack is not installed")
+                return _unpack(payload)
+            if codec_id == FLOAT32_LIST:
+                return _unpack_floats(payload).tolist()
+            if codec_id == FLOAT32_ARRAY:
+                return self._unpack_array(payload)
+            if codec_id == PICKLE:
+                return self._unpickle(payload)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"invalid value: {str(e)}") from e
+        raise CodecError(f"unknown codec {codec_id}")
+
+    def _serialize(self, value: Any, codec: Optional[str]) -> Tuple[int, bytes]:
+        """Pick a codec for a value and serialize it to (codec ID, payload)."""
+        if codec is not None and codec not in CODECS:
+            raise CodecError(f"codec must be one of {sorted(CODECS)}, got {codec!r}")
+        is_array = np is not None and isinstance(value, np.ndarray)
+        if codec == "float32" or (codec is None and is_array and value.dtype == np.float32):
+            if is_array:
+                return FLOAT32_ARRAY, self._pack_array(value)
+            try:
+                return FLOAT32_LIST, _pack_floats(value)
+            except TypeError as e:
+                raise CodecError(f"cannot encode as float32: {str(e)}") from e
+        if codec in (None, "bytes") and isinstance(value, bytes):
+            return BYTES, value
+        if codec in (None, "msgpack") and msgpack is not None:
+            try:
+                return MSGPACK, _pack(value)
+            except (TypeError, ValueError, OverflowError) as e:
+                if codec == "msgpack":
+                    raise CodecError(str(e)) from e
+        if codec in (None, "pickle") and self.allow_pickle:
+            try:
+                return PICKLE, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                raise CodecError(f"cannot pickle value: {str(e)}") from e
+        raise CodecError(f"no codec available for {type(value).__name__}")
+
+    @staticmethod
+    def _pack_array(value: Any) -> bytes:
+        values = np.ascontiguousarray(value, dtype="<f4")
+        return struct.pack(f"<B{values.ndim}I", values.ndim, *values.shape) + values.tobytes()
+
+    @staticmethod
+    def _unpack_array(payload: memoryview) -> Any:
+        if np is None:
+            raise CodecError("numpy is not installed")
+        ndim = payload[0]
+        offset = 1 + 4 * ndim
+        shape = struct.unpack(f"<{ndim}I", payload[1:offset])
+        return np.frombuffer(payload[offset:], dtype="<f4").astype(np.float32).reshape(shape)
+
+    def _unpickle(self, payload: Any) -> Any:
+        if not self.allow_pickle:
+            raise CodecError("pickled values are disabled")
+        try:
+            return pickle.loads(payload)
+        except Exception as e:
+            raise CodecError(f"cannot unpickle value: {str(e)}") from e
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.compress(payload, ZSTD_LEVEL)
+        return lz4_frame.compress(payload)
+
+    def _decompress(self, compression_id: int, payload: memoryview) -> memoryview:
+        if compression_id == NO_COMPRESSION:
+            return payload
+        try:
+            if compression_id == ZSTD and zstandard is not None:
+                return memoryview(zstandard.decompress(payload))
+            if compression_id == LZ4 and lz4_frame is not None:
+                return memoryview(lz4_frame.decompress(payload))
+        except Exception as e:
+            raise CodecError(f"cannot decompress value: {str(e)}") from e
+        raise CodecError(f"compression {compression_id} is unknown or not installed")
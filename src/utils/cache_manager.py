@@ -5,8 +5,12 @@ resilient data storage and retrieval. It includes:
 
 1. CacheManager:
    - Redis connection management
+   - Optional in-process LRU tier in front of Redis, bounded in bytes
+   - Batch get/set/delete with one round trip each
+   - Per-tier hit, miss and eviction statistics
    - Key prefixing and TTL support
-   - Serialization using pickle
+   - Compact serialization with a codec header (msgpack, float32 vectors,
+     optional zstd/lz4 compression); see ``src.utils.cache_codecs``
    - Error handling and logging
    - Automatic cleanup
 
@@ -18,6 +22,9 @@ resilient data storage and retrieval. It includes:
 
 3. Decorators:
    - @cached_with_retry: Combines caching and retry logic
+   - Concurrent misses compute once (single flight, in process and across
+     processes through a Redis lock)
+   - Optional stale-while-revalidate and probabilistic early expiration
    - Automatic key generation from function arguments
    - Support for complex data types
    - Configurable TTL and retry settings
@@ -31,6 +38,12 @@ Usage:
     cache.set("key", "value")
     value = cache.get("key")
 
+    # Two tiers and batch operations
+    cache = CacheManager(prefix="myapp", local_max_bytes=64 * 1024 * 1024)
+    cache.set_many({"a": 1, "b": 2})
+    values = cache.get_many(["a", "b", "c"])  # [1, 2, None]
+    print(cache.stats()["local"]["hits"])
+
     # Decorator usage
     @cached_with_retry(cache_manager=cache, key_prefix="data", max_attempts=3)
     def expensive_operation(arg1, arg2):
@@ -39,26 +52,71 @@ Usage:
     ```
 
 Note:
-    - Uses pickle for serialization (supports complex Python objects)
-    - Handles Redis connection failures gracefully
+    - Values msgpack cannot represent exactly are pickled, unless
+      ``allow_pickle=False``
+    - Handles Redis connection failures gracefully; with the in-process tier
+      enabled, caching continues per process without Redis
     - Provides automatic resource cleanup
     - Thread-safe operations
 """
 
-import hashlib
-import json
 import logging
-import pickle
+import math
+import random
+import threading
+import time
+import uuid
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import redis
 from redis.exceptions import RedisError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from .cache_codecs import COMPRESS_THRESHOLD, CacheCodec, CodecError
+from .fingerprint import fingerprint
+from .local_cache import LocalCache
+
+# Default maximum age in seconds of in-process entries
+LOCAL_TTL = 60
+
+# Seconds a recomputation may hold its cross-process lock, and waiters wait for it
+LOCK_TIMEOUT = 30
+LOCK_POLL_INTERVAL = 0.05
+
+# Deletes a lock only if it still holds our token, so an expired lock is never stolen
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Marks values written by get_or_compute, which carry their expiry and compute time
+ENTRY_MARKER = "__cache_entry__"
+
+_MISSING = object()
+
+
+class _Flight:
+    """A recomputation in progress in this process, shared by concurrent callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
 
 class CacheManager:
-    """Manages caching operations with Redis."""
+    """Manages caching operations with Redis and an optional in-process tier.
+
+    Attributes:
+        prefix (str): Prefix of every key.
+        default_ttl (int): TTL in seconds of values set without one.
+        redis (Optional[redis.Redis]): Redis connection, None if unavailable.
+        local (Optional[LocalCache]): In-process tier in front of Redis, if enabled.
+        codec (CacheCodec): Encoding of stored values.
+    """
 
     def __init__(
         self,
@@ -70,10 +128,44 @@ class CacheManager:
         socket_timeout: int = 5,
         socket_connect_timeout: int = 2,
         retry_on_timeout: bool = True,
+        local_max_bytes: int = 0,
+        local_ttl: Optional[int] = LOCAL_TTL,
+        compression: str = "auto",
+        compress_threshold: int = COMPRESS_THRESHOLD,
+        allow_pickle: bool = True,
     ):
+        """Initialize the cache manager.
+
+        Args:
+            host: Redis host (default: "localhost").
+            port: Redis port (default: 6379).
+            prefix: Prefix of every key (default: "cache").
+            default_ttl: TTL in seconds of values set without one (default: 3600).
+            logger: Optional logger instance.
+            socket_timeout: Redis socket timeout in seconds (default: 5).
+            socket_connect_timeout: Redis connect timeout in seconds (default: 2).
+            retry_on_timeout: Whether Redis commands are retried on timeout.
+            local_max_bytes: Size in bytes of the in-process tier; 0 disables it
+                (default: 0).
+            local_ttl: Maximum age in seconds of in-process entries, which bounds
+                how long writes by other processes go unseen (default: 60).
+            compression: Compression of large values: "zstd", "lz4", "none", or
+                "auto" for the best installed one (default: "auto").
+            compress_threshold: Minimum encoded size in bytes to compress
+                (default: 1024).
+            allow_pickle: Whether values msgpack cannot represent are pickled,
+                and pickled values read (default: True).
+        """
         self.prefix = prefix
         self.default_ttl = default_ttl
         self.logger = logger or logging.getLogger(__name__)
+        self.local = LocalCache(local_max_bytes, local_ttl) if local_max_bytes > 0 else None
+        self.codec = CacheCodec(compression, compress_threshold, allow_pickle)
+        self._redis_stats = {"hits": 0, "misses": 0, "errors": 0}
+        self._compute_stats = {"computed": 0, "coalesced": 0, "stale": 0}
+        self._stats_lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
         try:
             self.redis = redis.Redis(
                 host=host,
@@ -84,7 +176,8 @@ class CacheManager:
             )
             self.redis.ping()  # Test connection
         except RedisError as e:
-            self.logger.warning(f"Failed to connect to Redis: {str(e)}")
+            mode = "caching disabled" if self.local is None else "using the in-process cache only"
+            self.logger.warning(f"Failed to connect to Redis, {mode}: {str(e)}")
             self.redis = None
 
     def _get_full_key(self, key: str) -> str:
@@ -95,61 +188,412 @@ class CacheManager:
         """Generate a hash for a value to use as part of a cache key."""
         if value is None:
             return "none"
+        return fingerprint(value)
+
+    def _record(self, name: str, count: int = 1, stats: Optional[Dict[str, int]] = None) -> None:
+        with self._stats_lock:
+            target = self._redis_stats if stats is None else stats
+            target[name] += count
+
+    def _deserialize(self, raw: Optional[bytes]) -> Optional[Any]:
+        """Decode a cached value; invalid or unreadable data is treated as a miss."""
+        if not raw:
+            return None
         try:
-            # Convert the value to a JSON string for consistent hashing
-            json_str = json.dumps(value, sort_keys=True)
-            return hashlib.sha256(json_str.encode()).hexdigest()
-        except (TypeError, ValueError):
-            # If value can't be JSON serialized, use its string representation
-            return hashlib.sha256(str(value).encode()).hexdigest()
+            return self.codec.decode(raw)
+        except CodecError as e:
+            self.logger.warning(f"Failed to decode cached value: {str(e)}")
+            return None
 
     def get(self, key: str) -> Optional[Any]:
-        """Get a value from the cache."""
+        """Get a value from the cache, trying the in-process tier first."""
+        full_key = self._get_full_key(key)
+        if self.local is not None:
+            raw = self.local.get(full_key)
+            if raw is not None:
+                return self._deserialize(raw)
         if not self.redis:
             return None
         try:
-            full_key = self._get_full_key(key)
-            value = self.redis.get(full_key)
-            self.logger.debug(f"Got value from Redis: {value}")
-            if value:
-                try:
-                    result = pickle.loads(value)
-                    self.logger.debug(f"Unpickled value: {result}")
-                    return result
-                except (pickle.PickleError, TypeError, ValueError) as e:
-                    self.logger.warning(f"Failed to unpickle value: {str(e)}")
-                    # Don't return raw bytes/invalid data
-                    return None
-            return None
+            raw = self.redis.get(full_key)
         except Exception as e:
+            self._record("errors")
             self.logger.error(f"Error getting from cache: {str(e)}")
             return None
+        self._record("hits" if raw else "misses")
+        if raw and self.local is not None:
+            self.local.set(full_key, raw)
+        return self._deserialize(raw)
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
-        """Set a value in the cache with optional TTL."""
-        if not self.redis:
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Any]]:
+        """Get several values, fetching in-process misses from Redis in one round trip.
+
+        Args:
+            keys: Keys to look up
+
+        Returns:
+            List[Optional[Any]]: Value or None per key, in input order
+        """
+        full_keys = [self._get_full_key(key) for key in keys]
+        raw_values: List[Optional[bytes]] = [None] * len(keys)
+        if self.local is not None:
+            raw_values = [self.local.get(full_key) for full_key in full_keys]
+        missing = [i for i, raw in enumerate(raw_values) if raw is None]
+        if missing and self.redis:
+            try:
+                fetched = self.redis.mget([full_keys[i] for i in missing])
+            except Exception as e:
+                self._record("errors")
+                self.logger.error(f"Error getting from cache: {str(e)}")
+                fetched = [None] * len(missing)
+            found = 0
+            for i, raw in zip(missing, fetched):
+                if raw:
+                    found += 1
+                    raw_values[i] = raw
+                    if self.local is not None:
+                        self.local.set(full_keys[i], raw)
+            self._record("hits", found)
+            self._record("misses", len(missing) - found)
+        return [self._deserialize(raw) for raw in raw_values]
+
+    def set(
+        self, key: str, value: Any, ttl: Optional[int] = None, codec: Optional[str] = None
+    ) -> bool:
+        """Set a value in the cache with optional TTL and codec."""
+        return self.set_many({key: value}, ttl, codec)
+
+    def set_many(
+        self, items: Dict[str, Any], ttl: Optional[int] = None, codec: Optional[str] = None
+    ) -> bool:
+        """Set several values with one pipelined Redis round trip.
+
+        Args:
+            items: Values by key
+            ttl: Optional TTL in seconds, the default TTL if None
+            codec: Codec name, e.g. "float32" for vectors; None picks one per value
+
+        Returns:
+            bool: True if the values were written to Redis, or to the
+                in-process tier when Redis is unavailable
+        """
+        if not items or (self.redis is None and self.local is None):
             return False
+        if ttl is None:
+            ttl = self.default_ttl
         try:
-            full_key = self._get_full_key(key)
-            serialized = pickle.dumps(value)
-            if ttl is None:
-                ttl = self.default_ttl
-            return bool(self.redis.setex(full_key, ttl, serialized))
+            serialized = {
+                self._get_full_key(key): self.codec.encode(value, codec)
+                for key, value in items.items()
+            }
         except Exception as e:
             self.logger.error(f"Error setting cache: {str(e)}")
             return False
+        if self.redis:
+            try:
+                if len(serialized) == 1:
+                    ((full_key, raw),) = serialized.items()
+                    written = bool(self.redis.setex(full_key, ttl, raw))
+                else:
+                    pipe = self.redis.pipeline(transaction=False)
+                    for full_key, raw in serialized.items():
+                        pipe.setex(full_key, ttl, raw)
+                    written = all(pipe.execute())
+            except Exception as e:
+                self._record("errors")
+                self.logger.error(f"Error setting cache: {str(e)}")
+                return False
+            if not written:
+                return False
+        # The local tier only holds what Redis accepted, so it never serves values
+        # other processes cannot see
+        if self.local is not None:
+            for full_key, raw in serialized.items():
+                self.local.set(full_key, raw, ttl)
+        return True
 
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
+        full_key = self._get_full_key(key)
+        deleted = self.local.delete(full_key) if self.local is not None else False
         if not self.redis:
-            return False
+            return deleted
         try:
-            full_key = self._get_full_key(key)
             return bool(self.redis.delete(full_key))
         except Exception as e:
+            self._record("errors")
             self.logger.error(f"Error deleting from cache: {str(e)}")
             return False
 
+    def delete_many(self, keys: List[str]) -> int:
+        """Delete several values from the cache in one pipelined round trip.
+
+        Args:
+            keys: Keys to delete
+
+        Returns:
+            int: Number of keys that existed and were deleted
+        """
+        if not keys:
+            return 0
+        deleted = 0
+        if self.local is not None:
+            deleted = sum(self.local.delete(self._get_full_key(key)) for key in keys)
+        if not self.redis:
+            return deleted
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for start in range(0, len(keys), 1000):
+                pipe.delete(*(self._get_full_key(key) for key in keys[start : start + 1000]))
+            return sum(int(count) for count in pipe.execute())
+        except Exception as e:
+            self._record("errors")
+            self.logger.error(f"Error deleting from cache: {str(e)}")
+            return 0
+
+    def incr(self, key: str, ttl: Optional[int] = None) -> Optional[int]:
+        """Atomically increment an integer counter in Redis.
+
+        Counters are stored as plain integers rather than through the codec and
+        bypass the in-process tier, so every process sees the latest value.
+
+        Args:
+            key: Counter key
+            ttl: Optional TTL in seconds, refreshed on every increment; the
+                default TTL if None
+
+        Returns:
+            Optional[int]: New counter value, or None if Redis is unavailable
+        """
+        if not self.redis:
+            return None
+        full_key = self._get_full_key(key)
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incr(full_key)
+            pipe.expire(full_key, self.default_ttl if ttl is None else ttl)
+            value, _ = pipe.execute()
+            return int(value)
+        except Exception as e:
+            self._record("errors")
+            self.logger.error(f"Error incrementing cache counter: {str(e)}")
+            return None
+
+    def get_counter(self, key: str) -> Optional[int]:
+        """Read a counter written by ``incr`` straight from Redis.
+
+        Args:
+            key: Counter key
+
+        Returns:
+            Optional[int]: Counter value, 0 if it does not exist, or None if
+                Redis is unavailable
+        """
+        if not self.redis:
+            return None
+        try:
+            raw = self.redis.get(self._get_full_key(key))
+        except Exception as e:
+            self._record("errors")
+            self.logger.error(f"Error getting cache counter: {str(e)}")
+            return None
+        try:
+            return int(raw) if raw else 0
+        except ValueError:
+            self.logger.warning(f"Ignoring non-integer cache counter: {key}")
+            return 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counts per cache tier.
+
+        Returns:
+            Dict[str, Any]: ``local`` statistics of the in-process tier (None if
+                disabled), ``redis`` hits, misses, errors and availability, and
+                ``compute`` counts of ``get_or_compute`` recomputations, callers
+                that shared another caller's recomputation, and stale values served
+        """
+        with self._stats_lock:
+            redis_stats = dict(self._redis_stats, available=self.redis is not None)
+            compute_stats = dict(self._compute_stats)
+        local_stats = self.local.stats() if self.local is not None else None
+        return {"local": local_stats, "redis": redis_stats, "compute": compute_stats}
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: Optional[int] = None,
+        stale_ttl: int = 0,
+        beta: float = 1.0,
+        lock_timeout: float = LOCK_TIMEOUT,
+    ) -> Any:
+        """Get a value, computing it once on a miss however many callers ask.
+
+        Concurrent misses of a key are deduplicated: within the process, callers
+        wait for the one computing the value; across processes, a short Redis
+        lock elects the one computing it while the others poll the cache. A
+        stalled or crashed computation only delays waiters by ``lock_timeout``,
+        after which they compute the value themselves.
+
+        Values are refreshed before they expire with a probability rising
+        towards expiry, scaled by how long they took to compute (probabilistic
+        early expiration), so popular keys are rarely all missed at once. For
+        ``stale_ttl`` seconds after expiry, a value is still returned to every
+        caller but the one refreshing it.
+
+        Args:
+            key: Cache key
+            compute: Function computing the value; None results are not cached
+            ttl: Optional TTL in seconds, the default TTL if None
+            stale_ttl: Seconds an expired value may still be served while it
+                is refreshed (default: 0)
+            beta: Eagerness of early expiration; 0 disables it (default: 1.0)
+            lock_timeout: Seconds a computation holds the cross-process lock,
+                and the longest waiters wait for it (default: 30)
+
+        Returns:
+            Any: Cached or computed value
+
+        Raises:
+            Exception: Whatever ``compute`` raised, in the computing caller and
+                in callers waiting for it in this process
+
+        Example:
+            ```python
+            clusters = cache.get_or_compute(
+                f"clusters:{corpus_id}", lambda: cluster(corpus), ttl=3600, stale_ttl=600
+            )
+            ```
+        """
+        ttl = self.default_ttl if ttl is None else ttl
+        fallback = _MISSING
+        entry = self.get(key)
+        if entry is not None:
+            value, expires, delta = self._unwrap(entry)
+            if expires is None:
+                return value
+            now = time.time()
+            # XFetch: -log(u) is exponentially distributed, so few callers refresh early
+            if now - delta * beta * math.log(1.0 - random.random()) < expires:
+                return value
+            if now < expires + stale_ttl:
+                fallback = value
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            if fallback is not _MISSING:
+                self._record("stale", stats=self._compute_stats)
+                return fallback
+            if flight.done.wait(lock_timeout):
+                self._record("coalesced", stats=self._compute_stats)
+                if flight.error is not None:
+                    raise flight.error
+                return flight.value
+            self.logger.warning(f"Gave up waiting for {key} to be computed")
+            return compute()
+
+        try:
+            flight.value = self._compute_locked(
+                key, compute, ttl, stale_ttl, fallback, lock_timeout
+            )
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _compute_locked(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        fallback: Any,
+        lock_timeout: float,
+    ) -> Any:
+        """Compute and store a value under the cross-process lock of its key."""
+        lock_key = self._get_full_key(f"lock:{key}")
+        token = self._acquire_lock(lock_key, lock_timeout)
+        if token is None:
+            if fallback is not _MISSING:
+                self._record("stale", stats=self._compute_stats)
+                return fallback
+            value = self._wait_for_value(key, lock_key, lock_timeout)
+            if value is not _MISSING:
+                self._record("coalesced", stats=self._compute_stats)
+                return value
+        try:
+            started = time.monotonic()
+            value = compute()
+            delta = time.monotonic() - started
+            self._record("computed", stats=self._compute_stats)
+            if value is not None:
+                entry = {
+                    ENTRY_MARKER: True,
+                    "value": value,
+                    "expires": time.time() + ttl,
+                    "delta": delta,
+                }
+                self.set(key, entry, ttl + stale_ttl)
+            return value
+        finally:
+            if token:
+                self._release_lock(lock_key, token)
+
+    def _acquire_lock(self, lock_key: str, timeout: float) -> Optional[str]:
+        """Try to take a cross-process lock.
+
+        Returns:
+            Optional[str]: Lock token, "" if there is no Redis to lock with (or
+                it failed), or None if another process holds the lock
+        """
+        if self.redis is None:
+            return ""
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.redis.set(lock_key, token, nx=True, px=int(timeout * 1000))
+        except Exception as e:
+            self._record("errors")
+            self.logger.warning(f"Failed to take cache lock {lock_key}: {str(e)}")
+            return ""
+        return token if acquired else None
+
+    def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            self._record("errors")
+            self.logger.warning(f"Failed to release cache lock {lock_key}: {str(e)}")
+
+    def _wait_for_value(self, key: str, lock_key: str, timeout: float) -> Any:
+        """Poll for a value computed by another process until its lock is released."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(LOCK_POLL_INTERVAL)
+            entry = self.get(key)
+            if entry is not None:
+                return self._unwrap(entry)[0]
+            try:
+                if not self.redis.exists(lock_key):
+                    break
+            except Exception:
+                break
+        return _MISSING
+
+    @staticmethod
+    def _unwrap(entry: Any) -> tuple:
+        """Split a stored value into (value, expiry time or None, compute seconds)."""
+        if isinstance(entry, dict) and entry.get(ENTRY_MARKER):
+            return entry["value"], entry["expires"], entry["delta"]
+        return entry, None, 0.0
+
     def cleanup(self):
         """Clean up resources."""
         try:
@@ -158,12 +602,15 @@ class CacheManager:
         except Exception as e:
             self.logger.error(f"Error cleaning up cache: {str(e)}")
 
-    def cache_decorator(self, key_prefix: str, ttl: Optional[int] = None):
+    def cache_decorator(self, key_prefix: str, ttl: Optional[int] = None, stale_ttl: int = 0):
         """Decorator to cache function results.
 
+        Concurrent misses compute the result once; see ``get_or_compute``.
+
         Args:
             key_prefix: Prefix for cache key
             ttl: Optional TTL in seconds
+            stale_ttl: Seconds an expired result may be served while it is refreshed
 
         Returns:
             Decorated function
@@ -172,29 +619,12 @@ class CacheManager:
         def decorator(func: Callable):
             @wraps(func)
             def wrapper(*args, **kwargs):
-                # Generate cache key from function args
-                key_parts = [key_prefix, func.__name__]
-
-                # Add args to key
-                if args:
-                    key_parts.extend(str(arg) for arg in args[1:])  # Skip self
+                # Generate cache key from function args, skipping self
+                cache_key = f"{key_prefix}:{func.__name__}:{fingerprint(*args[1:], **kwargs)}"
 
-                # Add sorted kwargs to key
-                if kwargs:
-                    sorted_items = sorted(kwargs.items())
-                    key_parts.extend(f"{k}:{self._hash_key(v)}" for k, v in sorted_items)
-
-                cache_key = ":".join(key_parts)
-
-                # Try to get from cache
-                cached_value = self.get(cache_key)
-                if cached_value is not None:
-                    return cached_value
-
-                # Generate value and cache it
-                value = func(*args, **kwargs)
-                self.set(cache_key, value, ttl)
-                return value
+                return self.get_or_compute(
+                    cache_key, lambda: func(*args, **kwargs), ttl=ttl, stale_ttl=stale_ttl
+                )
 
             return wrapper
 
@@ -229,13 +659,24 @@ def create_retry_decorator(
     )
 
 
-def cached_with_retry(cache_manager: CacheManager, key_prefix: str, max_attempts: int = 3):
+def cached_with_retry(
+    cache_manager: CacheManager,
+    key_prefix: str,
+    max_attempts: int = 3,
+    ttl: Optional[int] = None,
+    stale_ttl: int = 0,
+):
     """Decorator that combines caching and retry logic.
 
+    Concurrent misses of the same key, in this or other processes, compute the
+    result once; see ``CacheManager.get_or_compute``.
+
     Args:
         cache_manager: CacheManager instance
         key_prefix: Prefix for cache keys
         max_attempts: Maximum number of retry attempts
+        ttl: Optional TTL in seconds, the cache manager's default if None
+        stale_ttl: Seconds an expired result may be served while it is refreshed
 
     Returns:
         Decorated function
@@ -244,30 +685,19 @@ def cached_with_retry(cache_manager: CacheManager, key_prefix: str, max_attempts
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Get cache key
-            key_parts = [key_prefix, func.__name__]
-            if args:
-                key_parts.extend(str(arg) for arg in args[1:])  # Skip self
-            if kwargs:
-                sorted_items = sorted(kwargs.items())
-                key_parts.extend(f"{k}:{cache_manager._hash_key(v)}" for k, v in sorted_items)
-            cache_key = ":".join(key_parts)
-
-            # Try to get from cache
-            cached_value = cache_manager.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            # Get cache key, skipping self
+            cache_key = f"{key_prefix}:{func.__name__}:{fingerprint(*args[1:], **kwargs)}"
 
             # Create retry decorator
             retry_decorator = create_retry_decorator(max_attempts=max_attempts)
 
             @retry_decorator
             def execute_with_retry():
-                value = func(*args, **kwargs)
-                cache_manager.set(cache_key, value)
-                return value
+                return func(*args, **kwargs)
 
-            return execute_with_retry()
+            return cache_manager.get_or_compute(
+                cache_key, execute_with_retry, ttl=ttl, stale_ttl=stale_ttl
+            )
 
         return wrapper
 
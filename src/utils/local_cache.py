@@ -0,0 +1,161 @@
+"""In-process LRU cache bounded by size in bytes.
+
+This module provides the level-one tier of ``CacheManager``: recently used
+serialized values kept in process memory, so hot keys are served without a
+Redis round trip. Values are stored as bytes, which makes the size bound exact
+and hands every caller its own deserialized copy.
+
+Features:
+1. Eviction:
+   - Least recently used entries are evicted once ``max_bytes`` is exceeded
+   - Values larger than a quarter of ``max_bytes`` are not cached
+   - Per-entry TTL; expired entries are dropped when read or evicted
+
+2. Monitoring:
+   - Hits, misses, evictions and expirations via ``stats()``
+
+Usage:
+    ```python
+    from src.utils.local_cache import LocalCache
+
+    local = LocalCache(max_bytes=64 * 1024 * 1024, ttl=60)
+    local.set("cache:key", b"value")
+    raw = local.get("cache:key")
+    print(local.stats()["hits"])
+    ```
+
+Note:
+    - The cache is per process; entries written by other processes are only
+      seen once the local copy expires
+    - Methods are thread-safe
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Values above this share of the budget would evict too much of the cache
+MAX_ENTRY_SHARE = 0.25
+
+
+class LocalCache:
+    """Byte-size-bounded LRU cache of serialized values with per-entry TTL.
+
+    Attributes:
+        max_bytes (int): Maximum total size of cached values.
+        ttl (Optional[float]): Maximum age in seconds of an entry, None for no limit.
+    """
+
+    def __init__(self, max_bytes: int, ttl: Optional[float] = None):
+        """Initialize the local cache.
+
+        Args:
+            max_bytes: Maximum total size of cached values in bytes.
+            ttl: Maximum age in seconds of an entry; None keeps entries until
+                evicted (default: None).
+
+        Raises:
+            ValueError: If max_bytes is not positive
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a value and mark it as recently used.
+
+        Returns:
+            Optional[bytes]: Cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> bool:
+        """Store a value, evicting least recently used entries to make room.
+
+        Args:
+            key: Cache key.
+            value: Serialized value.
+            ttl: Maximum age in seconds; capped by the cache's own TTL.
+
+        Returns:
+            bool: False if the value is too large to cache locally.
+        """
+        limits = [limit for limit in (ttl, self.ttl) if limit is not None]
+        expires = time.monotonic() + min(limits) if limits else float("inf")
+        with self._lock:
+            self._remove(key)
+            if len(value) > self.max_bytes * MAX_ENTRY_SHARE:
+                return False
+            self._entries[key] = (value, expires)
+            self._bytes += len(value)
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+            return True
+
+    def delete(self, key: str) -> bool:
+        """Remove a value.
+
+        Returns:
+            bool: True if the key was cached.
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all entries; statistics are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self._bytes -= len(entry[0])
+        return True
+
+    def __len__(self) -> int:
+        """Number of cached entries, expired ones included until they are dropped."""
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Summarize cache usage.
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, expirations, number of
+                entries, and cached and maximum size in bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -15,6 +15,7 @@ both regex patterns and Named Entity Recognition (NER). It includes:
    - Named entities (people, organizations, locations)
 
 2. Text Processing:
+   - Single-pass regex scanning restricted to tokens containing digits or "@"
    - Chunked processing for large texts
    - Clean text handling
    - Special character handling
@@ -23,7 +24,7 @@ both regex patterns and Named Entity Recognition (NER). It includes:
 3. Redaction:
    - Customizable redaction patterns
    - Context preservation
-   - Position-aware replacement
+   - Position-aware replacement in a single pass
    - Overlap handling
 
 4. Document Analysis:
@@ -32,6 +33,11 @@ both regex patterns and Named Entity Recognition (NER). It includes:
    - Type categorization
    - Timestamp tracking
 
+5. Batch Processing:
+   - Texts streamed through ``nlp.pipe`` with only NER enabled
+   - Optional fan-out across worker processes
+   - One loaded spaCy model per process, shared by all detectors
+
 Usage:
     ```python
     from src.utils.pii_detector import PIIDetector
@@ -52,6 +58,9 @@ Usage:
         "metadata": {}
     }
     processed_doc = detector.analyze_document(doc)
+
+    # Batch analysis on 8 worker processes
+    processed_docs = detector.analyze_documents(docs, n_process=8, batch_size=64)
     ```
 
 Note:
@@ -59,18 +68,67 @@ Note:
     - Handles large documents efficiently through chunking
     - Thread-safe operations
     - Customizable redaction patterns
+    - Worker processes are started on first use and kept until ``close()``
 """
 
 import logging
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import spacy
 
 from .text_processing import chunk_text_by_chars, clean_text
 
+# Pipeline components kept for NER; transformer models feed their NER from "transformer"
+NER_COMPONENTS = ("ner", "transformer")
+
+# Every regex PII match contains a digit or "@", so only runs of tokens containing
+# one of them are scanned
+_TRIGGER_TOKENS = re.compile(r"\S*[\d@]\S*(?:\s+\S*[\d@]\S*)*")
+
+# Month name directly before a scanned run ("Jan 5, 2024")
+_WORD_BEFORE = re.compile(r"[A-Za-z]+ $")
+
+# Detector of the current worker process, created by _init_worker
+_worker_detector: Optional["PIIDetector"] = None
+
+
+@lru_cache(maxsize=None)
+def load_ner_model(spacy_model: str):
+    """Load a spaCy model with only the components needed for NER.
+
+    The model is cached, so every detector in a process shares one copy.
+
+    Args:
+        spacy_model: Name of the spaCy model
+
+    Returns:
+        spacy.language.Language: Loaded model with non-NER components disabled
+    """
+    nlp = spacy.load(spacy_model)
+    nlp.select_pipes(disable=[name for name in nlp.pipe_names if name not in NER_COMPONENTS])
+    return nlp
+
+
+def _init_worker(spacy_model: str, chunk_size: int) -> None:
+    """Load the detector once per worker process."""
+    global _worker_detector
+    _worker_detector = PIIDetector(spacy_model=spacy_model, chunk_size=chunk_size)
+
+
+def _analyze_in_worker(
+    docs: List[Dict], batch_size: int, custom_redaction: Optional[Dict[str, str]]
+) -> List[Dict]:
+    """Analyze a slice of documents in a worker process."""
+    return _worker_detector.analyze_documents(
+        docs, n_process=1, batch_size=batch_size, custom_redaction=custom_redaction
+    )
+
 
 @dataclass
 class PIIMatch:
@@ -91,10 +149,13 @@ class PIIMatch:
 
 class PIIDetector:
     def __init__(self, spacy_model: str = "en_core_web_sm", chunk_size: int = 100000):  # characters
-        # Load spaCy model for NER
-        self.nlp = spacy.load(spacy_model)
+        # Load spaCy model for NER, shared with other detectors in this process
+        self.spacy_model = spacy_model
+        self.nlp = load_ner_model(spacy_model)
         self.chunk_size = chunk_size
         self.logger = logging.getLogger(__name__)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_size = 0
 
         # Common regex patterns
         self.patterns = {
@@ -133,64 +194,128 @@ class PIIDetector:
             name: re.compile(pattern, re.IGNORECASE) for name, pattern in self.patterns.items()
         }
 
+        # Combined scanner; at each position the first matching alternative wins,
+        # so specific patterns come before the permissive phone pattern
+        self.scan_order = [
+            "ethereum_address",
+            "bitcoin_address",
+            "email",
+            "ip_address",
+            "ssn",
+            "credit_card",
+            "date",
+            "passport",
+            "phone",
+        ]
+        self.scanner = re.compile(
+            "|".join(f"(?P<{name}>{self.patterns[name]})" for name in self.scan_order),
+            re.IGNORECASE,
+        )
+
+    @staticmethod
+    def _scan_windows(text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the spans of text that can contain a regex PII match."""
+        last_end = 0
+        for run in _TRIGGER_TOKENS.finditer(text):
+            start = run.start()
+            before = _WORD_BEFORE.search(text, max(last_end, start - 32), start)
+            if before:
+                start = before.start()
+            last_end = run.end()
+            yield start, last_end
+
     def _find_regex_matches(self, text: str) -> List[PIIMatch]:
-        """Find PII using regex patterns."""
+        """Find PII using regex patterns in a single pass over candidate spans."""
         matches = []
 
-        for pii_type, pattern in self.compiled_patterns.items():
-            try:
-                for match in pattern.finditer(text):
+        try:
+            for start, end in self._scan_windows(text):
+                for match in self.scanner.finditer(text, start, end):
                     matches.append(
                         PIIMatch(
-                            type=pii_type, value=match.group(), start=match.start(), end=match.end()
+                            type=match.lastgroup,
+                            value=match.group(),
+                            start=match.start(),
+                            end=match.end(),
                         )
                     )
-            except Exception as e:
-                self.logger.error(f"Error matching pattern {pii_type}: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"Error matching PII patterns: {str(e)}")
 
         return matches
 
+    def _ner_inputs(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Split cleaned text into NER inputs with their character offsets."""
+        offset = 0
+        for chunk in chunk_text_by_chars(text, chunk_size=self.chunk_size):
+            yield chunk, offset
+            offset += len(chunk)
+
+    def _entity_matches(self, spacy_doc, offset: int) -> List[PIIMatch]:
+        """Convert the entities of a processed chunk into PII matches."""
+        return [
+            PIIMatch(
+                type=self.ner_types[ent.label_],
+                value=ent.text,
+                start=ent.start_char + offset,
+                end=ent.end_char + offset,
+            )
+            for ent in spacy_doc.ents
+            if ent.label_ in self.ner_types
+        ]
+
     def _find_ner_matches(self, text: str) -> List[PIIMatch]:
         """Find PII using named entity recognition with chunking."""
         matches = []
-        chunks = chunk_text_by_chars(text, chunk_size=self.chunk_size)
-        offset = 0
 
-        for chunk in chunks:
+        for chunk, offset in self._ner_inputs(text):
             try:
-                # Clean text before NER processing
-                cleaned_chunk = clean_text(chunk)
-                doc = self.nlp(cleaned_chunk)
-
-                for ent in doc.ents:
-                    if ent.label_ in self.ner_types:
-                        matches.append(
-                            PIIMatch(
-                                type=self.ner_types[ent.label_],
-                                value=ent.text,
-                                start=ent.start_char + offset,
-                                end=ent.end_char + offset,
-                            )
-                        )
+                matches.extend(self._entity_matches(self.nlp(chunk), offset))
             except Exception as e:
                 self.logger.error(f"Error processing NER chunk: {str(e)}")
 
-            offset += len(chunk)
-
         return matches
 
-    def detect(self, text: str) -> List[PIIMatch]:
-        """Detect all PII in the given text."""
-        if not text:
-            return []
-
-        # Clean text before processing
-        text = clean_text(text)
-
-        # Combine regex and NER matches
-        matches = self._find_regex_matches(text) + self._find_ner_matches(text)
+    def _pipe_ner_matches(self, texts: List[str], batch_size: int) -> List[List[PIIMatch]]:
+        """Find NER matches of several texts with ``nlp.pipe``.
+
+        If a batch fails, the texts it contained are analyzed again one chunk at a
+        time with ``_find_ner_matches`` and the stream resumes after them, so one
+        bad document does not lose the entities of the others.
+        """
+        inputs = [
+            (chunk, (i, offset))
+            for i, text in enumerate(texts)
+            if text
+            for chunk, offset in self._ner_inputs(text)
+        ]
+        matches: List[List[PIIMatch]] = [[] for _ in texts]
+        start = 0
+        while start < len(inputs):
+            done = start
+            try:
+                for spacy_doc, (i, offset) in self.nlp.pipe(
+                    inputs[start:], as_tuples=True, batch_size=batch_size
+                ):
+                    matches[i].extend(self._entity_matches(spacy_doc, offset))
+                    done += 1
+                break
+            except Exception as e:
+                failed = {i for _, (i, _) in inputs[done : done + batch_size]}
+                self.logger.error(
+                    f"Error processing NER batch, retrying {len(failed)} documents "
+                    f"one by one: {str(e)}"
+                )
+                for i in failed:
+                    matches[i] = self._find_ner_matches(texts[i])
+                start = done
+                while start < len(inputs) and inputs[start][1][0] in failed:
+                    start += 1
+        return matches
 
-        # Sort by start position and remove duplicates
+    @staticmethod
+    def _resolve_overlaps(matches: List[PIIMatch]) -> List[PIIMatch]:
+        """Sort matches by position and drop those overlapping an earlier match."""
         matches.sort(key=lambda x: (x.start, x.end))
         unique_matches = []
         last_end = -1
@@ -203,6 +328,17 @@ class PIIDetector:
 
         return unique_matches
 
+    def detect(self, text: str) -> List[PIIMatch]:
+        """Detect all PII in the given text."""
+        if not text:
+            return []
+
+        # Clean text before processing
+        text = clean_text(text)
+
+        # Combine regex and NER matches
+        return self._resolve_overlaps(self._find_regex_matches(text) + self._find_ner_matches(text))
+
     def redact(
         self, text: str, matches: List[PIIMatch] = None, custom_redaction: Dict[str, str] = None
     ) -> str:
@@ -234,22 +370,27 @@ class PIIDetector:
         if custom_redaction:
             redaction_patterns.update(custom_redaction)
 
-        # Sort matches in reverse order to avoid offset issues
-        matches.sort(key=lambda x: x.start, reverse=True)
-
-        # Create a mutable list of characters
-        chars = list(text)
-
-        for match in matches:
-            redaction = redaction_patterns.get(match.type, f"[REDACTED:{match.type}]")
-            chars[match.start : match.end] = list(redaction)
-
-        return "".join(chars)
-
-    def analyze_document(self, doc: Dict, custom_redaction: Dict[str, str] = None) -> Dict:
-        """Analyze a document for PII and add results to metadata."""
+        # Join untouched segments and redactions in one pass, skipping overlaps
+        parts = []
+        last_end = 0
+        for match in sorted(matches, key=lambda x: (x.start, x.end)):
+            if match.start < last_end:
+                continue
+            parts.append(text[last_end : match.start])
+            parts.append(redaction_patterns.get(match.type, f"[REDACTED:{match.type}]"))
+            last_end = match.end
+        parts.append(text[last_end:])
+
+        return "".join(parts)
+
+    def _apply_analysis(
+        self,
+        doc: Dict,
+        matches: List[PIIMatch],
+        custom_redaction: Dict[str, str] = None,
+    ) -> Dict:
+        """Add PII analysis metadata to a document and redact it if requested."""
         content = doc["content"]["body"]
-        matches = self.detect(content)
 
         # Add PII analysis to metadata
         doc["metadata"]["pii_analysis"] = {
@@ -273,3 +414,84 @@ class PIIDetector:
                 )
 
         return doc
+
+    def analyze_document(self, doc: Dict, custom_redaction: Dict[str, str] = None) -> Dict:
+        """Analyze a document for PII and add results to metadata."""
+        return self._apply_analysis(doc, self.detect(doc["content"]["body"]), custom_redaction)
+
+    def analyze_documents(
+        self,
+        docs: List[Dict],
+        n_process: int = 1,
+        batch_size: int = 32,
+        custom_redaction: Dict[str, str] = None,
+    ) -> List[Dict]:
+        """Analyze several documents for PII.
+
+        Produces the same results as calling ``analyze_document`` on each
+        document, but streams all NER inputs through ``nlp.pipe``. With
+        ``n_process > 1`` the documents are split across a pool of worker
+        processes, each holding its own copy of the model; the pool is reused
+        by later calls.
+
+        Args:
+            docs: Documents to analyze
+            n_process: Number of processes to use, -1 for one per CPU core
+            batch_size: Number of texts per ``nlp.pipe`` batch
+            custom_redaction: Optional custom redaction patterns
+
+        Returns:
+            List[Dict]: Analyzed documents, in input order
+        """
+        if n_process == -1:
+            n_process = multiprocessing.cpu_count()
+        if n_process > 1 and len(docs) > 1:
+            return self._analyze_in_pool(docs, n_process, batch_size, custom_redaction)
+
+        texts = [clean_text(doc["content"]["body"]) for doc in docs]
+        matches: List[List[PIIMatch]] = [self._find_regex_matches(text) for text in texts]
+        for doc_matches, ner_matches in zip(matches, self._pipe_ner_matches(texts, batch_size)):
+            doc_matches.extend(ner_matches)
+
+        return [
+            self._apply_analysis(doc, self._resolve_overlaps(doc_matches), custom_redaction)
+            for doc, doc_matches in zip(docs, matches)
+        ]
+
+    def _analyze_in_pool(
+        self,
+        docs: List[Dict],
+        n_process: int,
+        batch_size: int,
+        custom_redaction: Optional[Dict[str, str]],
+    ) -> List[Dict]:
+        """Split documents across worker processes and collect results in order."""
+        if self._pool is None or self._pool_size != n_process:
+            self.close()
+            self._pool = ProcessPoolExecutor(
+                max_workers=n_process,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.spacy_model, self.chunk_size),
+            )
+            self._pool_size = n_process
+            self.logger.info(f"Started {n_process} PII worker processes")
+
+        slice_size = max(1, -(-len(docs) // n_process))
+        futures = [
+            self._pool.submit(
+                _analyze_in_worker, docs[i : i + slice_size], batch_size, custom_redaction
+            )
+            for i in range(0, len(docs), slice_size)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+            self._pool_size = 0
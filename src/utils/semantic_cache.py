@@ -0,0 +1,208 @@
+"""Semantic cache of search results keyed by query vectors.
+
+This module answers paraphrased queries ("reset password" and "how to reset my
+password") from the results of an earlier, semantically equivalent query. Recent
+query vectors are kept in a small in-memory matrix; a lookup is one matrix-vector
+product, and the most similar cached query is a hit when its cosine similarity
+reaches the threshold and its results are younger than the staleness bound.
+
+Features:
+1. Lookup:
+   - L2-normalized float32 query vectors in a fixed-size ring buffer
+   - Cosine similarity against all cached queries in one product
+   - Scopes keep queries with different search parameters apart
+
+2. Freshness:
+   - Entries older than ``max_age`` seconds are never returned
+   - The oldest entry is overwritten once the cache is full
+   - ``clear()`` drops everything, e.g. after the index changed
+
+3. Monitoring:
+   - Hit ratio and a histogram of best-match similarities via ``stats()``
+   - Hits, misses and similarities exported through the Prometheus recorders
+
+Usage:
+    ```python
+    from src.utils.semantic_cache import SemanticCache
+
+    cache = SemanticCache(capacity=1024, threshold=0.95, max_age=300)
+    results = cache.lookup(query_vector, scope="hybrid:10")
+    if results is None:
+        results = search(query_vector)
+        cache.add(query_vector, results, scope="hybrid:10")
+    print(cache.stats()["hit_ratio"])
+    ```
+
+Note:
+    - The cache is per process and opt-in
+    - Methods are thread-safe
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.api.monitoring.recorders import (
+    record_cache_hit,
+    record_cache_miss,
+    record_semantic_similarity,
+)
+
+# Upper edges of the similarity histogram buckets reported by stats()
+SIMILARITY_BUCKETS = (0.5, 0.8, 0.9, 0.95, 0.98, 0.99, 1.0)
+
+CACHE_TYPE = "semantic"
+
+
+class SemanticCache:
+    """In-memory cache of results keyed by query vector similarity.
+
+    Attributes:
+        capacity (int): Maximum number of cached queries.
+        threshold (float): Minimum cosine similarity for a hit.
+        max_age (float): Maximum age in seconds of returned results.
+    """
+
+    def __init__(self, capacity: int = 1024, threshold: float = 0.95, max_age: float = 300.0):
+        """Initialize the semantic cache.
+
+        Args:
+            capacity: Maximum number of cached queries (default: 1024).
+            threshold: Minimum cosine similarity for a hit (default: 0.95).
+            max_age: Maximum age in seconds of returned results (default: 300).
+
+        Raises:
+            ValueError: If capacity is not positive or threshold is not in (0, 1]
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.capacity = capacity
+        self.threshold = threshold
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._results: List[Any] = [None] * capacity
+        self._scopes = np.full(capacity, -1, dtype=np.int64)
+        self._created = np.zeros(capacity, dtype=np.float64)
+        self._scope_ids: Dict[str, int] = {}
+        self._next = 0
+        self._size = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._similarity_counts = [0] * len(SIMILARITY_BUCKETS)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def lookup(self, vector: Sequence[float], scope: str = "") -> Optional[Any]:
+        """Find the results of a sufficiently similar cached query.
+
+        Args:
+            vector: Query vector.
+            scope: Search parameters the results depend on; only entries of the
+                same scope can match.
+
+        Returns:
+            Optional[Any]: Results of the most similar fresh query, or None on a miss.
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            best, best_row = -1.0, -1
+            scope_id = self._scope_ids.get(scope)
+            if (
+                self._size
+                and scope_id is not None
+                and self._vectors is not None
+                and query.shape[0] == self._vectors.shape[1]
+            ):
+                valid = (self._scopes[: self._size] == scope_id) & (
+                    self._created[: self._size] >= time.time() - self.max_age
+                )
+                if valid.any():
+                    similarities = self._vectors[: self._size] @ query
+                    similarities[~valid] = -np.inf
+                    best_row = int(np.argmax(similarities))
+                    best = float(similarities[best_row])
+                    self._record_similarity(best)
+
+            if best >= self.threshold:
+                self._hits += 1
+                results = self._results[best_row]
+            else:
+                self._misses += 1
+                results = None
+
+        if results is None:
+            record_cache_miss(CACHE_TYPE)
+        else:
+            record_cache_hit(CACHE_TYPE)
+        return results
+
+    def add(self, vector: Sequence[float], results: Any, scope: str = "") -> None:
+        """Cache the results of a query, replacing the oldest entry if full.
+
+        Args:
+            vector: Query vector.
+            results: Results to return for similar queries.
+            scope: Search parameters the results depend on.
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+                # First entry or a different model: start over with the new dimension
+                self._vectors = np.zeros((self.capacity, query.shape[0]), dtype=np.float32)
+                self._size = self._next = 0
+            scope_id = self._scope_ids.setdefault(scope, len(self._scope_ids))
+            row = self._next
+            self._vectors[row] = query
+            self._results[row] = results
+            self._scopes[row] = scope_id
+            self._created[row] = time.time()
+            self._next = (row + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def clear(self) -> None:
+        """Drop all cached queries; statistics are kept."""
+        with self._lock:
+            self._results = [None] * self.capacity
+            self._scopes[:] = -1
+            self._scope_ids = {}
+            self._size = self._next = 0
+
+    def _record_similarity(self, similarity: float) -> None:
+        for i, edge in enumerate(SIMILARITY_BUCKETS):
+            if similarity <= edge or i == len(SIMILARITY_BUCKETS) - 1:
+                self._similarity_counts[i] += 1
+                break
+        record_semantic_similarity(similarity)
+
+    def stats(self) -> Dict[str, Any]:
+        """Summarize cache effectiveness.
+
+        Returns:
+            Dict[str, Any]: Lookups, hits, misses, hit ratio, number of cached
+                queries, and counts of best-match similarities per bucket keyed
+                by the bucket's upper edge.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "lookups": lookups,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "size": self._size,
+                "similarity": {
+                    f"le_{edge}": count
+                    for edge, count in zip(SIMILARITY_BUCKETS, self._similarity_counts)
+                },
+            }
@@ -11,7 +11,7 @@ storage and retrieval of summarization results. It includes:
 
 2. Decorator Features:
    - Function wrapping
-   - Argument hashing
+   - Argument fingerprinting, stable across processes
    - Type preservation
    - Generic support
 
@@ -58,6 +58,8 @@ import functools
 import logging
 from typing import Any, Callable, TypeVar
 
+from src.utils.fingerprint import fingerprint
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -84,8 +86,8 @@ def with_cache(key_prefix: str) -> Callable:
             if not self.cache_manager or not self.cache_config or not self.cache_config.enabled:
                 return func(self, *args, **kwargs)
 
-            # Generate cache key from function arguments
-            cache_key = f"{key_prefix}:{func.__name__}:{hash(str(args))}"
+            # Generate a key that is stable across processes from the arguments
+            cache_key = f"{key_prefix}:{func.__name__}:{fingerprint(*args, **kwargs)}"
 
             try:
                 # Try to get from cache
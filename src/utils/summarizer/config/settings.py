@@ -78,6 +78,7 @@ class SummarizerConfig:
         top_p: Nucleus sampling parameter
         chunk_size: Size of text chunks for processing
         chunk_overlap: Overlap between consecutive chunks
+        batch_size: Number of chunks passed to the model at once
         device: Device to use for model (cpu/cuda)
         num_beams: Number of beams for beam search
         early_stopping: Whether to use early stopping
@@ -96,6 +97,7 @@ class SummarizerConfig:
     top_p: float = 0.9
     chunk_size: int = 512
     chunk_overlap: int = 50
+    batch_size: int = 8
     device: str = "cpu"
     num_beams: int = 4
     early_stopping: bool = True
@@ -11,6 +11,7 @@ transformers with configurable parameters and error handling. It includes:
 
 2. Text Processing:
    - Chunk-based processing
+   - Batched inference over chunks of many texts, bucketed by length
    - Text cleaning
    - Length validation
    - Format handling
@@ -48,6 +49,9 @@ Usage:
         config
     )
     print(result["summary"])
+
+    # Summarize many texts with batched inference
+    results = summarizer.generate_summaries(texts, config)
     ```
 
 Note:
@@ -58,16 +62,27 @@ Note:
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List, Optional
 
 from transformers import Pipeline
 
+try:
+    import torch
+except ImportError:  # pragma: no cover - depends on the installed backend
+    torch = None
+
 from ...text_processing import chunk_text_by_words, clean_text
 from ..config.settings import SummarizerConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _inference_mode() -> ContextManager:
+    """Disable autograd bookkeeping during generation, if torch is installed."""
+    return torch.inference_mode() if torch is not None else nullcontext()
+
+
 class SummarizationError(Exception):
     """Base class for summarization-specific errors."""
 
@@ -115,6 +130,8 @@ class SummarizationPipeline:
             raise ValidationError("chunk_size must be at least 1")
         if self.config.chunk_overlap < 0:
             raise ValidationError("chunk_overlap must be non-negative")
+        if getattr(self.config, "batch_size", 1) < 1:
+            raise ValidationError("batch_size must be at least 1")
 
         # Ensure min_word_count exists and is valid
         min_word_count = getattr(self.config, "min_word_count", 100)
@@ -135,79 +152,197 @@ class SummarizationPipeline:
         Returns:
             Dict containing status, summary, and metadata
         """
-        if not text:
-            return {"status": "error", "error": "Empty text"}
+        return self.generate_summaries([text], config)[0]
 
+    def generate_summaries(
+        self, texts: List[str], config: Optional[SummarizerConfig] = None
+    ) -> List[Dict[str, Any]]:
+        """Generate summaries for several texts with batched inference.
+
+        Chunks of all texts are summarized together, in batches of
+        ``config.batch_size`` chunks of similar length, and the chunk summaries
+        of each text are then combined, again in batches.
+
+        Args:
+            texts: Texts to summarize
+            config: Optional summary configuration
+
+        Returns:
+            List of dicts containing status, summary, and metadata, one per
+            text in input order
+        """
         if config:
             self.config = config
 
+        invalid = None
         try:
             self._validate_config()
-
-            # Clean and truncate text
-            text = clean_text(text)
-            word_count = len(text.split())
-
-            if word_count < self.config.min_word_count:
-                return {
-                    "status": "success",
-                    "summary": text,
-                    "metadata": {
-                        "original_length": word_count,
-                        "was_summarized": False,
-                        "reason": "Text too short",
-                    },
-                }
-
-            # Split text into chunks
-            chunks = chunk_text_by_words(
-                text, self.config.chunk_size, overlap=self.config.chunk_overlap
-            )
-
-            # Process each chunk with error handling
-            chunk_summaries = []
-            failed_chunks = 0
-
-            for i, chunk in enumerate(chunks):
-                try:
-                    summary = self._summarize_chunk(chunk)
-                    if summary.strip():  # Only add non-empty summaries
-                        chunk_summaries.append(summary)
-                except Exception as e:
-                    failed_chunks += 1
-                    logger.error(f"Error processing chunk {i}: {str(e)}")
+        except ValidationError as e:
+            invalid = {"status": "error", "error": str(e)}
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending: Dict[int, Dict[str, Any]] = {}
+        all_chunks: List[str] = []
+        for i, text in enumerate(texts):
+            if not text:
+                results[i] = {"status": "error", "error": "Empty text"}
+                continue
+            if invalid is not None:
+                results[i] = dict(invalid)
+                continue
+            try:
+                # Clean and truncate text
+                text = clean_text(text)
+                word_count = len(text.split())
+
+                if word_count < self.config.min_word_count:
+                    results[i] = {
+                        "status": "success",
+                        "summary": text,
+                        "metadata": {
+                            "original_length": word_count,
+                            "was_summarized": False,
+                            "reason": "Text too short",
+                        },
+                    }
                     continue
 
-            if not chunk_summaries:
-                if failed_chunks == len(chunks):
-                    return {"status": "error", "error": "All chunks failed to summarize"}
-                return {
-                    "status": "error",
-                    "error": "No valid summaries generated",
-                    "metadata": {"failed_chunks": failed_chunks},
-                }
-
-            # Combine chunk summaries
-            final_summary = self._combine_summaries(chunk_summaries)
-
-            return {
+                # Split text into chunks
+                chunks = chunk_text_by_words(
+                    text, self.config.chunk_size, overlap=self.config.chunk_overlap
+                )
+            except Exception as e:
+                logger.error(f"Error generating summary: {str(e)}")
+                results[i] = {"status": "error", "error": str(e)}
+                continue
+            pending[i] = {
+                "word_count": word_count,
+                "chunks": len(chunks),
+                "start": len(all_chunks),
+            }
+            all_chunks.extend(chunks)
+
+        chunk_summaries = self._summarize_chunks(all_chunks)
+
+        # Combine the chunk summaries of each text
+        to_combine: Dict[int, List[str]] = {}
+        for i, state in pending.items():
+            start = state["start"]
+            summaries = chunk_summaries[start : start + state["chunks"]]
+            failed_chunks = sum(summary is None for summary in summaries)
+            state["failed_chunks"] = failed_chunks
+            summaries = [summary for summary in summaries if summary and summary.strip()]
+            if not summaries:
+                if failed_chunks == state["chunks"]:
+                    results[i] = {"status": "error", "error": "All chunks failed to summarize"}
+                else:
+                    results[i] = {
+                        "status": "error",
+                        "error": "No valid summaries generated",
+                        "metadata": {"failed_chunks": failed_chunks},
+                    }
+            elif len(summaries) == 1:
+                state["summary"] = summaries[0]
+            else:
+                to_combine[i] = summaries
+
+        combined = self._summarize_chunks([" ".join(s) for s in to_combine.values()])
+        for i, summary in zip(to_combine, combined):
+            if summary is None:
+                results[i] = {"status": "error", "error": "Failed to combine chunk summaries"}
+            else:
+                pending[i]["summary"] = summary
+
+        for i, state in pending.items():
+            if results[i] is not None:
+                continue
+            final_summary = state["summary"]
+            word_count = state["word_count"]
+            results[i] = {
                 "status": "success",
                 "summary": final_summary,
                 "metadata": {
                     "original_length": word_count,
                     "summary_length": len(final_summary.split()),
                     "compression_ratio": len(final_summary.split()) / word_count,
-                    "chunks_processed": len(chunks),
-                    "failed_chunks": failed_chunks,
+                    "chunks_processed": state["chunks"],
+                    "failed_chunks": state["failed_chunks"],
                     "was_summarized": True,
                 },
             }
+        return results
 
-        except ValidationError as e:
-            return {"status": "error", "error": str(e)}
+    def _summarize_chunks(self, chunks: List[str]) -> List[Optional[str]]:
+        """Summarize chunks in length-bucketed batches.
+
+        Chunks are sorted by length so each batch pads to a similar length. If
+        a batch fails, its chunks are retried one at a time so that a bad
+        chunk fails alone.
+
+        Args:
+            chunks: Text chunks to summarize
+
+        Returns:
+            Summary per chunk in input order, None where summarization failed
+        """
+        summaries: List[Optional[str]] = [None] * len(chunks)
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]), reverse=True)
+        batch_size = max(1, getattr(self.config, "batch_size", 1))
+        for start in range(0, len(order), batch_size):
+            batch = order[start : start + batch_size]
+            try:
+                for i, summary in zip(batch, self._summarize_batch([chunks[i] for i in batch])):
+                    summaries[i] = summary
+                continue
+            except SummarizationError as e:
+                if len(batch) == 1:
+                    logger.error(f"Error processing chunk {batch[0]}: {str(e)}")
+                    continue
+                logger.warning(f"Batch of {len(batch)} chunks failed, retrying one by one")
+            for i in batch:
+                try:
+                    summaries[i] = self._summarize_chunk(chunks[i])
+                except Exception as e:
+                    logger.error(f"Error processing chunk {i}: {str(e)}")
+        return summaries
+
+    def _summarize_batch(self, texts: List[str]) -> List[str]:
+        """Summarize a batch of chunks in one pipeline call.
+
+        Args:
+            texts: Text chunks to summarize
+
+        Returns:
+            Summary per chunk
+
+        Raises:
+            SummarizationError: If the pipeline fails or returns the wrong
+                number of summaries
+        """
+        try:
+            with _inference_mode():
+                results = self.pipeline(
+                    [text[:1024] for text in texts],  # Simple truncation of input text
+                    batch_size=len(texts),
+                    **self._generation_kwargs(),
+                )
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            return {"status": "error", "error": str(e)}
+            raise SummarizationError(f"Failed to summarize batch: {str(e)}")
+        if len(results) != len(texts):
+            raise SummarizationError(
+                f"Pipeline returned {len(results)} summaries for {len(texts)} chunks"
+            )
+        # Pipelines return a list per input when asked for several sequences
+        return [(r[0] if isinstance(r, list) else r)["summary_text"].strip() for r in results]
+
+    def _generation_kwargs(self) -> Dict[str, Any]:
+        return {
+            "max_length": self.config.max_length,
+            "min_length": self.config.min_length,
+            "do_sample": True,  # Enable sampling for temperature and top_p to work
+            "temperature": self.config.temperature,
+            "top_p": self.config.top_p,
+        }
 
     def _summarize_chunk(self, text: str) -> str:
         """Summarize a single chunk of text.
@@ -219,30 +354,12 @@ class SummarizationPipeline:
             Summarized text
         """
         try:
-            result = self.pipeline(
-                text[:1024],  # Simple truncation of input text
-                max_length=self.config.max_length,
-                min_length=self.config.min_length,
-                do_sample=True,  # Enable sampling for temperature and top_p to work
-                temperature=self.config.temperature,
-                top_p=self.config.top_p,
-            )
+            with _inference_mode():
+                result = self.pipeline(
+                    text[:1024],  # Simple truncation of input text
+                    **self._generation_kwargs(),
+                )
             return result[0]["summary_text"].strip()
         except Exception as e:
             logger.error(f"Error in summarization: {str(e)}")
             raise SummarizationError(f"Failed to summarize chunk: {str(e)}")
-
-    def _combine_summaries(self, summaries: List[str]) -> str:
-        """Combine multiple summaries into one.
-
-        Args:
-            summaries: List of summaries to combine
-
-        Returns:
-            Combined summary
-        """
-        if len(summaries) == 1:
-            return summaries[0]
-
-        combined_text = " ".join(summaries)
-        return self._summarize_chunk(combined_text)
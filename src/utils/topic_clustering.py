@@ -1,27 +1,31 @@
 """Topic clustering utilities for document organization.
 
-This module provides document clustering capabilities using embeddings and K-means
-clustering with automatic cluster size optimization. It includes:
+This module provides document clustering capabilities using embeddings and
+mini-batch K-means with automatic cluster count selection. It includes:
 
 1. Document Clustering:
-   - K-means clustering
-   - Optimal cluster detection
-   - Embedding-based similarity
+   - Mini-batch K-means on a float32 embedding matrix
+   - Cluster count selected by silhouette score on a sample
+   - Warm-started fits for consecutive cluster counts
    - Cluster size management
 
 2. Cluster Analysis:
-   - Keyword extraction
+   - Keyword extraction, once per cluster
    - Cluster labeling
    - Similarity scoring
    - Centroid calculation
 
-3. Performance Optimization:
-   - Redis-based caching
+3. Incremental Assignment:
+   - New documents assigned to the nearest existing centroid
+   - Optional online centroid updates without refitting
+
+4. Performance Optimization:
+   - Redis-based caching keyed by a digest of the embeddings
    - Batch processing
    - Resource cleanup
    - Error handling
 
-4. Cluster Search:
+5. Cluster Search:
    - Similar topic finding
    - Vector similarity
    - Cluster ranking
@@ -42,6 +46,9 @@ Usage:
     )
     clustered_docs = clusterer.cluster_documents(documents, config)
 
+    # Assign new documents to the existing clusters
+    new_docs = clusterer.assign_documents(new_documents)
+
     # Find similar topics
     similar = clusterer.find_similar_topics(
         query_vector,
@@ -51,85 +58,326 @@ Usage:
     ```
 
 Note:
-    - Uses cosine similarity for matching
+    - Embeddings are L2-normalized, so clusters follow cosine similarity
     - Caches results for performance
     - Handles document embeddings
     - Auto-scales cluster sizes
 """
 
+import hashlib
 import logging
-from typing import Dict, List, Optional
+from dataclasses import asdict
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.metrics import silhouette_score
 from sklearn.metrics.pairwise import cosine_similarity
 
 from src.models.settings import ClusteringConfig
-from src.utils.cache_manager import CacheManager, cached_with_retry
+from src.utils.cache_manager import CacheManager
 from src.utils.text_processing import clean_text
 
 logger = logging.getLogger(__name__)
 
 
+def top_keywords(texts: Sequence[str], similarities: np.ndarray, top_k: int = 5) -> List[str]:
+    """Extract keywords from the texts most similar to a centroid.
+
+    Args:
+        texts: Texts of the cluster members
+        similarities: Similarity of each text's embedding to the centroid
+        top_k: Number of texts to draw from and keywords to return
+
+    Returns:
+        List[str]: Up to ``top_k`` distinct words, most central texts first
+    """
+    if not len(texts):
+        return []
+    keywords: Dict[str, None] = {}
+    for idx in np.argsort(similarities)[-top_k:][::-1]:
+        keywords.update(dict.fromkeys(clean_text(texts[idx]).split()))
+    return list(keywords)[:top_k]
+
+
+class ClusteringEngine:
+    """Mini-batch K-means clustering of an embedding matrix.
+
+    Embeddings are converted once to an L2-normalized float32 matrix. The
+    number of clusters is chosen by silhouette score on a random sample, with
+    the fit for each cluster count initialized from the previous one, and the
+    final model is fitted on the full matrix. Once fitted, new embeddings can
+    be assigned to the existing centroids without refitting.
+
+    Attributes:
+        config (ClusteringConfig): Clustering configuration
+        sample_size (int): Maximum number of rows used to select the cluster count
+        batch_size (int): Mini-batch size of K-means
+        centroids (Optional[np.ndarray]): Cluster centroids after fitting
+        sizes (Optional[np.ndarray]): Number of documents in each cluster
+        keywords (List[List[str]]): Keywords of each cluster
+    """
+
+    def __init__(
+        self,
+        config: Optional[ClusteringConfig] = None,
+        sample_size: int = 2000,
+        batch_size: int = 1024,
+    ):
+        """Initialize the engine.
+
+        Args:
+            config: Optional clustering configuration
+            sample_size: Maximum number of rows used to select the cluster count
+            batch_size: Mini-batch size of K-means
+        """
+        self.config = config or ClusteringConfig()
+        self.sample_size = sample_size
+        self.batch_size = batch_size
+        self.centroids: Optional[np.ndarray] = None
+        self.sizes: Optional[np.ndarray] = None
+        self.keywords: List[List[str]] = []
+
+    @staticmethod
+    def to_matrix(embeddings) -> np.ndarray:
+        """Convert embeddings to an L2-normalized float32 matrix.
+
+        Args:
+            embeddings: Sequence of embedding vectors or a 2D array
+
+        Returns:
+            np.ndarray: Matrix with one unit-length row per embedding
+        """
+        matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _kmeans(self, n_clusters: int, init, n_init: int) -> MiniBatchKMeans:
+        return MiniBatchKMeans(
+            n_clusters=n_clusters,
+            init=init,
+            n_init=n_init,
+            batch_size=self.batch_size,
+            random_state=self.config.random_state,
+        )
+
+    def select_k(self, matrix: np.ndarray) -> int:
+        """Select the number of clusters for a matrix.
+
+        Args:
+            matrix: Normalized embedding matrix
+
+        Returns:
+            int: Number of clusters, between 1 and the configured maximum
+        """
+        config = self.config
+        if len(matrix) < config.min_cluster_size:
+            return 1
+        max_clusters = min(config.max_clusters, len(matrix) // config.min_cluster_size)
+
+        rng = np.random.RandomState(config.random_state)
+        sample = matrix
+        if len(matrix) > self.sample_size:
+            sample = matrix[rng.choice(len(matrix), self.sample_size, replace=False)]
+        # Silhouette needs fewer clusters than samples
+        max_clusters = min(max_clusters, len(sample) - 1)
+        if max_clusters <= 1:
+            return 1
+
+        best_k, best_score = 1, -1.0
+        centers = None
+        for k in range(2, max_clusters + 1):
+            if centers is None:
+                kmeans = self._kmeans(k, "k-means++", n_init=3)
+            else:
+                # Warm start: keep the previous centers and add the worst-served point
+                # (squared distances up to the constant |x|^2 of unit rows)
+                distances = (centers**2).sum(axis=1) - 2 * sample @ centers.T
+                init = np.vstack([centers, sample[np.argmax(distances.min(axis=1))]])
+                kmeans = self._kmeans(k, init, n_init=1)
+            labels = kmeans.fit_predict(sample)
+            centers = kmeans.cluster_centers_.astype(np.float32)
+            if len(np.unique(labels)) < 2:
+                continue
+            score = float(silhouette_score(sample, labels))
+            if score > best_score:
+                best_k, best_score = k, score
+        return best_k
+
+    def fit(self, matrix: np.ndarray, texts: Sequence[str], top_k: int = 5) -> np.ndarray:
+        """Cluster a matrix and compute the keywords of every cluster.
+
+        Args:
+            matrix: Normalized embedding matrix
+            texts: Text of each row, used for keywords
+            top_k: Number of keywords per cluster
+
+        Returns:
+            np.ndarray: Cluster label of each row
+        """
+        n_clusters = self.select_k(matrix)
+        if n_clusters == 1:
+            labels = np.zeros(len(matrix), dtype=np.int64)
+            self.centroids = matrix.mean(axis=0, keepdims=True)
+        else:
+            kmeans = self._kmeans(n_clusters, "k-means++", n_init=3)
+            labels = kmeans.fit_predict(matrix).astype(np.int64)
+            self.centroids = kmeans.cluster_centers_.astype(np.float32)
+        self.sizes = np.bincount(labels, minlength=n_clusters)
+
+        similarities = self.similarities(matrix, labels)
+        self.keywords = []
+        for cluster_id in range(n_clusters):
+            members = np.flatnonzero(labels == cluster_id)
+            self.keywords.append(
+                top_keywords([texts[i] for i in members], similarities[members], top_k)
+            )
+        return labels
+
+    def similarities(self, matrix: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each row to the centroid of its cluster.
+
+        Args:
+            matrix: Normalized embedding matrix
+            labels: Cluster label of each row
+
+        Returns:
+            np.ndarray: Similarity of each row
+        """
+        centroids = self.centroids[labels]
+        norms = np.linalg.norm(centroids, axis=1)
+        norms[norms == 0] = 1.0
+        return np.einsum("ij,ij->i", matrix, centroids) / norms
+
+    def assign(self, matrix: np.ndarray, update: bool = False) -> np.ndarray:
+        """Assign rows to the nearest existing centroid.
+
+        Args:
+            matrix: Normalized embedding matrix
+            update: Whether to move centroids towards their new members and
+                count them in the cluster sizes
+
+        Returns:
+            np.ndarray: Cluster label of each row
+
+        Raises:
+            ValueError: If the engine has not been fitted
+        """
+        if self.centroids is None:
+            raise ValueError("Clustering engine has not been fitted")
+        # Nearest centroid by Euclidean distance, without materializing distances
+        scores = matrix @ self.centroids.T - 0.5 * (self.centroids**2).sum(axis=1)
+        labels = np.argmax(scores, axis=1)
+        if update:
+            counts = np.bincount(labels, minlength=len(self.centroids))
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, labels, matrix)
+            totals = self.sizes + counts
+            changed = counts > 0
+            self.centroids[changed] += (
+                sums[changed] - counts[changed, None] * self.centroids[changed]
+            ) / totals[changed, None]
+            self.sizes = totals
+        return labels
+
+    def describe(self, labels: np.ndarray, similarities: np.ndarray) -> List[Dict]:
+        """Build the clustering metadata of each row.
+
+        Args:
+            labels: Cluster label of each row
+            similarities: Similarity of each row to its centroid
+
+        Returns:
+            List[Dict]: Cluster ID, size, keywords and similarity of each row
+        """
+        return [
+            {
+                "cluster_id": int(label),
+                "cluster_size": int(self.sizes[label]),
+                "keywords": list(self.keywords[label]),
+                "similarity_to_centroid": float(similarity),
+            }
+            for label, similarity in zip(labels, similarities)
+        ]
+
+    def to_dict(self) -> Dict:
+        """Serialize the fitted state."""
+        return {
+            "centroids": self.centroids.tolist(),
+            "sizes": self.sizes.tolist(),
+            "keywords": self.keywords,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict, config: Optional[ClusteringConfig] = None) -> "ClusteringEngine":
+        """Restore an engine serialized with ``to_dict``."""
+        engine = cls(config)
+        engine.centroids = np.array(data["centroids"], dtype=np.float32)
+        engine.sizes = np.array(data["sizes"], dtype=np.int64)
+        engine.keywords = [list(words) for words in data["keywords"]]
+        return engine
+
+
 class TopicClusterer:
     def __init__(
         self,
         cache_host: str = "localhost",
         cache_port: int = 6379,
         cache_ttl: int = 86400,  # 24 hours
+        sample_size: int = 2000,
     ):
         self.cache_manager = CacheManager(
             host=cache_host, port=cache_port, prefix="cluster", default_ttl=cache_ttl
         )
+        self.sample_size = sample_size
+        self.engine: Optional[ClusteringEngine] = None
         self.logger = logging.getLogger(__name__)
 
     def _get_optimal_clusters(self, embeddings: List[List[float]], config: ClusteringConfig) -> int:
-        """Determine optimal number of clusters using elbow method."""
-        if len(embeddings) < config.min_cluster_size:
-            return 1
-
-        max_clusters = min(config.max_clusters, len(embeddings) // config.min_cluster_size)
-        if max_clusters <= 1:
-            return 1
-
-        inertias = []
-        for k in range(1, max_clusters + 1):
-            kmeans = KMeans(
-                n_clusters=k,
-                random_state=config.random_state,
-                n_init=10,  # Explicitly set n_init to avoid FutureWarning
-            )
-            kmeans.fit(embeddings)
-            inertias.append(kmeans.inertia_)
-
-        # Find elbow point
-        diffs = np.diff(inertias)
-        elbow = np.argmin(diffs) + 1
-        return min(elbow, max_clusters)
+        """Determine optimal number of clusters by silhouette score on a sample."""
+        engine = ClusteringEngine(config, sample_size=self.sample_size)
+        return engine.select_k(ClusteringEngine.to_matrix(embeddings))
 
     def _get_cluster_keywords(
         self, embeddings: List[List[float]], texts: List[str], centroid: List[float], top_k: int = 5
     ) -> List[str]:
         """Extract keywords based on similarity to centroid."""
-        # Calculate similarities to centroid
+        if not len(embeddings):
+            return []
         similarities = cosine_similarity(embeddings, [centroid]).flatten()
+        return top_keywords(texts, similarities, top_k)
+
+    def _cache_key(self, matrix: np.ndarray, texts: List[str], config: ClusteringConfig) -> str:
+        """Build a cache key from a digest of the clustering inputs."""
+        digest = hashlib.sha256(matrix.tobytes())
+        digest.update(repr(matrix.shape).encode())
+        for text in texts:
+            digest.update(hashlib.sha256(text.encode("utf-8")).digest())
+        digest.update(repr(sorted(asdict(config).items())).encode())
+        return f"clustering:{digest.hexdigest()}"
+
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        try:
+            return self.cache_manager.get(key)
+        except Exception as e:
+            self.logger.warning(f"Error reading clustering cache: {str(e)}")
+            return None
 
-        # Get indices of top similar texts
-        top_indices = similarities.argsort()[-top_k:][::-1]
-
-        # Extract words from top texts
-        keywords = set()
-        for idx in top_indices:
-            words = clean_text(texts[idx]).split()
-            keywords.update(words)
-
-        return list(keywords)[:top_k]
+    def _cache_set(self, key: str, value: Dict) -> None:
+        try:
+            self.cache_manager.set(key, value)
+        except Exception as e:
+            self.logger.warning(f"Error writing clustering cache: {str(e)}")
 
-    @cached_with_retry(cache_manager=CacheManager(), key_prefix="clustering", max_attempts=3)
     def cluster_documents(
         self, documents: List[Dict], config: Optional[ClusteringConfig] = None
     ) -> List[Dict]:
-        """Cluster documents based on their embeddings."""
+        """Cluster documents based on their embeddings.
+
+        The fitted engine is kept, so later documents can be added with
+        ``assign_documents`` without reclustering.
+        """
         if not documents:
             return []
 
@@ -137,49 +385,71 @@ class TopicClusterer:
             config = ClusteringConfig()
 
         try:
-            # Extract embeddings and texts
-            embeddings = [
-                doc["embeddings"]["body"] for doc in documents if doc["embeddings"].get("body")
-            ]
-            if not embeddings:
+            embedded = [doc for doc in documents if doc["embeddings"].get("body")]
+            if not embedded:
                 self.logger.warning("No embeddings found in documents")
                 return documents
 
-            # Determine optimal number of clusters
-            n_clusters = self._get_optimal_clusters(embeddings, config)
-
-            # Perform clustering
-            kmeans = KMeans(n_clusters=n_clusters, random_state=config.random_state)
-            cluster_labels = kmeans.fit_predict(embeddings)
-
-            # Update documents with cluster information
-            for i, doc in enumerate(documents):
-                if doc["embeddings"].get("body"):
-                    cluster_id = int(cluster_labels[i])
-                    centroid = kmeans.cluster_centers_[cluster_id]
-
-                    # Get cluster keywords
-                    cluster_docs = [
-                        d for j, d in enumerate(documents) if cluster_labels[j] == cluster_id
-                    ]
-                    cluster_texts = [d["content"]["body"] for d in cluster_docs]
-                    keywords = self._get_cluster_keywords(embeddings, cluster_texts, centroid)
-
-                    doc["metadata"]["clustering"] = {
-                        "cluster_id": cluster_id,
-                        "cluster_size": int((cluster_labels == cluster_id).sum()),
-                        "keywords": keywords,
-                        "similarity_to_centroid": float(
-                            cosine_similarity([doc["embeddings"]["body"]], [centroid])[0][0]
-                        ),
-                    }
-
+            matrix = ClusteringEngine.to_matrix([doc["embeddings"]["body"] for doc in embedded])
+            texts = [doc["content"]["body"] for doc in embedded]
+
+            cache_key = self._cache_key(matrix, texts, config)
+            cached = self._cache_get(cache_key)
+            if isinstance(cached, dict) and len(cached.get("labels", ())) == len(embedded):
+                engine = ClusteringEngine.from_dict(cached["engine"], config)
+                labels = np.array(cached["labels"], dtype=np.int64)
+            else:
+                engine = ClusteringEngine(config, sample_size=self.sample_size)
+                labels = engine.fit(matrix, texts)
+                self._cache_set(cache_key, {"engine": engine.to_dict(), "labels": labels.tolist()})
+            self.engine = engine
+
+            assignments = engine.describe(labels, engine.similarities(matrix, labels))
+            for doc, clustering in zip(embedded, assignments):
+                doc["metadata"]["clustering"] = clustering
+
+            self.logger.info(
+                f"Clustered {len(embedded)} documents into {len(engine.centroids)} clusters"
+            )
             return documents
 
         except Exception as e:
             self.logger.error(f"Error clustering documents: {str(e)}")
             return documents
 
+    def assign_documents(self, documents: List[Dict], update: bool = True) -> List[Dict]:
+        """Assign documents to the clusters of the last ``cluster_documents`` call.
+
+        Falls back to clustering the documents if no clusters exist yet.
+
+        Args:
+            documents: Documents to assign
+            update: Whether to move centroids towards the new documents
+
+        Returns:
+            List[Dict]: Documents with cluster assignments
+        """
+        if self.engine is None:
+            return self.cluster_documents(documents)
+        if not documents:
+            return []
+
+        try:
+            embedded = [doc for doc in documents if doc["embeddings"].get("body")]
+            if not embedded:
+                return documents
+
+            matrix = ClusteringEngine.to_matrix([doc["embeddings"]["body"] for doc in embedded])
+            labels = self.engine.assign(matrix, update=update)
+            assignments = self.engine.describe(labels, self.engine.similarities(matrix, labels))
+            for doc, clustering in zip(embedded, assignments):
+                doc["metadata"]["clustering"] = clustering
+            return documents
+
+        except Exception as e:
+            self.logger.error(f"Error assigning documents to clusters: {str(e)}")
+            return documents
+
     def find_similar_topics(
         self, query_vector: List[float], documents: List[Dict], top_k: int = 5
     ) -> List[Dict]:
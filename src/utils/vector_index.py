@@ -1,38 +1,220 @@
 """Vector index for efficient similarity search.
 
-This module provides functionality for creating and managing vector indices
-for efficient similarity search over document embeddings.
+This module provides a local approximate nearest neighbor (ANN) engine over
+document embeddings, built on FAISS. It serves offline search and candidate
+generation for clustering and cross-referencing.
+
+Features:
+1. Index Types:
+   - ``flat``: exact brute-force search, for small collections
+   - ``ivf``: inverted file with ``nlist`` clusters; vectors are searched exactly
+     until ``train_size`` of them are buffered, then the clusters are trained
+   - ``hnsw``: graph-based search, no training, best recall per query cost
+
+2. Metrics:
+   - ``l2``: squared Euclidean distance, lower is closer
+   - ``cosine``: inner product of L2-normalized vectors, higher is closer
+
+3. IDs and Persistence:
+   - Stable string IDs mapped to int64 labels (IndexIDMap2 semantics)
+   - Adding an existing ID replaces its vector; IDs can be removed
+   - ``save``/``load`` to a directory, optionally memory-mapped for fast startup
 
 Classes:
     VectorIndex: Main class for managing vector indices.
 
 Example:
     ```python
-    index = VectorIndex(dimension=768)
+    index = VectorIndex(dimension=768, index_type="hnsw", metric="cosine")
     index.add_vectors(embeddings, ids)
-    results = index.search(query_embedding, k=5)
+    scores, result_ids = index.search(query_embeddings, k=5)
+    index.remove(["doc-1"])
+    index.save("/data/ann")
+
+    index = VectorIndex.load("/data/ann", mmap=True)
     ```
+
+Note:
+    - Removal from HNSW graphs is not supported by FAISS; removed HNSW vectors
+      are masked at query time and dropped when the index is compacted
+    - Memory-mapped indices are read-only
 """
 
-from typing import List, Optional, Tuple, Union
+import json
+import logging
+import math
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 
+import faiss
 import numpy as np
-from faiss import IndexFlatL2
+
+logger = logging.getLogger(__name__)
+
+INDEX_TYPES = ("flat", "ivf", "hnsw")
+METRICS = ("l2", "cosine")
+
+INDEX_FILE = "index.faiss"
+IDS_FILE = "ids.json"
+
+# FAISS warns below 39 training points per IVF cluster
+MIN_POINTS_PER_CLUSTER = 39
+
+# Removed HNSW vectors are compacted away once they exceed this share of the index
+COMPACT_RATIO = 0.2
 
 
 class VectorIndex:
-    """Manages vector indices for efficient similarity search."""
+    """Manages vector indices for efficient similarity search.
 
-    def __init__(self, dimension: int = 768):
+    Attributes:
+        dimension (int): Dimensionality of the indexed vectors.
+        index_type (str): One of "flat", "ivf" or "hnsw".
+        metric (str): "l2" or "cosine".
+        nlist (Optional[int]): Number of IVF clusters, chosen at training if None.
+        nprobe (int): Number of IVF clusters visited per query.
+        train_size (int): Number of buffered vectors that triggers IVF training.
+        hnsw_m (int): Number of HNSW graph neighbors per vector.
+        ef_construction (int): HNSW candidate list size while adding.
+        ef_search (int): HNSW candidate list size while searching.
+        index (faiss.Index): Underlying FAISS index keyed by int64 labels; an
+            IndexIDMap2 for flat and HNSW indices and untrained IVF indices, an
+            IndexIVFFlat for trained IVF indices.
+        trained (bool): Whether the index is searched with its final structure;
+            False while an IVF index buffers vectors for training.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 768,
+        index_type: str = "flat",
+        metric: str = "l2",
+        nlist: Optional[int] = None,
+        nprobe: int = 8,
+        train_size: Optional[int] = None,
+        hnsw_m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+    ):
         """Initialize the vector index.
 
         Args:
             dimension: Dimensionality of the vectors to index.
                 Defaults to 768 (BERT base model dimension).
+            index_type: "flat", "ivf" or "hnsw" (default: "flat").
+            metric: "l2" or "cosine" (default: "l2").
+            nlist: Number of IVF clusters; defaults to about 4 * sqrt(n) of the
+                training sample.
+            nprobe: Number of IVF clusters visited per query (default: 8).
+            train_size: Number of vectors an IVF index buffers in an exact index
+                before training on them; defaults to 39 per cluster.
+            hnsw_m: Number of HNSW graph neighbors per vector (default: 32).
+            ef_construction: HNSW candidate list size while adding (default: 200).
+            ef_search: HNSW candidate list size while searching (default: 64).
+
+        Raises:
+            ValueError: If the index type or metric is unknown
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {INDEX_TYPES}, got {index_type!r}")
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}, got {metric!r}")
         self.dimension = dimension
-        self.index = IndexFlatL2(dimension)
-        self.id_map = {}
+        self.index_type = index_type
+        self.metric = metric
+        self.nlist = nlist
+        self.nprobe = nprobe
+        if train_size is None:
+            # 4 * sqrt(n) default clusters get 39 points each from n = (4 * 39) ** 2
+            train_size = (
+                nlist * MIN_POINTS_PER_CLUSTER if nlist else (4 * MIN_POINTS_PER_CLUSTER) ** 2
+            )
+        self.train_size = train_size
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+
+        self.id_map: Dict[int, str] = {}
+        self._labels: Dict[str, int] = {}
+        self._removed: Set[int] = set()
+        self._next_label = 0
+        self._read_only = False
+        self._lock = threading.RLock()
+        self.trained = index_type != "ivf"
+        if self.trained:
+            self.index: faiss.Index = faiss.IndexIDMap2(self._create_base())
+        else:
+            # Search buffered vectors exactly until there are enough to train on
+            self.index = faiss.IndexIDMap2(faiss.IndexFlat(dimension, self._faiss_metric))
+
+    @property
+    def _faiss_metric(self) -> int:
+        return faiss.METRIC_INNER_PRODUCT if self.metric == "cosine" else faiss.METRIC_L2
+
+    def _create_base(self, nlist: Optional[int] = None) -> faiss.Index:
+        """Create the FAISS index wrapped by the ID map."""
+        if self.index_type == "hnsw":
+            base = faiss.IndexHNSWFlat(self.dimension, self.hnsw_m, self._faiss_metric)
+            base.hnsw.efConstruction = self.ef_construction
+            base.hnsw.efSearch = self.ef_search
+            return base
+        if self.index_type == "ivf":
+            quantizer = faiss.IndexFlat(self.dimension, self._faiss_metric)
+            return faiss.IndexIVFFlat(quantizer, self.dimension, nlist, self._faiss_metric)
+        return faiss.IndexFlat(self.dimension, self._faiss_metric)
+
+    def _prepare(self, vectors: Union[List[List[float]], np.ndarray]) -> np.ndarray:
+        """Convert vectors to a contiguous float32 matrix, normalized for cosine."""
+        matrix = np.array(vectors, dtype=np.float32, copy=True)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Expected vectors of dimension {self.dimension}, got shape {matrix.shape}"
+            )
+        matrix = np.ascontiguousarray(matrix)
+        if self.metric == "cosine":
+            faiss.normalize_L2(matrix)
+        return matrix
+
+    def train(self, vectors: Optional[Union[List[List[float]], np.ndarray]] = None) -> None:
+        """Train an IVF index and move the buffered vectors into it.
+
+        Not needed for flat and HNSW indices. IVF indices are otherwise trained on
+        their buffered vectors once ``train_size`` of them were added.
+
+        Args:
+            vectors: Representative training sample of shape (n, dimension);
+                defaults to the buffered vectors.
+
+        Raises:
+            ValueError: If the sample is smaller than the number of clusters
+            RuntimeError: If the index was loaded memory-mapped
+        """
+        with self._lock:
+            if self.trained:
+                return
+            self._check_writable()
+            labels = faiss.vector_to_array(self.index.id_map)
+            buffered = self.index.index.reconstruct_n(0, self.index.ntotal)
+            matrix = buffered if vectors is None else self._prepare(vectors)
+            nlist = self.nlist or max(
+                1,
+                min(int(4 * math.sqrt(len(matrix))), len(matrix) // MIN_POINTS_PER_CLUSTER),
+            )
+            if len(matrix) < nlist:
+                raise ValueError(f"Need at least {nlist} training vectors, got {len(matrix)}")
+            base = self._create_base(nlist)
+            base.train(matrix)
+            base.nprobe = self.nprobe
+            # IVF indices map IDs themselves; the hash table supports removal and lookup
+            base.set_direct_map_type(faiss.DirectMap.Hashtable)
+            base.add_with_ids(buffered, labels)
+            self.nlist = nlist
+            self.index = base
+            self.trained = True
+            logger.info(f"Trained IVF index with {nlist} clusters on {len(matrix)} vectors")
 
     def add_vectors(
         self,
@@ -43,31 +225,201 @@ class VectorIndex:
 
         Args:
             vectors: List of vectors or numpy array of shape (n, dimension).
-            ids: Optional list of string IDs for the vectors.
-                If None, sequential integers will be used.
+            ids: Optional list of string IDs for the vectors. Adding an ID
+                that is already indexed replaces its vector. If None,
+                sequential integers (as strings) will be used.
+
+        Raises:
+            ValueError: If the number of IDs does not match the number of vectors
+            RuntimeError: If the index was loaded memory-mapped
         """
-        if isinstance(vectors, list):
-            vectors = np.array(vectors, dtype=np.float32)
-        if ids is not None:
-            for i, id_ in enumerate(ids):
-                self.id_map[i] = id_
-        self.index.add(vectors)
+        matrix = self._prepare(vectors)
+        if ids is not None and len(ids) != len(matrix):
+            raise ValueError(f"Got {len(ids)} IDs for {len(matrix)} vectors")
+        with self._lock:
+            self._check_writable()
+            if ids is None:
+                ids = [str(self._next_label + i) for i in range(len(matrix))]
+            # Last occurrence wins within a batch, like repeated single adds
+            positions = {id_: position for position, id_ in enumerate(ids)}
+            if len(positions) < len(ids):
+                ids = list(positions)
+                matrix = matrix[list(positions.values())]
+            self._remove_labels([self._labels[id_] for id_ in ids if id_ in self._labels])
+
+            labels = np.arange(self._next_label, self._next_label + len(ids), dtype=np.int64)
+            self._next_label += len(ids)
+            self.index.add_with_ids(matrix, labels)
+            for label, id_ in zip(labels.tolist(), ids):
+                self.id_map[label] = id_
+                self._labels[id_] = label
+            if not self.trained and self.index.ntotal >= self.train_size:
+                self.train()
+
+    def remove(self, ids: Sequence[str]) -> int:
+        """Remove vectors by ID.
+
+        Args:
+            ids: IDs to remove; unknown IDs are ignored.
+
+        Returns:
+            int: Number of removed vectors.
+
+        Raises:
+            RuntimeError: If the index was loaded memory-mapped
+        """
+        with self._lock:
+            self._check_writable()
+            labels = [self._labels[id_] for id_ in dict.fromkeys(ids) if id_ in self._labels]
+            self._remove_labels(labels)
+            if self._removed and len(self._removed) > COMPACT_RATIO * self.index.ntotal:
+                self.compact()
+            return len(labels)
+
+    def _remove_labels(self, labels: List[int]) -> None:
+        if not labels:
+            return
+        for label in labels:
+            del self._labels[self.id_map.pop(label)]
+        if self.index_type == "hnsw":
+            self._removed.update(labels)
+        else:
+            self.index.remove_ids(np.array(labels, dtype=np.int64))
+
+    def compact(self) -> None:
+        """Rebuild an HNSW index without its removed vectors."""
+        with self._lock:
+            self._check_writable()
+            if not self._removed:
+                return
+            labels = np.array(sorted(self.id_map), dtype=np.int64)
+            vectors = np.empty((len(labels), self.dimension), dtype=np.float32)
+            for row, label in enumerate(labels.tolist()):
+                vectors[row] = self.index.reconstruct(label)
+            self.index = faiss.IndexIDMap2(self._create_base())
+            self.index.add_with_ids(vectors, labels)
+            logger.info(f"Compacted HNSW index, dropped {len(self._removed)} removed vectors")
+            self._removed = set()
 
     def search(
-        self, query: Union[List[float], np.ndarray], k: int = 5
+        self, query: Union[List[float], List[List[float]], np.ndarray], k: int = 5
     ) -> Tuple[np.ndarray, np.ndarray]:
-        """Search for nearest neighbors.
+        """Search for nearest neighbors of one or more queries.
 
         Args:
-            query: Query vector or numpy array of shape (dimension,).
+            query: Query vector of shape (dimension,), or a batch of queries of
+                shape (n, dimension).
             k: Number of nearest neighbors to return.
 
         Returns:
-            Tuple of (distances, indices) arrays.
+            Tuple of (scores, ids) arrays of shape (n, k), best match first.
+            Scores are squared L2 distances, or cosine similarities for the
+            cosine metric. Slots without a match have ID None.
+        """
+        matrix = self._prepare(query)
+        with self._lock:
+            if self.index.ntotal == 0:
+                empty = np.full((len(matrix), k), np.nan, dtype=np.float32)
+                return empty, np.full((len(matrix), k), None, dtype=object)
+            self._apply_search_params()
+            # Over-fetch so removed HNSW vectors can be dropped
+            fetch = min(k + len(self._removed), self.index.ntotal)
+            scores, labels = self.index.search(matrix, fetch)
+
+            out_scores = np.full((len(matrix), k), np.nan, dtype=np.float32)
+            out_ids = np.full((len(matrix), k), None, dtype=object)
+            for row in range(len(matrix)):
+                column = 0
+                for score, label in zip(scores[row].tolist(), labels[row].tolist()):
+                    if label < 0 or label in self._removed:
+                        continue
+                    out_scores[row, column] = score
+                    out_ids[row, column] = self.id_map[label]
+                    column += 1
+                    if column == k:
+                        break
+        return out_scores, out_ids
+
+    def _apply_search_params(self) -> None:
+        if self.index_type == "hnsw":
+            faiss.downcast_index(self.index.index).hnsw.efSearch = self.ef_search
+        elif self.index_type == "ivf" and self.trained:
+            self.index.nprobe = self.nprobe
+
+    def _check_writable(self) -> None:
+        if self._read_only:
+            raise RuntimeError("Index was loaded memory-mapped and is read-only")
+
+    def __len__(self) -> int:
+        """Number of indexed vectors."""
+        return len(self.id_map)
+
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self._labels
+
+    def save(self, path: str) -> None:
+        """Save the index and its ID mapping to a directory.
+
+        Args:
+            path: Directory to write to; created if missing.
+        """
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            faiss.write_index(self.index, os.path.join(path, INDEX_FILE))
+            labels = sorted(self.id_map)
+            state = {
+                "dimension": self.dimension,
+                "index_type": self.index_type,
+                "metric": self.metric,
+                "nlist": self.nlist,
+                "nprobe": self.nprobe,
+                "train_size": self.train_size,
+                "trained": self.trained,
+                "hnsw_m": self.hnsw_m,
+                "ef_construction": self.ef_construction,
+                "ef_search": self.ef_search,
+                "next_label": self._next_label,
+                "labels": labels,
+                "ids": [self.id_map[label] for label in labels],
+                "removed": sorted(self._removed),
+            }
+            with open(os.path.join(path, IDS_FILE), "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        logger.info(f"Saved {self.index_type} index of {len(labels)} vectors to {path}")
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = False) -> "VectorIndex":
+        """Load an index saved with ``save``.
+
+        Args:
+            path: Directory the index was saved to.
+            mmap: Whether to memory-map the index file instead of reading it
+                into memory. Startup is near-instant and pages are loaded on
+                demand, but the index is read-only (default: False).
+
+        Returns:
+            VectorIndex: The loaded index.
         """
-        if isinstance(query, list):
-            query = np.array(query, dtype=np.float32).reshape(1, -1)
-        distances, indices = self.index.search(query, k)
-        if self.id_map:
-            indices = np.array([[self.id_map.get(i, i) for i in row] for row in indices])
-        return distances, indices
+        with open(os.path.join(path, IDS_FILE), encoding="utf-8") as f:
+            state = json.load(f)
+        index = cls(
+            dimension=state["dimension"],
+            index_type=state["index_type"],
+            metric=state["metric"],
+            nlist=state["nlist"],
+            nprobe=state["nprobe"],
+            train_size=state.get("train_size"),
+            hnsw_m=state["hnsw_m"],
+            ef_construction=state["ef_construction"],
+            ef_search=state["ef_search"],
+        )
+        flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+        index.index = faiss.read_index(os.path.join(path, INDEX_FILE), flags)
+        index.id_map = dict(zip(state["labels"], state["ids"]))
+        index._labels = dict(zip(state["ids"], state["labels"]))
+        index._removed = set(state["removed"])
+        index._next_label = state["next_label"]
+        index.trained = state.get("trained", True)
+        index._read_only = mmap
+        logger.info(f"Loaded {index.index_type} index of {len(index)} vectors from {path}")
+        return index
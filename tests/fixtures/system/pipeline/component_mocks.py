@@ -35,6 +35,9 @@ def create_pii_detector_mock():
 
     mock.detect = MagicMock(side_effect=detect_with_logging)
     mock.analyze_document = MagicMock(side_effect=analyze_with_logging)
+    mock.analyze_documents = MagicMock(
+        side_effect=lambda docs, **kwargs: [mock.analyze_document(doc) for doc in docs]
+    )
     return mock
 
 
@@ -128,6 +131,7 @@ def create_embedding_generator_mock():
         return result
 
     mock.generate_embeddings = MagicMock(side_effect=process_docs_with_logging)
+    mock.generate_embeddings_batch = MagicMock(side_effect=process_docs_with_logging)
     return mock
 
 
@@ -0,0 +1,26 @@
+"""Common test fixtures for API service tests."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.api.services.document_retrieval_service import DocumentRetrievalService
+from src.api.services.statistics_service import StatisticsService
+
+
+@pytest.fixture
+def mock_repository():
+    """Create mock repository."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def document_retrieval_service(mock_repository):
+    """Create document retrieval service backed by the mock repository."""
+    return DocumentRetrievalService(repository=mock_repository)
+
+
+@pytest.fixture
+def statistics_service(mock_repository):
+    """Create statistics service backed by the mock repository."""
+    return StatisticsService(repository=mock_repository)
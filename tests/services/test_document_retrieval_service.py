@@ -26,6 +26,23 @@ async def test_list_documents(
     mock_repository.list_documents.assert_called_once_with(None, 10, 0)
 
 
+@pytest.mark.asyncio
+async def test_list_documents_page(
+    document_retrieval_service: DocumentRetrievalService,
+    mock_repository: AsyncMock,
+):
+    """Test listing documents with a cursor."""
+    mock_repository.list_documents_page.return_value = ([{"id": "2", "title": "doc2"}], "next")
+
+    documents, next_cursor = await document_retrieval_service.list_documents_page(
+        file_type="pdf", limit=1, cursor="prev"
+    )
+
+    assert documents == [{"id": "2", "title": "doc2"}]
+    assert next_cursor == "next"
+    mock_repository.list_documents_page.assert_called_once_with("pdf", 1, "prev")
+
+
 @pytest.mark.asyncio
 async def test_get_document_success(
     document_retrieval_service: DocumentRetrievalService,
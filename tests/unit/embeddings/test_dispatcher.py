@@ -0,0 +1,101 @@
+"""Tests for the concurrent, rate-limit-aware embedding dispatcher."""
+
+import threading
+import time
+import pytest
+from src.embeddings.dispatcher import EmbeddingDispatcher, TokenBucket, is_rate_limit_error
+
+
+class RateLimited(Exception):
+    """Stand-in for a provider 429 error."""
+
+    status_code = 429
+
+
+def test_token_bucket_blocks_when_empty():
+    """Test that acquiring beyond the bucket content waits for refill."""
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)
+    assert bucket.acquire(1) == 0.0
+    started = time.monotonic()
+    bucket.acquire(1)
+    assert time.monotonic() - started >= 0.05
+
+
+def test_token_bucket_admits_oversized_requests():
+    """Test that a request larger than the capacity is still admitted."""
+    bucket = TokenBucket(rate_per_minute=60000, capacity=10)
+    assert bucket.acquire(1000) == 0.0
+
+
+def test_is_rate_limit_error_follows_cause_chain():
+    """Test detection of wrapped 429 errors."""
+    try:
+        try:
+            raise RateLimited()
+        except RateLimited as e:
+            raise Exception("wrapped") from e
+    except Exception as wrapped:
+        assert is_rate_limit_error(wrapped)
+    assert not is_rate_limit_error(ValueError("other"))
+
+
+def test_map_keeps_input_order_and_concurrency_limit():
+    """Test that results come back in input order with bounded concurrency."""
+    dispatcher = EmbeddingDispatcher(max_concurrency=3)
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def work(item):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.01 * (5 - item % 5))
+        with lock:
+            state["active"] -= 1
+        return item * 2
+
+    assert dispatcher.map(work, list(range(10))) == [i * 2 for i in range(10)]
+    assert 1 < state["peak"] <= 3
+    dispatcher.close()
+
+
+def test_call_backs_off_on_rate_limit():
+    """Test that rate-limited calls are retried after a backoff."""
+    dispatcher = EmbeddingDispatcher(max_concurrency=1, initial_backoff=0.01, max_backoff=0.05)
+    attempts = []
+
+    def flaky():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise RateLimited()
+        return "ok"
+
+    assert dispatcher.call(flaky) == "ok"
+    assert len(attempts) == 3
+
+
+def test_call_does_not_retry_other_errors():
+    """Test that non rate-limit errors propagate immediately."""
+    dispatcher = EmbeddingDispatcher(max_concurrency=1)
+    attempts = []
+
+    def broken():
+        attempts.append(1)
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError):
+        dispatcher.call(broken)
+    assert len(attempts) == 1
+
+
+def test_call_gives_up_after_max_retries():
+    """Test that persistent rate limiting eventually raises."""
+    dispatcher = EmbeddingDispatcher(
+        max_concurrency=1, max_retries=2, initial_backoff=0.001, max_backoff=0.002
+    )
+
+    def always_limited():
+        raise RateLimited()
+
+    with pytest.raises(RateLimited):
+        dispatcher.call(always_limited)
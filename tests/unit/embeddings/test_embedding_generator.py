@@ -1,12 +1,18 @@
 """Tests for the EmbeddingGenerator class."""
-import logging
+
 import numpy as np
 import pytest
 from openai.types.create_embedding_response import CreateEmbeddingResponse
 from openai.types.embedding import Embedding
+from redis.exceptions import RedisError
+from src.embeddings.embedding_cache import EmbeddingCache
 from src.embeddings.embedding_generator import EmbeddingGenerator
+from src.utils import cache_manager
+from src.utils.cache_codecs import FLOAT32_LIST, MAGIC
+from src.utils.cache_manager import CacheManager
 from src.utils.text_processing import ChunkingConfig
 
+
 @pytest.fixture
 def mock_openai():
     """Create a mock OpenAI client."""
@@ -33,51 +39,74 @@ def mock_openai():
             def create(self, model, input, dimensions=None, encoding_format=None):
                 self.call_count += 1
                 if self.parent.error_mode:
-                    raise Exception('API Error')
+                    raise Exception("API Error")
                 if self.parent.side_effect:
                     if isinstance(self.parent.side_effect, list):
                         response = self.parent.side_effect.pop(0)
                         return response
                     return self.parent.side_effect
                 if isinstance(input, str):
-                    return CreateEmbeddingResponse(data=[Embedding(embedding=[0.1, 0.2, 0.3], index=0, object='embedding')], model=model, object='list', usage={'prompt_tokens': 4, 'total_tokens': 4})
+                    return CreateEmbeddingResponse(
+                        data=[Embedding(embedding=[0.1, 0.2, 0.3], index=0, object="embedding")],
+                        model=model,
+                        object="list",
+                        usage={"prompt_tokens": 4, "total_tokens": 4},
+                    )
                 else:
-                    raise ValueError('Invalid input type')
+                    raise ValueError("Invalid input type")
+
     return MockOpenAI()
 
+
 @pytest.fixture
 def sample_document():
     """Create a sample document for testing."""
-    return {'content': {'body': 'This is a test document.', 'summary': 'Test summary'}, 'embeddings': {'body': None, 'summary': None, 'version': None, 'model': None}, 'metadata': {'title': 'Test Document'}}
+    return {
+        "content": {"body": "This is a test document.", "summary": "Test summary"},
+        "embeddings": {"body": None, "summary": None, "version": None, "model": None},
+        "metadata": {"title": "Test Document"},
+    }
+
 
 @pytest.fixture
 def embedding_generator(mock_openai):
     """Create an EmbeddingGenerator instance with mocks."""
-    return EmbeddingGenerator(model='text-embedding-3-small', chunk_size=256, chunk_overlap=50, dimensions=3, client=mock_openai)
+    return EmbeddingGenerator(
+        model="text-embedding-3-small",
+        chunk_size=256,
+        chunk_overlap=50,
+        dimensions=3,
+        client=mock_openai,
+    )
+
 
 def test_embedding_generator_initialization(mock_openai):
     """Test EmbeddingGenerator initialization with default values."""
     generator = EmbeddingGenerator(client=mock_openai)
-    assert generator.model == 'text-embedding-3-small'
+    assert generator.model == "text-embedding-3-small"
     assert isinstance(generator.chunking_config, ChunkingConfig)
     assert generator.chunking_config.chunk_size == 512
     assert generator.chunking_config.chunk_overlap == 50
     assert generator.dimensions is None
     assert generator.client == mock_openai
 
+
 def test_embedding_generator_custom_config(mock_openai):
     """Test EmbeddingGenerator initialization with custom values."""
-    generator = EmbeddingGenerator(model='custom-model', chunk_size=128, chunk_overlap=25, dimensions=128, client=mock_openai)
-    assert generator.model == 'custom-model'
+    generator = EmbeddingGenerator(
+        model="custom-model", chunk_size=128, chunk_overlap=25, dimensions=128, client=mock_openai
+    )
+    assert generator.model == "custom-model"
     assert generator.chunking_config.chunk_size == 128
     assert generator.chunking_config.chunk_overlap == 25
     assert generator.dimensions == 128
     assert generator.client == mock_openai
     assert generator.chunking_config.max_chunk_size == 128 * 4
 
+
 def test_get_embedding(embedding_generator, mock_openai):
     """Test generating embedding for single text."""
-    text = 'Test text'
+    text = "Test text"
     embedding = embedding_generator._get_embedding(text)
     assert isinstance(embedding, list)
     assert len(embedding) == 3
@@ -85,6 +114,7 @@ def test_get_embedding(embedding_generator, mock_openai):
     expected = [0.267261, 0.534522, 0.801784]
     np.testing.assert_array_almost_equal(embedding, expected, decimal=5)
 
+
 def test_get_embedding_normalization(embedding_generator):
     """Test L2 normalization of embeddings."""
     vec = [1.0, 2.0, 2.0]
@@ -95,40 +125,52 @@ def test_get_embedding_normalization(embedding_generator):
     matrix = [[1.0, 2.0, 2.0], [3.0, 4.0, 4.0]]
     normalized = embedding_generator._normalize_l2(matrix)
     assert all((np.allclose(np.linalg.norm(row), 1.0) for row in normalized))
-    expected = np.array([[0.33333333, 0.66666667, 0.66666667], [0.46852129, 0.62469505, 0.62469505]])
+    expected = np.array(
+        [[0.33333333, 0.66666667, 0.66666667], [0.46852129, 0.62469505, 0.62469505]]
+    )
     assert np.allclose(normalized, expected, rtol=0.001)
 
+
 def test_get_embedding_error_handling(embedding_generator, mock_openai):
     """Test error handling in embedding generation."""
     mock_openai.raise_error()
-    with pytest.raises(Exception, match='Error generating embedding: API Error'):
-        embedding_generator._get_embedding('Test text')
+    with pytest.raises(Exception, match="Error generating embedding: API Error"):
+        embedding_generator._get_embedding("Test text")
     assert mock_openai.embeddings.call_count == 1
     mock_openai.error_mode = False
-    with pytest.raises(Exception, match='Error generating embedding: Invalid input type: text must be a string'):
+    with pytest.raises(
+        Exception, match="Error generating embedding: Invalid input type: text must be a string"
+    ):
         embedding_generator._get_embedding(None)
 
+
 def test_generate_embeddings_single_document(embedding_generator, sample_document):
     """Test generating embeddings for a single document."""
     docs = embedding_generator.generate_embeddings([sample_document])
     assert len(docs) == 1
     doc = docs[0]
-    assert isinstance(doc['embeddings']['body'], list)
-    assert len(doc['embeddings']['body']) == 3
-    assert doc['embeddings']['version'] == 'v1'
-    assert doc['embeddings']['model'] == embedding_generator.model
+    assert isinstance(doc["embeddings"]["body"], list)
+    assert len(doc["embeddings"]["body"]) == 3
+    assert doc["embeddings"]["version"] == "v1"
+    assert doc["embeddings"]["model"] == embedding_generator.model
+
 
 def test_generate_embeddings_long_document(embedding_generator, mock_openai):
     """Test generating embeddings for document requiring chunking."""
-    long_doc = {'content': {'body': 'test. ' * 1000, 'summary': 'Test summary'}, 'embeddings': {'body': None, 'summary': None, 'version': None, 'model': None}, 'metadata': {'title': 'Long Document'}}
+    long_doc = {
+        "content": {"body": "test. " * 1000, "summary": "Test summary"},
+        "embeddings": {"body": None, "summary": None, "version": None, "model": None},
+        "metadata": {"title": "Long Document"},
+    }
     docs = embedding_generator.generate_embeddings([long_doc])
     assert len(docs) == 1
     doc = docs[0]
-    assert isinstance(doc['embeddings']['body'], list)
-    assert len(doc['embeddings']['body']) == 3
-    assert doc['embeddings']['chunks'] is not None
-    assert isinstance(doc['embeddings']['chunks']['texts'], list)
-    assert isinstance(doc['embeddings']['chunks']['vectors'], list)
+    assert isinstance(doc["embeddings"]["body"], list)
+    assert len(doc["embeddings"]["body"]) == 3
+    assert doc["embeddings"]["chunks"] is not None
+    assert isinstance(doc["embeddings"]["chunks"]["texts"], list)
+    assert isinstance(doc["embeddings"]["chunks"]["vectors"], list)
+
 
 def test_generate_embeddings_batch(embedding_generator, sample_document):
     """Test generating embeddings for multiple documents."""
@@ -136,33 +178,288 @@ def test_generate_embeddings_batch(embedding_generator, sample_document):
     processed_docs = embedding_generator.generate_embeddings(docs)
     assert len(processed_docs) == 2
     for doc in processed_docs:
-        assert doc['embeddings']['version'] == 'v1'
-        assert doc['embeddings']['model'] == embedding_generator.model
-        assert isinstance(doc['embeddings']['body'], list)
-        assert len(doc['embeddings']['body']) == 3
+        assert doc["embeddings"]["version"] == "v1"
+        assert doc["embeddings"]["model"] == embedding_generator.model
+        assert isinstance(doc["embeddings"]["body"], list)
+        assert len(doc["embeddings"]["body"]) == 3
+
 
 def test_generate_embeddings_api_error(embedding_generator, mock_openai, sample_document):
     """Test handling of API errors during embedding generation."""
     mock_openai.raise_error()
     docs = embedding_generator.generate_embeddings([dict(sample_document)])
     assert len(docs) == 1
-    assert docs[0]['embeddings']['version'] == 'v1_failed'
-    assert docs[0]['embeddings']['body'] == []
-    assert 'error' in docs[0]['embeddings']
-    assert 'Failed to generate embeddings for all chunks' in docs[0]['embeddings']['error']
+    assert docs[0]["embeddings"]["version"] == "v1_failed"
+    assert docs[0]["embeddings"]["body"] == []
+    assert "error" in docs[0]["embeddings"]
+    assert "Failed to generate embeddings for all chunks" in docs[0]["embeddings"]["error"]
+
 
 def test_generate_embeddings_invalid_document(embedding_generator):
     """Test handling of invalid document structure."""
-    invalid_doc = {'content': {}, 'embeddings': {'body': None, 'summary': None, 'version': None, 'model': None}}
+    invalid_doc = {
+        "content": {},
+        "embeddings": {"body": None, "summary": None, "version": None, "model": None},
+    }
     docs = embedding_generator.generate_embeddings([invalid_doc])
     assert len(docs) == 1
-    assert docs[0]['embeddings']['version'] == 'v1_failed'
-    assert 'Document has no body text' in docs[0]['embeddings']['error']
+    assert docs[0]["embeddings"]["version"] == "v1_failed"
+    assert "Document has no body text" in docs[0]["embeddings"]["error"]
+
 
 def test_chunk_averaging(embedding_generator, mock_openai):
     """Test averaging of chunk embeddings."""
-    mock_openai.side_effect = [CreateEmbeddingResponse(data=[Embedding(embedding=[0.1, 0.2, 0.3], index=0, object='embedding')], model='text-embedding-3-small', object='list', usage={'prompt_tokens': 4, 'total_tokens': 4}), CreateEmbeddingResponse(data=[Embedding(embedding=[0.4, 0.5, 0.6], index=0, object='embedding')], model='text-embedding-3-small', object='list', usage={'prompt_tokens': 4, 'total_tokens': 4})]
-    doc = {'content': {'body': 'chunk1. ' * 500 + 'chunk2. ' * 500, 'summary': None}, 'embeddings': {'body': None, 'summary': None, 'version': None, 'model': None}, 'metadata': {'title': 'Test'}}
+    mock_openai.side_effect = [
+        CreateEmbeddingResponse(
+            data=[Embedding(embedding=[0.1, 0.2, 0.3], index=0, object="embedding")],
+            model="text-embedding-3-small",
+            object="list",
+            usage={"prompt_tokens": 4, "total_tokens": 4},
+        ),
+        CreateEmbeddingResponse(
+            data=[Embedding(embedding=[0.4, 0.5, 0.6], index=0, object="embedding")],
+            model="text-embedding-3-small",
+            object="list",
+            usage={"prompt_tokens": 4, "total_tokens": 4},
+        ),
+    ]
+    doc = {
+        "content": {"body": "chunk1. " * 500 + "chunk2. " * 500, "summary": None},
+        "embeddings": {"body": None, "summary": None, "version": None, "model": None},
+        "metadata": {"title": "Test"},
+    }
     docs = embedding_generator.generate_embeddings([doc])
     expected_avg = [0.274, 0.536, 0.798]
-    np.testing.assert_array_almost_equal(docs[0]['embeddings']['body'], expected_avg, decimal=2)
\ No newline at end of file
+    np.testing.assert_array_almost_equal(docs[0]["embeddings"]["body"], expected_avg, decimal=2)
+
+
+@pytest.fixture
+def mock_batch_openai():
+    """Create a mock OpenAI client that accepts list inputs."""
+
+    class MockBatchOpenAI:
+
+        def __init__(self):
+            self.embeddings = self
+            self.calls = []
+            self.fail_on = set()
+
+        def close(self):
+            pass
+
+        def create(self, model, input, dimensions=None, encoding_format=None):
+            self.calls.append(list(input))
+            if any((text in self.fail_on for text in input)):
+                raise Exception("API Error")
+            data = [
+                Embedding(embedding=[float(len(text)), 1.0, 0.0], index=i, object="embedding")
+                for i, text in enumerate(input)
+            ]
+            return CreateEmbeddingResponse(
+                data=list(reversed(data)),
+                model=model,
+                object="list",
+                usage={"prompt_tokens": 4, "total_tokens": 4},
+            )
+
+    return MockBatchOpenAI()
+
+
+def _make_doc(body, summary=None):
+    return {
+        "content": {"body": body, "summary": summary},
+        "embeddings": {"body": None, "summary": None, "version": None, "model": None},
+        "metadata": {},
+    }
+
+
+def test_plan_batches_respects_item_and_token_limits(mock_batch_openai):
+    """Test packing of texts into batches by item count and token budget."""
+    generator = EmbeddingGenerator(
+        client=mock_batch_openai, batch_size=3, max_batch_tokens=10, cache_embeddings=False
+    )
+    assert generator._plan_batches([1, 1, 1, 1]) == [[0, 1, 2], [3]]
+    assert generator._plan_batches([6, 6, 3, 20, 1]) == [[0], [1, 2], [3], [4]]
+
+
+def test_generate_embeddings_batch_packs_documents(mock_batch_openai):
+    """Test that chunks and summaries of several documents share one request."""
+    generator = EmbeddingGenerator(client=mock_batch_openai, dimensions=3, cache_embeddings=False)
+    docs = [_make_doc("First document.", "First summary"), _make_doc("Second doc.")]
+    result = generator.generate_embeddings_batch(docs)
+    assert len(mock_batch_openai.calls) == 1
+    assert mock_batch_openai.calls[0] == ["First document.", "First summary", "Second doc."]
+    expected_first = generator._normalize_l2([float(len("First document.")), 1.0, 0.0])
+    np.testing.assert_array_almost_equal(result[0]["embeddings"]["body"], expected_first)
+    assert result[0]["embeddings"]["summary"] is not None
+    assert result[1]["embeddings"]["summary"] is None
+    assert all((doc["embeddings"]["version"] == "v1" for doc in result))
+
+
+def test_generate_embeddings_batch_retries_failed_sub_batches(mock_batch_openai):
+    """Test that only the failing part of a batch is retried."""
+    generator = EmbeddingGenerator(client=mock_batch_openai, cache_embeddings=False)
+    mock_batch_openai.fail_on = {"Bad document."}
+    docs = [_make_doc("Good document."), _make_doc("Bad document."), _make_doc("Another good one.")]
+    result = generator.generate_embeddings_batch(docs)
+    assert result[0]["embeddings"]["version"] == "v1"
+    assert result[1]["embeddings"]["version"] == "v1_failed"
+    assert "Failed to generate embeddings for all chunks" in result[1]["embeddings"]["error"]
+    assert result[2]["embeddings"]["version"] == "v1"
+    assert mock_batch_openai.calls[0] == ["Good document.", "Bad document.", "Another good one."]
+    assert ["Good document."] in mock_batch_openai.calls
+
+
+def test_generate_embeddings_batch_invalid_document(mock_batch_openai):
+    """Test that invalid documents fail without affecting the rest of the batch."""
+    generator = EmbeddingGenerator(client=mock_batch_openai, cache_embeddings=False)
+    docs = [{"content": {}, "embeddings": {}}, _make_doc("Valid text.")]
+    result = generator.generate_embeddings_batch(docs)
+    assert result[0]["embeddings"]["version"] == "v1_failed"
+    assert "Document has no body text" in result[0]["embeddings"]["error"]
+    assert result[1]["embeddings"]["version"] == "v1"
+
+
+class FakePipeline:
+    """Collects pipelined SETEX calls and applies them on execute."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append((key, value))
+
+    def execute(self):
+        if self.redis.fail_writes:
+            raise RedisError("write failed")
+        self.redis.store.update(self.ops)
+        return [True] * len(self.ops)
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis counting MGET round trips."""
+
+    def __init__(self, **kwargs):
+        self.store = {}
+        self.mget_calls = 0
+        self.fail_writes = False
+
+    def ping(self):
+        return True
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        if self.fail_writes:
+            raise RedisError("write failed")
+        self.store[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_cache_manager(monkeypatch):
+    """Create a cache manager backed by an in-memory Redis stand-in."""
+    monkeypatch.setattr(cache_manager.redis, "Redis", FakeRedis)
+    return CacheManager(prefix="emb", default_ttl=60, compression="none")
+
+
+def test_embed_texts_uses_cache(mock_batch_openai, fake_cache_manager):
+    """Test that cached chunks are not sent to the API again."""
+    generator = EmbeddingGenerator(client=mock_batch_openai, cache_manager=fake_cache_manager)
+    first = generator.embed_texts(["alpha", "beta"])
+    assert mock_batch_openai.calls == [["alpha", "beta"]]
+    stored = list(fake_cache_manager.redis.store.values())
+    assert all((isinstance(value, bytes) and len(value) == 3 + 3 * 4 for value in stored))
+    second = generator.embed_texts(["beta", "gamma", "alpha", "gamma"])
+    assert mock_batch_openai.calls == [["alpha", "beta"], ["gamma"]]
+    assert fake_cache_manager.redis.mget_calls == 2
+    np.testing.assert_array_almost_equal(second[0], first[1])
+    np.testing.assert_array_almost_equal(second[2], first[0])
+    assert second[1] == second[3]
+
+
+def test_embedding_cache_key_depends_on_model_and_dimensions(fake_cache_manager):
+    """Test that cache keys separate models and dimensionalities."""
+    base = EmbeddingCache(fake_cache_manager, model="m1", dimensions=3)
+    assert base.key_for("text") == EmbeddingCache(
+        fake_cache_manager, model="m1", dimensions=3
+    ).key_for("text")
+    assert base.key_for("text") != EmbeddingCache(
+        fake_cache_manager, model="m2", dimensions=3
+    ).key_for("text")
+    assert base.key_for("text") != EmbeddingCache(
+        fake_cache_manager, model="m1", dimensions=4
+    ).key_for("text")
+    assert base.key_for("text").startswith("chunk:")
+
+
+def test_embedding_cache_uses_the_float32_codec(fake_cache_manager):
+    """Test that vectors are stored with the codec header CacheManager writes."""
+    cache = EmbeddingCache(fake_cache_manager, model="m1", dimensions=3)
+    cache.set_many(["text"], [[0.5, -1.0, 2.0]])
+    raw = fake_cache_manager.redis.store["emb:" + cache.key_for("text")]
+    assert raw[:3] == bytes((MAGIC, FLOAT32_LIST, 0))
+    assert raw == fake_cache_manager.codec.encode([0.5, -1.0, 2.0], "float32")
+    assert cache.get_many(["text", "other"]) == [[0.5, -1.0, 2.0], None]
+
+
+def test_embedding_cache_treats_headerless_vectors_as_misses(fake_cache_manager):
+    """Test that raw float32 bytes written before the codec header are misses."""
+    cache = EmbeddingCache(fake_cache_manager, model="m1", dimensions=3)
+    fake_cache_manager.redis.store["emb:" + cache.key_for("text")] = np.float32([1, 2, 3]).tobytes()
+    assert cache.get_many(["text"]) == [None]
+
+
+def test_embedding_cache_goes_through_the_cache_manager_tiers(monkeypatch):
+    """Test that lookups are counted per tier and failed writes stay out of the local tier."""
+    monkeypatch.setattr(cache_manager.redis, "Redis", FakeRedis)
+    manager = CacheManager(prefix="emb", local_max_bytes=4096, compression="none")
+    cache = EmbeddingCache(manager, model="m1", dimensions=3)
+    manager.redis.fail_writes = True
+    assert cache.set_many(["alpha", "beta"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]) is False
+    assert len(manager.local) == 0
+    manager.redis.fail_writes = False
+    assert cache.set_many(["alpha", "beta"], [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]) is True
+    manager.local.clear()
+    assert cache.get_many(["alpha", "gamma"]) == [[1.0, 0.0, 0.0], None]
+    assert cache.get_many(["alpha"]) == [[1.0, 0.0, 0.0]]
+    stats = manager.stats()
+    assert stats["redis"]["hits"] == 1
+    assert stats["redis"]["misses"] == 1
+    assert stats["redis"]["errors"] == 1
+    assert stats["local"]["hits"] == 1
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_failed_middle_chunk_keeps_texts_and_vectors_aligned(
+    mock_batch_openai, monkeypatch, batched
+):
+    """Test that a failed chunk is dropped from both the chunk texts and vectors."""
+    monkeypatch.setattr(
+        "src.utils.chunking.base.chunk_text_by_tokens", lambda text, config: ["a", "bb", "ccc"]
+    )
+    monkeypatch.setattr(ChunkingConfig, "count_tokens", lambda self, text: 1)
+    generator = EmbeddingGenerator(
+        client=mock_batch_openai, dimensions=3, batch_size=1, cache_embeddings=False
+    )
+    mock_batch_openai.fail_on = {"bb"}
+    if batched:
+        result = generator.generate_embeddings_batch([_make_doc("a bb ccc")])
+    else:
+        monkeypatch.setattr(
+            generator, "_get_embedding", lambda text: generator._get_embeddings([text])[0]
+        )
+        result = generator.generate_embeddings([_make_doc("a bb ccc")])
+    chunks = result[0]["embeddings"]["chunks"]
+    assert chunks["texts"] == ["a", "ccc"]
+    # The mock embeds a text as [len(text), 1, 0]
+    assert [round(vector[0] / vector[1]) for vector in chunks["vectors"]] == [1, 3]
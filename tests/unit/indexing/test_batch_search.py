@@ -0,0 +1,82 @@
+"""Tests for batched multi-query search."""
+
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.search.search_executor import SearchExecutor
+
+
+def hit(doc_id, score=0.9):
+    return {
+        "content_body": f"body {doc_id}",
+        "content_title": doc_id,
+        "_additional": {"id": doc_id, "score": score},
+    }
+
+
+def multi_get_response(builders):
+    aliases = [builder.alias for builder in builders]
+    return {"data": {"Get": {alias: [hit(f"doc-{alias}")] for alias in aliases}}}
+
+
+@pytest.fixture
+def client():
+    """Create a mock Weaviate client recording aliased queries"""
+    client = MagicMock()
+
+    def get(class_name, properties):
+        builder = MagicMock()
+        builder.with_alias.side_effect = lambda alias: setattr(builder, "alias", alias) or builder
+        for method in ("with_additional", "with_near_vector", "with_bm25", "with_limit"):
+            getattr(builder, method).return_value = builder
+        return builder
+
+    client.query.get.side_effect = get
+    client.query.multi_get.side_effect = lambda builders: MagicMock(
+        do=MagicMock(return_value=multi_get_response(builders))
+    )
+    return client
+
+
+@pytest.fixture
+def executor(client):
+    """Create a SearchExecutor with the mock client"""
+    return SearchExecutor(client, "Document")
+
+
+def test_batch_semantic_search_keeps_input_order(executor, client):
+    """Test that queries are grouped into aliased requests and returned in order"""
+    results = executor.batch_semantic_search(
+        [[0.1, 0.2]] * 5, limit=3, queries_per_request=2, max_concurrency=2
+    )
+    assert [[r.id for r in query_results] for query_results in results] == [
+        [f"doc-q{i}"] for i in range(5)
+    ]
+    assert client.query.multi_get.call_count == 3
+    assert all(len(call.args[0]) <= 2 for call in client.query.multi_get.call_args_list)
+
+
+def test_batch_hybrid_search_adds_bm25(executor, client):
+    """Test that hybrid batches combine the vector and keyword query"""
+    results = executor.batch_hybrid_search(["rag", "faiss"], [[0.1], [0.2]], limit=5)
+    assert [query_results[0]["_additional"]["id"] for query_results in results] == [
+        "doc-q0",
+        "doc-q1",
+    ]
+    assert client.query.multi_get.call_count == 1
+    builder = client.query.multi_get.call_args.args[0][1]
+    builder.with_bm25.assert_called_once_with({"query": "faiss"})
+    with pytest.raises(ValueError):
+        executor.batch_hybrid_search(["rag"], [], limit=5)
+
+
+def test_failed_request_yields_empty_results(executor, client):
+    """Test that a failed request only empties the results of its queries"""
+    responses = iter([{"errors": [{"message": "timeout"}]}, None])
+
+    def multi_get(builders):
+        response = next(responses) or multi_get_response(builders)
+        return MagicMock(do=MagicMock(return_value=response))
+
+    client.query.multi_get.side_effect = multi_get
+    results = executor.batch_semantic_search([[0.1]] * 3, queries_per_request=2, max_concurrency=1)
+    assert [len(query_results) for query_results in results] == [0, 0, 1]
@@ -0,0 +1,99 @@
+"""Tests for batched document deletion."""
+
+import uuid
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.document.operations.deletion import DocumentDeletion
+
+IDS = [str(uuid.UUID(int=i)) for i in range(5)]
+
+
+def delete_response(ids, status="SUCCESS", limit=10000, matches=None):
+    return {
+        "results": {
+            "matches": len(ids) if matches is None else matches,
+            "limit": limit,
+            "objects": [{"id": doc_id, "status": status} for doc_id in ids],
+        }
+    }
+
+
+@pytest.fixture
+def client():
+    """Create a mock Weaviate client"""
+    return MagicMock()
+
+
+@pytest.fixture
+def cache_manager():
+    """Create a mock cache manager"""
+    return MagicMock()
+
+
+@pytest.fixture
+def deleter(client, cache_manager):
+    """Create a DocumentDeletion instance with mocks"""
+    return DocumentDeletion(client, "Document", cache_manager)
+
+
+def test_bulk_delete_chunks_ids(deleter, client, cache_manager):
+    """Test that IDs are deleted in chunks with per-ID outcomes"""
+    client.batch.delete_objects.side_effect = [delete_response(IDS[:2]), delete_response(IDS[2:3])]
+    outcomes = deleter.bulk_delete(IDS[:4] + ["not-a-uuid"], chunk_size=2)
+    assert outcomes == {
+        IDS[0]: "deleted",
+        IDS[1]: "deleted",
+        IDS[2]: "deleted",
+        IDS[3]: "not_found",
+        "not-a-uuid": "invalid_id",
+    }
+    assert client.batch.delete_objects.call_count == 2
+    where = client.batch.delete_objects.call_args_list[0].kwargs["where"]
+    assert where == {"path": ["id"], "operator": "ContainsAny", "valueTextArray": IDS[:2]}
+    cache_manager.delete_many.assert_called_once_with([f"doc:{doc_id}" for doc_id in IDS[:3]])
+    cache_manager.delete.assert_not_called()
+    client.data_object.delete.assert_not_called()
+
+
+def test_bulk_delete_failed_request(deleter, client, cache_manager):
+    """Test that a failed request marks its chunk as failed"""
+    client.batch.delete_objects.side_effect = [
+        Exception("timeout"),
+        delete_response(IDS[2:4]),
+        delete_response(IDS[4:]),
+        Exception("timeout"),
+    ]
+    outcomes = deleter.bulk_delete(IDS, chunk_size=2)
+    assert [outcomes[doc_id] for doc_id in IDS] == [
+        "failed",
+        "failed",
+        "deleted",
+        "deleted",
+        "deleted",
+    ]
+    assert deleter.delete_documents(IDS[:1]) is False
+
+
+def test_delete_by_filter_repeats_until_done(deleter, client, cache_manager):
+    """Test that filter deletion repeats while the server limit was reached"""
+    client.batch.delete_objects.side_effect = [
+        delete_response(IDS[:2], limit=2, matches=5),
+        delete_response(IDS[2:4], limit=2, matches=3),
+        delete_response(IDS[4:], limit=2),
+    ]
+    where = {"path": ["parent_id"], "operator": "Equal", "valueText": "workspace"}
+    outcomes = deleter.delete_by_filter(where)
+    assert outcomes == {doc_id: "deleted" for doc_id in IDS}
+    assert client.batch.delete_objects.call_count == 3
+    assert client.batch.delete_objects.call_args.kwargs["where"] == where
+    assert cache_manager.delete_many.call_count == 3
+
+
+def test_delete_by_filter_stops_without_progress(deleter, client):
+    """Test that filter deletion stops when nothing could be deleted"""
+    client.batch.delete_objects.return_value = delete_response(IDS[:2], status="FAILED", limit=2)
+    outcomes = deleter.delete_by_filter(
+        {"path": ["parent_id"], "operator": "Equal", "valueText": "x"}
+    )
+    assert outcomes == {IDS[0]: "failed", IDS[1]: "failed"}
+    assert client.batch.delete_objects.call_count == 1
@@ -0,0 +1,138 @@
+"""Tests for the parallel Weaviate bulk writer."""
+
+import threading
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.document.bulk_writer import BulkWriter, BulkWriteStats
+
+
+def make_response(objects, failing=(), status_code=200):
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = [
+        {
+            "id": obj["id"],
+            "result": (
+                {"errors": {"error": [{"message": "invalid"}]}} if obj["id"] in failing else {}
+            ),
+        }
+        for obj in objects
+    ]
+    return response
+
+
+@pytest.fixture
+def sent():
+    """Record the objects of every batch request"""
+    return []
+
+
+@pytest.fixture
+def client(sent):
+    """Create a mock client accepting every object"""
+    client = MagicMock()
+    lock = threading.Lock()
+
+    def post(path, weaviate_object):
+        with lock:
+            sent.append([obj["id"] for obj in weaviate_object["objects"]])
+        return make_response(weaviate_object["objects"])
+
+    client._connection.post.side_effect = post
+    return client
+
+
+def test_writes_in_batches(client, sent):
+    """Test that objects are split into batches by count"""
+    writer = BulkWriter(client, "Document", batch_size=3, num_workers=2)
+    for i in range(7):
+        writer.add({"title": f"doc {i}"}, [0.1, 0.2], f"id-{i}")
+    assert writer.flush() == {}
+    assert sorted((len(batch) for batch in sent)) == [1, 3, 3]
+    assert writer.stats.objects == 7
+    assert writer.stats.requests == 3
+    payload = client._connection.post.call_args.kwargs["weaviate_object"]["objects"][0]
+    assert payload["class"] == "Document" and "vector" in payload
+
+
+def test_splits_batches_by_payload_size(client, sent):
+    """Test that the payload size limit closes batches early"""
+    writer = BulkWriter(client, "Document", batch_size=100, max_batch_bytes=300)
+    for i in range(4):
+        writer.add({"body": "x" * 150}, None, f"id-{i}")
+    writer.flush()
+    assert all((len(batch) == 1 for batch in sent))
+
+
+def test_requeues_only_failed_objects(client, sent):
+    """Test that per-object errors re-send just the failed objects"""
+    calls = []
+
+    def post(path, weaviate_object):
+        objects = weaviate_object["objects"]
+        calls.append([obj["id"] for obj in objects])
+        return make_response(objects, failing={"id-1"} if len(calls) == 1 else ())
+
+    client._connection.post.side_effect = post
+    writer = BulkWriter(client, "Document", batch_size=10, retry_backoff=0)
+    for i in range(3):
+        writer.add({}, None, f"id-{i}")
+    assert writer.flush() == {}
+    assert calls == [["id-0", "id-1", "id-2"], ["id-1"]]
+    assert writer.stats.retried == 1
+    assert writer.stats.objects == 3
+
+
+def test_reports_objects_failing_after_retries(client):
+    """Test that objects failing every attempt are returned by flush"""
+    client._connection.post.side_effect = lambda path, weaviate_object: make_response(
+        weaviate_object["objects"], failing={"id-0"}
+    )
+    writer = BulkWriter(client, "Document", max_retries=2, retry_backoff=0)
+    writer.add({}, None, "id-0")
+    writer.add({}, None, "id-1")
+    assert writer.flush() == {"id-0": "invalid"}
+    assert client._connection.post.call_count == 3
+    assert writer.stats.failed == 1
+
+
+def test_failed_request_requeues_batch(client):
+    """Test that a failed request re-sends its whole batch"""
+    responses = [MagicMock(status_code=503)]
+    client._connection.post.side_effect = lambda path, weaviate_object: (
+        responses.pop() if responses else make_response(weaviate_object["objects"])
+    )
+    writer = BulkWriter(client, "Document", retry_backoff=0)
+    writer.add({}, None, "id-0")
+    writer.add({}, None, "id-1")
+    assert writer.flush() == {}
+    assert writer.stats.objects == 2
+    assert writer.stats.retried == 2
+
+
+def test_stats_summary():
+    """Test throughput and p95 latency reporting"""
+    stats = BulkWriteStats(objects=200, elapsed=2.0)
+    stats.latencies.extend([0.01 * i for i in range(1, 21)])
+    stats.flush_latencies.extend([0.1, 0.5])
+    summary = stats.to_dict()
+    assert summary["objects_per_second"] == 100.0
+    assert summary["p95_latency_ms"] == 190.0
+    assert summary["p95_flush_latency_ms"] == 500.0
+
+
+def test_records_flush_latency(client):
+    """Test that every flush writing objects records its duration"""
+    writer = BulkWriter(client, "Document", batch_size=2)
+    for i in range(3):
+        writer.add({}, None, f"id-{i}")
+    writer.flush()
+    writer.flush()
+    assert len(writer.stats.flush_latencies) == 1
+    assert writer.stats.p95_flush_latency >= 0
+
+
+def test_rejects_unsupported_client_version(client, monkeypatch):
+    """Test that the connection-based transport checks the client version"""
+    monkeypatch.setattr("src.indexing.document.bulk_writer.weaviate.__version__", "4.4.0")
+    with pytest.raises(RuntimeError, match="4.4.0"):
+        BulkWriter(client, "Document")
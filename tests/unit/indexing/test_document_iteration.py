@@ -0,0 +1,84 @@
+"""Tests for cursor-based document iteration."""
+
+import io
+import json
+import uuid
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.document.operations.retrieval import DocumentRetrieval
+
+IDS = [str(uuid.UUID(int=i)) for i in range(5)]
+
+
+@pytest.fixture
+def client():
+    """Create a mock client serving five objects through the after cursor"""
+    client = MagicMock()
+
+    def get(class_name, limit, after, with_vector):
+        start = 0 if after is None else IDS.index(after) + 1
+        return {
+            "objects": [
+                {"id": doc_id, "properties": {"n": i}, "vector": [float(i)]}
+                for i, doc_id in enumerate(IDS)
+                if i >= start
+            ][:limit]
+        }
+
+    client.data_object.get.side_effect = get
+    return client
+
+
+@pytest.fixture
+def retrieval(client):
+    """Create a DocumentRetrieval instance with the mock client"""
+    return DocumentRetrieval(client, "Document")
+
+
+def test_iterates_with_after_cursor(retrieval, client):
+    """Test that pages are chained through the ID of the last object"""
+    docs = list(retrieval.iter_documents(batch_size=2))
+    assert [doc["id"] for doc in docs] == IDS
+    assert docs[0] == {"id": IDS[0], "properties": {"n": 0}}
+    afters = [call.kwargs["after"] for call in client.data_object.get.call_args_list]
+    assert afters == [None, IDS[1], IDS[3]]
+
+
+def test_iteration_is_lazy(retrieval, client):
+    """Test that pages are only fetched when consumed"""
+    docs = retrieval.iter_documents(batch_size=2, include_vectors=True)
+    assert next(docs) == {"id": IDS[0], "properties": {"n": 0}, "vector": [0.0]}
+    assert client.data_object.get.call_count == 1
+    assert client.data_object.get.call_args.kwargs["with_vector"] is True
+
+
+def test_filtered_iteration_uses_keyset(retrieval, client):
+    """Test that filtered iteration pages on IDs greater than the last one"""
+    client.schema.get.return_value = {"properties": [{"name": "n"}]}
+    query = client.query.get.return_value
+    chain = (
+        query.with_where.return_value.with_sort.return_value.with_additional.return_value.with_limit.return_value
+    )
+    chain.do.side_effect = [
+        {"data": {"Get": {"Document": [{"n": i, "_additional": {"id": IDS[i]}} for i in (0, 1)]}}},
+        {"data": {"Get": {"Document": [{"n": 2, "_additional": {"id": IDS[2]}}]}}},
+    ]
+    where = {"path": ["source"], "operator": "Equal", "valueText": "notion"}
+    docs = list(retrieval.iter_documents(batch_size=2, where=where))
+    assert docs == [{"id": IDS[i], "properties": {"n": i}} for i in range(3)]
+    wheres = [call.args[0] for call in query.with_where.call_args_list]
+    assert wheres[0] == where
+    assert wheres[1]["operands"][1] == {
+        "path": ["id"],
+        "operator": "GreaterThan",
+        "valueText": IDS[1],
+    }
+    client.data_object.get.assert_not_called()
+
+
+def test_export_writes_json_lines(retrieval):
+    """Test that export writes one JSON document per line"""
+    stream = io.StringIO()
+    assert retrieval.export_documents(stream, batch_size=3) == 5
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == IDS
@@ -0,0 +1,272 @@
+"""Tests for the embedded BM25 + ANN index backend."""
+
+import os
+import uuid
+from datetime import datetime
+import pytest
+from src.indexing.embedded import EmbeddedIndexOperations, matches_where
+from src.indexing.search.fusion import fuse_scores
+from src.indexing.index.index_config import IndexConfig
+from src.indexing.index.vector_index import VectorIndex
+
+IDS = [str(uuid.UUID(int=i + 1)) for i in range(4)]
+TEXTS = [
+    ("Vector databases", "Approximate nearest neighbor search over embeddings"),
+    ("Cooking pasta", "Boil water and add salt"),
+    ("Keyword search", "BM25 ranks documents by term frequency"),
+    ("Gardening", "Water the plants every morning"),
+]
+VECTORS = [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.0, 0.7], [0.0, 0.6, 0.8]]
+TIMES = [
+    "2024-01-01T12:00:00Z",
+    "2024-01-02T12:00:00Z",
+    "2024-01-03T12:00:00Z",
+    "2024-02-01T12:00:00Z",
+]
+
+
+def make_doc(i, parent_id="workspace"):
+    title, body = TEXTS[i]
+    return {
+        "uuid": IDS[i],
+        "content": {"title": title, "body": body},
+        "embeddings": {"body": VECTORS[i], "model": "test", "version": "1"},
+        "metadata": {"title": title, "timestamp_utc": TIMES[i]},
+        "relationships": {"parent_id": parent_id if i % 2 == 0 else "other", "chunk_ids": []},
+    }
+
+
+@pytest.fixture
+def ops(tmp_path):
+    """Create an embedded index with four documents"""
+    index = EmbeddedIndexOperations(str(tmp_path), index_type="flat")
+    index.add_documents([make_doc(i) for i in range(4)])
+    yield index
+    index.close()
+
+
+def result_ids(results):
+    return [r.id if hasattr(r, "id") else r["_additional"]["id"] for r in results]
+
+
+def test_add_documents_skips_invalid(tmp_path):
+    """Test that invalid and duplicate documents are skipped"""
+    index = EmbeddedIndexOperations(str(tmp_path))
+    ids = index.add_documents(
+        [make_doc(0), {"uuid": IDS[1]}, make_doc(0), dict(make_doc(2), uuid="bad")]
+    )
+    assert ids == [IDS[0]]
+    assert index.store.count() == 1
+    assert index.write_stats()["objects"] == 1
+    index.close()
+
+
+def test_semantic_search(ops):
+    """Test that semantic search ranks by cosine similarity and applies min_score"""
+    results = ops.semantic_search([1.0, 0.0, 0.0], limit=2, min_score=0.5)
+    assert result_ids(results) == [IDS[0], IDS[2]]
+    assert results[0].score == pytest.approx(1.0)
+    assert results[0].content["title"] == "Vector databases"
+    assert result_ids(ops.semantic_search([1.0, 0.0, 0.0], limit=4, min_score=0.99)) == [IDS[0]]
+
+
+def test_batch_semantic_search(ops):
+    """Test that batched semantic search returns results per query"""
+    results = ops.batch_semantic_search([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], limit=1, min_score=0.5)
+    assert [result_ids(r) for r in results] == [[IDS[0]], [IDS[1]]]
+
+
+def test_hybrid_search_fuses_keyword_and_vector(ops):
+    """Test that hybrid search combines BM25 and vector scores"""
+    keyword_only = ops.hybrid_search("BM25 term frequency", [0.0, 1.0, 0.0], limit=1, alpha=0.0)
+    assert result_ids(keyword_only) == [IDS[2]]
+    vector_only = ops.hybrid_search("BM25 term frequency", [0.0, 1.0, 0.0], limit=1, alpha=1.0)
+    assert result_ids(vector_only) == [IDS[1]]
+    both = ops.hybrid_search("water", [0.0, 0.6, 0.8], limit=2)
+    assert result_ids(both)[0] == IDS[3]
+    assert both[0]["_additional"]["score"] >= both[1]["_additional"]["score"]
+
+
+def test_fuse_scores():
+    """Test min-max normalized score fusion"""
+    fused = fuse_scores([("a", 10.0), ("b", 5.0)], [("b", 0.9), ("c", 0.1)], alpha=0.75)
+    assert fused == [("b", 0.75), ("a", 0.25), ("c", 0.0)]
+    assert fuse_scores([], [("c", 0.3)], alpha=0.5) == [("c", 0.5)]
+
+
+def test_time_range_search(ops):
+    """Test that time range search uses the document timestamps"""
+    results = ops.time_range_search(datetime(2024, 1, 1), datetime(2024, 1, 31))
+    assert result_ids(results) == [IDS[2], IDS[1], IDS[0]]
+    ranked = ops.time_range_search(
+        datetime(2024, 1, 1), datetime(2024, 1, 31), [0.0, 1.0, 0.0], limit=1
+    )
+    assert result_ids(ranked) == [IDS[1]]
+
+
+def test_relationship_search(ops):
+    """Test that relationship search filters by parent ID"""
+    assert set(result_ids(ops.relationship_search("workspace"))) == {IDS[0], IDS[2]}
+    assert result_ids(ops.relationship_search("workspace", [0.7, 0.0, 0.7], limit=1)) == [IDS[2]]
+
+
+def test_bulk_delete(ops):
+    """Test per-ID delete outcomes and removal from both indexes"""
+    outcomes = ops.bulk_delete([IDS[0], str(uuid.UUID(int=99)), "not-a-uuid"])
+    assert outcomes == {
+        IDS[0]: "deleted",
+        str(uuid.UUID(int=99)): "not_found",
+        "not-a-uuid": "invalid_id",
+    }
+    assert IDS[0] not in result_ids(ops.semantic_search([1.0, 0.0, 0.0], limit=4, min_score=0.0))
+    assert ops.hybrid_search("vector databases", [1.0, 0.0, 0.0], alpha=0.0) == []
+
+
+def test_delete_by_filter(ops):
+    """Test deletion by where filter, with dry run"""
+    where = {"path": ["parent_id"], "operator": "Equal", "valueText": "other"}
+    assert ops.delete_by_filter(where, dry_run=True) == {IDS[1]: "dry_run", IDS[3]: "dry_run"}
+    assert ops.store.count() == 4
+    assert ops.delete_by_filter(where) == {IDS[1]: "deleted", IDS[3]: "deleted"}
+    assert [doc["id"] for doc in ops.iter_documents()] == [IDS[0], IDS[2]]
+
+
+def test_update_document(ops):
+    """Test that updates merge properties and replace the vector"""
+    assert ops.update_document(
+        IDS[1], {"content": {"title": "Fresh pasta"}}, vector=[1.0, 0.0, 0.0]
+    )
+    assert set(result_ids(ops.semantic_search([1.0, 0.0, 0.0], limit=2, min_score=0.9))) == {
+        IDS[0],
+        IDS[1],
+    }
+    assert not ops.update_document(str(uuid.UUID(int=99)), {"content": {}})
+
+
+def test_reopen_loads_saved_ann_index(tmp_path, ops):
+    """Test that a closed index is reloaded from its saved ANN index"""
+    ops.close()
+    assert os.path.isdir(os.path.join(str(tmp_path), "Document.vectors"))
+    reopened = EmbeddedIndexOperations(str(tmp_path), index_type="flat")
+    assert len(reopened.vectors) == 4
+    assert result_ids(reopened.semantic_search([0.0, 1.0, 0.0], limit=1)) == [IDS[1]]
+    reopened.close()
+
+
+def test_reopen_rebuilds_missing_ann_index(tmp_path):
+    """Test that the ANN index is rebuilt from the store after a crash"""
+    index = EmbeddedIndexOperations(str(tmp_path), index_type="flat")
+    index.add_documents([make_doc(i) for i in range(4)])
+    index.store.close()
+    assert not os.path.isdir(os.path.join(str(tmp_path), "Document.vectors"))
+    reopened = EmbeddedIndexOperations(str(tmp_path), index_type="flat")
+    assert len(reopened.vectors) == 4
+    assert result_ids(reopened.semantic_search([0.0, 0.0, 1.0], limit=1, min_score=0.0)) == [IDS[3]]
+    reopened.close()
+
+
+def test_snapshot_round_trip(tmp_path, ops):
+    """Test that a snapshot restores documents and vectors into a new index"""
+    manifest = ops.create_snapshot(str(tmp_path / "snap"), chunk_size=3, compress=False)
+    assert (manifest.count, len(manifest.chunks), manifest.dimension) == (4, 2, 3)
+    restored = EmbeddedIndexOperations(str(tmp_path / "restored"), index_type="flat")
+    progress = []
+    stats = restored.restore_snapshot(
+        str(tmp_path / "snap"), progress=lambda *p: progress.append(p)
+    )
+    assert stats == {"restored": 4, "failed": 0}
+    assert progress == [(3, 4), (4, 4)]
+    assert [doc["id"] for doc in restored.iter_documents()] == IDS
+    assert result_ids(restored.semantic_search([0.0, 1.0, 0.0], limit=1)) == [IDS[1]]
+    with pytest.raises(ValueError):
+        restored.restore_snapshot(str(tmp_path / "snap"), class_name="Other")
+    restored.close()
+
+
+def test_find_pages_in_sql(ops):
+    """Test that find applies limit and offset newest first"""
+    assert [doc[0] for doc in ops.store.find(limit=2)] == [IDS[3], IDS[2]]
+    assert [doc[0] for doc in ops.store.find(limit=2, offset=3)] == [IDS[0]]
+
+
+def test_ranked_find_reads_pages(ops, monkeypatch):
+    """Test that vector-ranked filtered searches rank across store pages"""
+    monkeypatch.setattr("src.indexing.embedded.embedded_operations.FETCH_SIZE", 1)
+    ranked = ops.relationship_search("workspace", [1.0, 0.0, 0.0], limit=2)
+    assert result_ids(ranked) == [IDS[0], IDS[2]]
+
+
+def test_matches_where():
+    """Test where filter evaluation"""
+    props = {
+        "parent_id": "workspace",
+        "metadata": {
+            "title": "Vector databases",
+            "tags": ["ann", "db"],
+            "timestamp_utc": "2024-01-02T00:00:00Z",
+        },
+    }
+    assert matches_where(None, IDS[0], props)
+    assert matches_where({"path": ["id"], "operator": "Equal", "valueText": IDS[0]}, IDS[0], props)
+    assert matches_where(
+        {"path": ["metadata", "title"], "operator": "Like", "valueText": "vector*"}, IDS[0], props
+    )
+    assert matches_where(
+        {"path": ["metadata", "tags"], "operator": "ContainsAny", "valueTextArray": ["db", "x"]},
+        IDS[0],
+        props,
+    )
+    assert not matches_where(
+        {"path": ["metadata", "tags"], "operator": "ContainsAll", "valueTextArray": ["db", "x"]},
+        IDS[0],
+        props,
+    )
+    assert matches_where(
+        {
+            "path": ["metadata", "timestamp_utc"],
+            "operator": "GreaterThan",
+            "valueDate": "2024-01-01T00:00:00Z",
+        },
+        IDS[0],
+        props,
+    )
+    assert matches_where(
+        {
+            "operator": "And",
+            "operands": [
+                {"path": ["parent_id"], "operator": "Equal", "valueText": "workspace"},
+                {
+                    "operator": "Not",
+                    "operands": [
+                        {"path": ["missing"], "operator": "IsNull", "valueBoolean": False}
+                    ],
+                },
+            ],
+        },
+        IDS[0],
+        props,
+    )
+    with pytest.raises(ValueError):
+        matches_where(
+            {"path": ["parent_id"], "operator": "WithinGeoRange", "valueText": "x"}, IDS[0], props
+        )
+
+
+def test_vector_index_selects_embedded_backend(tmp_path):
+    """Test that VectorIndex runs on the embedded backend without a server"""
+    index = VectorIndex(backend="embedded", data_dir=str(tmp_path), ann_index_type="flat")
+    assert isinstance(index.operations, EmbeddedIndexOperations)
+    index.initialize()
+    index.add_documents([make_doc(i) for i in range(4)])
+    assert result_ids(index.relationship_search("other", [0.0, 0.6, 0.8], limit=1)) == [IDS[3]]
+    assert index.get_schema()["backend"] == "embedded"
+    index.cleanup()
+    assert os.path.isdir(os.path.join(str(tmp_path), "Document.vectors"))
+
+
+def test_embedded_backend_requires_data_dir():
+    """Test backend validation of the index configuration"""
+    with pytest.raises(ValueError):
+        IndexConfig(backend="embedded")
+    with pytest.raises(ValueError):
+        IndexConfig(backend="elastic")
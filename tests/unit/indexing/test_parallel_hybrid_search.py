@@ -0,0 +1,129 @@
+"""Tests for parallel hybrid search with client-side fusion."""
+
+import threading
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.search.fusion import fuse, reciprocal_rank_fusion
+from src.indexing.search.search_executor import SearchExecutor
+
+
+def hit(doc_id, **additional):
+    return {"content_title": doc_id, "_additional": {"id": doc_id, **additional}}
+
+
+BM25_HITS = [hit("a", score="7.5"), hit("b", score="3.0"), hit("c", score="1.0")]
+VECTOR_HITS = [hit("b", certainty=0.95), hit("d", certainty=0.9), hit("a", certainty=0.6)]
+
+
+@pytest.fixture
+def release():
+    """Event gating the slow leg of a query"""
+    event = threading.Event()
+    yield event
+    event.set()
+
+
+@pytest.fixture
+def client(release):
+    """Create a mock Weaviate client answering BM25 and vector queries separately"""
+    client = MagicMock()
+    client.slow = None
+    client.failing = None
+
+    def get(class_name, properties):
+        builder = MagicMock()
+        builder.calls = {}
+        for method in ("with_additional", "with_bm25", "with_near_vector", "with_limit"):
+            getattr(builder, method).side_effect = (
+                lambda arg, method=method: builder.calls.update({method: arg}) or builder
+            )
+
+        def do():
+            leg = "bm25" if "with_bm25" in builder.calls else "vector"
+            if leg == client.slow:
+                release.wait(5)
+            if leg == client.failing:
+                raise ConnectionError("leg down")
+            hits = BM25_HITS if leg == "bm25" else VECTOR_HITS
+            return {"data": {"Get": {class_name: hits[: builder.calls["with_limit"]]}}}
+
+        builder.do.side_effect = do
+        client.builders.append(builder)
+        return builder
+
+    client.builders = []
+    client.query.get.side_effect = get
+    return client
+
+
+@pytest.fixture
+def executor(client):
+    """Create a SearchExecutor with the mock client"""
+    return SearchExecutor(client, "Document")
+
+
+def test_reciprocal_rank_fusion_dedupes_and_weights():
+    """Test weighted RRF over both rankings"""
+    fused = reciprocal_rank_fusion(
+        [("a", 9.0), ("b", 1.0), ("a", 0.5)], [("b", 0.9), ("c", 0.8)], alpha=0.5, k=1
+    )
+    assert [doc_id for doc_id, _ in fused] == ["b", "a", "c"]
+    assert dict(fused)["b"] == pytest.approx(0.5 / 3 + 0.5 / 2)
+    assert dict(fused)["a"] == pytest.approx(0.5 / 2)
+    assert [
+        doc_id for doc_id, _ in reciprocal_rank_fusion([("a", 1.0)], [("c", 1.0)], alpha=1.0)
+    ] == ["c", "a"]
+
+
+def test_fuse_rejects_unknown_method():
+    """Test that an unknown fusion method raises ValueError"""
+    with pytest.raises(ValueError):
+        fuse([], [], method="borda")
+
+
+def test_parallel_hybrid_search_fuses_legs(executor, client):
+    """Test that both legs run with their own limits and are fused by ID"""
+    results = executor.parallel_hybrid_search(
+        "query", [0.1, 0.2], limit=3, bm25_limit=3, vector_limit=2
+    )
+    assert [r["_additional"]["id"] for r in results] == ["b", "a", "d"]
+    assert results[0]["content_title"] == "b"
+    limits = {
+        ("bm25" if "with_bm25" in b.calls else "vector"): b.calls["with_limit"]
+        for b in client.builders
+    }
+    assert limits == {"bm25": 3, "vector": 2}
+    assert not results.degraded
+
+
+def test_parallel_hybrid_search_relative_fusion(executor):
+    """Test normalized score fusion of the BM25 and certainty scores"""
+    results = executor.parallel_hybrid_search(
+        "query", [0.1, 0.2], limit=2, alpha=0.5, fusion="relative"
+    )
+    assert [r["_additional"]["id"] for r in results] == ["b", "a"]
+    assert results[0]["_additional"]["score"] == pytest.approx(0.5 * (3.0 - 1.0) / 6.5 + 0.5)
+
+
+def test_parallel_hybrid_search_deadline_returns_other_leg(executor, client):
+    """Test that a leg missing the deadline is dropped"""
+    client.slow = "vector"
+    results = executor.parallel_hybrid_search("query", [0.1, 0.2], limit=3, timeout=0.05)
+    assert [r["_additional"]["id"] for r in results] == ["a", "b", "c"]
+    assert results.degraded
+
+
+def test_parallel_hybrid_search_failed_leg(executor, client):
+    """Test that a failing leg is dropped"""
+    client.failing = "bm25"
+    results = executor.parallel_hybrid_search("query", [0.1, 0.2], limit=2)
+    assert [r["_additional"]["id"] for r in results] == ["b", "d"]
+    assert results.degraded
+
+
+def test_parallel_hybrid_search_alpha_skips_leg(executor, client):
+    """Test that alpha 0 or 1 runs a single leg"""
+    executor.parallel_hybrid_search("query", [0.1, 0.2], alpha=1.0)
+    assert len(client.builders) == 1 and "with_near_vector" in client.builders[0].calls
+    with pytest.raises(ValueError):
+        executor.parallel_hybrid_search("query", [0.1, 0.2], fusion="borda")
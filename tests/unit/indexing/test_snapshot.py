@@ -0,0 +1,97 @@
+"""Tests for offline index snapshots."""
+
+import threading
+import uuid
+from unittest.mock import MagicMock
+import numpy as np
+import pytest
+from src.indexing.document.snapshot import IndexSnapshot, SnapshotManifest
+
+SCHEMA = {"class": "Document", "properties": [{"name": "title"}, {"name": "page"}]}
+
+
+def make_objects(count):
+    return [
+        {
+            "id": str(uuid.UUID(int=i)),
+            "properties": {"title": f"doc {i}", "page": i},
+            "vector": [i / 10, 1.0, -i / 10] if i % 4 else None,
+        }
+        for i in range(count)
+    ]
+
+
+class LocalWeaviate:
+    """In-memory stand-in for the object, schema and batch endpoints"""
+
+    def __init__(self, objects):
+        self.objects = {obj["id"]: obj for obj in objects}
+        self.written = {}
+        self.classes = {"Document": SCHEMA}
+        self.lock = threading.Lock()
+        self.data_object = MagicMock()
+        self.data_object.get.side_effect = self.get
+        self.schema = MagicMock()
+        self.schema.get.side_effect = lambda name: self.classes[name]
+        self.schema.exists.side_effect = lambda name: name in self.classes
+        self.schema.create_class.side_effect = lambda schema: self.classes.update(
+            {schema["class"]: schema}
+        )
+        self._connection = MagicMock()
+        self._connection.post.side_effect = self.post
+
+    def get(self, class_name, limit, after, with_vector):
+        ids = sorted(self.objects)
+        start = 0 if after is None else ids.index(after) + 1
+        return {"objects": [self.objects[doc_id] for doc_id in ids[start : start + limit]]}
+
+    def post(self, path, weaviate_object):
+        with self.lock:
+            for obj in weaviate_object["objects"]:
+                self.written[obj["id"]] = obj
+        return MagicMock(
+            status_code=200,
+            json=MagicMock(
+                return_value=[{"id": obj["id"], "result": {}} for obj in weaviate_object["objects"]]
+            ),
+        )
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_snapshot_round_trip(tmp_path, compress):
+    """Test that a restore reproduces properties and vectors exactly"""
+    objects = make_objects(25)
+    client = LocalWeaviate(objects)
+    manifest = IndexSnapshot(client, "Document").create(
+        str(tmp_path), chunk_size=10, compress=compress
+    )
+    assert manifest.count == 25 and manifest.dimension == 3
+    assert [chunk["count"] for chunk in manifest.chunks] == [10, 10, 5]
+    vectors = manifest.chunks[0]["vectors"]
+    assert vectors.endswith(".npy.gz" if compress else ".npy")
+    if not compress:
+        assert np.load(tmp_path / vectors).dtype == np.float32
+    progress = []
+    result = IndexSnapshot(client, "Document", num_workers=3).restore(
+        str(tmp_path),
+        class_name="DocumentV2",
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert result == {"restored": 25, "failed": 0}
+    assert progress == [(10, 25), (20, 25), (25, 25)]
+    assert client.classes["DocumentV2"]["properties"] == SCHEMA["properties"]
+    for obj in objects:
+        written = client.written[obj["id"]]
+        assert written["class"] == "DocumentV2"
+        assert written["properties"] == obj["properties"]
+        if obj["vector"] is None:
+            assert "vector" not in written
+        else:
+            assert written["vector"] == pytest.approx(obj["vector"])
+
+
+def test_manifest_rejects_unknown_version(tmp_path):
+    """Test that snapshots of another format version are refused"""
+    SnapshotManifest(class_name="Document", version=99).save(str(tmp_path))
+    with pytest.raises(ValueError):
+        SnapshotManifest.load(str(tmp_path))
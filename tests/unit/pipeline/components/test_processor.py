@@ -1,4 +1,5 @@
 """Tests for the document processor component."""
+
 import logging
 from typing import List
 from unittest.mock import MagicMock, patch
@@ -8,59 +9,84 @@ from src.pipeline.components.processor import DocumentProcessor
 from src.pipeline.config.settings import PipelineConfig
 from src.utils.summarizer.config.settings import SummarizerConfig
 
+
 @pytest.fixture
 def config():
     """Create a test configuration."""
-    return PipelineConfig(export_dir='test_dir', batch_size=2, max_document_length=100, max_retries=2)
+    return PipelineConfig(
+        export_dir="test_dir", batch_size=2, max_document_length=100, max_retries=2, retry_backoff=0
+    )
+
 
 @pytest.fixture
 def mock_base_processor():
     """Create a mock base document processor."""
-    with patch('src.pipeline.components.processor.BaseDocProcessor') as mock:
+    with patch("src.pipeline.components.processor.BaseDocProcessor") as mock:
         instance = mock.return_value
         instance.batch_documents.side_effect = lambda docs, batch_size: [docs]
         instance.deduplicate_documents.side_effect = lambda docs: docs
         instance.logger = logging.getLogger(__name__)
         yield instance
 
+
 @pytest.fixture
 def mock_pii_detector():
     """Create a mock PII detector."""
-    with patch('src.pipeline.components.processor.PIIDetector') as mock:
+    with patch("src.pipeline.components.processor.PIIDetector") as mock:
         instance = mock.return_value
         instance.analyze_document.side_effect = lambda x: x
+        instance.analyze_documents.side_effect = lambda docs, **kwargs: docs
         yield instance
 
+
 @pytest.fixture
 def mock_summarizer():
     """Create a mock summarizer."""
-    with patch('src.pipeline.components.processor.SummarizerProcessor') as mock:
+    with patch("src.pipeline.components.processor.SummarizerProcessor") as mock:
         instance = mock.return_value
         instance.process_documents.side_effect = lambda docs, _: docs
         yield instance
 
+
 @pytest.fixture
 def mock_embedding_generator():
     """Create a mock embedding generator."""
-    with patch('src.pipeline.components.processor.EmbeddingGenerator') as mock:
+    with patch("src.pipeline.components.processor.EmbeddingGenerator") as mock:
         instance = mock.return_value
-        instance.generate_embeddings.side_effect = lambda docs: docs
+        instance.generate_embeddings_batch.side_effect = lambda docs: docs
         yield instance
 
+
 @pytest.fixture
 def mock_topic_clusterer():
     """Create a mock topic clusterer."""
-    with patch('src.pipeline.components.processor.TopicClusterer') as mock:
+    with patch("src.pipeline.components.processor.TopicClusterer") as mock:
         instance = mock.return_value
         instance.cluster_documents.side_effect = lambda docs, _: docs
         yield instance
 
+
 @pytest.fixture
-def processor(config, mock_base_processor, mock_pii_detector, mock_summarizer, mock_embedding_generator, mock_topic_clusterer):
+def processor(
+    config,
+    mock_base_processor,
+    mock_pii_detector,
+    mock_summarizer,
+    mock_embedding_generator,
+    mock_topic_clusterer,
+):
     """Create a test processor."""
     return DocumentProcessor(config=config)
 
-def test_processor_initialization(config, mock_base_processor, mock_pii_detector, mock_summarizer, mock_embedding_generator, mock_topic_clusterer):
+
+def test_processor_initialization(
+    config,
+    mock_base_processor,
+    mock_pii_detector,
+    mock_summarizer,
+    mock_embedding_generator,
+    mock_topic_clusterer,
+):
     """Test processor initialization."""
     processor = DocumentProcessor(config=config)
     assert processor.config == config
@@ -70,70 +96,230 @@ def test_processor_initialization(config, mock_base_processor, mock_pii_detector
     assert isinstance(processor.embedding_generator, MagicMock)
     assert isinstance(processor.topic_clusterer, MagicMock)
 
+
+def test_processor_passes_embedding_rate_limits(
+    mock_base_processor, mock_pii_detector, mock_summarizer, mock_topic_clusterer
+):
+    """Test that the embedding dispatcher limits come from the pipeline config."""
+    config = PipelineConfig(
+        export_dir="test_dir",
+        embedding_concurrency=8,
+        embedding_requests_per_minute=3000,
+        embedding_tokens_per_minute=1000000,
+    )
+    with patch("src.pipeline.components.processor.EmbeddingGenerator") as mock:
+        DocumentProcessor(config=config)
+    mock.assert_called_once_with(
+        max_concurrency=8, requests_per_minute=3000, tokens_per_minute=1000000
+    )
+
+
 def test_processor_process_empty(processor):
     """Test processing with no documents."""
     result = processor.process([])
     assert result == []
 
+
 def test_processor_process_deduplication(processor, mock_base_processor, mock_embedding_generator):
     """Test document deduplication."""
-    docs = [{'id': '1', 'content': {'body': 'test1'}}, {'id': '2', 'content': {'body': 'test2'}}]
+    docs = [{"id": "1", "content": {"body": "test1"}}, {"id": "2", "content": {"body": "test2"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
     mock_base_processor.deduplicate_documents.side_effect = lambda docs: [docs[0]]
-    mock_embedding_generator.generate_embeddings.side_effect = lambda docs: docs
+    mock_embedding_generator.generate_embeddings_batch.side_effect = lambda docs: docs
     result = processor.process(docs, deduplicate=True)
     assert len(result) == 1
-    assert result[0]['id'] == '1'
+    assert result[0]["id"] == "1"
     mock_base_processor.deduplicate_documents.assert_called_once_with(docs)
 
+
+def test_processor_records_skipped_duplicates(processor, mock_base_processor):
+    """Test that skipped exact duplicates are recorded with their canonical document."""
+    docs = [
+        {"id": "1", "content": {"body": "same"}},
+        {"id": "2", "content": {"body": "other"}},
+        {"id": "3", "content": {"body": " same "}},
+    ]
+    mock_base_processor.deduplicate_documents.side_effect = lambda docs: docs[:2]
+    assert processor.deduplicate_batch(docs) == docs[:2]
+    assert processor.skipped_duplicates == {"3": "1"}
+    processor.reset_skipped()
+    assert processor.skipped_duplicates == {}
+
+
 def test_processor_process_pii_detection(processor, mock_pii_detector, mock_base_processor):
     """Test PII detection."""
-    docs = [{'id': '1', 'content': {'body': 'test'}}]
+    docs = [{"id": "1", "content": {"body": "test"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
     processor.process(docs, detect_pii=True)
-    mock_pii_detector.analyze_document.assert_called_once_with(docs[0])
+    mock_pii_detector.analyze_documents.assert_called_once_with(docs, n_process=1, batch_size=32)
+
 
 def test_processor_process_summarization(processor, mock_summarizer, mock_base_processor):
     """Test document summarization."""
-    docs = [{'id': '1', 'content': {'body': 'test'}}]
+    docs = [{"id": "1", "content": {"body": "test"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
-    summary_config = SummarizerConfig(model_name='test-model')
+    summary_config = SummarizerConfig(model_name="test-model")
     processor.process(docs, summary_config=summary_config)
     mock_summarizer.process_documents.assert_called_once_with(docs, summary_config)
 
-def test_processor_process_embedding_generation(processor, mock_embedding_generator, mock_base_processor):
+
+def test_processor_process_embedding_generation(
+    processor, mock_embedding_generator, mock_base_processor
+):
     """Test embedding generation."""
-    docs = [{'content': {'body': 'test'}}]
+    docs = [{"content": {"body": "test"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
     processor.process(docs)
-    mock_embedding_generator.generate_embeddings.assert_called_once_with(docs)
+    mock_embedding_generator.generate_embeddings_batch.assert_called_once_with(docs)
+
 
 def test_processor_process_topic_clustering(processor, mock_topic_clusterer, mock_base_processor):
     """Test topic clustering."""
-    docs = [{'id': '1', 'content': {'body': 'test'}}]
+    docs = [{"id": "1", "content": {"body": "test"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
     cluster_config = ClusteringConfig()
     processor.process(docs, cluster_config=cluster_config)
     mock_topic_clusterer.cluster_documents.assert_called_once_with(docs, cluster_config)
 
+
 def test_processor_document_length_truncation(processor, mock_base_processor):
     """Test document length truncation."""
-    docs = [{'content': {'body': 'x' * 200}}]
+    docs = [{"content": {"body": "x" * 200}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
     result = processor.process(docs)
-    assert len(result[0]['content']['body']) == processor.config.max_document_length
+    assert len(result[0]["content"]["body"]) == processor.config.max_document_length
 
-def test_processor_embedding_generation_retries(processor, mock_embedding_generator, mock_base_processor):
+
+def test_processor_embedding_generation_retries(
+    processor, mock_embedding_generator, mock_base_processor
+):
     """Test embedding generation retries on failure."""
-    docs = [{'content': {'body': 'test'}}]
+    docs = [{"content": {"body": "test"}}]
     mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs]
-    mock_embedding_generator.generate_embeddings.side_effect = [Exception('First attempt'), docs]
+    mock_embedding_generator.generate_embeddings_batch.side_effect = [
+        Exception("First attempt"),
+        docs,
+    ]
     result = processor.process(docs)
     assert len(result) == 1
-    assert mock_embedding_generator.generate_embeddings.call_count == 2
+    assert mock_embedding_generator.generate_embeddings_batch.call_count == 2
+
+
+def test_processor_counts_documents_of_failed_batches(
+    processor, mock_summarizer, mock_base_processor
+):
+    """Test that documents of a batch failing a step are counted as dropped."""
+    docs = [{"id": str(i), "content": {"body": f"test{i}"}} for i in range(3)]
+    mock_base_processor.batch_documents.side_effect = lambda docs, _: [docs[:2], docs[2:]]
+    mock_summarizer.process_documents.side_effect = [Exception("model crashed"), docs[2:]]
+    result = processor.process(docs)
+    assert [doc["id"] for doc in result] == ["2"]
+    assert processor.dropped_documents == 2
+
 
 def test_processor_cleanup(processor, mock_summarizer, mock_topic_clusterer):
     """Test processor cleanup."""
     processor.cleanup()
     mock_summarizer.cleanup.assert_called_once()
-    mock_topic_clusterer.cleanup.assert_called_once()
\ No newline at end of file
+    mock_topic_clusterer.cleanup.assert_called_once()
+
+
+def test_processor_skips_near_duplicates_across_batches(
+    config,
+    tmp_path,
+    mock_base_processor,
+    mock_pii_detector,
+    mock_summarizer,
+    mock_embedding_generator,
+    mock_topic_clusterer,
+):
+    """Test that near-duplicates of earlier batches and runs skip processing."""
+    config.near_duplicate_threshold = 0.7
+    config.state_dir = tmp_path
+    body = " ".join((f"word{i}" for i in range(200)))
+    original = {
+        "id": "1",
+        "content": {"body": body},
+        "metadata": {"source": "notion", "path": "a.md"},
+    }
+    copy = {
+        "id": "2",
+        "content": {"body": body + " copied footer"},
+        "metadata": {"source": "notion", "path": "b.md"},
+    }
+    processor = DocumentProcessor(config=config)
+    assert processor.deduplicate_batch([original]) == [original]
+    assert processor.deduplicate_batch([copy]) == []
+    assert processor.skipped_near_duplicates == 1
+    processor.commit_near_duplicates([original])
+    processor.save_state()
+    rerun = DocumentProcessor(config=config)
+    assert rerun.near_duplicates.links["2"][0] == "1"
+    assert rerun.skipped_near_duplicates == 0
+    assert rerun.deduplicate_batch([dict(original, id="3")])[0]["id"] == "3"
+    assert rerun.deduplicate_batch([dict(copy, id="4")]) == []
+    assert rerun.near_duplicates.links["4"][0] == "3"
+    assert rerun.skipped_near_duplicates == 1
+    assert rerun.skipped_duplicates == {"4": "3"}
+
+
+def test_processor_rolls_back_canonicals_that_were_not_indexed(
+    config,
+    tmp_path,
+    mock_base_processor,
+    mock_pii_detector,
+    mock_summarizer,
+    mock_embedding_generator,
+    mock_topic_clusterer,
+):
+    """Test that a dropped canonical does not hide its duplicates in the next run."""
+    config.near_duplicate_threshold = 0.7
+    config.state_dir = tmp_path
+    body = " ".join((f"word{i}" for i in range(200)))
+    original = {
+        "id": "1",
+        "content": {"body": body},
+        "metadata": {"source": "notion", "path": "a.md"},
+    }
+    copy = {
+        "id": "2",
+        "content": {"body": body + " copied footer"},
+        "metadata": {"source": "notion", "path": "b.md"},
+    }
+    processor = DocumentProcessor(config=config)
+    assert processor.deduplicate_batch([original, copy]) == [original]
+    processor.save_state()
+    assert len(processor.near_duplicates) == 0
+    assert processor.near_duplicates.links == {}
+    rerun = DocumentProcessor(config=config)
+    assert rerun.deduplicate_batch([copy]) == [copy]
+
+
+def test_processor_near_duplicates_with_shared_source_key(
+    config,
+    tmp_path,
+    mock_base_processor,
+    mock_pii_detector,
+    mock_summarizer,
+    mock_embedding_generator,
+    mock_topic_clusterer,
+):
+    """Test that rows sharing a source key are not treated as the same page."""
+    config.near_duplicate_threshold = 0.7
+    config.state_dir = tmp_path
+    body = " ".join((f"word{i}" for i in range(200)))
+    rows = [
+        {
+            "id": str(i),
+            "content": {"body": body + suffix},
+            "metadata": {"source": "notion", "path": "table.csv", "title": "Untitled"},
+        }
+        for i, suffix in enumerate(["", " second row"])
+    ]
+    processor = DocumentProcessor(config=config)
+    assert processor.deduplicate_batch(rows) == [rows[0]]
+    assert [row["source_key"] for row in rows] == [
+        "notion:table.csv:Untitled#1",
+        "notion:table.csv:Untitled#2",
+    ]
+    assert processor.near_duplicates.links["1"][0] == "0"
@@ -0,0 +1,65 @@
+"""Tests for per-batch pipeline checkpoints."""
+
+import numpy as np
+import pytest
+from src.pipeline.checkpoint import CheckpointStore, batch_fingerprint
+
+
+def _doc(body):
+    return {"id": "random", "content": {"body": body}, "metadata": {"source": "notion"}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Checkpoint store in a temporary directory."""
+    return CheckpointStore(tmp_path / "checkpoints")
+
+
+def test_fingerprint_ignores_ids_but_not_content():
+    """Test that batch fingerprints depend on content and order only."""
+    batch = [_doc("alpha"), _doc("beta")]
+    other_ids = [dict(doc, id="other") for doc in batch]
+    assert batch_fingerprint(batch) == batch_fingerprint(other_ids)
+    assert batch_fingerprint(batch) != batch_fingerprint(batch[::-1])
+    assert batch_fingerprint(batch) != batch_fingerprint([_doc("alpha"), _doc("gamma")])
+
+
+def test_save_and_resume_last_stage(store):
+    """Test that a resumed run sees the last completed stage of each batch."""
+    fingerprint = batch_fingerprint([_doc("alpha")])
+    assert store.open({"stages": ["summarize", "embed"]}) is False
+    store.save(0, fingerprint, "summarize", [_doc("alpha")])
+    embedded = dict(_doc("alpha"), embeddings={"body": np.array([0.5, 0.25])})
+    store.save(0, fingerprint, "embed", [embedded])
+    assert store.open({"stages": ["summarize", "embed"]}, resume=True) is True
+    stage, documents = store.load(0, fingerprint)
+    assert stage == "embed"
+    assert documents[0]["embeddings"]["body"] == [0.5, 0.25]
+    assert store.load(1, fingerprint) is None
+
+
+def test_changed_batch_input_ignores_checkpoint(store):
+    """Test that a checkpoint is not reused for different batch content."""
+    store.open({"stages": ["embed"]})
+    store.save(0, batch_fingerprint([_doc("alpha")]), "embed", [_doc("alpha")])
+    assert store.load(0, batch_fingerprint([_doc("edited")])) is None
+
+
+def test_different_signature_starts_over(store):
+    """Test that checkpoints of a differently configured run are discarded."""
+    fingerprint = batch_fingerprint([_doc("alpha")])
+    store.open({"stages": ["embed"], "batch_size": 10})
+    store.save(0, fingerprint, "embed", [_doc("alpha")])
+    assert store.open({"stages": ["embed"], "batch_size": 20}, resume=True) is False
+    assert store.load(0, fingerprint) is None
+
+
+def test_open_without_resume_clears_checkpoints(store):
+    """Test that a fresh run removes checkpoints of an earlier run."""
+    fingerprint = batch_fingerprint([_doc("alpha")])
+    store.open({"stages": ["embed"]})
+    store.save(0, fingerprint, "embed", [_doc("alpha")])
+    store.open({"stages": ["embed"]})
+    assert store.load(0, fingerprint) is None
+    store.clear()
+    assert not store.directory.exists()
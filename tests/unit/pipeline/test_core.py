@@ -2,28 +2,54 @@ import os
 from unittest.mock import Mock, patch
 import pandas as pd
 import pytest
-from src.pipeline.core import DocumentSummarizer, EmbeddingGenerator, Pipeline, TopicClusterer, VectorIndex
+from src.pipeline.core import (
+    DocumentSummarizer,
+    EmbeddingGenerator,
+    Pipeline,
+    TopicClusterer,
+    VectorIndex,
+)
 from src.pipeline.steps import PipelineStep
 
+
 @pytest.fixture
 def mock_components():
     """Create mock components used by the pipeline"""
-    return {'notion': Mock(), 'processor': Mock(), 'indexer': Mock(), 'doc_ops': Mock(), 'search_ops': Mock()}
+    return {
+        "notion": Mock(),
+        "processor": Mock(dropped_documents=0, skipped_duplicates={}),
+        "indexer": Mock(),
+        "doc_ops": Mock(),
+        "search_ops": Mock(),
+    }
+
 
 @pytest.fixture
 def pipeline_with_mocks(mock_components, tmp_path):
     """Create a pipeline instance with mocked components"""
-    with patch('src.pipeline.core.NotionConnector', return_value=mock_components['notion']), patch('src.pipeline.core.DocumentProcessor', return_value=mock_components['processor']), patch('src.pipeline.core.DocumentIndexer', return_value=mock_components['indexer']), patch('src.pipeline.core.DocumentOperations', return_value=mock_components['doc_ops']), patch('src.pipeline.core.SearchOperations', return_value=mock_components['search_ops']):
-        export_dir = tmp_path / 'notion_export'
+    with patch("src.pipeline.core.NotionConnector", return_value=mock_components["notion"]), patch(
+        "src.pipeline.core.DocumentProcessor", return_value=mock_components["processor"]
+    ), patch("src.pipeline.core.DocumentIndexer", return_value=mock_components["indexer"]), patch(
+        "src.pipeline.core.DocumentOperations", return_value=mock_components["doc_ops"]
+    ), patch(
+        "src.pipeline.core.SearchOperations", return_value=mock_components["search_ops"]
+    ):
+        export_dir = tmp_path / "notion_export"
         export_dir.mkdir()
-        pipeline = Pipeline(export_dir=str(export_dir), index_url='http://localhost:8080', log_dir=str(tmp_path / 'logs'), batch_size=100)
+        pipeline = Pipeline(
+            export_dir=str(export_dir),
+            index_url="http://localhost:8080",
+            log_dir=str(tmp_path / "logs"),
+            batch_size=100,
+        )
         pipeline._mocks = mock_components
         return pipeline
 
+
 def test_pipeline_initialization(pipeline_with_mocks, tmp_path):
     """Test that pipeline initializes with valid configuration"""
     pipeline = pipeline_with_mocks
-    log_dir = tmp_path / 'logs'
+    log_dir = tmp_path / "logs"
     assert log_dir.exists()
     assert pipeline.doc_processor is not None
     assert pipeline.notion is not None
@@ -35,99 +61,350 @@ def test_pipeline_initialization(pipeline_with_mocks, tmp_path):
     assert pipeline.search_ops is not None
     assert pipeline.doc_ops is not None
 
+
 def test_pipeline_initialization_invalid_export_dir():
     """Test pipeline initialization with non-existent export directory"""
     with pytest.raises(Exception):
-        Pipeline(export_dir='/nonexistent/path')
+        Pipeline(export_dir="/nonexistent/path")
+
 
 def test_full_pipeline_execution(pipeline_with_mocks):
     """Test full pipeline execution with all steps"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mock_docs = [{'content': {'body': 'Test document 1'}}, {'content': {'body': 'Test document 2'}}]
-    mocks['notion'].load_csv_files.return_value = {'test.csv': pd.DataFrame()}
-    mocks['notion'].normalize_data.return_value = mock_docs
-    mocks['processor'].process.return_value = mock_docs
-    mocks['indexer'].process.return_value = mock_docs
+    mock_docs = [{"content": {"body": "Test document 1"}}, {"content": {"body": "Test document 2"}}]
+    mocks["notion"].load_csv_files.return_value = {"test.csv": pd.DataFrame()}
+    mocks["notion"].normalize_data.return_value = mock_docs
+    mocks["processor"].process.return_value = mock_docs
+    mocks["indexer"].process.return_value = mock_docs
     result = pipeline.process_documents()
     assert len(result) == 2
-    mocks['notion'].load_csv_files.assert_called_once()
-    mocks['notion'].normalize_data.assert_called_once()
-    mocks['processor'].process.assert_called_once()
-    mocks['indexer'].process.assert_called_once()
+    mocks["notion"].load_csv_files.assert_called_once()
+    mocks["notion"].normalize_data.assert_called_once()
+    mocks["processor"].process.assert_called_once()
+    mocks["indexer"].process.assert_called_once()
+
 
 def test_partial_pipeline_execution(pipeline_with_mocks):
     """Test pipeline execution with only specific steps"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mock_docs = [{'content': {'body': 'Test document 1', 'title': 'Test 1'}}]
-    mocks['notion'].load_csv_files.return_value = {'test.csv': 'mock_dataframe'}
-    mocks['notion'].normalize_data.return_value = mock_docs
-    mocks['doc_processor'].batch_documents.return_value = [mock_docs]
+    mock_docs = [{"content": {"body": "Test document 1", "title": "Test 1"}}]
+    mocks["notion"].load_csv_files.return_value = {"test.csv": "mock_dataframe"}
+    mocks["notion"].normalize_data.return_value = mock_docs
+    mocks["doc_processor"].batch_documents.return_value = [mock_docs]
     steps = {PipelineStep.LOAD, PipelineStep.SUMMARIZE}
     pipeline.process_documents(steps=steps)
-    mocks['notion'].load_csv_files.assert_called_once()
-    mocks['notion'].normalize_data.assert_called_once()
-    mocks['notion'].normalize_data.assert_called_once()
-    mocks['summarizer'].process_documents.assert_called_once()
-    mocks['pii_detector'].analyze_document.assert_not_called()
-    mocks['embedding_generator'].generate_embeddings.assert_not_called()
-    mocks['topic_clusterer'].cluster_documents.assert_not_called()
-    mocks['vector_index'].add_documents.assert_not_called()
+    mocks["notion"].load_csv_files.assert_called_once()
+    mocks["notion"].normalize_data.assert_called_once()
+    mocks["notion"].normalize_data.assert_called_once()
+    mocks["summarizer"].process_documents.assert_called_once()
+    mocks["pii_detector"].analyze_document.assert_not_called()
+    mocks["embedding_generator"].generate_embeddings.assert_not_called()
+    mocks["topic_clusterer"].cluster_documents.assert_not_called()
+    mocks["vector_index"].add_documents.assert_not_called()
+
 
 def test_pipeline_error_handling(pipeline_with_mocks):
     """Test pipeline error handling during execution"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mocks['notion'].load_csv_files.side_effect = Exception('Test error')
+    mocks["notion"].load_csv_files.side_effect = Exception("Test error")
     with pytest.raises(Exception) as exc_info:
         pipeline.process_documents()
-    assert 'Test error' in str(exc_info.value)
+    assert "Test error" in str(exc_info.value)
+
 
 def test_empty_document_handling(pipeline_with_mocks):
     """Test handling of empty or invalid documents"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mock_docs = [{'content': {'body': '', 'title': 'Empty'}}, {'content': {'body': '   ', 'title': 'Whitespace'}}, {'content': {'body': 'Valid', 'title': 'Valid'}}]
-    mocks['notion'].load_csv_files.return_value = {'test.csv': 'mock_dataframe'}
-    mocks['notion'].normalize_data.return_value = mock_docs
-    mocks['doc_processor'].batch_documents.side_effect = lambda x, _: [x]
+    mock_docs = [
+        {"content": {"body": "", "title": "Empty"}},
+        {"content": {"body": "   ", "title": "Whitespace"}},
+        {"content": {"body": "Valid", "title": "Valid"}},
+    ]
+    mocks["notion"].load_csv_files.return_value = {"test.csv": "mock_dataframe"}
+    mocks["notion"].normalize_data.return_value = mock_docs
+    mocks["doc_processor"].batch_documents.side_effect = lambda x, _: [x]
     result = pipeline.process_documents(steps={PipelineStep.LOAD})
     assert len(result) == 1
-    assert result[0]['content']['body'] == 'Valid'
+    assert result[0]["content"]["body"] == "Valid"
+
 
 def test_document_batching(pipeline_with_mocks):
     """Test document processing in batches"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mock_docs = [{'content': {'body': f'Doc {i}', 'title': f'Title {i}'}} for i in range(150)]
-    mocks['notion'].load_csv_files.return_value = {'test.csv': 'mock_dataframe'}
-    mocks['notion'].normalize_data.return_value = mock_docs
+    mock_docs = [{"content": {"body": f"Doc {i}", "title": f"Title {i}"}} for i in range(150)]
+    mocks["notion"].load_csv_files.return_value = {"test.csv": "mock_dataframe"}
+    mocks["notion"].normalize_data.return_value = mock_docs
     batch1 = mock_docs[:100]
     batch2 = mock_docs[100:]
-    mocks['doc_processor'].batch_documents.return_value = [batch1, batch2]
+    mocks["doc_processor"].batch_documents.return_value = [batch1, batch2]
     pipeline.process_documents(steps={PipelineStep.LOAD, PipelineStep.INDEX})
-    assert mocks['vector_index'].add_documents.call_count == 2
+    assert mocks["vector_index"].add_documents.call_count == 2
+
 
 def test_search_delegation(pipeline_with_mocks):
     """Test search operations are properly delegated"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    expected_result = [{'id': '1', 'score': 0.9}]
-    mocks['search_ops'].search.return_value = expected_result
-    result = pipeline.search(query='test')
-    mocks['search_ops'].search.assert_called_once_with(query='test')
+    expected_result = [{"id": "1", "score": 0.9}]
+    mocks["search_ops"].search.return_value = expected_result
+    result = pipeline.search(query="test")
+    mocks["search_ops"].search.assert_called_once_with(query="test")
     assert result == expected_result
 
+
 def test_document_operations_delegation(pipeline_with_mocks):
     """Test document operations are properly delegated"""
     pipeline = pipeline_with_mocks
     mocks = pipeline._mocks
-    mocks['doc_ops'].update_document.return_value = True
-    mocks['doc_ops'].delete_documents.return_value = True
-    update_result = pipeline.update_document(doc_id='1', content='Updated content')
-    delete_result = pipeline.delete_documents(doc_ids=['1', '2'])
-    mocks['doc_ops'].update_document.assert_called_once_with(doc_id='1', content='Updated content')
-    mocks['doc_ops'].delete_documents.assert_called_once_with(doc_ids=['1', '2'])
+    mocks["doc_ops"].update_document.return_value = True
+    mocks["doc_ops"].delete_documents.return_value = {"1": "deleted", "2": "failed"}
+    update_result = pipeline.update_document(doc_id="1", content="Updated content")
+    delete_result = pipeline.delete_documents(doc_ids=["1", "2"])
+    mocks["doc_ops"].update_document.assert_called_once_with(doc_id="1", content="Updated content")
+    mocks["doc_ops"].delete_documents.assert_called_once_with(["1", "2"])
     assert update_result is True
-    assert delete_result is True
\ No newline at end of file
+    assert delete_result == {"1": "deleted", "2": "failed"}
+
+
+def test_delete_documents_returns_outcome_per_id(pipeline_with_mocks):
+    """Test that deletion reports the outcome of every document ID"""
+    pipeline = pipeline_with_mocks
+    mocks = pipeline._mocks
+    outcomes = {"1": "deleted", "2": "not_found", "3": "failed"}
+    mocks["doc_ops"].delete_documents.return_value = outcomes
+    assert pipeline.delete_documents(["1", "2", "3"]) == outcomes
+    mocks["doc_ops"].delete_documents.assert_called_once_with(["1", "2", "3"])
+    mocks["search_ops"].invalidate.assert_called_once()
+
+
+def test_delete_by_filter_delegation(pipeline_with_mocks):
+    """Test filter deletion is delegated to document operations"""
+    pipeline = pipeline_with_mocks
+    mocks = pipeline._mocks
+    where = {"path": ["parent_id"], "operator": "Equal", "valueText": "workspace"}
+    mocks["doc_ops"].delete_by_filter.return_value = {"1": "deleted"}
+    assert pipeline.delete_by_filter(where) == {"1": "deleted"}
+    mocks["doc_ops"].delete_by_filter.assert_called_once_with(where, dry_run=False)
+
+
+def test_index_changes_invalidate_search_cache(pipeline_with_mocks):
+    """Test that updates and deletes invalidate cached search results"""
+    pipeline = pipeline_with_mocks
+    mocks = pipeline._mocks
+    pipeline.delete_by_filter(
+        {"path": ["parent_id"], "operator": "Equal", "valueText": "x"}, dry_run=True
+    )
+    mocks["search_ops"].invalidate.assert_not_called()
+    pipeline.update_document(doc_id="1", content="Updated content")
+    pipeline.delete_documents(["1"])
+    assert mocks["search_ops"].invalidate.call_count == 2
+
+
+def test_checkpointed_run_resumes_after_failed_batch(pipeline_with_mocks, tmp_path):
+    """Test that a resumed run only repeats the stages a batch did not complete"""
+    from src.pipeline.errors import EmbeddingError
+    from src.pipeline.streaming import StreamStage
+
+    pipeline = pipeline_with_mocks
+    pipeline.config.state_dir = tmp_path / "state"
+    pipeline.config.batch_size = 1
+    pipeline.processor.doc_processor.batch_documents.side_effect = lambda docs, size: [
+        docs[i : i + size] for i in range(0, len(docs), size)
+    ]
+    calls = {"summarize": 0, "embed": 0}
+    fail = {"body": "second"}
+
+    def summarize(batch):
+        calls["summarize"] += 1
+        return [dict(doc, summary="s") for doc in batch]
+
+    def embed(batch):
+        calls["embed"] += 1
+        if batch[0]["content"]["body"] == fail["body"]:
+            raise EmbeddingError("quota exceeded")
+        return [dict(doc, embedding=[0.1]) for doc in batch]
+
+    stages = [StreamStage("summarize", summarize), StreamStage("embed", embed)]
+    docs = [{"content": {"body": "first"}}, {"content": {"body": "second"}}]
+    first = pipeline._process_with_checkpoints(
+        docs, stages, {"stages": ["summarize", "embed"]}, resume=False
+    )
+    assert [doc["content"]["body"] for doc in first] == ["first"]
+    assert calls == {"summarize": 2, "embed": 2}
+    assert pipeline.dropped_documents == 1
+    fail["body"] = None
+    resumed = pipeline._process_with_checkpoints(
+        docs, stages, {"stages": ["summarize", "embed"]}, resume=True
+    )
+    assert [doc["content"]["body"] for doc in resumed] == ["first", "second"]
+    assert calls == {"summarize": 2, "embed": 3}
+    assert not (tmp_path / "state" / "checkpoints").exists()
+
+
+def test_checkpointed_run_reindexes_after_failed_indexing(pipeline_with_mocks, tmp_path):
+    """Test that a batch the index rejected keeps its checkpoint and is re-indexed on resume"""
+    from src.pipeline.components.indexer import DocumentIndexer
+    from src.pipeline.streaming import StreamStage
+
+    pipeline = pipeline_with_mocks
+    pipeline.config.state_dir = tmp_path / "state"
+    pipeline.processor.doc_processor.batch_documents.side_effect = lambda docs, size: [docs]
+    with patch("src.pipeline.components.indexer.VectorIndex") as vector_index:
+        pipeline.indexer = DocumentIndexer(config=pipeline.config, logger=pipeline.logger)
+    vector_index.return_value.add_documents.side_effect = Exception("connection refused")
+    calls = {"embed": 0}
+
+    def embed(batch):
+        calls["embed"] += 1
+        return [dict(doc, embedding=[0.1]) for doc in batch]
+
+    stages = [StreamStage("embed", embed), StreamStage("index", pipeline._index_batch)]
+    signature = {"stages": ["embed", "index"]}
+    docs = [{"id": "1", "content": {"body": "first"}}, {"id": "2", "content": {"body": "second"}}]
+    assert pipeline._process_with_checkpoints(docs, stages, signature, resume=False) == []
+    assert pipeline.dropped_documents == 2
+    assert (tmp_path / "state" / "checkpoints").exists()
+
+    pipeline.dropped_documents = 0
+    vector_index.return_value.add_documents.side_effect = lambda batch, deduplicate=False: [
+        doc["id"] for doc in batch
+    ]
+    resumed = pipeline._process_with_checkpoints(docs, stages, signature, resume=True)
+    assert [doc["id"] for doc in resumed] == ["1", "2"]
+    assert calls["embed"] == 1
+    assert pipeline.dropped_documents == 0
+    assert not (tmp_path / "state" / "checkpoints").exists()
+
+
+def test_guard_stage_counts_dropped_documents(pipeline_with_mocks):
+    """Test that a batch failing a streamed stage is dropped and counted"""
+    from src.pipeline.errors import EmbeddingError
+    from src.pipeline.streaming import StreamStage
+
+    pipeline = pipeline_with_mocks
+
+    def embed(batch):
+        raise EmbeddingError("quota exceeded")
+
+    stage = pipeline._guard_stage(StreamStage("embed", embed))
+    assert stage.func([{"id": "1"}, {"id": "2"}]) == []
+    assert pipeline.dropped_documents == 2
+
+
+def test_unindexed_documents_are_counted_as_dropped(pipeline_with_mocks):
+    """Test that documents the indexer did not write are counted as dropped"""
+    pipeline = pipeline_with_mocks
+    mocks = pipeline._mocks
+    docs = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    mocks["indexer"].process.return_value = docs[:1]
+    assert pipeline._index_batch(docs) == docs[:1]
+    assert pipeline.dropped_documents == 2
+
+
+def test_incremental_rerun_skips_unchanged_documents(pipeline_with_mocks, tmp_path):
+    """Test that a second incremental run only re-indexes changed or unwritten documents"""
+    from src.pipeline.components.indexer import DocumentIndexer
+
+    pipeline = pipeline_with_mocks
+    pipeline.config.state_dir = tmp_path / "state"
+    with patch("src.pipeline.components.indexer.VectorIndex") as vector_index:
+        pipeline.indexer = DocumentIndexer(config=pipeline.config, logger=pipeline.logger)
+    written, rejected = [], set()
+
+    def add_documents(docs, deduplicate=False):
+        written.append({doc["content"]["body"]: doc["id"] for doc in docs})
+        return [doc["id"] for doc in docs if doc["content"]["body"] not in rejected]
+
+    vector_index.return_value.add_documents.side_effect = add_documents
+
+    def load(bodies):
+        return [
+            {
+                "content": {"body": body},
+                "metadata": {"source": "notion", "path": f"{title}.md", "title": title},
+            }
+            for title, body in bodies.items()
+        ]
+
+    steps = {PipelineStep.LOAD, PipelineStep.INDEX}
+    rejected.add("third")
+    pipeline.loader.process = Mock(return_value=load({"a": "first", "b": "second", "c": "third"}))
+    first = pipeline.process_documents(steps=steps, incremental=True)
+    assert [doc["content"]["body"] for doc in first] == ["first", "second"]
+    rejected.clear()
+    pipeline._manifest = None
+    pipeline.loader.process = Mock(return_value=load({"a": "first", "b": "changed", "c": "third"}))
+    second = pipeline.process_documents(steps=steps, incremental=True)
+    assert [doc["content"]["body"] for doc in second] == ["changed", "third"]
+    assert written[1] == {"changed": written[0]["second"], "third": written[0]["third"]}
+
+
+def test_pruned_sources_leave_the_near_duplicate_index(pipeline_with_mocks, tmp_path):
+    """Test that pruning a deleted source stops it from hiding later copies"""
+    from src.utils.near_duplicates import NearDuplicateIndex
+
+    pipeline = pipeline_with_mocks
+    pipeline.config.state_dir = tmp_path / "state"
+    near_duplicates = NearDuplicateIndex(threshold=0.8)
+    pipeline.processor.near_duplicates = near_duplicates
+    pipeline.indexer.process.side_effect = lambda docs, deduplicate=False: docs
+    pipeline.delete_documents = Mock(side_effect=lambda ids: dict.fromkeys(ids, "deleted"))
+    bodies = {"a": "alpha " * 50, "b": "beta " * 50}
+
+    def load(titles):
+        return [
+            {
+                "content": {"body": bodies[title]},
+                "metadata": {"source": "notion", "path": f"{title}.md", "title": title},
+            }
+            for title in titles
+        ]
+
+    steps = {PipelineStep.LOAD, PipelineStep.INDEX}
+    pipeline.loader.process = Mock(return_value=load(["a", "b"]))
+    first = pipeline.process_documents(steps=steps, incremental=True)
+    for doc in first:
+        near_duplicates.check(doc["source_key"], doc["id"], doc["content"]["body"])
+    near_duplicates.commit([doc["source_key"] for doc in first])
+    pipeline.loader.process = Mock(return_value=load(["a"]))
+    pipeline.process_documents(steps=steps, incremental=True, prune_deleted=True)
+    assert pipeline.deleted_sources == {}
+    assert len(near_duplicates) == 1
+    assert near_duplicates.check("copy", "doc-copy", bodies["b"]) is None
+
+
+def test_sources_that_failed_to_delete_are_kept_for_the_next_prune(pipeline_with_mocks, tmp_path):
+    """Test that pruning only forgets sources whose documents were deleted"""
+    pipeline = pipeline_with_mocks
+    pipeline.config.state_dir = tmp_path / "state"
+    pipeline.indexer.process.side_effect = lambda docs, deduplicate=False: docs
+
+    def load(titles):
+        return [
+            {
+                "content": {"body": f"{title} body"},
+                "metadata": {"source": "notion", "path": f"{title}.md", "title": title},
+            }
+            for title in titles
+        ]
+
+    steps = {PipelineStep.LOAD, PipelineStep.INDEX}
+    pipeline.loader.process = Mock(return_value=load(["a", "b", "c"]))
+    first = {
+        doc["metadata"]["title"]: doc["id"]
+        for doc in pipeline.process_documents(steps=steps, incremental=True)
+    }
+    pipeline._mocks["doc_ops"].delete_documents.return_value = {
+        first["b"]: "deleted",
+        first["c"]: "failed",
+    }
+    pipeline.loader.process = Mock(return_value=load(["a"]))
+    pipeline.process_documents(steps=steps, incremental=True, prune_deleted=True)
+    pipeline._mocks["doc_ops"].delete_documents.assert_called_once()
+    assert list(pipeline.deleted_sources.values()) == [first["c"]]
+    assert list(pipeline.manifest.deleted_sources().values()) == [first["c"]]
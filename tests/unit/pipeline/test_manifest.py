@@ -0,0 +1,224 @@
+"""Tests for the incremental run manifest."""
+
+import pytest
+from src.pipeline.manifest import DocumentManifest, content_hash, stable_document_id
+
+
+def _doc(path, title, body):
+    return {
+        "id": "random",
+        "content": {"body": body, "summary": None},
+        "metadata": {"source": "notion", "path": path, "title": title},
+    }
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    """Location of a manifest file."""
+    return tmp_path / "state" / "manifest.json"
+
+
+def _run(path, documents, versions=None):
+    manifest = DocumentManifest(path)
+    manifest.start_run(versions or {"EMBED": "v1:model"})
+    changed = manifest.select_changed(documents)
+    manifest.record(changed)
+    deleted = manifest.deleted_sources()
+    manifest.save()
+    return (changed, deleted)
+
+
+def test_first_run_processes_everything_with_stable_ids(manifest_path):
+    """Test that a first run selects all documents and assigns stable IDs."""
+    docs = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "beta")]
+    changed, deleted = _run(manifest_path, docs)
+    assert changed == docs
+    assert deleted == {}
+    assert docs[0]["id"] == stable_document_id("notion:a.md:A")
+    assert manifest_path.exists()
+
+
+def test_unchanged_documents_are_skipped(manifest_path):
+    """Test that a rerun over identical content selects nothing."""
+    _run(manifest_path, [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "beta")])
+    rerun = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "beta")]
+    changed, _ = _run(manifest_path, rerun)
+    assert changed == []
+    assert rerun[0]["id"] == stable_document_id("notion:a.md:A")
+
+
+def test_changed_documents_keep_their_id(manifest_path):
+    """Test that edited documents are reprocessed under the same ID."""
+    first = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "beta")]
+    _run(manifest_path, first)
+    rerun = [_doc("a.md", "A", "alpha v2"), _doc("b.md", "B", "beta")]
+    changed, _ = _run(manifest_path, rerun)
+    assert [doc["id"] for doc in changed] == [first[0]["id"]]
+
+
+def test_step_version_change_reprocesses(manifest_path):
+    """Test that a new step version invalidates previous outputs."""
+    _run(manifest_path, [_doc("a.md", "A", "alpha")], {"EMBED": "v1:small"})
+    changed, _ = _run(manifest_path, [_doc("a.md", "A", "alpha")], {"EMBED": "v1:large"})
+    assert len(changed) == 1
+    changed, _ = _run(
+        manifest_path, [_doc("a.md", "A", "alpha")], {"EMBED": "v1:large", "INDEX": "v1:Document"}
+    )
+    assert len(changed) == 1
+
+
+def test_unrecorded_documents_are_retried(manifest_path):
+    """Test that documents which failed processing are selected again."""
+    manifest = DocumentManifest(manifest_path)
+    manifest.start_run({"EMBED": "v1"})
+    manifest.select_changed([_doc("a.md", "A", "alpha")])
+    manifest.save()
+    changed, _ = _run(manifest_path, [_doc("a.md", "A", "alpha")], {"EMBED": "v1"})
+    assert len(changed) == 1
+
+
+def test_deleted_sources_are_reported_until_forgotten(manifest_path):
+    """Test reporting and forgetting of removed sources."""
+    first = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "beta")]
+    _run(manifest_path, first)
+    _, deleted = _run(manifest_path, [_doc("a.md", "A", "alpha")])
+    assert deleted == {"notion:b.md:B": first[1]["id"]}
+    manifest = DocumentManifest(manifest_path)
+    manifest.forget(list(deleted))
+    manifest.save()
+    _, deleted = _run(manifest_path, [_doc("a.md", "A", "alpha")])
+    assert deleted == {}
+
+
+def _row(title, body, created):
+    doc = _doc("table.csv", title, body)
+    doc["metadata"]["timestamp_utc"] = created
+    return doc
+
+
+def test_repeated_source_keys_are_disambiguated(manifest_path):
+    """Test that rows sharing a source key get distinct stable IDs."""
+    docs = [_row("Untitled", "one", "2024-01-01"), _row("Untitled", "two", "2024-01-02")]
+    changed, _ = _run(manifest_path, docs)
+    assert len({doc["id"] for doc in changed}) == 2
+    assert all(doc["source_key"].startswith("notion:table.csv:Untitled#") for doc in changed)
+    rerun = [_row("Untitled", "one", "2024-01-01"), _row("Untitled", "two", "2024-01-02")]
+    changed, deleted = _run(manifest_path, rerun)
+    assert changed == []
+    assert deleted == {}
+
+
+def test_reordered_rows_keep_their_ids(manifest_path):
+    """Test that IDs of rows sharing a source key do not depend on the row order."""
+    first = [_row("Untitled", "one", "2024-01-01"), _row("Untitled", "two", "2024-01-02")]
+    _run(manifest_path, first)
+    rerun = [_row("Untitled", "two", "2024-01-02"), _row("Untitled", "one", "2024-01-01")]
+    changed, deleted = _run(manifest_path, rerun)
+    assert changed == []
+    assert deleted == {}
+    assert [doc["id"] for doc in rerun] == [first[1]["id"], first[0]["id"]]
+
+
+def test_rows_without_tie_breaker_are_always_reprocessed(manifest_path, caplog):
+    """Test that rows that cannot be told apart are reprocessed with a warning."""
+    docs = [_doc("table.csv", "Untitled", "one"), _doc("table.csv", "Untitled", "two")]
+    changed, _ = _run(manifest_path, docs)
+    assert [doc["source_key"] for doc in changed] == [
+        "notion:table.csv:Untitled#1",
+        "notion:table.csv:Untitled#2",
+    ]
+    assert "Cannot tell apart documents" in caplog.text
+    rerun = [_doc("table.csv", "Untitled", "two"), _doc("table.csv", "Untitled", "one")]
+    changed, deleted = _run(manifest_path, rerun)
+    assert changed == rerun
+    assert deleted == {}
+
+
+def test_key_shared_across_batches_is_suffixed_in_later_runs(manifest_path):
+    """Test that a base key first shared in a later batch gets suffixed on the next run."""
+
+    def run(batches):
+        manifest = DocumentManifest(manifest_path)
+        manifest.start_run({"EMBED": "v1:model"})
+        for batch in batches:
+            manifest.record(manifest.select_changed(batch))
+        deleted = manifest.deleted_sources()
+        manifest.save()
+        return deleted
+
+    one, two = _row("Untitled", "one", "2024-01-01"), _row("Untitled", "two", "2024-01-02")
+    run([[one], [two]])
+    assert one["source_key"] == "notion:table.csv:Untitled"
+    first_two = two["id"]
+    one, two = _row("Untitled", "one", "2024-01-01"), _row("Untitled", "two", "2024-01-02")
+    deleted = run([[two], [one]])
+    assert two["id"] == first_two
+    assert one["source_key"] != "notion:table.csv:Untitled"
+    assert list(deleted) == ["notion:table.csv:Untitled"]
+
+
+def _run_with_duplicates(path, documents):
+    manifest = DocumentManifest(path)
+    manifest.start_run({"DEDUPLICATE": "v1:True"})
+    changed = manifest.select_changed(documents)
+    canonical = {}
+    for doc in changed:
+        canonical.setdefault(doc["content"]["body"], doc["id"])
+    manifest.record([doc for doc in changed if canonical[doc["content"]["body"]] == doc["id"]])
+    manifest.record_duplicates(
+        {
+            doc["id"]: canonical[doc["content"]["body"]]
+            for doc in changed
+            if canonical[doc["content"]["body"]] != doc["id"]
+        }
+    )
+    deleted = manifest.deleted_sources()
+    manifest.save()
+    return (changed, deleted)
+
+
+def test_unchanged_duplicates_are_skipped(manifest_path):
+    """Test that duplicates are rechecked only when they or their canonical change."""
+    docs = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")]
+    changed, _ = _run_with_duplicates(manifest_path, docs)
+    assert len(changed) == 2
+    changed, _ = _run_with_duplicates(
+        manifest_path, [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")]
+    )
+    assert changed == []
+    changed, _ = _run_with_duplicates(
+        manifest_path, [_doc("a.md", "A", "alpha v2"), _doc("b.md", "B", "alpha")]
+    )
+    assert [doc["metadata"]["path"] for doc in changed] == ["a.md", "b.md"]
+
+
+def test_duplicates_are_not_reported_as_deleted(manifest_path):
+    """Test that a missing duplicate is forgotten instead of reported for removal."""
+    _run_with_duplicates(manifest_path, [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")])
+    _, deleted = _run_with_duplicates(manifest_path, [_doc("a.md", "A", "alpha")])
+    assert deleted == {}
+    changed, _ = _run_with_duplicates(
+        manifest_path, [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")]
+    )
+    assert [doc["metadata"]["path"] for doc in changed] == ["b.md"]
+
+
+def test_duplicates_of_unindexed_documents_are_not_recorded(manifest_path):
+    """Test that a duplicate is retried if its canonical document was not indexed."""
+    docs = [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")]
+    manifest = DocumentManifest(manifest_path)
+    manifest.start_run({"DEDUPLICATE": "v1:True"})
+    manifest.select_changed(docs)
+    manifest.record_duplicates({docs[1]["id"]: docs[0]["id"]})
+    manifest.save()
+    changed, _ = _run_with_duplicates(
+        manifest_path, [_doc("a.md", "A", "alpha"), _doc("b.md", "B", "alpha")]
+    )
+    assert len(changed) == 2
+
+
+def test_content_hash_ignores_generated_fields():
+    """Test that only source content contributes to the hash."""
+    doc = _doc("a.md", "A", "alpha")
+    processed = dict(doc, id="other", embeddings={"body": [0.1]})
+    assert content_hash(doc) == content_hash(processed)
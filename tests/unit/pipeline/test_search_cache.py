@@ -0,0 +1,209 @@
+"""Tests for the two-level search cache."""
+
+from unittest.mock import MagicMock
+import pytest
+from src.indexing.search.fusion import FusedResults
+from src.pipeline import search_cache
+from src.pipeline.config.settings import PipelineConfig
+from src.pipeline.search import SearchOperations
+from src.pipeline.search_cache import SearchCache, normalize_query
+from src.utils import semantic_cache
+from src.utils.semantic_cache import SemanticCache
+
+
+class FakeCacheManager:
+    """In-memory stand-in for CacheManager"""
+
+    def __init__(self):
+        self.store = {}
+        self.default_ttl = 3600
+
+    def _get_full_key(self, key):
+        return f"search:{key}"
+
+    def get(self, key):
+        return self.store.get(self._get_full_key(key))
+
+    def get_many(self, keys):
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items, ttl=None, codec=None):
+        for key, value in items.items():
+            self.set(key, value, ttl)
+        return True
+
+    def set(self, key, value, ttl=None):
+        self.store[self._get_full_key(key)] = value
+        return True
+
+    def incr(self, key, ttl=None):
+        full_key = self._get_full_key(key)
+        self.store[full_key] = self.store.get(full_key, 0) + 1
+        return self.store[full_key]
+
+    def get_counter(self, key):
+        return self.store.get(self._get_full_key(key), 0)
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    """Record cache hits and misses by cache type"""
+    counts = {"hit": [], "miss": []}
+    monkeypatch.setattr(search_cache, "record_cache_hit", counts["hit"].append)
+    monkeypatch.setattr(search_cache, "record_cache_miss", counts["miss"].append)
+    monkeypatch.setattr(semantic_cache, "record_cache_hit", counts["hit"].append)
+    monkeypatch.setattr(semantic_cache, "record_cache_miss", counts["miss"].append)
+    monkeypatch.setattr(semantic_cache, "record_semantic_similarity", lambda similarity: None)
+    return counts
+
+
+@pytest.fixture
+def search_ops():
+    """Create SearchOperations with mock components and an in-memory cache"""
+    embedding_generator = MagicMock()
+    embedding_generator._get_embedding.return_value = [0.1, 0.2, 0.3]
+    vector_index = MagicMock()
+    vector_index.hybrid_search.return_value = [{"id": "1", "score": 0.9}]
+    cache = SearchCache(FakeCacheManager(), model="test-model")
+    return SearchOperations(
+        embedding_generator, vector_index, MagicMock(), MagicMock(), cache=cache
+    )
+
+
+def test_normalize_query():
+    """Test that normalization ignores case and whitespace"""
+    assert normalize_query("  What   is\tRAG? ") == "what is rag?"
+
+
+def test_repeated_search_is_served_from_cache(search_ops, metrics):
+    """Test that a repeated query skips embedding and vector search"""
+    first = search_ops.search(query_text="What is RAG?")
+    second = search_ops.search(query_text="  what is rag?")
+    assert first == second == [{"id": "1", "score": 0.9}]
+    search_ops.embedding_generator._get_embedding.assert_called_once()
+    search_ops.vector_index.hybrid_search.assert_called_once()
+    assert metrics["hit"] == ["search_results"]
+    assert metrics["miss"] == ["search_results", "query_embedding"]
+
+
+def test_invalidate_keeps_embeddings(search_ops, metrics):
+    """Test that an index change drops results but not query embeddings"""
+    search_ops.search(query_text="rag")
+    search_ops.invalidate()
+    search_ops.search(query_text="rag")
+    search_ops.embedding_generator._get_embedding.assert_called_once()
+    assert search_ops.vector_index.hybrid_search.call_count == 2
+    assert search_ops.cache.generation() == 1
+    assert metrics["hit"] == ["query_embedding"]
+
+
+def test_generation_is_kept_per_process_without_redis():
+    """Test that invalidation still works when the shared counter is unavailable"""
+    manager = FakeCacheManager()
+    manager.incr = lambda key, ttl=None: None
+    manager.get_counter = lambda key: None
+    cache = SearchCache(manager, model="test-model")
+    assert cache.generation() == 0
+    assert cache.bump_generation() == 1
+    assert cache.generation() == 1
+
+
+def test_result_key_depends_on_parameters(search_ops):
+    """Test that mode, limit and score threshold are part of the result key"""
+    cache = search_ops.cache
+    key = cache.result_key("rag", None, "hybrid", 10, 0.7)
+    assert key == cache.result_key("RAG ", None, "hybrid", 10, 0.7)
+    assert key != cache.result_key("rag", None, "semantic", 10, 0.7)
+    assert key != cache.result_key("rag", None, "hybrid", 5, 0.7)
+    assert key != cache.result_key("rag", None, "hybrid", 10, 0.8)
+    assert key != cache.result_key("rag", None, "hybrid", 10, 0.7, {"source": "notion"})
+
+
+def test_paraphrase_is_served_by_semantic_cache(search_ops, metrics):
+    """Test that a similar query reuses results and index changes clear them"""
+    search_ops.semantic_cache = SemanticCache(threshold=0.95)
+    search_ops.embedding_generator._get_embedding.side_effect = [
+        [1.0, 0.0, 0.0],
+        [0.99, 0.05, 0.0],
+        [0.99, 0.05, 0.0],
+    ]
+    search_ops.search(query_text="reset password")
+    assert search_ops.search(query_text="how to reset my password") == [{"id": "1", "score": 0.9}]
+    search_ops.vector_index.hybrid_search.assert_called_once()
+    assert "semantic" in metrics["hit"]
+    search_ops.invalidate()
+    search_ops.search(query_text="how do I reset the password")
+    assert search_ops.vector_index.hybrid_search.call_count == 2
+
+
+def test_batch_search_embeds_misses_in_one_call(search_ops, metrics):
+    """Test that a batch reuses cached results and embeds the rest in bulk"""
+    search_ops.search(query_text="rag")
+    search_ops.embedding_generator.embed_texts.return_value = [
+        [0.5, 0.25, 0.125],
+        [0.25, 0.25, 0.25],
+    ]
+    search_ops.vector_index.batch_hybrid_search.return_value = [[{"id": "2", "score": 0.8}], []]
+    results = search_ops.batch_search(["RAG", "faiss", "bm25", "Faiss "])
+    assert results == [
+        [{"id": "1", "score": 0.9}],
+        [{"id": "2", "score": 0.8}],
+        [],
+        [{"id": "2", "score": 0.8}],
+    ]
+    search_ops.embedding_generator.embed_texts.assert_called_once_with(["faiss", "bm25"])
+    search_ops.vector_index.batch_hybrid_search.assert_called_once()
+    assert search_ops.cache.get_embeddings(["faiss", "bm25"]) == [
+        [0.5, 0.25, 0.125],
+        [0.25, 0.25, 0.25],
+    ]
+
+
+def test_hybrid_fusion_uses_parallel_hybrid_search(search_ops):
+    """Test that a fusion method routes hybrid searches to the parallel legs"""
+    search_ops.hybrid_fusion = "rrf"
+    search_ops.hybrid_timeout = 0.2
+    search_ops.vector_index.parallel_hybrid_search.return_value = [{"id": "3", "score": 0.03}]
+    assert search_ops.search(query_text="rag") == [{"id": "3", "score": 0.03}]
+    search_ops.vector_index.parallel_hybrid_search.assert_called_once_with(
+        text_query="rag", query_vector=[0.1, 0.2, 0.3], limit=10, fusion="rrf", timeout=0.2
+    )
+    search_ops.vector_index.hybrid_search.assert_not_called()
+    search_ops.hybrid_fusion = None
+    assert search_ops.search(query_text="rag") == [{"id": "1", "score": 0.9}]
+
+
+def test_degraded_hybrid_results_are_not_cached(search_ops):
+    """Test that results of a single surviving leg are neither cached nor reused"""
+    search_ops.hybrid_fusion = "rrf"
+    search_ops.semantic_cache = SemanticCache(threshold=0.95)
+    degraded = FusedResults([{"id": "3", "score": 0.03}], degraded=True)
+    search_ops.vector_index.parallel_hybrid_search.return_value = degraded
+    assert search_ops.search(query_text="rag") == degraded
+    search_ops.vector_index.parallel_hybrid_search.return_value = FusedResults(
+        [{"id": "4", "score": 0.04}]
+    )
+    assert search_ops.search(query_text="rag") == [{"id": "4", "score": 0.04}]
+    assert search_ops.search(query_text="rag") == [{"id": "4", "score": 0.04}]
+    assert search_ops.vector_index.parallel_hybrid_search.call_count == 2
+
+
+def test_batch_search_uses_hybrid_fusion(search_ops):
+    """Test that batch hybrid searches fuse client-side like single searches"""
+    search_ops.hybrid_fusion = "relative"
+    search_ops.embedding_generator.embed_texts.return_value = [[0.5, 0.25, 0.125]]
+    search_ops.vector_index.parallel_hybrid_search.return_value = [{"id": "3", "score": 0.5}]
+    assert search_ops.batch_search(["rag"]) == [[{"id": "3", "score": 0.5}]]
+    search_ops.vector_index.parallel_hybrid_search.assert_called_once_with(
+        text_query="rag", query_vector=[0.5, 0.25, 0.125], limit=10, fusion="relative", timeout=None
+    )
+    search_ops.vector_index.batch_hybrid_search.assert_not_called()
+    assert search_ops.search(query_text="rag") == [{"id": "3", "score": 0.5}]
+    search_ops.vector_index.parallel_hybrid_search.assert_called_once()
+
+
+def test_config_rejects_unknown_hybrid_fusion():
+    """Test that PipelineConfig validates the fusion method"""
+    assert PipelineConfig(export_dir="docs", hybrid_fusion="rrf").hybrid_fusion == "rrf"
+    with pytest.raises(ValueError):
+        PipelineConfig(export_dir="docs", hybrid_fusion="borda")
@@ -0,0 +1,75 @@
+"""Tests for the streaming pipeline executor."""
+
+import threading
+import time
+import pytest
+from src.pipeline.errors import PipelineError
+from src.pipeline.streaming import StreamingExecutor, StreamStage
+
+
+def _batches(count, produced=None):
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        yield [{"id": str(i)}]
+
+
+def test_streaming_preserves_order_and_applies_stages():
+    """Test that batches pass every stage in source order."""
+
+    def slow(batch):
+        time.sleep(0.001)
+        return batch
+
+    executor = StreamingExecutor(
+        [
+            StreamStage("tag", lambda batch: [dict(doc, tagged=True) for doc in batch]),
+            StreamStage("slow", slow),
+        ],
+        queue_size=2,
+    )
+    result = [doc for batch in executor.run(_batches(20)) for doc in batch]
+    assert [doc["id"] for doc in result] == [str(i) for i in range(20)]
+    assert all((doc["tagged"] for doc in result))
+    assert executor.stats["tag"].batches == 20
+    assert executor.stats["slow"].documents == 20
+
+
+def test_streaming_applies_backpressure():
+    """Test that the source is not drained ahead of a slow consumer."""
+    produced = []
+    executor = StreamingExecutor([StreamStage("noop", lambda batch: batch)], queue_size=1)
+    stream = executor.run(_batches(100, produced))
+    next(stream)
+    time.sleep(0.3)
+    assert len(produced) < 10
+    stream.close()
+    assert not [t for t in threading.enumerate() if t.name.startswith("stream-")]
+
+
+def test_streaming_drops_empty_batches():
+    """Test that empty stage results are not passed downstream."""
+    executor = StreamingExecutor(
+        [StreamStage("filter", lambda batch: [doc for doc in batch if doc["id"] != "1"])]
+    )
+    result = list(executor.run(_batches(3)))
+    assert result == [[{"id": "0"}], [{"id": "2"}]]
+
+
+def test_streaming_stage_failure_raises():
+    """Test that a failing stage stops the stream and surfaces the error."""
+
+    def fail(batch):
+        if batch[0]["id"] == "3":
+            raise ValueError("stage failed")
+        return batch
+
+    executor = StreamingExecutor([StreamStage("fail", fail)])
+    with pytest.raises(PipelineError, match="stage failed"):
+        list(executor.run(_batches(10)))
+
+
+def test_streaming_invalid_queue_size():
+    """Test that the queue size must be positive."""
+    with pytest.raises(ValueError):
+        StreamingExecutor([], queue_size=0)
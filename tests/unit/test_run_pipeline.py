@@ -81,10 +81,21 @@ def test_main_with_defaults(mock_args, mock_pipeline_cls):
     args.cache_ttl = 86400
     args.no_pii = False
     args.no_dedup = False
+    args.pii_processes = 1
+    args.near_duplicate_threshold = None
+    args.embedding_concurrency = 4
+    args.embedding_rpm = None
+    args.embedding_tpm = None
     args.summary_max_length = 150
     args.summary_min_length = 50
     args.cluster_count = 5
     args.min_cluster_size = 3
+    args.stream = False
+    args.queue_size = 4
+    args.incremental = False
+    args.prune_deleted = False
+    args.checkpoint = False
+    args.resume = False
     mock_args.return_value = args
 
     # Run main
@@ -100,6 +111,11 @@ def test_main_with_defaults(mock_args, mock_pipeline_cls):
         cache_host="localhost",
         cache_port=6379,
         cache_ttl=86400,
+        pii_processes=1,
+        near_duplicate_threshold=None,
+        embedding_concurrency=4,
+        embedding_requests_per_minute=None,
+        embedding_tokens_per_minute=None,
     )
 
     # Verify process_documents call
@@ -112,6 +128,8 @@ def test_main_with_defaults(mock_args, mock_pipeline_cls):
     assert call_kwargs["summary_config"].min_length == 50
     assert call_kwargs["cluster_config"].n_clusters == 5
     assert call_kwargs["cluster_config"].min_cluster_size == 3
+    assert call_kwargs["checkpoint"] is False
+    assert call_kwargs["resume"] is False
 
     # Verify output
     mock_print.assert_any_call("\nProcessing complete. Processed 2 documents")
@@ -126,6 +144,7 @@ def test_main_with_custom_args(mock_args, mock_pipeline_cls):
     mock_pipeline = MagicMock()
     mock_pipeline_cls.return_value = mock_pipeline
     mock_pipeline.process_documents.return_value = ["doc1"]
+    mock_pipeline.skipped_near_duplicates = 3
 
     # Setup mock args with custom values
     args = MagicMock()
@@ -139,10 +158,21 @@ def test_main_with_custom_args(mock_args, mock_pipeline_cls):
     args.cache_ttl = 3600
     args.no_pii = True
     args.no_dedup = True
+    args.pii_processes = 4
+    args.near_duplicate_threshold = 0.8
+    args.embedding_concurrency = 8
+    args.embedding_rpm = 3000
+    args.embedding_tpm = 1000000
     args.summary_max_length = 200
     args.summary_min_length = 100
     args.cluster_count = 10
     args.min_cluster_size = 5
+    args.stream = False
+    args.queue_size = 4
+    args.incremental = False
+    args.prune_deleted = False
+    args.checkpoint = False
+    args.resume = False
     mock_args.return_value = args
 
     # Run main
@@ -158,6 +188,11 @@ def test_main_with_custom_args(mock_args, mock_pipeline_cls):
         cache_host="custom_host",
         cache_port=6380,
         cache_ttl=3600,
+        pii_processes=4,
+        near_duplicate_threshold=0.8,
+        embedding_concurrency=8,
+        embedding_requests_per_minute=3000,
+        embedding_tokens_per_minute=1000000,
     )
 
     # Verify process_documents call
@@ -173,6 +208,7 @@ def test_main_with_custom_args(mock_args, mock_pipeline_cls):
 
     # Verify output
     mock_print.assert_any_call("\nProcessing complete. Processed 1 documents")
+    mock_print.assert_any_call("Skipped 3 near-duplicate documents")
     mock_print.assert_any_call("Check custom_logs/pipeline.json for detailed logs")
 
 
@@ -197,10 +233,21 @@ def test_main_error_handling(mock_args, mock_pipeline_cls):
     args.cache_ttl = 86400
     args.no_pii = False
     args.no_dedup = False
+    args.pii_processes = 1
+    args.near_duplicate_threshold = None
+    args.embedding_concurrency = 4
+    args.embedding_rpm = None
+    args.embedding_tpm = None
     args.summary_max_length = 150
     args.summary_min_length = 50
     args.cluster_count = 5
     args.min_cluster_size = 3
+    args.stream = False
+    args.queue_size = 4
+    args.incremental = False
+    args.prune_deleted = False
+    args.checkpoint = False
+    args.resume = False
     mock_args.return_value = args
 
     # Run main and verify it handles the error
@@ -209,3 +256,102 @@ def test_main_error_handling(mock_args, mock_pipeline_cls):
             main()
         assert exc_info.value.code == 1
         mock_print.assert_called_once_with("Error: Test error", file=mock_print.return_value)
+
+
+@patch("run_pipeline.Pipeline")
+@patch("argparse.ArgumentParser.parse_args")
+def test_main_with_streaming(mock_args, mock_pipeline_cls):
+    """Test main function in streaming mode."""
+    # Setup mock pipeline streaming two batches
+    mock_pipeline = MagicMock()
+    mock_pipeline_cls.return_value = mock_pipeline
+    mock_pipeline.stream_documents.return_value = iter([["doc1", "doc2"], ["doc3"]])
+
+    # Setup mock args
+    args = MagicMock()
+    args.export_dir = "test_dir"
+    args.steps = "LOAD,EMBED,INDEX"
+    args.index_url = "http://localhost:8080"
+    args.log_dir = "logs"
+    args.batch_size = 100
+    args.cache_host = "localhost"
+    args.cache_port = 6379
+    args.cache_ttl = 86400
+    args.no_pii = False
+    args.no_dedup = False
+    args.pii_processes = 1
+    args.near_duplicate_threshold = None
+    args.embedding_concurrency = 4
+    args.embedding_rpm = None
+    args.embedding_tpm = None
+    args.summary_max_length = 150
+    args.summary_min_length = 50
+    args.cluster_count = 5
+    args.min_cluster_size = 3
+    args.stream = True
+    args.queue_size = 2
+    args.incremental = False
+    args.prune_deleted = False
+    args.checkpoint = False
+    args.resume = False
+    mock_args.return_value = args
+
+    # Run main
+    with patch("builtins.print") as mock_print:
+        main()
+
+    # Verify streaming was used instead of the batch path
+    mock_pipeline.process_documents.assert_not_called()
+    mock_pipeline.stream_documents.assert_called_once()
+    call_kwargs = mock_pipeline.stream_documents.call_args[1]
+    assert call_kwargs["queue_size"] == 2
+    assert call_kwargs["steps"] == {PipelineStep.LOAD, PipelineStep.EMBED, PipelineStep.INDEX}
+
+    # Verify output
+    mock_print.assert_any_call("\nProcessing complete. Processed 3 documents")
+
+
+@patch("run_pipeline.Pipeline")
+@patch("argparse.ArgumentParser.parse_args")
+def test_main_reports_dropped_documents(mock_args, mock_pipeline_cls):
+    """Test that main exits non-zero when a failing step dropped documents."""
+    mock_pipeline = MagicMock()
+    mock_pipeline_cls.return_value = mock_pipeline
+    mock_pipeline.process_documents.return_value = ["doc1"]
+    mock_pipeline.dropped_documents = 2
+
+    args = MagicMock()
+    args.export_dir = "test_dir"
+    args.steps = ""
+    args.index_url = "http://localhost:8080"
+    args.log_dir = "logs"
+    args.batch_size = 100
+    args.cache_host = "localhost"
+    args.cache_port = 6379
+    args.cache_ttl = 86400
+    args.no_pii = False
+    args.no_dedup = False
+    args.pii_processes = 1
+    args.near_duplicate_threshold = None
+    args.embedding_concurrency = 4
+    args.embedding_rpm = None
+    args.embedding_tpm = None
+    args.summary_max_length = 150
+    args.summary_min_length = 50
+    args.cluster_count = 5
+    args.min_cluster_size = 3
+    args.stream = False
+    args.queue_size = 4
+    args.incremental = False
+    args.prune_deleted = False
+    args.checkpoint = False
+    args.resume = False
+    mock_args.return_value = args
+
+    # Run main and verify the dropped documents fail the run
+    with patch("builtins.print") as mock_print, patch("sys.stderr", mock_print.return_value):
+        assert main() == 1
+
+    mock_print.assert_any_call(
+        "Error: 2 documents were dropped by a failing step", file=mock_print.return_value
+    )
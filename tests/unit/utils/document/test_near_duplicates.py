@@ -0,0 +1,99 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+import random
+import numpy as np
+import pytest
+from src.utils.near_duplicates import NearDuplicateIndex, optimal_bands
+
+
+def _text(seed, words=300):
+    rng = random.Random(seed)
+    return " ".join((f"w{rng.randrange(5000)}" for _ in range(words)))
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """Location of a persisted index."""
+    return tmp_path / "state" / "near_duplicates.npz"
+
+
+def test_band_layout_matches_threshold():
+    """Test that the LSH S-curve crosses close to the threshold."""
+    for threshold in (0.5, 0.8, 0.9):
+        bands, rows = optimal_bands(threshold, 128)
+        assert bands * rows == 128
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
+
+
+def test_signature_estimates_jaccard():
+    """Test that identical texts share a signature and unrelated texts do not."""
+    index = NearDuplicateIndex()
+    text = _text(1)
+    assert np.array_equal(index.signature(text), index.signature(text.upper()))
+    assert np.mean(index.signature(text) == index.signature(_text(2))) < 0.1
+    assert index.signature("   ") is None
+
+
+def test_near_duplicate_links_to_canonical():
+    """Test that an edited copy is linked to the first document."""
+    index = NearDuplicateIndex(threshold=0.8)
+    text = _text(1)
+    assert index.check("a", "doc-a", text) is None
+    canonical, similarity = index.check("b", "doc-b", text + " edited footer text")
+    assert canonical == "doc-a"
+    assert similarity >= 0.8
+    assert index.check("c", "doc-c", _text(2)) is None
+    assert index.links == {"doc-b": ("doc-a", similarity)}
+    assert len(index) == 2
+
+
+def test_same_source_replaces_its_entry():
+    """Test that a page is not reported as a duplicate of its own earlier version."""
+    index = NearDuplicateIndex(threshold=0.8)
+    index.check("a", "doc-a", _text(1))
+    assert index.check("a", "doc-a2", _text(1) + " small edit") is None
+    assert index.check("b", "doc-b", _text(1))[0] == "doc-a2"
+    index.remove(["a"])
+    assert index.check("c", "doc-c", _text(1)) is None
+
+
+def test_persistence_across_runs(index_path):
+    """Test that signatures and links survive a save and reload."""
+    index = NearDuplicateIndex(index_path, threshold=0.8)
+    index.check("a", "doc-a", _text(1))
+    index.check("b", "doc-b", _text(1))
+    index.save()
+    reloaded = NearDuplicateIndex(index_path, threshold=0.7)
+    assert len(reloaded) == 1
+    assert reloaded.links["doc-b"][0] == "doc-a"
+    assert reloaded.check("c", "doc-c", _text(1))[0] == "doc-a"
+    other_params = NearDuplicateIndex(index_path, num_perm=64)
+    assert len(other_params) == 0
+
+
+def test_rollback_restores_committed_entries():
+    """Test that uncommitted entries and their links are undone."""
+    index = NearDuplicateIndex(threshold=0.8)
+    index.check("a", "doc-a", _text(1))
+    index.commit(["a"])
+    index.check("a", "doc-a2", _text(2))
+    index.check("b", "doc-b", _text(2))
+    index.check("c", "doc-c", _text(3))
+    assert set(index.links) == {"doc-b"}
+    index.rollback()
+    assert len(index) == 1
+    assert index.links == {}
+    assert index.check("d", "doc-d", _text(1))[0] == "doc-a"
+    assert index.check("e", "doc-e", _text(2)) is None
+
+
+def test_remove_drops_links_to_removed_documents():
+    """Test that duplicates of a removed document are no longer linked to it."""
+    index = NearDuplicateIndex(threshold=0.8)
+    index.check("a", "doc-a", _text(1))
+    index.check("b", "doc-b", _text(1))
+    index.check("c", "doc-c", _text(2))
+    index.check("d", "doc-d", _text(2))
+    index.remove(["a"])
+    assert set(index.links) == {"doc-d"}
+    assert len(index) == 1
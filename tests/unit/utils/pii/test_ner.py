@@ -1,48 +1,101 @@
 """Tests for PII NER (Named Entity Recognition) functionality."""
+
 from unittest.mock import Mock, patch
 import pytest
-from src.utils.pii_detector import PIIDetector
+from src.utils.pii_detector import PIIDetector, load_ner_model
+
 
 @pytest.fixture
 def mock_spacy_model():
     """Create a mock spaCy model."""
-    with patch('spacy.load') as mock_load:
+    with patch("spacy.load") as mock_load:
         mock_ent = Mock()
-        mock_ent.label_ = 'PERSON'
-        mock_ent.text = 'John Doe'
+        mock_ent.label_ = "PERSON"
+        mock_ent.text = "John Doe"
         mock_ent.start_char = 0
         mock_ent.end_char = 8
         mock_doc = Mock()
         mock_doc.ents = [mock_ent]
         mock_nlp = Mock()
         mock_nlp.return_value = mock_doc
+        mock_nlp.pipe_names = ["tok2vec", "tagger", "parser", "ner"]
+        mock_nlp.pipe.side_effect = lambda inputs, **kwargs: (
+            (mock_doc, context) for _, context in inputs
+        )
         mock_load.return_value = mock_nlp
+        load_ner_model.cache_clear()
         yield mock_nlp
+        load_ner_model.cache_clear()
+
 
 @pytest.fixture
 def pii_detector(mock_spacy_model):
     """Create a PIIDetector instance with mock spaCy model."""
-    return PIIDetector(spacy_model='en_core_web_sm')
+    return PIIDetector(spacy_model="en_core_web_sm")
+
 
 def test_ner_detection(pii_detector, mock_spacy_model):
     """Test named entity recognition."""
-    text = 'John Doe works at Apple Inc in New York'
+    text = "John Doe works at Apple Inc in New York"
     matches = pii_detector._find_ner_matches(text)
     assert matches
-    assert any((m.type == 'person' for m in matches))
+    assert any((m.type == "person" for m in matches))
+
 
 def test_ner_chunking(pii_detector):
     """Test NER processing with text chunking."""
-    long_text = 'John Doe ' * 10000
-    chunked_detector = PIIDetector(spacy_model='en_core_web_sm', chunk_size=1000)
+    long_text = "John Doe " * 10000
+    chunked_detector = PIIDetector(spacy_model="en_core_web_sm", chunk_size=1000)
     matches = chunked_detector._find_ner_matches(long_text)
     assert matches
 
+
 def test_combined_pii_detection(pii_detector):
     """Test combined regex and NER detection."""
     text = "John Doe's email is john.doe@email.com and phone is +1-555-123-4567"
     matches = pii_detector.detect(text)
     detected_types = {m.type for m in matches}
-    assert 'person' in detected_types
-    assert 'email' in detected_types
-    assert 'phone' in detected_types
\ No newline at end of file
+    assert "person" in detected_types
+    assert "email" in detected_types
+    assert "phone" in detected_types
+
+
+def test_model_loaded_with_ner_only(pii_detector, mock_spacy_model):
+    """Test that non-NER components are disabled and the model is shared."""
+    mock_spacy_model.select_pipes.assert_called_once_with(disable=["tok2vec", "tagger", "parser"])
+    assert PIIDetector(spacy_model="en_core_web_sm").nlp is pii_detector.nlp
+
+
+def test_analyze_documents_batches_ner(pii_detector, mock_spacy_model):
+    """Test batch analysis streams every document through nlp.pipe."""
+    docs = [
+        {"content": {"body": "John Doe called"}, "metadata": {}},
+        {"content": {"body": ""}, "metadata": {}},
+        {"content": {"body": "John Doe wrote"}, "metadata": {}},
+    ]
+    results = pii_detector.analyze_documents(docs, batch_size=8)
+    mock_spacy_model.assert_not_called()
+    assert mock_spacy_model.pipe.call_args[1] == {"as_tuples": True, "batch_size": 8}
+    assert [doc["metadata"]["pii_analysis"]["match_count"] for doc in results] == [1, 0, 1]
+    assert results[0]["metadata"]["pii_analysis"]["found_types"] == ["person"]
+
+
+def test_analyze_documents_recovers_per_document(pii_detector, mock_spacy_model):
+    """Test that a failing NER batch only falls back for the documents it contained."""
+    ok = mock_spacy_model.pipe.side_effect
+
+    def pipe(inputs, **kwargs):
+        for text, context in inputs:
+            if text == "broken":
+                raise ValueError("bad input")
+            yield from ok([(text, context)], **kwargs)
+
+    mock_spacy_model.pipe.side_effect = pipe
+    docs = [
+        {"content": {"body": body}, "metadata": {}}
+        for body in ["John Doe called", "broken", "John Doe wrote"]
+    ]
+    results = pii_detector.analyze_documents(docs, batch_size=1)
+    assert [doc["metadata"]["pii_analysis"]["match_count"] for doc in results] == [1, 1, 1]
+    mock_spacy_model.assert_called_once_with("broken")
+    assert mock_spacy_model.pipe.call_count == 2
@@ -0,0 +1,149 @@
+"""Complexity checks and benchmarks of the single-pass regex PII scanner and redaction.
+
+The benchmarks compare the scanner and redaction with the previous implementations
+on 100k-word documents. They are skipped unless pytest-benchmark runs with
+``--benchmark-only``::
+
+    pytest tests/unit/utils/pii/test_pattern_performance.py --benchmark-only
+"""
+
+import random
+
+import pytest
+
+from src.utils.pii_detector import PIIDetector
+
+WORDS = "the quick brown fox jumps over lazy dog report meeting notes project budget".split()
+PII_VALUES = [
+    "john.doe@example.com",
+    "+1-555-123-4567",
+    "123-45-6789",
+    "4111-1111-1111-1111",
+    "192.168.1.1",
+    "01/01/2024",
+    "Jan 5, 2024",
+    "AB123456",
+    "1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa",
+    "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
+    "42",
+    "v2.0",
+]
+
+
+@pytest.fixture
+def pii_detector():
+    """Create a PIIDetector instance."""
+    return PIIDetector(spacy_model="en_core_web_sm")
+
+
+class _ScannerSpy:
+    """Record the spans passed to the compiled scanner."""
+
+    def __init__(self, scanner):
+        self.scanner = scanner
+        self.spans = []
+
+    def finditer(self, text, start, end):
+        self.spans.append((start, end))
+        return self.scanner.finditer(text, start, end)
+
+
+class _SliceCountingStr(str):
+    """String that counts the characters copied by slicing."""
+
+    sliced = 0
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if isinstance(key, slice):
+            type(self).sliced += len(value)
+        return value
+
+
+def _document(word_count, pii_rate, seed=0):
+    rng = random.Random(seed)
+    return " ".join(
+        (
+            rng.choice(PII_VALUES) if rng.random() < pii_rate else rng.choice(WORDS)
+            for _ in range(word_count)
+        )
+    )
+
+
+def _multi_pass_matches(pii_detector, text):
+    """Previous implementation: one finditer pass per pattern."""
+    return [
+        (match.start(), match.end())
+        for pattern in pii_detector.compiled_patterns.values()
+        for match in pattern.finditer(text)
+    ]
+
+
+def _list_redact(text, matches):
+    """Previous implementation: replace each match in a list of characters."""
+    chars = list(text)
+    for match in sorted(matches, key=lambda x: x.start, reverse=True):
+        chars[match.start : match.end] = list(f"[{match.type.upper()}]")
+    return "".join(chars)
+
+
+@pytest.fixture
+def pii_benchmark(request, benchmark):
+    """Benchmark fixture that only runs with --benchmark-only."""
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("benchmark, run with --benchmark-only")
+    return benchmark
+
+
+@pytest.mark.parametrize("pii_rate", [0.02, 0.2])
+def test_single_pass_scanner_reads_text_once(pii_detector, pii_rate):
+    """Test that the scanner visits each character at most once and misses nothing."""
+    text = _document(10000, pii_rate)
+    spy = _ScannerSpy(pii_detector.scanner)
+    pii_detector.scanner = spy
+    matches = pii_detector._find_regex_matches(text)
+
+    assert all(end <= start for (_, end), (start, _) in zip(spy.spans, spy.spans[1:]))
+    assert sum(end - start for start, end in spy.spans) <= len(text)
+    spans = sorted(((m.start, m.end) for m in matches))
+    ends = [end for _, end in spans]
+    for start, end in _multi_pass_matches(pii_detector, text)[::50]:
+        i = next((i for i, e in enumerate(ends) if e > start), None)
+        assert i is not None and spans[i][0] < end, f"Missed {text[start:end]!r}"
+
+
+def test_redaction_is_linear(pii_detector):
+    """Test that redaction copies each character of the text at most once."""
+    text = _SliceCountingStr(_document(10000, 0.2))
+    matches = pii_detector._find_regex_matches(str(text))
+    redacted = pii_detector.redact(text, matches=matches)
+
+    assert "john.doe@example.com" not in redacted
+    assert _SliceCountingStr.sliced <= len(text)
+
+
+@pytest.mark.parametrize("pii_rate", [0.02, 0.2])
+@pytest.mark.parametrize("scanner", ["per_pattern", "single_pass"])
+def test_scanner_benchmark(pii_detector, pii_benchmark, scanner, pii_rate):
+    """Benchmark the scanner against per-pattern passes on 100k-word documents."""
+    text = _document(100000, pii_rate)
+    find = {
+        "per_pattern": lambda: _multi_pass_matches(pii_detector, text),
+        "single_pass": lambda: pii_detector._find_regex_matches(text),
+    }[scanner]
+    pii_benchmark.group = f"scan, {pii_rate:.0%} PII tokens"
+    assert pii_benchmark(find)
+
+
+@pytest.mark.parametrize("redaction", ["character_list", "single_pass"])
+def test_redaction_benchmark(pii_detector, pii_benchmark, redaction):
+    """Benchmark redaction against per-match list edits on a 100k-word document."""
+    text = _document(100000, 0.2)
+    matches = pii_detector._find_regex_matches(text)
+    labels = {name: f"[{name.upper()}]" for name in pii_detector.scan_order}
+    redact = {
+        "character_list": lambda: _list_redact(text, matches),
+        "single_pass": lambda: pii_detector.redact(text, matches=matches, custom_redaction=labels),
+    }[redaction]
+    pii_benchmark.group = "redaction, 20% PII tokens"
+    assert pii_benchmark(redact) == _list_redact(text, matches)
@@ -0,0 +1,86 @@
+"""Tests for batched summarization inference."""
+
+import pytest
+from src.utils.summarizer import DocumentSummarizer, SummarizerConfig
+from src.utils.summarizer.pipeline.summarizer import SummarizationPipeline
+
+
+class FakePipeline:
+    """Summarization pipeline recording batches and summarizing by first word"""
+
+    def __init__(self, failing=None):
+        self.batches = []
+        self.failing = failing
+
+    def __call__(self, inputs, **kwargs):
+        batch = inputs if isinstance(inputs, list) else [inputs]
+        self.batches.append(batch)
+        if any(self.failing and self.failing in text for text in batch):
+            raise RuntimeError("model error")
+        results = [
+            {"summary_text": f"sum({text.split()[0]},{len(text.split())})"} for text in batch
+        ]
+        return results if isinstance(inputs, list) else results[:1]
+
+
+def words(tag, count):
+    return " ".join([tag] + ["w"] * (count - 1))
+
+
+@pytest.fixture
+def config():
+    """Create a config with small chunks and batches"""
+    return SummarizerConfig(min_word_count=5, chunk_size=10, chunk_overlap=0, batch_size=2)
+
+
+def test_generate_summaries_batches_chunks_by_length(config):
+    """Test that chunks of all texts are batched longest first and reassembled in order"""
+    model = FakePipeline()
+    results = SummarizationPipeline(model, config).generate_summaries(
+        [words("a", 6), "too short", words("b", 18), ""], config
+    )
+    assert [r["status"] for r in results] == ["success", "success", "success", "error"]
+    assert results[0]["summary"] == "sum(a,6)"
+    assert results[1]["metadata"]["was_summarized"] is False
+    assert results[2]["summary"] == "sum(sum(b,10),2)"
+    assert results[2]["metadata"]["chunks_processed"] == 2
+    assert [[len(text.split()) for text in batch] for batch in model.batches] == [[10, 8], [6], [2]]
+
+
+def test_failed_batch_retries_chunks_alone(config):
+    """Test that a failing chunk only fails its own text"""
+    model = FakePipeline(failing="bad")
+    results = SummarizationPipeline(model, config).generate_summaries(
+        [words("bad", 6), words("good", 7)], config
+    )
+    assert results[0] == {"status": "error", "error": "All chunks failed to summarize"}
+    assert results[1]["summary"] == "sum(good,7)"
+
+
+def test_generate_summary_is_a_batch_of_one(config):
+    """Test the single-text API"""
+    result = SummarizationPipeline(FakePipeline(), config).generate_summary(words("a", 6))
+    assert result["summary"] == "sum(a,6)"
+    assert (
+        SummarizationPipeline(FakePipeline(), config).generate_summary("")["error"] == "Empty text"
+    )
+
+
+def test_process_documents_summarizes_in_one_pass(config):
+    """Test that documents are summarized together and updated in order"""
+    summarizer = DocumentSummarizer(config)
+    summarizer._pipeline = model = FakePipeline()
+    docs = [
+        {"content": {"body": words("a", 6)}},
+        {"content": {"body": "short"}},
+        {"content": {}},
+        {"content": {"body": words("c", 7)}},
+    ]
+    processed = summarizer.process_documents(docs, config)
+    assert [d["summary_status"] for d in processed] == ["success", "success", "error", "success"]
+    assert [processed[0]["summary"], processed[1]["summary"], processed[3]["summary"]] == [
+        "sum(a,6)",
+        "short",
+        "sum(c,7)",
+    ]
+    assert len(model.batches) == 1
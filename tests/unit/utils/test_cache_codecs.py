@@ -0,0 +1,95 @@
+"""Tests for the binary encodings of cached values."""
+
+import pickle
+from dataclasses import dataclass
+import numpy as np
+import pytest
+from src.utils import cache_codecs
+from src.utils.cache_codecs import CacheCodec, CodecError
+
+
+@dataclass
+class Result:
+    id: str
+    score: float
+
+
+@pytest.fixture
+def codec():
+    """Create a codec without compression"""
+    return CacheCodec(compression="none")
+
+
+def test_float32_vectors(codec):
+    """Test that vectors are stored as raw float32 behind a three-byte header"""
+    raw = codec.encode([0.5, 0.25, 1.0], codec="float32")
+    assert len(raw) == 3 + 3 * 4
+    assert codec.decode(raw) == [0.5, 0.25, 1.0]
+    matrix = np.arange(6, dtype=np.float32).reshape(2, 3)
+    decoded = codec.decode(codec.encode(matrix))
+    assert decoded.dtype == np.float32 and decoded.shape == (2, 3)
+    np.testing.assert_array_equal(decoded, matrix)
+    with pytest.raises(CodecError):
+        codec.encode(["a"], codec="float32")
+
+
+def test_bytes_are_stored_as_is(codec):
+    """Test the raw bytes codec"""
+    assert codec.encode(b"data") == bytes((cache_codecs.MAGIC, cache_codecs.BYTES, 0)) + b"data"
+    assert codec.decode(codec.encode(b"data")) == b"data"
+
+
+def test_msgpack_round_trips_exactly(codec):
+    """Test that msgpack keeps tuples and integer keys and rejects other types"""
+    pytest.importorskip("msgpack")
+    value = {"summary": "text", "scores": [0.9, 0.7], "span": (1, 2), 1: None, "raw": b"\x00"}
+    raw = codec.encode(value)
+    assert raw[1] == cache_codecs.MSGPACK
+    assert codec.decode(raw) == value
+    assert isinstance(codec.decode(raw)["span"], tuple)
+    with pytest.raises(CodecError):
+        codec.encode([Result("a", 1.0)], codec="msgpack")
+
+
+def test_objects_fall_back_to_pickle(codec):
+    """Test the pickle fallback and that it can be disabled"""
+    raw = codec.encode([Result("a", 1.0)])
+    assert raw[1] == cache_codecs.PICKLE
+    assert codec.decode(raw) == [Result("a", 1.0)]
+    strict = CacheCodec(compression="none", allow_pickle=False)
+    with pytest.raises(CodecError):
+        strict.encode([Result("a", 1.0)])
+    with pytest.raises(CodecError):
+        strict.decode(raw)
+
+
+def test_reads_legacy_pickled_values(codec):
+    """Test that values pickled before codec headers are still read"""
+    legacy = pickle.dumps({"value": 1})
+    assert codec.decode(legacy) == {"value": 1}
+    with pytest.raises(CodecError):
+        CacheCodec(compression="none", allow_pickle=False).decode(legacy)
+
+
+def test_rejects_unreadable_values(codec, monkeypatch):
+    """Test unknown codecs, missing headers and unavailable compression"""
+    with pytest.raises(CodecError):
+        codec.decode(bytes((cache_codecs.MAGIC, 99, 0)) + b"x")
+    with pytest.raises(CodecError):
+        codec.decode(b"plain")
+    monkeypatch.setattr(cache_codecs, "zstandard", None)
+    with pytest.raises(CodecError):
+        codec.decode(bytes((cache_codecs.MAGIC, cache_codecs.BYTES, cache_codecs.ZSTD)) + b"x")
+    with pytest.raises(ValueError):
+        CacheCodec(compression="zstd")
+
+
+@pytest.mark.parametrize("compression,module", [("zstd", "zstandard"), ("lz4", "lz4.frame")])
+def test_compresses_large_values(compression, module):
+    """Test that values above the threshold are compressed"""
+    pytest.importorskip(module)
+    codec = CacheCodec(compression=compression, compress_threshold=64)
+    raw = codec.encode(b"x" * 1000)
+    assert raw[2] == cache_codecs.COMPRESSIONS[compression] and len(raw) < 1000
+    assert codec.decode(raw) == b"x" * 1000
+    assert codec.encode(b"x" * 10)[2] == cache_codecs.NO_COMPRESSION
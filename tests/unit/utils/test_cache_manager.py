@@ -0,0 +1,313 @@
+"""Tests for the two-tier cache manager."""
+
+import threading
+import time
+from unittest.mock import patch
+import pytest
+from redis.exceptions import RedisError
+from src.utils import cache_codecs, cache_manager, local_cache
+from src.utils.cache_manager import CacheManager
+from src.utils.local_cache import LocalCache
+
+
+class FakePipeline:
+    """Records pipelined commands and runs them on execute"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def setex(self, key, ttl, value):
+        self.ops.append(lambda: self.redis.setex(key, ttl, value))
+
+    def delete(self, *keys):
+        self.ops.append(lambda: self.redis.delete(*keys))
+
+    def incr(self, key):
+        self.ops.append(lambda: self.redis.incr(key))
+
+    def expire(self, key, ttl):
+        self.ops.append(lambda: key in self.redis.store)
+
+    def execute(self):
+        self.redis.round_trips += 1
+        return [op() for op in self.ops]
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis counting round trips"""
+
+    def __init__(self, **kwargs):
+        self.store = {}
+        self.round_trips = 0
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def exists(self, key):
+        return int(key in self.store)
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1).encode()
+        return int(self.store[key])
+
+    def eval(self, script, numkeys, key, token):
+        if self.store.get(key) != token:
+            return 0
+        return self.delete(key)
+
+    def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class DownRedis(FakeRedis):
+    """Redis that cannot be reached"""
+
+    def ping(self):
+        raise RedisError("connection refused")
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Create a cache manager with an in-process tier over a fake Redis"""
+    monkeypatch.setattr(cache_manager.redis, "Redis", FakeRedis)
+    return CacheManager(prefix="test", local_max_bytes=4096)
+
+
+def test_local_tier_serves_hot_keys(cache):
+    """Test that repeated gets are served without Redis round trips"""
+    cache.set("key", {"value": 1})
+    cache.local.clear()
+    assert cache.get("key") == {"value": 1}
+    assert cache.get("key") == {"value": 1}
+    assert cache.redis.round_trips == 1
+    stats = cache.stats()
+    assert (stats["redis"]["hits"], stats["local"]["hits"], stats["local"]["misses"]) == (1, 1, 1)
+
+
+def test_get_many_fetches_misses_in_one_round_trip(cache):
+    """Test batch get order, local hits and a single MGET for the rest"""
+    assert cache.set_many({"a": 1, "b": [2], "c": "three"})
+    cache.local.delete("test:b")
+    cache.local.delete("test:c")
+    trips = cache.redis.round_trips
+    assert cache.get_many(["a", "b", "missing", "c"]) == [1, [2], None, "three"]
+    assert cache.redis.round_trips == trips + 1
+    assert cache.stats()["redis"]["misses"] == 1
+
+
+def test_set_many_and_delete_many_pipeline(cache):
+    """Test that batch writes and deletes each take one round trip"""
+    cache.set_many({f"k{i}": i for i in range(10)})
+    assert cache.redis.round_trips == 1
+    assert cache.delete_many(["k1", "k2", "nope"]) == 2
+    assert cache.get_many(["k1", "k3"]) == [None, 3]
+    assert "test:k1" not in cache.redis.store
+
+
+def test_failed_redis_write_skips_local_tier(cache, monkeypatch):
+    """Test that values Redis rejected are not served from the local tier"""
+
+    def fail(*args):
+        raise RedisError("connection reset")
+
+    monkeypatch.setattr(cache.redis, "setex", fail)
+    assert not cache.set_many({"a": 1, "b": 2})
+    assert not cache.set("c", 3)
+    assert cache.local.get("test:a") is None and cache.local.get("test:c") is None
+
+
+def test_counters_are_shared_and_bypass_local_tier(cache):
+    """Test that counters are incremented in Redis and never served from the local tier"""
+    other = CacheManager(prefix="test", local_max_bytes=4096)
+    other.redis = cache.redis
+    assert cache.get_counter("generation") == 0
+    assert cache.incr("generation", ttl=60) == 1
+    assert other.incr("generation") == 2
+    assert cache.get_counter("generation") == 2
+    assert cache.local.get("test:generation") is None
+    cache.redis = None
+    assert cache.incr("generation") is None and cache.get_counter("generation") is None
+
+
+def test_mutating_a_result_does_not_change_the_cache(cache):
+    """Test that every get returns its own copy"""
+    cache.set("list", [1, 2])
+    cache.get("list").append(3)
+    assert cache.get("list") == [1, 2]
+
+
+def test_degrades_to_local_tier_without_redis(monkeypatch):
+    """Test that caching continues per process when Redis is down"""
+    monkeypatch.setattr(cache_manager.redis, "Redis", DownRedis)
+    cache = CacheManager(local_max_bytes=4096)
+    assert cache.redis is None
+    assert cache.set("key", "value")
+    assert cache.get_many(["key", "other"]) == ["value", None]
+    assert cache.delete("key") and cache.get("key") is None
+    assert cache.stats()["redis"]["available"] is False
+    without_local = CacheManager()
+    assert not without_local.set("key", "value") and without_local.get("key") is None
+    assert without_local.stats()["local"] is None
+
+
+def test_local_cache_evicts_least_recently_used():
+    """Test byte-size-bounded LRU eviction"""
+    local = LocalCache(max_bytes=40)
+    local.set("a", b"x" * 10)
+    local.set("b", b"x" * 10)
+    local.set("c", b"x" * 10)
+    local.get("a")
+    local.set("d", b"x" * 10)
+    local.set("e", b"x" * 10)
+    assert local.get("b") is None and local.get("a") == b"x" * 10
+    assert not local.set("big", b"x" * 11)
+    stats = local.stats()
+    assert (stats["evictions"], stats["bytes"], stats["entries"]) == (1, 40, 4)
+
+
+def test_local_cache_expires_entries():
+    """Test that entries expire after the shorter of their and the cache TTL"""
+    local = LocalCache(max_bytes=100, ttl=60)
+    with patch.object(local_cache.time, "monotonic", return_value=1000.0):
+        local.set("short", b"1", ttl=10)
+        local.set("long", b"2", ttl=600)
+    with patch.object(local_cache.time, "monotonic", return_value=1030.0):
+        assert local.get("short") is None
+        assert local.get("long") == b"2"
+    with patch.object(local_cache.time, "monotonic", return_value=1061.0):
+        assert local.get("long") is None
+    assert local.stats()["expirations"] == 2
+
+
+def test_concurrent_misses_compute_once(cache):
+    """Test that callers missing the same key share one computation"""
+    calls = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.1)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cache.get_or_compute("key", compute, ttl=60))
+        )
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait(1)
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["value"] * 5 and len(calls) == 1
+    assert cache.stats()["compute"] == {"computed": 1, "coalesced": 4, "stale": 0}
+    assert "test:lock:key" not in cache.redis.store
+
+
+def test_errors_reach_waiting_callers(cache):
+    """Test that a failed computation is raised and not cached"""
+
+    def compute():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("key", compute)
+    assert cache.get("key") is None
+    assert cache.get_or_compute("key", lambda: 1) == 1
+
+
+def test_stale_value_served_while_refreshing(cache):
+    """Test that an expired value is served while another process holds the lock"""
+    cache.get_or_compute("key", lambda: "old", ttl=10, stale_ttl=60, beta=0)
+    cache.redis.store["test:lock:key"] = "other-process"
+    with patch.object(cache_manager.time, "time", return_value=time.time() + 30):
+        assert cache.get_or_compute("key", lambda: "new", ttl=10, stale_ttl=60) == "old"
+    assert cache.stats()["compute"]["stale"] == 1
+    del cache.redis.store["test:lock:key"]
+    with patch.object(cache_manager.time, "time", return_value=time.time() + 30):
+        assert cache.get_or_compute("key", lambda: "new", ttl=10, stale_ttl=60) == "new"
+
+
+def test_early_expiration(cache):
+    """Test probabilistic refresh before expiry, scaled by compute time"""
+    cache.set(
+        "key",
+        {
+            cache_manager.ENTRY_MARKER: True,
+            "value": "old",
+            "expires": time.time() + 5,
+            "delta": 2.0,
+        },
+    )
+    with patch.object(cache_manager.random, "random", return_value=0.5):
+        assert cache.get_or_compute("key", lambda: "new") == "old"
+    with patch.object(cache_manager.random, "random", return_value=0.99):
+        assert cache.get_or_compute("key", lambda: "new") == "new"
+
+
+def test_waits_for_other_process(cache, monkeypatch):
+    """Test that a miss polls for the value while another process computes it"""
+    monkeypatch.setattr(cache_manager, "LOCK_POLL_INTERVAL", 0.01)
+    cache.redis.store["test:lock:key"] = "other-process"
+
+    def finish():
+        time.sleep(0.05)
+        cache.set("key", "theirs")
+
+    threading.Thread(target=finish).start()
+    assert cache.get_or_compute("key", lambda: "ours") == "theirs"
+    del cache.redis.store["test:lock:key"]
+    assert cache.get_or_compute("gone", lambda: "ours", lock_timeout=0.05) == "ours"
+
+
+def test_cache_decorator_without_redis(monkeypatch):
+    """Test that the decorator caches per process when Redis is down"""
+    monkeypatch.setattr(cache_manager.redis, "Redis", DownRedis)
+    cache = CacheManager(local_max_bytes=4096)
+    calls = []
+
+    @cache.cache_decorator("square", ttl=60)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert square(3) == 9 and square(3) == 9
+    assert calls == [3]
+
+
+def test_values_carry_codec_header(cache):
+    """Test that stored values are encoded by the codec and bad values are misses"""
+    cache.set("vector", [0.5, 0.25], codec="float32")
+    assert cache.redis.store["test:vector"][:2] == bytes(
+        (cache_codecs.MAGIC, cache_codecs.FLOAT32_LIST)
+    )
+    cache.local.clear()
+    assert cache.get("vector") == [0.5, 0.25]
+    cache.redis.store["test:bad"] = b"not a cached value"
+    assert cache.get("bad") is None
@@ -0,0 +1,78 @@
+"""Tests for stable cache-key fingerprints."""
+
+import numpy as np
+from src.utils import fingerprint as fingerprint_module
+from src.utils.fingerprint import (
+    content_fingerprint,
+    document_fingerprint,
+    documents_fingerprint,
+    fingerprint,
+)
+
+
+def make_doc(doc_id="doc-1", body="Some text", vector=(0.1, 0.2), parent_id="parent"):
+    return {
+        "uuid": doc_id,
+        "content": {"body": body},
+        "metadata": {"title": "Doc"},
+        "embeddings": {"body": list(vector), "model": "m", "version": "1"},
+        "relationships": {"parent_id": parent_id, "chunk_ids": []},
+    }
+
+
+def test_fingerprint_is_stable_across_processes():
+    """Test that digests are fixed values, not salted per process like hash()"""
+    assert (
+        fingerprint("text", [1, 2.5], key={"b": None, "a": (True,)})
+        == "255374ec952ab93ad11da3e0acdefebf"
+    )
+    assert (
+        fingerprint("text", [1, 2.5], key={"a": (True,), "b": None})
+        == "255374ec952ab93ad11da3e0acdefebf"
+    )
+
+
+def test_fingerprint_distinguishes_arguments():
+    """Test that different arguments and argument boundaries give different digests"""
+    assert fingerprint("ab", "c") != fingerprint("a", "bc")
+    assert fingerprint(1) != fingerprint("1")
+    assert fingerprint(limit=1) != fingerprint(1)
+    assert fingerprint([0.1, 0.2]) != fingerprint([0.1, 0.3])
+    assert fingerprint(np.array([1.0, 2.0])) != fingerprint(np.array([1.0, 2.0], dtype=np.float32))
+    assert fingerprint({3, 1, 2}) == fingerprint({1, 2, 3})
+
+
+def test_documents_keyed_by_id_and_content():
+    """Test that documents ignore their vectors but not their ID or content"""
+    assert document_fingerprint(make_doc()) == document_fingerprint(make_doc(vector=(0.9, 0.9)))
+    assert document_fingerprint(make_doc()) != document_fingerprint(make_doc(doc_id="doc-2"))
+    assert document_fingerprint(make_doc()) != document_fingerprint(make_doc(body="Other text"))
+    assert content_fingerprint(make_doc()) == content_fingerprint(make_doc(doc_id="doc-2"))
+    assert documents_fingerprint([make_doc()]) == documents_fingerprint(
+        [make_doc(vector=(0.5, 0.5))]
+    )
+
+
+def test_relationships_change_document_fingerprints():
+    """Test that documents differing only in relationships get different keys"""
+    moved = make_doc(parent_id="other")
+    assert content_fingerprint(make_doc()) == content_fingerprint(moved)
+    assert document_fingerprint(make_doc()) != document_fingerprint(moved)
+    assert documents_fingerprint([make_doc()]) != documents_fingerprint([moved])
+
+
+def test_plain_fingerprint_hashes_documents_whole():
+    """Test that generic arguments are not shortened to document fingerprints"""
+    assert fingerprint({"id": 1, "content": "a", "extra": 1}) != fingerprint(
+        {"id": 1, "content": "a", "extra": 2}
+    )
+    assert fingerprint([make_doc()]) != fingerprint([make_doc(vector=(0.5, 0.5))])
+
+
+def test_long_texts_are_memoized():
+    """Test that long texts are hashed once"""
+    fingerprint_module._text_digest.cache_clear()
+    doc = make_doc(body="word " * 1000)
+    assert document_fingerprint(doc) == document_fingerprint(doc)
+    info = fingerprint_module._text_digest.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
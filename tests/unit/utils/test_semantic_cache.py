@@ -0,0 +1,62 @@
+"""Tests for the semantic query cache."""
+
+from unittest.mock import patch
+import pytest
+from src.utils import semantic_cache
+from src.utils.semantic_cache import SemanticCache
+
+
+@pytest.fixture(autouse=True)
+def recorders(monkeypatch):
+    """Silence the Prometheus recorders"""
+    for name in ("record_cache_hit", "record_cache_miss", "record_semantic_similarity"):
+        monkeypatch.setattr(semantic_cache, name, lambda *args: None)
+
+
+@pytest.fixture
+def cache():
+    """Create a small semantic cache"""
+    return SemanticCache(capacity=3, threshold=0.95, max_age=60)
+
+
+def test_similar_query_hits(cache):
+    """Test that a paraphrase above the threshold returns the cached results"""
+    cache.add([1.0, 0.0, 0.0], ["reset password"])
+    assert cache.lookup([0.99, 0.05, 0.0]) == ["reset password"]
+    assert cache.lookup([0.7, 0.7, 0.0]) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+    assert stats["similarity"]["le_1.0"] == 1 and stats["similarity"]["le_0.8"] == 1
+
+
+def test_returns_most_similar_entry(cache):
+    """Test that the closest cached query wins"""
+    cache.add([1.0, 0.0, 0.0], "a")
+    cache.add([0.98, 0.2, 0.0], "b")
+    assert cache.lookup([0.97, 0.22, 0.0]) == "b"
+
+
+def test_scopes_are_separate(cache):
+    """Test that entries only match lookups with the same scope"""
+    cache.add([1.0, 0.0], "ten", scope="hybrid:10")
+    assert cache.lookup([1.0, 0.0], scope="hybrid:5") is None
+    assert cache.lookup([1.0, 0.0], scope="hybrid:10") == "ten"
+
+
+def test_stale_entries_are_ignored(cache):
+    """Test that results older than the staleness bound are not returned"""
+    with patch.object(semantic_cache.time, "time", return_value=1000.0):
+        cache.add([1.0, 0.0], "old")
+    with patch.object(semantic_cache.time, "time", return_value=1061.0):
+        assert cache.lookup([1.0, 0.0]) is None
+
+
+def test_capacity_evicts_oldest(cache):
+    """Test that the oldest entry is overwritten when full"""
+    for i, vector in enumerate(([1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1])):
+        cache.add(vector, i)
+    assert cache.lookup([1, 0, 0, 0]) is None
+    assert cache.lookup([0, 0, 0, 1]) == 3
+    assert cache.stats()["size"] == 3
+    cache.clear()
+    assert cache.lookup([0, 0, 0, 1]) is None
@@ -0,0 +1,109 @@
+"""Tests for the local FAISS vector index."""
+
+import numpy as np
+import pytest
+from src.utils.vector_index import VectorIndex
+
+
+@pytest.fixture
+def vectors():
+    """Create random test vectors"""
+    return np.random.default_rng(0).standard_normal((2000, 16)).astype(np.float32)
+
+
+@pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+@pytest.mark.parametrize("metric", ["l2", "cosine"])
+def test_batches_keep_their_ids(vectors, index_type, metric):
+    """Test that IDs of earlier batches survive later batches"""
+    index = VectorIndex(dimension=16, index_type=index_type, metric=metric)
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    index.add_vectors(vectors[:1000], ids[:1000])
+    index.add_vectors(vectors[1000:], ids[1000:])
+    scores, result_ids = index.search(vectors[[3, 1500]], k=2)
+    assert result_ids.shape == (2, 2)
+    assert list(result_ids[:, 0]) == ["doc-3", "doc-1500"]
+    assert scores[0, 0] == pytest.approx(1.0 if metric == "cosine" else 0.0, abs=1e-4)
+
+
+@pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+def test_remove_and_replace(vectors, index_type):
+    """Test that removed IDs disappear and re-added IDs get the new vector"""
+    index = VectorIndex(dimension=16, index_type=index_type)
+    index.add_vectors(vectors[:1000], [f"doc-{i}" for i in range(1000)])
+    assert index.remove(["doc-3", "unknown"]) == 1
+    assert "doc-3" not in index and len(index) == 999
+    assert "doc-3" not in index.search(vectors[3], k=5)[1][0]
+    index.add_vectors(vectors[1500:1501], ["doc-4"])
+    assert index.search(vectors[1500], k=1)[1][0, 0] == "doc-4"
+    assert len(index) == 999
+
+
+def test_hnsw_compacts_removed_vectors(vectors):
+    """Test that HNSW drops masked vectors once enough are removed"""
+    index = VectorIndex(dimension=16, index_type="hnsw")
+    index.add_vectors(vectors[:100], [f"doc-{i}" for i in range(100)])
+    index.remove([f"doc-{i}" for i in range(30)])
+    assert index.index.ntotal == 70
+    assert index.search(vectors[50], k=1)[1][0, 0] == "doc-50"
+
+
+def test_ivf_defers_training_until_enough_vectors(vectors):
+    """Test that IVF buffers vectors exactly until train_size and keeps them after training"""
+    index = VectorIndex(dimension=16, index_type="ivf", nlist=8)
+    assert index.train_size == 8 * 39
+    ids = [f"doc-{i}" for i in range(len(vectors))]
+    index.add_vectors(vectors[:200], ids[:200])
+    assert not index.trained
+    assert index.search(vectors[5], k=1)[1][0, 0] == "doc-5"
+    index.remove(["doc-6"])
+    index.add_vectors(vectors[200:400], ids[200:400])
+    assert index.trained and index.index.ntotal == 399
+    assert index.search(vectors[[5, 300]], k=1)[1][:, 0].tolist() == ["doc-5", "doc-300"]
+    assert "doc-6" not in index.search(vectors[6], k=5)[1][0]
+
+
+def test_ivf_explicit_train(vectors):
+    """Test that train() builds the IVF from a sample and the buffered vectors"""
+    index = VectorIndex(dimension=16, index_type="ivf", nlist=4)
+    index.add_vectors(vectors[:10], [f"doc-{i}" for i in range(10)])
+    index.train(vectors[1000:])
+    assert index.trained and index.nlist == 4 and len(index) == 10
+    assert index.search(vectors[3], k=1)[1][0, 0] == "doc-3"
+    with pytest.raises(ValueError):
+        VectorIndex(dimension=16, index_type="ivf", nlist=64).train(vectors[:10])
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_save_and_load(vectors, tmp_path, mmap):
+    """Test that a saved index loads with its IDs and settings"""
+    index = VectorIndex(dimension=16, index_type="ivf", metric="cosine", nprobe=4)
+    index.add_vectors(vectors, [f"doc-{i}" for i in range(len(vectors))])
+    index.remove(["doc-7"])
+    index.save(str(tmp_path))
+    loaded = VectorIndex.load(str(tmp_path), mmap=mmap)
+    assert (loaded.index_type, loaded.metric, loaded.nprobe, len(loaded)) == (
+        "ivf",
+        "cosine",
+        4,
+        1999,
+    )
+    assert loaded.search(vectors[8], k=1)[1][0, 0] == "doc-8"
+    if mmap:
+        with pytest.raises(RuntimeError):
+            loaded.add_vectors(vectors[:1], ["new"])
+    else:
+        loaded.add_vectors(vectors[:1], ["new"])
+        assert len(loaded) == 2000
+
+
+def test_empty_and_invalid(vectors):
+    """Test empty searches and argument validation"""
+    index = VectorIndex(dimension=16)
+    scores, ids = index.search(vectors[0], k=3)
+    assert ids.tolist() == [[None, None, None]] and np.isnan(scores).all()
+    with pytest.raises(ValueError):
+        index.add_vectors(vectors[:2, :8])
+    with pytest.raises(ValueError):
+        index.add_vectors(vectors[:2], ["only-one"])
+    with pytest.raises(ValueError):
+        VectorIndex(dimension=16, index_type="lsh")
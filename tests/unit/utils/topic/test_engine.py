@@ -0,0 +1,101 @@
+"""Tests for the clustering engine behind topic clustering."""
+
+from unittest.mock import patch
+import numpy as np
+import pytest
+from src.utils.topic_clustering import ClusteringConfig, ClusteringEngine, TopicClusterer
+
+
+@pytest.fixture
+def mock_cache_manager():
+    """Create a mock cache manager"""
+    with patch("src.utils.topic_clustering.CacheManager") as mock:
+        mock.return_value.get.return_value = None
+        yield mock.return_value
+
+
+@pytest.fixture
+def clusterer(mock_cache_manager):
+    """Create a TopicClusterer instance with mocks"""
+    return TopicClusterer(cache_host="localhost", cache_port=6379)
+
+
+@pytest.fixture
+def blobs():
+    """Create three well-separated groups of embeddings"""
+    rng = np.random.RandomState(0)
+    centers = np.eye(8)[:3] * 10
+    return np.vstack([center + rng.normal(scale=0.3, size=(30, 8)) for center in centers])
+
+
+def make_docs(embeddings):
+    return [
+        {
+            "content": {"body": f"topic{i // 30} doc{i}"},
+            "embeddings": {"body": list(map(float, e))},
+            "metadata": {},
+        }
+        for i, e in enumerate(embeddings)
+    ]
+
+
+def test_to_matrix_normalizes_float32():
+    """Test conversion to a unit-length float32 matrix"""
+    matrix = ClusteringEngine.to_matrix([[3.0, 4.0], [0.0, 0.0]])
+    assert matrix.dtype == np.float32
+    assert np.allclose(matrix, [[0.6, 0.8], [0.0, 0.0]])
+
+
+def test_select_k_on_sample(blobs):
+    """Test that the cluster count is found from a subsample"""
+    engine = ClusteringEngine(ClusteringConfig(max_clusters=6), sample_size=45)
+    assert engine.select_k(ClusteringEngine.to_matrix(blobs)) == 3
+
+
+def test_fit_computes_keywords_once_per_cluster(blobs):
+    """Test that keywords are extracted per cluster, not per document"""
+    engine = ClusteringEngine(ClusteringConfig(max_clusters=6))
+    texts = [f"topic{i // 30} doc{i}" for i in range(len(blobs))]
+    with patch("src.utils.topic_clustering.clean_text", side_effect=lambda t: t) as mock_clean:
+        labels = engine.fit(ClusteringEngine.to_matrix(blobs), texts)
+    assert mock_clean.call_count <= 3 * 5
+    assert sorted(engine.sizes.tolist()) == [30, 30, 30]
+    for cluster_id in range(3):
+        topic = texts[int(np.flatnonzero(labels == cluster_id)[0])].split()[0]
+        assert topic in engine.keywords[cluster_id]
+
+
+def test_assign_uses_existing_centroids(blobs):
+    """Test incremental assignment without refitting"""
+    engine = ClusteringEngine(ClusteringConfig(max_clusters=6))
+    labels = engine.fit(ClusteringEngine.to_matrix(blobs), [""] * len(blobs))
+    new = ClusteringEngine.to_matrix(blobs[[0, 30, 60]] + 0.1)
+    assigned = engine.assign(new, update=True)
+    assert assigned.tolist() == labels[[0, 30, 60]].tolist()
+    assert engine.sizes.sum() == len(blobs) + 3
+
+
+def test_assign_documents(clusterer, blobs):
+    """Test assigning new documents to the clusters of an earlier run"""
+    docs = clusterer.cluster_documents(make_docs(blobs), ClusteringConfig(max_clusters=6))
+    new_docs = clusterer.assign_documents(make_docs(blobs[[0, 45]] + 0.05))
+    assert (
+        new_docs[0]["metadata"]["clustering"]["cluster_id"]
+        == docs[0]["metadata"]["clustering"]["cluster_id"]
+    )
+    assert (
+        new_docs[1]["metadata"]["clustering"]["cluster_id"]
+        == docs[45]["metadata"]["clustering"]["cluster_id"]
+    )
+    assert new_docs[0]["metadata"]["clustering"]["similarity_to_centroid"] > 0.9
+
+
+def test_cache_key_ignores_metadata(clusterer, mock_cache_manager, blobs):
+    """Test that the cache key depends on embeddings and text only"""
+    docs = make_docs(blobs)
+    clusterer.cluster_documents(docs)
+    for doc in docs:
+        doc["metadata"]["extra"] = "changed"
+    clusterer.cluster_documents(docs)
+    keys = [call.args[0] for call in mock_cache_manager.get.call_args_list]
+    assert len(keys) == 2 and keys[0] == keys[1]